@@ -0,0 +1,81 @@
+"""Benchmark blocking vs. asynchronous chart export against a local fake export server.
+
+Run from the repository root::
+
+  python -m benchmarks.benchmark_async_export --charts 200 --latency 0.05
+
+"""
+import argparse
+import asyncio
+import time
+
+from highcharts_maps.chart import Chart
+from highcharts_maps.headless_export import ExportServer, AsyncExportClient
+
+from benchmarks.fake_export_server import FakeExportServer
+
+
+def get_charts(count):
+    return [Chart.from_options({'title': {'text': f'chart {x}'}})
+            for x in range(count)]
+
+
+def export_blocking(charts, server_kwargs):
+    server = ExportServer(**server_kwargs)
+    for chart in charts:
+        chart.download_chart(server_instance = server, timeout = 10)
+
+
+async def watch_event_loop(interval, lags):
+    """Record how late each tick of the event loop runs, which is how long the loop
+    was blocked."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def export_async(charts, server_kwargs, max_concurrency):
+    lags = []
+    watcher = asyncio.create_task(watch_event_loop(0.005, lags))
+    async with AsyncExportClient(server_instance = ExportServer(**server_kwargs),
+                                 max_concurrency = max_concurrency,
+                                 timeout = 10) as client:
+        await asyncio.gather(*[x.adownload_chart(client = client, timeout = 10)
+                               for x in charts])
+    watcher.cancel()
+
+    return max(lags) if lags else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--charts', type = int, default = 200)
+    parser.add_argument('--latency', type = float, default = 0.05)
+    parser.add_argument('--concurrency', type = int, default = 16)
+    args = parser.parse_args()
+
+    server = FakeExportServer(latency = args.latency)
+    server_kwargs = server.get_export_server_kwargs()
+    charts = get_charts(args.charts)
+    try:
+        start = time.perf_counter()
+        export_blocking(charts, server_kwargs)
+        blocking = time.perf_counter() - start
+
+        start = time.perf_counter()
+        max_lag = asyncio.run(export_async(charts, server_kwargs, args.concurrency))
+        concurrent = time.perf_counter() - start
+    finally:
+        server.close()
+
+    print(f'{"mode":<28}{"total (s)":>12}{"charts / s":>12}')
+    print(f'{"blocking download_chart":<28}{blocking:>12.3f}'
+          f'{args.charts / blocking:>12.1f}')
+    print(f'{"adownload_chart":<28}{concurrent:>12.3f}'
+          f'{args.charts / concurrent:>12.1f}')
+    print(f'Longest event loop stall while exporting: {max_lag * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
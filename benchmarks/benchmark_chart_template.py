@@ -0,0 +1,78 @@
+"""Benchmark re-serializing a map chart per request vs. rendering a compiled template.
+
+Run from the repository root::
+
+  python -m benchmarks.benchmark_chart_template --requests 200
+
+"""
+import argparse
+import time
+
+from highcharts_maps.chart import Chart
+from highcharts_maps.options import HighchartsMapsOptions
+from highcharts_maps.options.series.data.map_data import MapData
+
+from benchmarks.benchmark_render_many import WORLD
+
+
+def get_data(keys, seed):
+    return [{'hc-key': key, 'value': (index * seed) % 97}
+            for index, key in enumerate(keys)]
+
+
+def get_chart(map_data, data, title):
+    return Chart(container = 'container',
+                 options = HighchartsMapsOptions.from_dict({
+                     'chart': {'map': map_data},
+                     'title': {'text': title},
+                     'colorAxis': {'min': 0, 'max': 100, 'type': 'logarithmic'},
+                     'legend': {'enabled': True, 'layout': 'vertical'},
+                     'mapView': {'projection': {'name': 'EqualEarth'}},
+                     'series': [{'type': 'map',
+                                 'name': 'values',
+                                 'joinBy': 'hc-key',
+                                 'data': data}]
+                 }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--requests', type = int, default = 200)
+    parser.add_argument('--format', choices = ['js', 'json'], default = 'js')
+    args = parser.parse_args()
+
+    map_data = MapData.from_topojson(WORLD)
+    keys = [x['properties']['hc-key']
+            for x in map_data.topology.to_dict()['objects']['default']['geometries']
+            if 'hc-key' in (x.get('properties') or {})]
+    requests = [(get_data(keys, x), f'request {x}') for x in range(args.requests)]
+
+    def serialize(chart):
+        return chart.to_json() if args.format == 'json' else chart.to_js_literal()
+
+    start = time.perf_counter()
+    direct = [serialize(get_chart(map_data, data, title)) for data, title in requests]
+    direct_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    template = get_chart(map_data, [], '').to_template({'data': 'series[0].data',
+                                                        'title': 'title.text'},
+                                                       format = args.format)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    rendered = [template.render(data = data, title = title) for data, title in requests]
+    render_time = time.perf_counter() - start
+
+    assert rendered == direct
+
+    print(f'{"mode":<32}{"total (s)":>12}{"ms / request":>14}')
+    print(f'{"build and serialize each chart":<32}{direct_time:>12.3f}'
+          f'{direct_time * 1000 / args.requests:>14.2f}')
+    print(f'{"compile template (once)":<32}{compile_time:>12.3f}')
+    print(f'{"render template":<32}{render_time:>12.3f}'
+          f'{render_time * 1000 / args.requests:>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark the per-point memory footprint of map data points.
+
+Compares the sparse attribute storage used by the map data point classes against an
+equivalent class that stores every attribute densely. Run from the repository root::
+
+  python -m benchmarks.benchmark_data_point_memory --points 100000
+
+"""
+import argparse
+import gc
+import tracemalloc
+
+from highcharts_maps.options.series.data.geometric import (GeometricData,
+                                                           GeometricLatLonData,
+                                                           GeometricZData)
+from highcharts_maps.options.series.data.connections import FlowmapData
+from highcharts_maps.options.series.data.cartesian import CartesianValueData
+
+
+SAMPLE_KWARGS = {
+    GeometricData: {'name': 'region', 'value': 1.5},
+    GeometricZData: {'name': 'region', 'z': 1.5},
+    GeometricLatLonData: {'name': 'city', 'lat': 51.5, 'lon': -0.1},
+    FlowmapData: {'from_': 'origin', 'to': 'destination', 'weight': 2},
+    CartesianValueData: {'x': 1, 'y': 2, 'value': 1.5},
+}
+
+
+def get_dense_class(data_point_cls):
+    """Return a variant of ``data_point_cls`` which stores every attribute."""
+    return type(f'Dense{data_point_cls.__name__}',
+                (data_point_cls, ),
+                {'__setattr__': object.__setattr__})
+
+
+def measure(data_point_cls, kwargs, points):
+    gc.collect()
+    tracemalloc.start()
+    collection = [data_point_cls(**kwargs) for x in range(points)]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del collection
+
+    return current / points
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--points', type = int, default = 100000)
+    args = parser.parse_args()
+
+    print(f'{"data point class":<22}{"dense (B/point)":>18}{"sparse (B/point)":>19}'
+          f'{"reduction":>12}')
+    for data_point_cls, kwargs in SAMPLE_KWARGS.items():
+        dense = measure(get_dense_class(data_point_cls), kwargs, args.points)
+        sparse = measure(data_point_cls, kwargs, args.points)
+        print(f'{data_point_cls.__name__:<22}{dense:>18.0f}{sparse:>19.0f}'
+              f'{1 - sparse / dense:>11.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark serial vs. process-pool serialization of many small-multiple map charts.
+
+Run from the repository root::
+
+  python -m benchmarks.benchmark_render_many --charts 500 --workers 4
+
+"""
+import argparse
+import os
+import pickle
+import time
+
+from highcharts_maps.chart import Chart
+from highcharts_maps.options import HighchartsMapsOptions
+from highcharts_maps.options.series.map import MapSeries
+from highcharts_maps.options.series.data.map_data import MapData
+
+WORLD = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                     'tests',
+                     'input_files',
+                     'series',
+                     'data',
+                     'map_data',
+                     'map_data',
+                     'world.topo.json')
+
+
+def get_charts(count, map_data):
+    keys = [x['properties']['hc-key']
+            for x in map_data.topology.to_dict()['objects']['default']['geometries']
+            if 'hc-key' in (x.get('properties') or {})]
+
+    return [Chart(container = f'chart_{x}',
+                  options = HighchartsMapsOptions(
+                      chart = {'map': map_data},
+                      title = {'text': f'chart {x}'},
+                      series = [MapSeries(name = 'values',
+                                          data = [{'hc-key': key,
+                                                   'value': (index * x) % 97}
+                                                  for index, key in enumerate(keys)])]
+                  ))
+            for x in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--charts', type = int, default = 500)
+    parser.add_argument('--workers', type = int, default = os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    map_data = MapData.from_topojson(WORLD)
+    charts = get_charts(args.charts, map_data)
+
+    start = time.perf_counter()
+    serial = [x.to_js_literal() for x in charts]
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = list(Chart.render_many(charts, max_workers = args.workers))
+    parallel_time = time.perf_counter() - start
+
+    assert parallel == serial
+
+    per_chart = len(pickle.dumps(map_data.topology.to_json()))
+    print(f'{"mode":<32}{"total (s)":>12}{"charts / s":>12}')
+    print(f'{"serial to_js_literal":<32}{serial_time:>12.3f}'
+          f'{args.charts / serial_time:>12.1f}')
+    print(f'{f"render_many ({args.workers} workers)":<32}{parallel_time:>12.3f}'
+          f'{args.charts / parallel_time:>12.1f}')
+    print(f'Map data shared once rather than pickled per chart: '
+          f'{per_chart * (args.charts - 1) / 1e6:.1f} MB saved')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark validated vs. trusted construction of map data points.
+
+Run from the repository root::
+
+  python -m benchmarks.benchmark_trusted_construction --points 100000
+
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from highcharts_maps.options.series.data.geometric import (GeometricData,
+                                                           GeometricLatLonData,
+                                                           GeometricZData)
+from highcharts_maps.options.series.data.connections import FlowmapData
+
+
+def get_columns(data_point_cls, points):
+    rng = np.random.default_rng(0)
+    names = np.array([f'region-{x}' for x in range(points)], dtype = object)
+    if data_point_cls is GeometricData:
+        return {'name': names, 'value': rng.random(points)}
+    if data_point_cls is GeometricZData:
+        return {'name': names, 'z': rng.random(points)}
+    if data_point_cls is GeometricLatLonData:
+        return {'name': names,
+                'lat': rng.uniform(-90, 90, points),
+                'lon': rng.uniform(-180, 180, points)}
+
+    return {'from_': names,
+            'to': names[::-1].copy(),
+            'weight': rng.random(points)}
+
+
+def construct_validated(data_point_cls, columns):
+    keys = list(columns)
+    values = [x.tolist() for x in columns.values()]
+    return [data_point_cls(**dict(zip(keys, row))) for row in zip(*values)]
+
+
+def construct_trusted(data_point_cls, columns):
+    return data_point_cls.from_trusted_columns(columns)
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--points', type = int, default = 100000)
+    parser.add_argument('--repeat', type = int, default = 3)
+    args = parser.parse_args()
+
+    print(f'{"data point class":<22}{"validated (s)":>16}{"trusted (s)":>14}'
+          f'{"speedup":>10}')
+    for data_point_cls in [GeometricData,
+                           GeometricZData,
+                           GeometricLatLonData,
+                           FlowmapData]:
+        columns = get_columns(data_point_cls, args.points)
+        validated = min(timeit.repeat(lambda: construct_validated(data_point_cls,
+                                                                  columns),
+                                      number = 1,
+                                      repeat = args.repeat))
+        trusted = min(timeit.repeat(lambda: construct_trusted(data_point_cls,
+                                                              columns),
+                                    number = 1,
+                                    repeat = args.repeat))
+        print(f'{data_point_cls.__name__:<22}{validated:>16.3f}{trusted:>14.3f}'
+              f'{validated / trusted:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
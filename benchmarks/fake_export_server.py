@@ -0,0 +1,100 @@
+"""A local stand-in for the Highcharts Export Server, used by the tests and benchmarks
+of chart export.
+
+Run from the repository root to serve it until interrupted::
+
+  python -m benchmarks.fake_export_server --port 7801 --latency 0.05
+
+"""
+import argparse
+import http.server
+import json
+import threading
+import time
+
+
+class FakeExportServer(object):
+    """Stand-in for the Highcharts Export Server, which runs on a local port in a
+    background thread and records the requests and connections it receives.
+
+    Returns the bytes ``EXPORT:<type>:<constr>:<title text>`` for each chart after
+    waiting ``latency`` seconds, or responds with a ``500`` error if the chart's title
+    text is ``'fail'``.
+    """
+
+    def __init__(self, port = 0, latency = 0):
+        self.latency = latency
+        self.requests = []
+        self.connections = set()
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                payload = json.loads(body)
+                with server._lock:
+                    server.requests.append(payload)
+                    server.connections.add(self.client_address)
+                if server.latency:
+                    time.sleep(server.latency)
+
+                title = ((payload.get('infile') or {}).get('title') or {}).get('text')
+                if title == 'fail':
+                    content, status = b'Export failed', 500
+                else:
+                    content = f'EXPORT:{payload.get("type")}:{payload.get("constr")}:'\
+                              f'{title}'.encode('utf-8')
+                    status = 200
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/octet-stream')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+        self._server = http.server.ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target = self._server.serve_forever,
+                                        daemon = True)
+        self._thread.start()
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def url(self):
+        return f'http://localhost:{self.port}/'
+
+    def get_export_server_kwargs(self):
+        """Return the keyword arguments which configure an ``ExportServer`` to use
+        this server."""
+        return {'protocol': 'http', 'domain': 'localhost', 'port': self.port}
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument('--port', type = int, default = 7801)
+    parser.add_argument('--latency', type = float, default = 0)
+    args = parser.parse_args()
+
+    server = FakeExportServer(port = args.port, latency = args.latency)
+    print(f'Serving on {server.url} (Ctrl+C to stop)')
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,11 @@
 from typing import Optional, List
 from collections import UserDict
+import asyncio
+import concurrent.futures
+import itertools
+import json
+import os
+import tempfile
 
 from validator_collection import validators, checkers
 
@@ -8,16 +14,106 @@ from highcharts_core.chart import Chart as ChartBase
 from highcharts_maps import errors, utility_functions
 from highcharts_maps.options import HighchartsOptions, HighchartsMapsOptions
 from highcharts_maps.decorators import validate_types
-from highcharts_maps.js_literal_functions import serialize_to_js_literal
-from highcharts_maps.headless_export import ExportServer
+from highcharts_maps.metaclasses import register_pickling
+from highcharts_maps.js_literal_functions import (serialize_to_js_literal,
+                                                   replace_map_data_placeholders)
+from highcharts_maps.headless_export import ExportServer, AsyncExportClient
 from highcharts_maps.options.series.series_generator import (create_series_obj,
                                                              SERIES_CLASSES,
                                                              MAPS_SERIES_LIST)
 from highcharts_maps.global_options.shared_options import SharedMapsOptions, SharedOptions
 from highcharts_maps.options.chart import ChartOptions
 from highcharts_maps.options.map_views import MapViewOptions
-from highcharts_maps.options.series.data.map_data import MapData
+from highcharts_maps.options.series.data.map_data import MapData, RenderContext
+from highcharts_maps.options.series.map import MapSeries
+from highcharts_maps.utility_classes.fetch_configuration import FetchConfiguration
+from highcharts_maps.utility_classes.chart_diffs import ChartDiff
+from highcharts_maps.utility_classes.chart_templates import ChartTemplate
+from highcharts_maps.utility_classes.javascript_functions import CallbackFunction
 from highcharts_maps.utility_classes.projections import ProjectionOptions, CustomProjection
+from highcharts_maps.utility_classes.topojson import Topology
+
+# Map data loaded by a worker process of Chart.render_many(), by the path it was
+# shared through.
+_SHARED_MAP_DATA = {}
+
+
+def _serialize_chart(chart, format):
+    """Serialize ``chart`` as a JavaScript literal (``'js'``) or JSON (``'json'``)."""
+    if format == 'json':
+        return chart.to_json()
+
+    return chart.to_js_literal()
+
+
+def _get_render_task(chart, directory, shared_paths):
+    """Return the form in which ``chart`` is sent to a worker process of
+    :meth:`Chart.render_many() <Chart.render_many>`: a copy of the chart without its
+    :class:`MapData`, along with where to find each of them.
+
+    Each :class:`MapData` is written (once per batch) to a file in ``directory`` and
+    sent by path, rather than being pickled with every chart that uses it. ``chart``
+    itself is not modified.
+
+    :param shared_paths: The paths of the map data already written in the batch, by the
+      :func:`id <python:id>` of each instance.
+    :type shared_paths: :class:`dict <python:dict>`
+
+    :rtype: :class:`tuple <python:tuple>`
+    """
+    def share(map_data):
+        if id(map_data) not in shared_paths:
+            # The instance is held so that its id is not re-used within the batch.
+            shared_paths[id(map_data)] = (map_data, map_data.write_asset(directory))
+        return shared_paths[id(map_data)][1], map_data.force_geojson
+
+    options = chart.options
+    if options is None:
+        return chart, []
+
+    map_data = []
+    options = utility_functions.shallow_copy(options)
+    chart_map = getattr(options.chart, 'map', None) if options.chart else None
+    if isinstance(chart_map, MapData) and isinstance(chart_map.topology, Topology):
+        options._chart = utility_functions.shallow_copy(options.chart)
+        options._chart._map = None
+        map_data.append((None, share(chart_map)))
+    if options.series:
+        series = []
+        for index, item in enumerate(options.series):
+            series_map = getattr(item, 'map_data', None)
+            if isinstance(series_map, MapData) and isinstance(series_map.topology,
+                                                              Topology):
+                item = utility_functions.shallow_copy(item)
+                item._map_data = None
+                map_data.append((index, share(series_map)))
+            series.append(item)
+        options._series = series
+
+    chart = utility_functions.shallow_copy(chart)
+    chart._options = options
+
+    return chart, map_data
+
+
+def _render_chart(task, format):
+    """Restore the map data of a chart sent by :func:`_get_render_task` and serialize
+    it.
+
+    Defined at module level so that it can be dispatched to a process pool.
+    """
+    chart, map_data = task
+    for index, (path, force_geojson) in map_data:
+        if path not in _SHARED_MAP_DATA:
+            _SHARED_MAP_DATA[path] = MapData.from_topojson(path)
+        item = utility_functions.shallow_copy(_SHARED_MAP_DATA[path])
+        item.force_geojson = force_geojson
+        if index is None:
+            chart.options.chart._map = item
+        else:
+            chart.options.series[index]._map_data = item
+
+    return _serialize_chart(chart, format)
 
 
 class Chart(ChartBase):
@@ -62,13 +158,10 @@ class Chart(ChartBase):
 
         :rtype: :class:`str <python:str>`
         """
-        original_container = self.container
-        new_container = container or self.container or 'highcharts_target_div'
-        if not random_slug:
-            self.container = new_container
-        else:
-            self.container = f'{new_container}_{random_slug}'
-        
+        container = container or self.container or 'highcharts_target_div'
+        if random_slug:
+            container = f'{container}_{random_slug}'
+
         if global_options is not None:
             global_options = validate_types(global_options,
                                             types = (SharedMapsOptions, SharedOptions))
@@ -79,13 +172,13 @@ class Chart(ChartBase):
         if global_options:
             js_str += '\n' + utility_functions.prep_js_for_jupyter(global_options.to_js_literal()) + '\n'
 
-        js_str += utility_functions.prep_js_for_jupyter(self.to_js_literal(),
-                                                        container = self.container,
-                                                        random_slug = random_slug,
-                                                        retries = retries,
-                                                        interval = interval)
-
-        self.container = original_container
+        js_str += utility_functions.prep_js_for_jupyter(
+            self._get_js_literal(container = container),
+            container = container,
+            random_slug = random_slug,
+            retries = retries,
+            interval = interval
+        )
 
         return js_str
 
@@ -217,46 +310,69 @@ class Chart(ChartBase):
         if filename:
             filename = validators.path(filename)
 
-        untrimmed = self._to_untrimmed_dict()
-        as_dict = {}
-        for key in untrimmed:
-            item = untrimmed[key]
-            serialized = serialize_to_js_literal(item,
-                                                 encoding = encoding,
-                                                 careful_validation = careful_validation)
-            if serialized is not None:
-                as_dict[key] = serialized
+        as_str = self._get_js_literal(encoding = encoding,
+                                      careful_validation = careful_validation)
+
+        if filename:
+            with open(filename, 'w', encoding = encoding) as file_:
+                file_.write(as_str)
+
+        return as_str
+
+    def _get_js_literal(self,
+                        encoding = 'utf-8',
+                        careful_validation = False,
+                        container = None) -> str:
+        """Return the chart serialized as a JavaScript literal, as per
+        :meth:`.to_js_literal() <Chart.to_js_literal>`.
+
+        The chart is not modified, so it can be serialized concurrently from multiple
+        threads. The variable names of the topologies fetched asynchronously are assigned
+        by a :class:`RenderContext <highcharts_maps.options.series.data.map_data.RenderContext>`
+        which lasts for this serialization only.
+
+        :param container: The ID of the HTML container to render the chart in. Defaults
+          to :obj:`None <python:None>`, which applies
+          :meth:`.container <Chart.container>`.
+        :type container: :class:`str <python:str>` or :obj:`None <python:None>`
 
+        :rtype: :class:`str <python:str>`
+        """
+        with RenderContext() as context:
+            return self._assemble_js_literal(context,
+                                             encoding = encoding,
+                                             careful_validation = careful_validation,
+                                             container = container or self.container)
+
+    def _assemble_js_literal(self,
+                             context,
+                             encoding = 'utf-8',
+                             careful_validation = False,
+                             container = None) -> str:
+        """Serialize the chart as a JavaScript literal within ``context``, rendering it in
+        the HTML container ``container``.
+
+        :rtype: :class:`str <python:str>`
+        """
         signature_elements = 0
 
         fetch_as_str = ''
         if self.is_async:
-            urls = []
+            async_map_data = []
+            if self.options.chart and getattr(self.options.chart, 'is_async', False):
+                async_map_data.append(self.options.chart.map)
+            for series in self.options.series or []:
+                if getattr(series, 'is_async', False):
+                    async_map_data.append(series.map_data)
+
             topologies = []
-            if self.options.chart and self.options.chart.map:
-                url = self.options.chart.map.url
-                urls.append(url)
-                self.options.chart.map.fetch_counter = 1
-
-                map_data_as_str = self.options.chart.map.to_js_literal(
-                    encoding = encoding,
-                    careful_validation = careful_validation
-                )
-                topologies.append(map_data_as_str)
-            
-            for index, series in enumerate(self.options.series):
-                if series.is_async:
-                    url = series.map_data.url
-                    if url in urls:
-                        continue
-                    urls.append(url)
-                    if len(urls) > 1:
-                        self.options.series[index].map_data.fetch_counter += 1
-                    map_data_as_str = series.map_data.to_js_literal(
+            for map_data in async_map_data:
+                _, is_new = context.add_topology(map_data)
+                if is_new:
+                    topologies.append(map_data.to_js_literal(
                         encoding = encoding,
                         careful_validation = careful_validation
-                    )
-                    topologies.append(map_data_as_str)
+                    ))
 
             fetch_as_str = '\n'.join(topologies)
 
@@ -269,8 +385,8 @@ class Chart(ChartBase):
             custom_projection_as_str += f"""\nHighcharts.Projection.add('{self.options.map_view.projection.custom.name}', {self.options.map_view.projection.custom.class_name})\n"""
 
         container_as_str = ''
-        if self.container:
-            container_as_str = f"""'{self.container}'"""
+        if container:
+            container_as_str = f"""'{container}'"""
         else:
             container_as_str = """null"""
         signature_elements += 1
@@ -288,9 +404,11 @@ class Chart(ChartBase):
                 chart_map_str = self.options.chart.map.to_js_literal(encoding = encoding,
                                                                      careful_validation = careful_validation)
                 chart_map_str = f"""'{chart_map_str}'"""
-                fetch_counter = self.options.chart.map.fetch_counter
-                options_as_str = options_as_str.replace(chart_map_str, f'topology{fetch_counter}')
-            options_as_str = f"""{options_as_str}"""
+                options_as_str = options_as_str.replace(
+                    chart_map_str,
+                    context.get_topology_name(self.options.chart.map)
+                )
+            options_as_str = replace_map_data_placeholders(options_as_str)
         else:
             options_as_str = """{}"""
         signature_elements += 1
@@ -336,13 +454,165 @@ class Chart(ChartBase):
                 prefix += custom_projection_as_str
             suffix = """});"""
 
-        as_str = prefix + as_str + '\n' + suffix
+        return prefix + as_str + '\n' + suffix
 
-        if filename:
-            with open(filename, 'w', encoding = encoding) as file_:
-                file_.write(as_str)
+    @classmethod
+    def render_many(cls,
+                    charts,
+                    format = 'js',
+                    max_workers = None,
+                    chunksize = None):
+        """Serialize many charts, distributing the (CPU-bound) serialization across a
+        pool of processes.
+
+        Each chart is pickled to be sent to a worker process, except for the
+        :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>` it uses:
+        each is written once to a temporary file and loaded once by each worker, rather
+        than being pickled with every chart that uses it.
+
+        .. code-block:: python
+
+          for as_js in Chart.render_many(small_multiples, max_workers = 8):
+              write_to_page(as_js)
+
+        :param charts: The charts to serialize.
+        :type charts: iterable of :class:`Chart`
+
+        :param format: ``'js'`` to serialize each chart as per
+          :meth:`.to_js_literal() <Chart.to_js_literal>`, or ``'json'`` as per
+          :meth:`.to_json() <Chart.to_json>`. Defaults to ``'js'``.
+        :type format: :class:`str <python:str>`
+
+        :param max_workers: The maximum number of worker processes to use. Defaults to
+          :obj:`None <python:None>`, which uses one per CPU. If ``1``, the charts are
+          serialized in the current process.
+        :type max_workers: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param chunksize: The number of charts sent to a worker process at a time.
+          Defaults to :obj:`None <python:None>`, which sends each worker around four
+          chunks.
+        :type chunksize: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :returns: The serialized charts, in the order of ``charts``, as each becomes
+          available.
+        :rtype: iterator of :class:`str <python:str>` (or, for JSON, possibly
+          :class:`bytes <python:bytes>`)
+
+        :raises HighchartsValueError: if ``format`` is not supported, or if ``charts``
+          contains a value that is not a :class:`Chart`
+        """
+        format = validators.string(format).lower()
+        if format not in ['js', 'json']:
+            raise errors.HighchartsValueError(f'format expects "js" or "json". '
+                                              f'Received: "{format}"')
+        charts = [x for x in validators.iterable(charts,
+                                                 allow_empty = True,
+                                                 forbid_literals = (str,
+                                                                    bytes,
+                                                                    dict)) or []]
+        for chart in charts:
+            if not isinstance(chart, Chart):
+                raise errors.HighchartsValueError(f'render_many() expects Chart '
+                                                  f'instances. Received: '
+                                                  f'{chart.__class__.__name__}')
+        max_workers = validators.integer(max_workers, allow_empty = True, minimum = 1)
+        max_workers = min(max_workers or os.cpu_count() or 1, len(charts))
+        chunksize = validators.integer(chunksize, allow_empty = True, minimum = 1)
+        if not chunksize:
+            chunksize = max(1, len(charts) // (max(max_workers, 1) * 4))
+
+        if max_workers <= 1:
+            return (_serialize_chart(x, format) for x in charts)
+
+        return cls._render_in_processes(charts, format, max_workers, chunksize)
 
-        return as_str
+    @staticmethod
+    def _render_in_processes(charts, format, max_workers, chunksize):
+        """Serialize ``charts`` using a pool of ``max_workers`` processes, as per
+        :meth:`.render_many() <Chart.render_many>`."""
+        with tempfile.TemporaryDirectory() as directory:
+            shared_paths = {}
+            tasks = [_get_render_task(x, directory, shared_paths) for x in charts]
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers = max_workers)
+            try:
+                yield from executor.map(_render_chart,
+                                        tasks,
+                                        itertools.repeat(format),
+                                        chunksize = chunksize)
+            finally:
+                executor.shutdown(wait = True, cancel_futures = True)
+
+    def to_template(self, slots, format = 'js', careful_validation = False):
+        """Compile the chart into a
+        :class:`ChartTemplate <highcharts_maps.utility_classes.chart_templates.ChartTemplate>`,
+        which serializes its configuration once so that it can be rendered repeatedly
+        with different values for the properties designated as ``slots``.
+
+        .. code-block:: python
+
+          template = my_chart.to_template({'data': 'series[0].data',
+                                           'title': 'title.text'})
+
+          for region, data in data_by_region.items():
+              as_js = template.render(data = data, title = region)
+
+        :param slots: The properties that vary between renders, as a
+          :class:`dict <python:dict>` mapping the name of each slot to the (camelCase)
+          path of its property within :meth:`.options <Chart.options>` (e.g.
+          ``'series[0].data'`` or ``'colorAxis.min'``), or as an iterable of paths.
+        :type slots: :class:`dict <python:dict>` or iterable of :class:`str <python:str>`
+
+        :param format: ``'js'`` to render the chart as per
+          :meth:`.to_js_literal() <Chart.to_js_literal>`, or ``'json'`` as per
+          :meth:`.to_json() <Chart.to_json>`. Defaults to ``'js'``.
+        :type format: :class:`str <python:str>`
+
+        :param careful_validation: if ``True``, will carefully validate JavaScript values
+          along the way using the
+          `esprima-python <https://github.com/Kronuz/esprima-python>`__ library. Defaults
+          to ``False``.
+        :type careful_validation: :class:`bool <python:bool>`
+
+        :rtype: :class:`ChartTemplate <highcharts_maps.utility_classes.chart_templates.ChartTemplate>`
+
+        :raises HighchartsValueError: if ``format`` is not supported, or if a slot's path
+          does not identify a property of the chart's options
+        """
+        return ChartTemplate(self,
+                             slots,
+                             format = format,
+                             careful_validation = careful_validation)
+
+    def diff(self, other, max_point_updates = 10, careful_validation = False):
+        """Compare the chart with ``other``, a later state of it, returning the
+        :class:`ChartDiff <highcharts_maps.utility_classes.chart_diffs.ChartDiff>` which
+        updates a (JavaScript) chart rendered from this state to ``other`` without
+        re-rendering it.
+
+        .. code-block:: python
+
+          as_js = my_chart.diff(updated_chart).to_js_literal()
+
+        :param other: The later state of the chart.
+        :type other: :class:`Chart` or
+          :class:`HighchartsMapsOptions <highcharts_maps.options.HighchartsMapsOptions>`
+
+        :param max_point_updates: The most points of a series to update individually,
+          before replacing its data instead. Defaults to ``10``.
+        :type max_point_updates: :class:`int <python:int>`
+
+        :param careful_validation: if ``True``, will carefully validate JavaScript values
+          along the way using the
+          `esprima-python <https://github.com/Kronuz/esprima-python>`__ library. Defaults
+          to ``False``.
+        :type careful_validation: :class:`bool <python:bool>`
+
+        :rtype: :class:`ChartDiff <highcharts_maps.utility_classes.chart_diffs.ChartDiff>`
+        """
+        return ChartDiff(self,
+                         other,
+                         max_point_updates = max_point_updates,
+                         careful_validation = careful_validation)
 
     def download_chart(self,
                        format = 'png',
@@ -379,6 +649,13 @@ class Chart(ChartBase):
           instance to use to programmatically produce the exported chart. Defaults to
           :obj:`None <python:None>`, which causes Highcharts for Python to instantiate
           a new :class:`ExportServer` instance.
+
+          .. hint::
+
+            To render charts without a remote :term:`Export Server`, supply a
+            :class:`LocalExportServer <highcharts_maps.headless_export.LocalExportServer>`,
+            which renders them using a pool of warm workers on the local machine.
+
         :type server_instance: :class:`ExportServer` or :obj:`None <python:None>`
 
         .. note::
@@ -419,6 +696,70 @@ class Chart(ChartBase):
                                              constructor = constructor,
                                              **kwargs)
 
+    async def adownload_chart(self,
+                              format = 'png',
+                              scale = 1,
+                              width = None,
+                              filename = None,
+                              auth_user = None,
+                              auth_password = None,
+                              timeout = 0.5,
+                              server_instance = None,
+                              client = None,
+                              **kwargs):
+        """Asynchronously export a downloaded form of the chart using a Highcharts
+        :term:`Export Server`, without blocking the running event loop.
+
+        This is the :mod:`asyncio` counterpart to
+        :meth:`.download_chart() <highcharts_maps.chart.Chart.download_chart>`, and
+        accepts the same arguments.
+
+        :param client: The client whose pooled connections and concurrency limit should
+          be used. Defaults to :obj:`None <python:None>`, which uses the client shared
+          across the process (see
+          :meth:`AsyncExportClient.get_shared() <highcharts_maps.headless_export.AsyncExportClient.get_shared>`).
+        :type client: :class:`AsyncExportClient <highcharts_maps.headless_export.AsyncExportClient>`
+          or :obj:`None <python:None>`
+
+        .. note::
+
+          All other arguments are as per
+          :meth:`.download_chart() <highcharts_maps.chart.Chart.download_chart>`.
+
+        :returns: The exported chart image, either as a :class:`bytes <python:bytes>`
+          binary object or as a base-64 encoded string (depending on the ``use_base64``
+          keyword argument).
+        :rtype: :class:`bytes <python:bytes>` or :class:`str <python:str>`
+        """
+        if client is None:
+            client = AsyncExportClient.get_shared()
+        elif not isinstance(client, AsyncExportClient):
+            raise errors.HighchartsValueError(f'client is expected to be an '
+                                              f'AsyncExportClient instance. Was: '
+                                              f'{client.__class__.__name__}')
+
+        if filename:
+            filename = validators.path(filename)
+        if server_instance is None:
+            kwargs['scale'] = scale
+            kwargs['width'] = width
+            kwargs['format_'] = kwargs.get('format_', format)
+
+        result = await client.request_chart(self,
+                                            server_instance = server_instance,
+                                            timeout = timeout,
+                                            auth_user = auth_user,
+                                            auth_password = auth_password,
+                                            **kwargs)
+        if filename:
+            server = server_instance or client.server_instance
+            await asyncio.to_thread(ExportServer._write_export,
+                                    filename,
+                                    result,
+                                    server._copy_with(kwargs).format_)
+
+        return result
+
     def add_series(self, *series):
         """Adds ``series`` to the
         :meth:`Chart.options.series <highcharts_core.options.HighchartsOptions.series>`
@@ -1028,6 +1369,7 @@ class Chart(ChartBase):
                        chart_kwargs = None,
                        series_in_rows = False,
                        series_index = None,
+                       reproject = None,
                        **kwargs):
         """Create a :class:`Chart <highcharts_core.chart.Chart>` instance whose
         data is populated from a `geopandas <https://geopandas.org/>`__
@@ -1097,6 +1439,18 @@ class Chart(ChartBase):
         :type series_index: :class:`int <python:int>`, slice, or 
           :obj:`None <python:None>`
 
+        :param reproject: An optional target coordinate reference system (e.g.
+          ``'EPSG:5070'``) into which the map geometries are transformed server-side,
+          or a callable which transforms them. Defaults to :obj:`None <python:None>`,
+          which leaves coordinates as-is.
+
+          .. seealso::
+
+            * :meth:`MapData.from_geodataframe() <highcharts_maps.options.series.data.map_data.MapData.from_geodataframe>`
+
+        :type reproject: :class:`str <python:str>`, :class:`int <python:int>`,
+          callable, or :obj:`None <python:None>`
+
         :param **kwargs: Additional keyword arguments that are - in turn - propagated to 
           the series created from the ``gdf``.
 
@@ -1154,7 +1508,8 @@ class Chart(ChartBase):
         if not options.chart:
             options.chart = ChartOptions()
 
-        options.chart.map = MapData.from_geodataframe(as_gdf = gdf)
+        options.chart.map = MapData.from_geodataframe(as_gdf = gdf,
+                                                      reproject = reproject)
 
         instance = cls(**chart_kwargs)
         instance.options = options
@@ -1458,3 +1813,251 @@ class Chart(ChartBase):
             self.options.map_view.projection = ProjectionOptions()
 
         self.options.map_view.projection.custom = projection
+
+    def pre_project(self, projection = None, precision = None):
+        """Projects the chart's :term:`map geometries <map geometry>` and the ``lat`` /
+        ``lon`` of its data points in Python, and configures the chart to render them
+        as-is (i.e. without a client-side :term:`projection`).
+
+        Pre-projecting a chart spares the browser from projecting every map area and
+        point on each render, which can make a material difference on slow client
+        devices.
+
+        .. note::
+
+          Only :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>`
+          geometries are projected. Geometries that are loaded client-side (e.g.
+          :class:`AsyncMapData <highcharts_maps.options.series.data.map_data.AsyncMapData>`)
+          are left unchanged, as are coordinates supplied other than through data points'
+          ``lat`` and ``lon``.
+
+        .. seealso::
+
+          * :meth:`ProjectionOptions.project_map_data() <highcharts_maps.utility_classes.projections.ProjectionOptions.project_map_data>`
+          * :meth:`ProjectionOptions.project_data_points() <highcharts_maps.utility_classes.projections.ProjectionOptions.project_data_points>`
+
+        :param projection: The :term:`projection` to apply. If
+          :obj:`None <python:None>`, applies the chart's
+          ``options.map_view.projection``. Defaults to :obj:`None <python:None>`.
+        :type projection: :class:`ProjectionOptions <highcharts_maps.utility_classes.projections.ProjectionOptions>`
+          or :obj:`None <python:None>`
+
+        :param precision: If supplied, the number of decimal places to which the
+          projected coordinates of map geometries are rounded. Defaults to
+          :obj:`None <python:None>`, which does not round.
+        :type precision: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :raises HighchartsValueError: if no named :term:`projection` is available, or if
+          it cannot be applied in Python
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          available in the runtime environment
+        """
+        if projection is None and self.options and self.options.map_view:
+            projection = self.options.map_view.projection
+        projection = validate_types(projection, ProjectionOptions)
+        if not projection or not projection.name:
+            raise errors.HighchartsValueError('pre_project() requires a named '
+                                              'projection to apply')
+
+        if not self.options:
+            self.options = HighchartsMapsOptions()
+
+        if self.options.chart and isinstance(self.options.chart.map, MapData):
+            self.options.chart.map = projection.project_map_data(self.options.chart.map,
+                                                                 precision = precision)
+
+        for series in self.options.series or []:
+            map_data = getattr(series, 'map_data', None)
+            if isinstance(map_data, MapData):
+                series.map_data = projection.project_map_data(map_data,
+                                                              precision = precision)
+            elif checkers.is_iterable(map_data, forbid_literals = (str, bytes, dict)):
+                series.map_data = [projection.project_map_data(x, precision = precision)
+                                   if isinstance(x, MapData) else x
+                                   for x in map_data]
+
+            data = getattr(series, 'data', None)
+            if data is not None and not isinstance(data, (str, bytes)) and \
+               any(getattr(x, 'lat', None) is not None for x in data):
+                series.data = projection.project_data_points(data)
+
+        if not self.options.map_view:
+            self.options.map_view = MapViewOptions()
+
+        if self.options.map_view.center:
+            x, y = projection.forward([self.options.map_view.center[0]],
+                                      [self.options.map_view.center[1]])
+            if x[0] == x[0] and y[0] == y[0]:
+                self.options.map_view.center = [float(x[0]), float(y[0])]
+            else:
+                self.options.map_view.center = None
+
+        self.options.map_view.projection = None
+
+    def add_drilldown_maps(self,
+                           map_data,
+                           parent_key,
+                           directory,
+                           base_url,
+                           series = 0,
+                           drilldown_series = None,
+                           object_name = None,
+                           filename_template = '{hash}.topo.json'):
+        """Configure the chart to drill down from the data points of one of its series
+        into child maps whose :term:`map geometry` is fetched only when the user drills
+        into them.
+
+        The detailed ``map_data`` (e.g. the counties of a country) is split into one
+        child map per parent data point (e.g. per state), each written to a
+        content-hashed :term:`TopoJSON` asset in ``directory`` (see
+        :meth:`MapSeriesBase.set_drilldown_maps() <highcharts_maps.options.series.base.MapSeriesBase.set_drilldown_maps>`).
+        The chart's ``chart.events.drilldown`` is then set to a callback which fetches
+        the child map of the data point clicked and adds it as a drilldown series, so
+        that the initial payload holds only the parent series' map geometry.
+
+        .. note::
+
+          Child maps are fetched client-side on demand rather than listed in
+          ``drilldown.series``, since Highcharts requires the
+          :term:`map geometry` of a series supplied in ``drilldown.series`` to be
+          available when the chart is rendered. Any ``chart.events.drilldown`` callback
+          already configured is replaced.
+
+        :param map_data: The detailed :term:`map geometry` to split.
+        :type map_data: :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>`
+
+        :param parent_key: The name of the feature property holding the key of each
+          feature's parent data point, or a callable which receives a feature's
+          properties and returns that key.
+        :type parent_key: :class:`str <python:str>` or callable
+
+        :param directory: The directory to write the assets to. Created if it does not
+          exist.
+        :type directory: Path-like
+
+        :param base_url: The URL from which the files in ``directory`` are served.
+        :type base_url: :class:`str <python:str>`
+
+        :param series: The index or ``id`` of the series whose data points are drilled
+          from. Defaults to ``0``.
+        :type series: :class:`int <python:int>` or :class:`str <python:str>`
+
+        :param drilldown_series: The options applied to each drilldown series (e.g. its
+          ``data``, ``join_by``, or ``data_labels``), either as a single template applied
+          to all of them or as a :class:`dict <python:dict>` keyed by drilldown id. Any
+          ``map_data`` it holds is ignored. Defaults to :obj:`None <python:None>`, which
+          names each drilldown series after the data point drilled from.
+        :type drilldown_series: :class:`MapSeries <highcharts_maps.options.series.map.MapSeries>`,
+          :class:`dict <python:dict>`, or :obj:`None <python:None>`
+
+        :param object_name: The name(s) of the objects within ``map_data`` to split.
+          Defaults to :obj:`None <python:None>`, which splits all of them.
+        :type object_name: :class:`str <python:str>`, iterable of
+          :class:`str <python:str>`, or :obj:`None <python:None>`
+
+        :param filename_template: The name of each asset, with ``{hash}`` replaced by the
+          hash of its content. Defaults to ``'{hash}.topo.json'``.
+        :type filename_template: :class:`str <python:str>`
+
+        :returns: The child map of each parent, keyed by drilldown id.
+        :rtype: :class:`dict <python:dict>` of
+          :class:`AsyncMapData <highcharts_maps.options.series.data.map_data.AsyncMapData>`
+
+        :raises HighchartsValueError: if ``series`` does not identify one of the chart's
+          series
+        """
+        all_series = (self.options.series or []) if self.options else []
+        if checkers.is_integer(series) and not isinstance(series, bool) and \
+           -len(all_series) <= series < len(all_series):
+            target = all_series[series]
+        else:
+            target = [x for x in all_series if series is not None and x.id == series]
+            target = target[0] if target else None
+        if target is None or not hasattr(target, 'set_drilldown_maps'):
+            raise errors.HighchartsValueError(f'series expects the index or id of one '
+                                              f'of the chart\'s map series. Received: '
+                                              f'{series}')
+
+        children = target.set_drilldown_maps(map_data,
+                                             parent_key,
+                                             directory,
+                                             base_url,
+                                             object_name = object_name,
+                                             filename_template = filename_template)
+
+        if isinstance(drilldown_series, dict) and \
+           drilldown_series and \
+           all(x in children for x in drilldown_series):
+            templates = {str(key): validate_types(value, MapSeries)
+                         for key, value in drilldown_series.items()}
+            default = None
+        else:
+            templates = {}
+            default = validate_types(drilldown_series, MapSeries)
+
+        callback = self._get_drilldown_maps_callback(children, templates, default)
+        if not self.options.chart:
+            self.options.chart = ChartOptions()
+        if self.options.chart.events:
+            self.options.chart.events.drilldown = callback
+        else:
+            self.options.chart.events = {'drilldown': callback}
+
+        return children
+
+    @staticmethod
+    def _get_drilldown_maps_callback(children, templates, default = None):
+        """Return the JavaScript callback function which, assigned to
+        ``chart.events.drilldown``, fetches the child map of the data point drilled into
+        and adds it as a drilldown series.
+
+        :rtype: :class:`CallbackFunction <highcharts_maps.utility_classes.javascript_functions.CallbackFunction>`
+        """
+        def to_options(template):
+            if template is None:
+                return '{}'
+            template = template.copy()
+            template.map_data = None
+            return template.to_js_literal()
+
+        loaders = []
+        for key, child in children.items():
+            fetch_config = child.fetch_config or FetchConfiguration(child.url)
+            fetch_config.url = child.url
+            loader = f'{str(fetch_config)}.then(function (response) {{ return response.json(); }})'
+            if child.selector:
+                loader += f'.then({str(child.selector)})'
+            loaders.append(f'{json.dumps(key)}: function () {{ return {loader}; }}')
+
+        options = [f'{json.dumps(key)}: {to_options(value)}'
+                   for key, value in templates.items()]
+
+        loaders_as_str = ',\n        '.join(loaders)
+        options_as_str = ',\n        '.join(options)
+        function_body = f"""var chart = this,
+    loaders = {{
+        {loaders_as_str}
+    }},
+    options = {{
+        {options_as_str}
+    }},
+    template = {to_options(default)},
+    drilldown = e.point ? e.point.drilldown : undefined;
+if (e.seriesOptions || !loaders[drilldown]) {{
+    return;
+}}
+chart.showLoading();
+loaders[drilldown]().then(function (topology) {{
+    chart.hideLoading();
+    chart.addSeriesAsDrilldown(e.point, Object.assign({{
+        id: drilldown,
+        name: e.point.name
+    }}, template, options[drilldown] || {{}}, {{ mapData: topology }}));
+}});"""
+
+        return CallbackFunction(arguments = ['e'], body = function_body)
+
+
+# Pickle the options classes imported above with only the properties that have been
+# set.
+register_pickling()
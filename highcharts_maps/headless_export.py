@@ -4,15 +4,34 @@ try:
 except ImportError:
     pass
 
+import asyncio
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import json
+import os
+import shlex
+import socket
+import subprocess
+import threading
+import time
+import weakref
 from typing import Optional
 
-from validator_collection import checkers
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from validator_collection import validators, checkers
 
 from highcharts_core.headless_export import ExportServer as ExportServerBase
 
+from highcharts_maps import errors, utility_functions
 from highcharts_maps.decorators import validate_types
 from highcharts_maps.options import HighchartsOptions, HighchartsMapsOptions
 from highcharts_maps.global_options.shared_options import SharedOptions, SharedMapsOptions
+from highcharts_maps.options.series.data.map_data import MapData
+from highcharts_maps.utility_classes.export_cache import ExportCacheBase
 
 
 class ExportServer(ExportServerBase):
@@ -29,11 +48,95 @@ class ExportServer(ExportServerBase):
       the ``HIGHCHARTS_EXPORT_SERVER_DOMAIN`, ``HIGHCHARTS_EXPORT_SERVER_PORT``, or
       ``HIGHCHARTS_EXPORT_SERVER_PATH`` environment variables.
 
+    .. hint::
+
+      Supplying a :meth:`cache <ExportServer.cache>` allows repeated exports of an
+      identical chart to be served without contacting the :term:`Export Server`.
+
+    .. hint::
+
+      When exporting many charts that render the same map, enabling
+      :meth:`share_map_data <ExportServer.share_map_data>` serializes each
+      :term:`map geometry` once and references it by key in each chart's options.
+
     """
 
     def __init__(self, **kwargs):
+        self._cache = None
+        self._share_map_data = False
+        self._map_data_directory = None
+
         super().__init__(**kwargs)
 
+        self.cache = kwargs.get('cache', None)
+        self.share_map_data = kwargs.get('share_map_data', False)
+        self.map_data_directory = kwargs.get('map_data_directory', None)
+
+    @property
+    def cache(self) -> Optional[ExportCacheBase]:
+        """The cache of exported chart images consulted before issuing a request to the
+        :term:`Export Server`. Defaults to :obj:`None <python:None>`, which sends every
+        request to the :term:`Export Server`.
+
+        .. seealso::
+
+          * :class:`MemoryExportCache <highcharts_maps.utility_classes.export_cache.MemoryExportCache>`
+          * :class:`DirectoryExportCache <highcharts_maps.utility_classes.export_cache.DirectoryExportCache>`
+
+        :rtype: :class:`ExportCacheBase <highcharts_maps.utility_classes.export_cache.ExportCacheBase>`
+          or :obj:`None <python:None>`
+        """
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        if value is None:
+            self._cache = None
+        elif not isinstance(value, ExportCacheBase):
+            raise errors.HighchartsValueError(f'cache expects an ExportCacheBase '
+                                              f'instance. Received: '
+                                              f'{value.__class__.__name__}')
+        else:
+            self._cache = value
+
+    @property
+    def share_map_data(self) -> bool:
+        """If ``True``, each :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>`
+        used as the chart's :meth:`map <highcharts_maps.options.chart.ChartOptions.map>`
+        or a series' ``map_data`` is registered in the (JavaScript) ``Highcharts.maps``
+        collection by a script supplied in the request's
+        :meth:`resources <ExportServer.resources>`, and referenced by its key in the
+        chart's options. Defaults to ``False``.
+
+        Each :term:`map geometry` is then serialized only once per request, and only
+        once per batch in :meth:`.export_many() <ExportServer.export_many>`. If
+        :meth:`map_data_directory <ExportServer.map_data_directory>` is also set, the
+        script is written to a file there once and the request only carries its
+        file name.
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        return self._share_map_data
+
+    @share_map_data.setter
+    def share_map_data(self, value):
+        self._share_map_data = bool(value)
+
+    @property
+    def map_data_directory(self) -> Optional[str]:
+        """A directory, readable by a self-hosted :term:`Export Server` at the same
+        path, to which the scripts registering shared :term:`map geometries <map geometry>`
+        are written (see :meth:`share_map_data <ExportServer.share_map_data>`). Defaults
+        to :obj:`None <python:None>`, which includes the scripts in each request.
+
+        :rtype: Path-like or :obj:`None <python:None>`
+        """
+        return self._map_data_directory
+
+    @map_data_directory.setter
+    def map_data_directory(self, value):
+        self._map_data_directory = validators.path(value, allow_empty = True)
+
     @property
     def options(self) -> Optional[HighchartsOptions | HighchartsMapsOptions]:
         """The :class:`HighchartsOptions` which should be applied to render the exported
@@ -84,3 +187,971 @@ class ExportServer(ExportServerBase):
                 self._global_options = validate_types(value, SharedMapsOptions)
             else:
                 self._global_options = validate_types(value, SharedOptions)
+
+    def _get_shared_map_data(self, map_data, registry):
+        """Return the key under which ``map_data`` is registered in the (JavaScript)
+        ``Highcharts.maps`` collection, along with the resource which registers it.
+
+        :param registry: The keys and resources of the map data already shared in the
+          batch, by the :func:`id <python:id>` of each instance.
+        :type registry: :class:`dict <python:dict>`
+
+        :returns: The key and either the script or (if
+          :meth:`map_data_directory <ExportServer.map_data_directory>` is set) the name
+          of the file holding it.
+        :rtype: :class:`tuple <python:tuple>` of :class:`str <python:str>`
+        """
+        if id(map_data) in registry:
+            return registry[id(map_data)][1:]
+
+        as_json = map_data.to_json()
+        if isinstance(as_json, bytes):
+            as_json = str(as_json, encoding = 'utf-8')
+
+        key = 'hcmap-' + hashlib.sha1(as_json.encode('utf-8')).hexdigest()[:16]
+        script = f'Highcharts.maps[{json.dumps(key)}] = {as_json};'
+        if self.map_data_directory:
+            os.makedirs(self.map_data_directory, exist_ok = True)
+            filename = os.path.abspath(os.path.join(self.map_data_directory,
+                                                    f'{key}.js'))
+            if not os.path.exists(filename):
+                with open(filename, 'w', encoding = 'utf-8') as file_:
+                    file_.write(script)
+            script = filename
+
+        # The instance is held so that its id is not re-used within the batch.
+        registry[id(map_data)] = (map_data, key, script)
+
+        return key, script
+
+    def _hoist_map_data(self, options, registry):
+        """Return a copy of ``options`` in which the chart's map and each series'
+        map data are replaced by their keys in the (JavaScript) ``Highcharts.maps``
+        collection, along with the resources which register them. ``options`` itself is
+        not modified.
+
+        :rtype: :class:`tuple <python:tuple>` of :class:`HighchartsMapsOptions` and
+          :class:`list <python:list>`
+        """
+        resources = []
+        options = utility_functions.shallow_copy(options)
+        if options.chart and isinstance(getattr(options.chart, 'map', None), MapData):
+            key, resource = self._get_shared_map_data(options.chart.map, registry)
+            options._chart = utility_functions.shallow_copy(options.chart)
+            options._chart._map = key
+            resources.append(resource)
+        if options.series:
+            series = []
+            for item in options.series:
+                map_data = getattr(item, 'map_data', None)
+                if isinstance(map_data, MapData):
+                    key, resource = self._get_shared_map_data(map_data, registry)
+                    item = utility_functions.shallow_copy(item)
+                    item._map_data = key
+                    if resource not in resources:
+                        resources.append(resource)
+                series.append(item)
+            options._series = series
+
+        return options, resources
+
+    def _get_request_body(self, map_data_registry = None) -> str:
+        """Return the JSON body of the request to the :term:`Export Server` that exports
+        the chart configured in the instance.
+
+        :param map_data_registry: The map data already shared in the batch (see
+          :meth:`share_map_data <ExportServer.share_map_data>`). Defaults to
+          :obj:`None <python:None>`, which shares map data within this request only.
+        :type map_data_registry: :class:`dict <python:dict>` or
+          :obj:`None <python:None>`
+
+        :rtype: :class:`str <python:str>`
+
+        :raises HighchartsMissingExportSettingsError: if the instance is missing
+          settings required to export a chart
+        :raises HighchartsUnsupportedExportError: if the chart cannot be exported by the
+          :term:`Export Server`
+        """
+        missing_details = []
+        if not self.options:
+            missing_details.append('options')
+        if not self.format_:
+            missing_details.append('format_')
+        if not self.constructor:
+            missing_details.append('constructor')
+        if not self.url:
+            missing_details.append('url')
+
+        if missing_details:
+            raise errors.HighchartsMissingExportSettingsError(
+                f'Unable to export a chart. ExportServer was missing the following '
+                f'settings: {missing_details}'
+            )
+
+        if not self.is_export_supported(self.options):
+            raise errors.HighchartsUnsupportedExportError(
+                'The Highcharts Export Server does not support exporting one or more of '
+                'the series types used in the chart.'
+            )
+
+        payload = {
+            'infile': 'HIGHCHARTS FOR PYTHON: REPLACE WITH OPTIONS',
+            'type': self.format_,
+            'scale': self.scale,
+            'constr': self.constructor,
+            'b64': self.use_base64,
+            'noDownload': self.no_download,
+        }
+        if self.width:
+            payload['width'] = self.width
+        if self.height:
+            payload['height'] = self.height
+
+        options = self.options
+        resources = self.resources
+        if self.share_map_data:
+            if map_data_registry is None:
+                map_data_registry = {}
+            options, map_resources = self._hoist_map_data(options, map_data_registry)
+            if map_resources:
+                resources = dict(resources or {})
+                if self.map_data_directory:
+                    resources['files'] = list(resources.get('files', None) or []) + \
+                                         map_resources
+                else:
+                    resources['js'] = '\n'.join(map_resources +
+                                                 [resources.get('js', None) or ''])
+
+        replacements = [('OPTIONS', options)]
+        if self.callback:
+            payload['callback'] = 'HIGHCHARTS FOR PYTHON: REPLACE WITH CALLBACK'
+            replacements.append(('CALLBACK', self.callback))
+        if self.global_options:
+            payload['globalOptions'] = 'HIGHCHARTS FOR PYTHON: REPLACE WITH GLOBAL'
+            replacements.append(('GLOBAL', self.global_options))
+        if self.data_options:
+            payload['dataOptions'] = 'HIGHCHARTS FOR PYTHON: REPLACE WITH DATA'
+            replacements.append(('DATA', self.data_options))
+        if self.custom_code:
+            payload['customCode'] = 'HIGHCHARTS FOR PYTHON: REPLACE WITH CUSTOM'
+            replacements.append(('CUSTOM', self.custom_code))
+        if resources:
+            payload['resources'] = resources
+
+        as_json = json.dumps(payload)
+        for placeholder, value in replacements:
+            value_as_json = value.to_json(for_export = True)
+            if isinstance(value_as_json, bytes):
+                value_as_json = str(value_as_json, encoding = 'utf-8')
+            as_json = as_json.replace(f'"HIGHCHARTS FOR PYTHON: REPLACE WITH '
+                                      f'{placeholder}"',
+                                      value_as_json)
+
+        return as_json
+
+    def _get_request_headers(self) -> dict:
+        """Return the HTTP headers of a request to the :term:`Export Server`.
+
+        :rtype: :class:`dict <python:dict>`
+        """
+        return {
+            'Content-Type': 'application/json',
+            'Origin': self.referer,
+            'Referer': self.referer,
+            'User-Agent': self.user_agent,
+        }
+
+    def _configure(self, kwargs):
+        """Apply the export settings supplied in ``kwargs`` to the instance, as
+        :meth:`.request_chart() <ExportServer.request_chart>` does."""
+        for key in ['options', 'format_', 'scale', 'width', 'height', 'callback',
+                    'constructor', 'use_base64', 'no_download', 'async_rendering',
+                    'global_options', 'data_options', 'custom_code', 'cache',
+                    'share_map_data', 'map_data_directory']:
+            if key in kwargs:
+                setattr(self, key, kwargs[key])
+        if 'type' in kwargs and 'format_' not in kwargs:
+            self.format_ = kwargs['type']
+
+    def _copy_with(self, kwargs):
+        """Return a shallow copy of the instance with the export settings supplied in
+        ``kwargs`` applied, leaving the instance itself unchanged.
+
+        :rtype: :class:`ExportServer`
+        """
+        result = copy.copy(self)
+        result._configure(kwargs)
+
+        return result
+
+    def _get_cache_key(self, request_body) -> str:
+        """Return the key under which the chart exported by ``request_body`` is held in
+        the :meth:`.cache <ExportServer.cache>`.
+
+        :rtype: :class:`str <python:str>`
+        """
+        try:
+            return self.cache.get_key(request_body)
+        except ValueError:
+            # Callbacks and custom code are serialized as JavaScript, which cannot be
+            # parsed as JSON, so the body is hashed as-is.
+            return hashlib.sha256(request_body.encode('utf-8')).hexdigest()
+
+    def request_chart(self,
+                      filename = None,
+                      auth_user = None,
+                      auth_password = None,
+                      timeout = 3,
+                      **kwargs):
+        """Execute a request against the export server based on the configuration in the
+        instance.
+
+        If a :meth:`cache <ExportServer.cache>` is configured, the exported chart is
+        returned from the cache when available and stored in it otherwise.
+
+        :param filename: The name of the file where the exported chart should (optionally)
+          be persisted. Defaults to :obj:`None <python:None>`.
+        :type filename: Path-like or :obj:`None <python:None>`
+
+        :param auth_user: The username to use to authenticate against the
+          Export Server, using :term:`basic authentication`. Defaults to
+          :obj:`None <python:None>`.
+        :type auth_user: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param auth_password: The password to use to authenticate against the Export
+          Server (using :term:`basic authentication`). Defaults to
+          :obj:`None <python:None>`.
+        :type auth_password: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param timeout: The number of seconds to wait before issuing a timeout error.
+          The timeout check is passed if bytes have been received on the socket in less
+          than the ``timeout`` value. Defaults to ``3``.
+        :type timeout: numeric or :obj:`None <python:None>`
+
+        .. note::
+
+          All other keyword arguments are as per the :class:`ExportServer` constructor
+          :meth:`ExportServer.__init__() <highcharts_core.headless_export.ExportServer.__init__>`
+
+        :returns: The exported chart image, either as a :class:`bytes <python:bytes>`
+          binary object or as a base-64 encoded string (depending on the
+          :meth:`use_base64 <ExportServer.use_base64>` property).
+        :rtype: :class:`bytes <python:bytes>` or :class:`str <python:str>`
+        """
+        self._configure(kwargs)
+
+        basic_auth = None
+        if auth_user and auth_password:
+            basic_auth = HTTPBasicAuth(auth_user, auth_password)
+
+        result = self._send(requests,
+                            None,
+                            auth = basic_auth,
+                            timeout = timeout,
+                            set_constructor = False)
+        if filename:
+            self._write_export(filename, result, self.format_)
+
+        return result
+
+    @staticmethod
+    def _get_session(max_connections):
+        """Return a :class:`requests.Session` which keeps up to ``max_connections``
+        persistent connections open to each host.
+
+        :rtype: :class:`requests.Session`
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections = 1, pool_maxsize = max_connections)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        return session
+
+    @staticmethod
+    def _write_export(filename, content, format_):
+        """Write the exported chart ``content`` to ``filename``, decoding it if it is an
+        SVG image."""
+        if format_ and 'svg' in format_:
+            content = str(content, encoding = 'utf-8').replace('\u200b', ' ')
+            with open(filename, 'wt') as file_:
+                file_.write(content)
+        else:
+            with open(filename, 'wb') as file_:
+                file_.write(content)
+
+    def _send(self,
+              session,
+              chart,
+              filename = None,
+              auth = None,
+              timeout = 3,
+              chunk_size = 65536,
+              set_constructor = True,
+              map_data_registry = None):
+        """Export ``chart`` using the instance's configuration, issuing the request
+        through ``session``.
+
+        :param chart: The chart to export, either a
+          :class:`Chart <highcharts_maps.chart.Chart>` or the options to render. If
+          :obj:`None <python:None>`, exports the instance's
+          :meth:`.options <ExportServer.options>`.
+
+        :param set_constructor: If ``True``, applies the constructor that corresponds to
+          ``chart`` when it is a :class:`Chart <highcharts_maps.chart.Chart>`.
+        :type set_constructor: :class:`bool <python:bool>`
+
+        :param map_data_registry: The map data already shared in the batch, as per
+          :meth:`._get_request_body() <ExportServer._get_request_body>`.
+        :type map_data_registry: :class:`dict <python:dict>` or
+          :obj:`None <python:None>`
+
+        :returns: The name of the file the exported chart was written to (if ``filename``
+          is supplied) or the exported chart image.
+        :rtype: Path-like, :class:`bytes <python:bytes>` or :class:`str <python:str>`
+        """
+        item = copy.copy(self)
+        if checkers.is_type(chart, 'Chart'):
+            item.options = chart.options
+            if set_constructor:
+                item.constructor = 'Map' if chart.is_maps_chart else 'Chart'
+        elif chart is not None:
+            item.options = chart
+
+        request_body = item._get_request_body(map_data_registry)
+        key = None
+        if item.cache:
+            key = item._get_cache_key(request_body)
+            content = item.cache.get(key)
+            if content is not None:
+                if not filename:
+                    return content
+                self._write_export(filename, content, item.format_)
+                return filename
+
+        with session.post(item.url,
+                          data = request_body.encode('utf-8'),
+                          headers = item._get_request_headers(),
+                          auth = auth,
+                          timeout = timeout,
+                          stream = True) as response:
+            if not response.ok:
+                # Read the body so that the connection is returned to the pool.
+                response.content
+                response.raise_for_status()
+            if key is not None:
+                item.cache.set(key, response.content)
+            if not filename:
+                return response.content
+
+            if key is not None or 'svg' in item.format_:
+                self._write_export(filename, response.content, item.format_)
+            else:
+                with open(filename, 'wb') as file_:
+                    for chunk in response.iter_content(chunk_size = chunk_size):
+                        file_.write(chunk)
+
+        return filename
+
+    def export_many(self,
+                    charts,
+                    filenames = None,
+                    max_workers = 4,
+                    auth_user = None,
+                    auth_password = None,
+                    timeout = 3,
+                    session = None,
+                    chunk_size = 65536,
+                    **kwargs) -> list:
+        """Export a batch of charts using the :term:`Export Server`, issuing up to
+        ``max_workers`` requests concurrently over a shared pool of persistent HTTP
+        connections.
+
+        Each chart is exported using the instance's configuration (as modified by
+        ``kwargs``), and the results are returned in the order of ``charts``. A chart
+        which fails to export does not abort the batch: its result is the exception
+        raised instead.
+
+        .. note::
+
+          The instance itself is not modified, so it can safely be re-used across
+          batches (e.g. as the ``server_instance`` of
+          :meth:`Chart.download_chart() <highcharts_maps.chart.Chart.download_chart>`).
+
+        :param charts: The charts to export, each either a
+          :class:`Chart <highcharts_maps.chart.Chart>` or the options to render (as
+          :class:`HighchartsMapsOptions`, :class:`HighchartsOptions`, or a
+          :class:`dict <python:dict>`).
+        :type charts: iterable
+
+        :param filenames: The name of the file to which each exported chart should be
+          written, streamed to disk as it is received. Defaults to
+          :obj:`None <python:None>`, which returns the exported charts in memory instead.
+        :type filenames: iterable of Path-like or :obj:`None <python:None>`
+
+        :param max_workers: The maximum number of requests to issue concurrently, which
+          is also the number of HTTP connections kept open. Defaults to ``4``.
+        :type max_workers: :class:`int <python:int>`
+
+        :param auth_user: The username to use to authenticate against the
+          Export Server, using :term:`basic authentication`. Defaults to
+          :obj:`None <python:None>`.
+        :type auth_user: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param auth_password: The password to use to authenticate against the Export
+          Server (using :term:`basic authentication`). Defaults to
+          :obj:`None <python:None>`.
+        :type auth_password: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param timeout: The number of seconds to wait before issuing a timeout error
+          for each request. Defaults to ``3``.
+        :type timeout: numeric or :obj:`None <python:None>`
+
+        :param session: An existing :class:`requests.Session` whose connections should
+          be used. Defaults to :obj:`None <python:None>`, which opens (and closes) a
+          session sized to ``max_workers`` for the batch.
+        :type session: :class:`requests.Session` or :obj:`None <python:None>`
+
+        :param chunk_size: The number of bytes written to disk at a time when streaming
+          exported charts to ``filenames``. Defaults to ``65536``.
+        :type chunk_size: :class:`int <python:int>`
+
+        .. note::
+
+          All other keyword arguments are as per the :class:`ExportServer` constructor
+          :meth:`ExportServer.__init__() <highcharts_core.headless_export.ExportServer.__init__>`
+          and are applied to every chart in the batch.
+
+        :returns: For each chart, the name of the file it was written to (if
+          ``filenames`` is supplied) or the exported chart image (as per
+          :meth:`.request_chart() <ExportServer.request_chart>`), or the exception raised
+          while exporting it.
+        :rtype: :class:`list <python:list>`
+
+        :raises HighchartsValueError: if ``filenames`` does not supply one file name per
+          chart
+        """
+        charts = [x for x in validators.iterable(charts, allow_empty = True) or []]
+        if filenames is not None:
+            filenames = validators.iterable(filenames, allow_empty = True) or []
+            filenames = [validators.path(x) for x in filenames]
+            if len(filenames) != len(charts):
+                raise errors.HighchartsValueError(f'filenames expects one file name '
+                                                  f'for each of the {len(charts)} '
+                                                  f'charts. Received: '
+                                                  f'{len(filenames)}')
+        max_workers = validators.integer(max_workers, minimum = 1)
+        chunk_size = validators.integer(chunk_size, minimum = 1)
+
+        template = self._copy_with(kwargs)
+        set_constructor = 'constructor' not in kwargs
+
+        owns_session = session is None
+        if owns_session:
+            session = self._get_session(max_workers)
+
+        basic_auth = None
+        if auth_user and auth_password:
+            basic_auth = HTTPBasicAuth(auth_user, auth_password)
+
+        map_data_registry = {}
+
+        def export_chart(index):
+            try:
+                return template._send(session,
+                                      charts[index],
+                                      filename = filenames[index] if filenames else None,
+                                      auth = basic_auth,
+                                      timeout = timeout,
+                                      chunk_size = chunk_size,
+                                      set_constructor = set_constructor,
+                                      map_data_registry = map_data_registry)
+            except Exception as error:
+                return error
+
+        try:
+            if max_workers == 1:
+                return [export_chart(x) for x in range(len(charts))]
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+                return list(executor.map(export_chart, range(len(charts))))
+        finally:
+            if owns_session:
+                session.close()
+
+
+def _stop_process(state):
+    """Stop the export server process held in ``state`` (if it is running)."""
+    process = state.get('process', None)
+    state['process'] = None
+    if process is None or process.poll() is not None:
+        return
+
+    process.terminate()
+    try:
+        process.wait(timeout = 5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+class LocalExportServer(ExportServer):
+    """:class:`ExportServer` which renders charts using a
+    `Highcharts Export Server <https://github.com/highcharts/node-export-server>`__
+    process that it runs on the local machine, for use where a remote
+    :term:`Export Server` is unavailable (e.g. in air-gapped batch jobs) or its network
+    latency is undesirable.
+
+    The process is started when the first chart is exported, and keeps a pool of
+    :meth:`workers <LocalExportServer.workers>` (each a headless browser with the
+    Highcharts scripts, including Highcharts Maps, already loaded) warm for subsequent
+    exports. It is stopped by :meth:`.close() <LocalExportServer.close>`, when the
+    instance is used as a context manager, or when the instance is garbage collected.
+
+    .. code-block:: python
+
+      with LocalExportServer(workers = 4) as server:
+          for chart in charts:
+              chart.download_chart(server_instance = server)
+
+    .. note::
+
+      Requires the Highcharts Export Server, which can be installed using:
+
+      .. code-block:: bash
+
+        npm install -g highcharts-export-server
+
+    """
+
+    def __init__(self, **kwargs):
+        self._command = None
+        self._arguments = None
+        self._workers = None
+        self._startup_timeout = None
+        self._state = {'process': None, 'lock': threading.Lock()}
+
+        kwargs['protocol'] = kwargs.get('protocol', 'http')
+        kwargs['domain'] = kwargs.get('domain', 'localhost')
+        kwargs['port'] = kwargs.get('port', None) or self._get_free_port()
+
+        super().__init__(**kwargs)
+
+        self.command = kwargs.get('command',
+                                  os.getenv('HIGHCHARTS_EXPORT_SERVER_COMMAND',
+                                            'highcharts-export-server'))
+        self.arguments = kwargs.get('arguments', None)
+        self.workers = kwargs.get('workers', 2)
+        self.startup_timeout = kwargs.get('startup_timeout', 30)
+
+        weakref.finalize(self, _stop_process, self._state)
+
+    @property
+    def command(self) -> list:
+        """The command which runs the Highcharts Export Server. Defaults to the value of
+        the ``HIGHCHARTS_EXPORT_SERVER_COMMAND`` environment variable, or
+        ``'highcharts-export-server'`` if it is not set.
+
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+        """
+        return self._command
+
+    @command.setter
+    def command(self, value):
+        if isinstance(value, str):
+            value = shlex.split(value)
+        value = [validators.string(x) for x in validators.iterable(value)]
+
+        self._command = value
+
+    @property
+    def arguments(self) -> list:
+        """The arguments passed to the :meth:`command <LocalExportServer.command>`,
+        in which ``{host}``, ``{port}``, and ``{workers}`` are replaced by the
+        instance's :meth:`domain <ExportServer.domain>`,
+        :meth:`port <ExportServer.port>`, and
+        :meth:`workers <LocalExportServer.workers>`, respectively.
+
+        Defaults to the arguments which run the Highcharts Export Server as an HTTP
+        server with a fixed pool of workers.
+
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+        """
+        return self._arguments
+
+    @arguments.setter
+    def arguments(self, value):
+        if value is None:
+            value = ['--enableServer', '1',
+                     '--host', '{host}',
+                     '--port', '{port}',
+                     '--minWorkers', '{workers}',
+                     '--maxWorkers', '{workers}']
+        elif isinstance(value, str):
+            value = shlex.split(value)
+
+        self._arguments = [validators.string(x)
+                           for x in validators.iterable(value, allow_empty = True) or []]
+
+    @property
+    def workers(self) -> int:
+        """The number of rendering workers the Highcharts Export Server keeps warm,
+        which is the number of charts it can render concurrently. Defaults to ``2``.
+
+        :rtype: :class:`int <python:int>`
+        """
+        return self._workers
+
+    @workers.setter
+    def workers(self, value):
+        self._workers = validators.integer(value, minimum = 1)
+
+    @property
+    def startup_timeout(self) -> int | float:
+        """The number of seconds to wait for the Highcharts Export Server to accept
+        connections once started. Defaults to ``30``.
+
+        :rtype: numeric
+        """
+        return self._startup_timeout
+
+    @startup_timeout.setter
+    def startup_timeout(self, value):
+        self._startup_timeout = validators.numeric(value, minimum = 0)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the Highcharts Export Server process is running.
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        process = self._state['process']
+
+        return process is not None and process.poll() is None
+
+    @staticmethod
+    def _get_free_port():
+        """Return a TCP port on the local machine which is not in use."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as socket_:
+            socket_.bind(('localhost', 0))
+            return socket_.getsockname()[1]
+
+    def start(self):
+        """Start the Highcharts Export Server process (if it is not already running),
+        and wait until it accepts connections.
+
+        :raises HighchartsDependencyError: if the
+          :meth:`command <LocalExportServer.command>` is not found
+        :raises HighchartsExportServerError: if the process exits or does not accept
+          connections within the :meth:`startup_timeout <LocalExportServer.startup_timeout>`
+        """
+        with self._state['lock']:
+            if self.is_running:
+                return
+
+            arguments = [x.format(host = self.domain,
+                                  port = self.port,
+                                  workers = self.workers)
+                         for x in self.arguments]
+            try:
+                process = subprocess.Popen(self.command + arguments,
+                                           stdin = subprocess.DEVNULL,
+                                           stdout = subprocess.DEVNULL,
+                                           stderr = subprocess.DEVNULL)
+            except FileNotFoundError:
+                raise errors.HighchartsDependencyError(
+                    f'LocalExportServer requires the Highcharts Export Server, but '
+                    f'"{self.command[0]}" was not found. Please install it using: '
+                    f'"npm install -g highcharts-export-server"'
+                )
+            self._state['process'] = process
+
+            deadline = time.monotonic() + self.startup_timeout
+            while True:
+                if process.poll() is not None:
+                    self._state['process'] = None
+                    raise errors.HighchartsExportServerError(
+                        f'The Highcharts Export Server exited with code '
+                        f'{process.returncode} before accepting connections.'
+                    )
+                try:
+                    socket.create_connection((self.domain, self.port),
+                                             timeout = 0.5).close()
+                    return
+                except OSError:
+                    if time.monotonic() > deadline:
+                        _stop_process(self._state)
+                        raise errors.HighchartsExportServerError(
+                            f'The Highcharts Export Server did not accept connections '
+                            f'within {self.startup_timeout} seconds.'
+                        )
+                    time.sleep(0.05)
+
+    def close(self):
+        """Stop the Highcharts Export Server process (if it is running)."""
+        with self._state['lock']:
+            _stop_process(self._state)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _send(self, *args, **kwargs):
+        self.start()
+
+        return super()._send(*args, **kwargs)
+
+
+_SHARED_ASYNC_CLIENT = None
+
+
+class AsyncExportClient(object):
+    """Asynchronous client for the Highcharts
+    `Export Server <https://github.com/highcharts/node-export-server>`_, for use within
+    an :mod:`asyncio` event loop (e.g. an ASGI application).
+
+    Every export requested through the client shares a single pool of persistent HTTP
+    connections, and at most
+    :meth:`max_concurrency <AsyncExportClient.max_concurrency>` exports are in flight
+    at any one time. Each export is configured by an :class:`ExportServer` instance,
+    so the :term:`Export Server`'s URL, port, path, and export settings are honored as
+    they are by :meth:`ExportServer.request_chart() <ExportServer.request_chart>`.
+
+    .. note::
+
+      Each HTTP round-trip is executed using `requests <https://requests.readthedocs.io>`__
+      in one of the client's worker threads, so that awaiting an export never blocks
+      the event loop.
+
+    .. code-block:: python
+
+      client = AsyncExportClient(max_concurrency = 8)
+      image = await client.request_chart(my_chart)
+      images = await client.export_many([chart_1, chart_2])
+      client.close()
+
+    """
+
+    def __init__(self,
+                 server_instance = None,
+                 max_concurrency = 10,
+                 timeout = 3,
+                 auth_user = None,
+                 auth_password = None):
+        self._server_instance = None
+        self._max_concurrency = None
+        self._timeout = None
+
+        self.server_instance = server_instance
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+
+        self._auth = None
+        if auth_user and auth_password:
+            self._auth = HTTPBasicAuth(auth_user, auth_password)
+
+        self._session = ExportServer._get_session(self.max_concurrency)
+        self._executor = concurrent.futures.ThreadPoolExecutor(self.max_concurrency)
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @property
+    def server_instance(self) -> ExportServer:
+        """The :class:`ExportServer` whose configuration is applied to exports that do
+        not supply their own. Defaults to an :class:`ExportServer` with its default
+        configuration.
+
+        :rtype: :class:`ExportServer`
+        """
+        return self._server_instance
+
+    @server_instance.setter
+    def server_instance(self, value):
+        if value is None:
+            value = ExportServer()
+        elif not isinstance(value, ExportServer):
+            raise errors.HighchartsValueError(f'server_instance is expected to be an '
+                                              f'ExportServer instance. Was: '
+                                              f'{value.__class__.__name__}')
+        self._server_instance = value
+
+    @property
+    def max_concurrency(self) -> int:
+        """The maximum number of exports in flight at any one time, which is also the
+        number of persistent connections kept open. Defaults to ``10``.
+
+        :rtype: :class:`int <python:int>`
+        """
+        return self._max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, value):
+        if self._max_concurrency is not None:
+            raise errors.HighchartsValueError('max_concurrency cannot be changed once '
+                                              'the client has been created')
+        self._max_concurrency = validators.integer(value, minimum = 1)
+
+    @property
+    def timeout(self) -> Optional[int | float]:
+        """The default number of seconds to wait for each export before issuing a
+        timeout error. Defaults to ``3``.
+
+        :rtype: numeric or :obj:`None <python:None>`
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        self._timeout = validators.numeric(value, allow_empty = True, minimum = 0)
+
+    def _get_semaphore(self):
+        """Return the semaphore which bounds the concurrency of exports within the
+        running event loop."""
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+
+        return self._semaphores[loop]
+
+    async def request_chart(self,
+                            chart = None,
+                            filename = None,
+                            server_instance = None,
+                            timeout = None,
+                            auth_user = None,
+                            auth_password = None,
+                            **kwargs):
+        """Export a chart using the :term:`Export Server`.
+
+        :param chart: The chart to export, either a
+          :class:`Chart <highcharts_maps.chart.Chart>` or the options to render (as
+          :class:`HighchartsMapsOptions`, :class:`HighchartsOptions`, or a
+          :class:`dict <python:dict>`). Defaults to :obj:`None <python:None>`, which
+          exports the ``options`` of the :class:`ExportServer` configuration.
+
+        :param filename: The name of the file where the exported chart should
+          (optionally) be persisted. Defaults to :obj:`None <python:None>`.
+        :type filename: Path-like or :obj:`None <python:None>`
+
+        :param server_instance: The :class:`ExportServer` whose configuration should be
+          applied. Defaults to :obj:`None <python:None>`, which applies
+          :meth:`.server_instance <AsyncExportClient.server_instance>`.
+        :type server_instance: :class:`ExportServer` or :obj:`None <python:None>`
+
+        :param timeout: The number of seconds to wait before issuing a timeout error.
+          Defaults to :obj:`None <python:None>`, which applies
+          :meth:`.timeout <AsyncExportClient.timeout>`.
+        :type timeout: numeric or :obj:`None <python:None>`
+
+        :param auth_user: The username to use to authenticate against the
+          Export Server, using :term:`basic authentication`. Defaults to
+          :obj:`None <python:None>`, which applies the client's credentials (if any).
+        :type auth_user: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param auth_password: The password to use to authenticate against the Export
+          Server (using :term:`basic authentication`). Defaults to
+          :obj:`None <python:None>`.
+        :type auth_password: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        .. note::
+
+          All other keyword arguments are as per the :class:`ExportServer` constructor
+          :meth:`ExportServer.__init__() <highcharts_core.headless_export.ExportServer.__init__>`.
+
+        :returns: The exported chart image (as per
+          :meth:`ExportServer.request_chart() <ExportServer.request_chart>`), or the name
+          of the file it was written to if ``filename`` is supplied.
+        :rtype: :class:`bytes <python:bytes>`, :class:`str <python:str>`, or Path-like
+        """
+        if server_instance is None:
+            server_instance = self.server_instance
+        elif not isinstance(server_instance, ExportServer):
+            raise errors.HighchartsValueError(f'server_instance is expected to be an '
+                                              f'ExportServer instance. Was: '
+                                              f'{server_instance.__class__.__name__}')
+        if filename:
+            filename = validators.path(filename)
+
+        auth = self._auth
+        if auth_user and auth_password:
+            auth = HTTPBasicAuth(auth_user, auth_password)
+
+        template = server_instance._copy_with(kwargs)
+        send = functools.partial(template._send,
+                                 self._session,
+                                 chart,
+                                 filename = filename,
+                                 auth = auth,
+                                 timeout = timeout if timeout is not None else self.timeout,
+                                 set_constructor = 'constructor' not in kwargs)
+        async with self._get_semaphore():
+            return await asyncio.get_running_loop().run_in_executor(self._executor, send)
+
+    async def export_many(self, charts, filenames = None, **kwargs) -> list:
+        """Export a batch of charts concurrently, as per
+        :meth:`ExportServer.export_many() <ExportServer.export_many>`.
+
+        :param charts: The charts to export.
+        :type charts: iterable
+
+        :param filenames: The name of the file to which each exported chart should be
+          written. Defaults to :obj:`None <python:None>`, which returns the exported
+          charts in memory instead.
+        :type filenames: iterable of Path-like or :obj:`None <python:None>`
+
+        .. note::
+
+          All other keyword arguments are as per
+          :meth:`.request_chart() <AsyncExportClient.request_chart>`.
+
+        :returns: For each chart (in order), the exported chart image or file name, or
+          the exception raised while exporting it.
+        :rtype: :class:`list <python:list>`
+
+        :raises HighchartsValueError: if ``filenames`` does not supply one file name per
+          chart
+        """
+        charts = [x for x in validators.iterable(charts, allow_empty = True) or []]
+        if filenames is None:
+            filenames = [None for x in charts]
+        else:
+            filenames = [x for x in validators.iterable(filenames,
+                                                        allow_empty = True) or []]
+            if len(filenames) != len(charts):
+                raise errors.HighchartsValueError(f'filenames expects one file name '
+                                                  f'for each of the {len(charts)} '
+                                                  f'charts. Received: '
+                                                  f'{len(filenames)}')
+
+        return await asyncio.gather(*[self.request_chart(chart,
+                                                         filename = filename,
+                                                         **kwargs)
+                                      for chart, filename in zip(charts, filenames)],
+                                    return_exceptions = True)
+
+    def close(self):
+        """Close the client's persistent connections and worker threads."""
+        self._session.close()
+        self._executor.shutdown(wait = False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    @classmethod
+    def get_shared(cls):
+        """Return the client shared by default across the process (e.g. by
+        :meth:`Chart.adownload_chart() <highcharts_maps.chart.Chart.adownload_chart>`),
+        creating it if necessary.
+
+        :rtype: :class:`AsyncExportClient`
+        """
+        global _SHARED_ASYNC_CLIENT
+        if _SHARED_ASYNC_CLIENT is None:
+            _SHARED_ASYNC_CLIENT = cls()
+
+        return _SHARED_ASYNC_CLIENT
@@ -1 +1,21 @@
+import re
+
 from highcharts_core.js_literal_functions import *
+
+_MAP_DATA_PLACEHOLDER = re.compile(r"""['"]HCP: REPLACE-WITH-([A-Za-z_$][\w$]*)['"]""")
+
+
+def replace_map_data_placeholders(as_str):
+    """Replace the (quoted) placeholders which stand in for JavaScript variables holding
+    :term:`map data` (e.g. ``'HCP: REPLACE-WITH-topology'``) with the variables
+    themselves.
+
+    :param as_str: The serialized JavaScript literal.
+    :type as_str: :class:`str <python:str>`
+
+    :rtype: :class:`str <python:str>`
+    """
+    if not as_str:
+        return as_str
+
+    return _MAP_DATA_PLACEHOLDER.sub(r'\1', as_str)
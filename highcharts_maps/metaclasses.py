@@ -1 +1,118 @@
+import copyreg
+
 from highcharts_core.metaclasses import *
+from highcharts_core.metaclasses import HighchartsMeta
+
+# The modules whose classes hold chart options, which may be instantiated without
+# arguments (and without side effects) to find the attributes they leave unset.
+_OPTIONS_MODULES = ('highcharts_core.global_options.',
+                    'highcharts_core.options.',
+                    'highcharts_core.utility_classes.',
+                    'highcharts_maps.global_options.',
+                    'highcharts_maps.options.',
+                    'highcharts_maps.utility_classes.')
+
+_UNSET_ATTRIBUTES = {}
+
+
+def _get_unset_attributes(cls):
+    """Return the (cached) names of the attributes which an instance of ``cls`` holds as
+    :obj:`None <python:None>` when none of its properties have been set.
+
+    .. warning::
+
+      ``cls`` is instantiated without arguments, so this is only called for the classes
+      registered by :func:`register_pickling`.
+
+    :returns: The attribute names, or :obj:`None <python:None>` if ``cls`` cannot be
+      instantiated without arguments.
+    :rtype: :class:`frozenset <python:frozenset>` or :obj:`None <python:None>`
+    """
+    try:
+        return _UNSET_ATTRIBUTES[cls]
+    except KeyError:
+        pass
+
+    try:
+        names = frozenset(key for key, value in cls().__dict__.items() if value is None)
+    except Exception:
+        names = None
+    _UNSET_ATTRIBUTES[cls] = names
+
+    return names
+
+
+def _get_state(instance) -> dict:
+    """Return the state of ``instance`` to pickle, which omits any attribute that is
+    :obj:`None <python:None>` because its property has not been set.
+
+    Most of the (many) properties of an options object are never set, so this keeps
+    pickles of options trees - e.g. when sending charts to worker processes - compact.
+
+    :rtype: :class:`dict <python:dict>`
+    """
+    unset = _get_unset_attributes(instance.__class__)
+    if not unset:
+        return dict(instance.__dict__)
+
+    return {key: value for key, value in instance.__dict__.items()
+            if value is not None or key not in unset}
+
+
+def _reduce(instance):
+    """Return the instructions to pickle (or copy) ``instance``.
+
+    :rtype: :class:`tuple <python:tuple>`
+    """
+    # Reconstructing through a function defined in this module ensures that it has been
+    # imported wherever the pickle is loaded.
+    return _restore, (instance.__class__, _get_state(instance))
+
+
+def _restore(cls, state):
+    """Return an instance of ``cls`` restored from a state returned by
+    :func:`_get_state`, resetting the attributes it omits to
+    :obj:`None <python:None>`."""
+    instance = cls.__new__(cls)
+    unset = _get_unset_attributes(cls)
+    if unset:
+        instance.__dict__.update(dict.fromkeys(unset))
+    instance.__dict__.update(state)
+
+    return instance
+
+
+def _defines_pickling(cls) -> bool:
+    """Return ``True`` if ``cls`` (or one of its bases) implements its own pickling, or
+    holds state beyond its attributes by extending a built-in type (e.g. the
+    :class:`dict <python:dict>` underlying a :term:`GeoJSON` object)."""
+    return any(base.__module__ == 'builtins' or
+               any(name in vars(base)
+                   for name in ('__getstate__', '__reduce__', '__reduce_ex__'))
+               for base in cls.__mro__[:-1])
+
+
+def register_pickling(classes = None):
+    """Register the classes whose instances pickle only the properties that have been
+    set with :mod:`copyreg`.
+
+    :param classes: The classes to register. If :obj:`None <python:None>`, registers
+      every sub-class of :class:`HighchartsMeta` imported from the options modules of
+      Highcharts Core and Highcharts Maps, except for those that implement their own
+      pickling. Defaults to :obj:`None <python:None>`.
+    :type classes: iterable of :class:`type <python:type>` or
+      :obj:`None <python:None>`
+    """
+    if classes is None:
+        classes = []
+        pending = [HighchartsMeta]
+        while pending:
+            for subclass in pending.pop().__subclasses__():
+                pending.append(subclass)
+                if f'{subclass.__module__}.'.startswith(_OPTIONS_MODULES) and \
+                   not _defines_pickling(subclass):
+                    classes.append(subclass)
+
+    for cls in classes:
+        if cls not in copyreg.dispatch_table:
+            copyreg.pickle(cls, _reduce)
@@ -4,6 +4,7 @@ from typing import Optional, List
 from validator_collection import validators
 
 from highcharts_maps.decorators import class_sensitive
+from highcharts_maps.metaclasses import register_pickling
 from highcharts_maps.options.series.series_generator import create_series_obj
 
 from highcharts_maps.options.chart import ChartOptions
@@ -240,3 +241,8 @@ class HighchartsMapsOptions(HighchartsOptions):
         }
 
         return untrimmed
+
+
+# Pickle the options classes imported above with only the properties that have been
+# set.
+register_pickling()
@@ -1,19 +1,66 @@
 from typing import Optional, List
+import os
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 from validator_collection import validators, checkers
 
 from highcharts_core.options.series.base import SeriesBase as CoreSeriesBase
 
-from highcharts_maps import errors
+from highcharts_maps import constants, errors
 from highcharts_maps.decorators import validate_types
-from highcharts_maps.options.series.data.map_data import AsyncMapData, MapData
+from highcharts_maps.options.series.data.map_data import AsyncMapData, MapData, \
+    RenderContext
 from highcharts_maps.utility_classes.javascript_functions import VariableName
-from highcharts_maps.utility_functions import mro__to_untrimmed_dict
+from highcharts_maps.utility_functions import (mro__to_untrimmed_dict,
+                                              iter_csv_column_chunks,
+                                              to_camelCase,
+                                              to_snake_case)
 from highcharts_maps.js_literal_functions import (serialize_to_js_literal,
                                                   assemble_js_literal)
 
 
+def _requires_topology(item) -> bool:
+    """Return whether ``item``, a member of the value supplied to
+    :meth:`MapSeriesBase.set_map_data`, requires a :term:`topology` to be built.
+
+    :class:`geopandas.GeoDataFrame <geopandas:GeoDataFrame>` instances, paths to
+    existing files, and serialized :term:`TopoJSON` / :term:`GeoJSON` documents require a
+    topology to be built, while URLs and all other (non-string) values are applied
+    as-is.
+
+    :rtype: :class:`bool <python:bool>`
+
+    :raises HighchartsValueError: if ``item`` is a string which is neither a URL, the
+      path to an existing file, nor a serialized JSON document
+    """
+    if checkers.is_type(item, 'GeoDataFrame'):
+        return True
+    if not isinstance(item, (str, bytes)):
+        return False
+
+    if item.lstrip()[:1] in ['{', b'{']:
+        return True
+    if isinstance(item, str) and checkers.is_url(item):
+        return False
+    if os.path.isfile(item):
+        return True
+
+    raise errors.HighchartsValueError(f'set_map_data() expects strings to be a URL, the '
+                                      f'path to an existing file, or a TopoJSON / '
+                                      f'GeoJSON document. Received: {item[:100]!r}')
+
+
 class SeriesBase(CoreSeriesBase):
+    def __setstate__(self, state):
+        # Defined explicitly so that unpickling does not look it up through
+        # __getattr__(), which recurses while the instance has no attributes.
+        self.__dict__.update(state)
+
     def convert_to(self, series_type):
         """Creates a new series of ``series_type`` from the current series.
         
@@ -71,9 +118,70 @@ class SeriesBase(CoreSeriesBase):
             raise errors.HighchartsSeriesConversionError(f'Unable to convert '
                                                          f'{self.__class__.__name__} instance '
                                                          f'to {series_type_name}')
-        
+
         return target
 
+    def load_from_trusted_columns(self, columns, validate_sample = True):
+        """Replace the existing
+        :meth:`.data <highcharts_maps.options.series.base.SeriesBase.data>` property
+        with data points constructed from already-typed columnar data *without*
+        per-value validation.
+
+        .. seealso::
+
+          :meth:`TrustedConstructionMixin.from_trusted_columns() <highcharts_maps.options.series.data.base.TrustedConstructionMixin.from_trusted_columns>`
+
+        :param columns: A :class:`dict <python:dict>` whose keys are data point
+          properties and whose values are equal-length columns of values.
+        :type columns: :class:`dict <python:dict>`
+
+        :param validate_sample: If ``True``, validates the first non-null value of each
+          column through the property's regular setter. Defaults to ``True``.
+        :type validate_sample: :class:`bool <python:bool>`
+
+        :raises HighchartsValueError: if the series' data point class does not support
+          trusted construction, or if ``columns`` are not valid for the data point class
+        """
+        data_point_cls = self._data_point_class()
+        if not hasattr(data_point_cls, 'from_trusted_columns'):
+            raise errors.HighchartsValueError(f'{self.__class__.__name__} does not '
+                                              f'support trusted construction')
+
+        data_points = data_point_cls.from_trusted_columns(columns,
+                                                          validate_sample = validate_sample)
+        self._data = data_points or None
+
+    @classmethod
+    def from_trusted_columns(cls,
+                             columns,
+                             validate_sample = True,
+                             series_kwargs = None):
+        """Create a :term:`series` instance whose
+        :meth:`.data <highcharts_maps.options.series.base.SeriesBase.data>` property is
+        populated from already-typed columnar data *without* per-value validation.
+
+        :param columns: A :class:`dict <python:dict>` whose keys are data point
+          properties and whose values are equal-length columns of values.
+        :type columns: :class:`dict <python:dict>`
+
+        :param validate_sample: If ``True``, validates the first non-null value of each
+          column through the property's regular setter. Defaults to ``True``.
+        :type validate_sample: :class:`bool <python:bool>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :returns: A :term:`series` instance.
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+
+        instance = cls(**series_kwargs)
+        instance.load_from_trusted_columns(columns, validate_sample = validate_sample)
+
+        return instance
+
 
 class MapSeriesBase(SeriesBase):
     """Generic base class for map series configurations."""
@@ -216,6 +324,63 @@ class MapSeriesBase(SeriesBase):
                                       fetch_config = fetch_config)
         self.map_data = async_map_data
 
+    def set_map_data(self, value, max_workers = None, **kwargs):
+        """Configures the series'
+        :meth:`.map_data <highcharts_maps.options.series.base.MapSeriesBase.map_data>`,
+        building the :term:`topologies <topology>` of multiple
+        :term:`map geometries <map geometry>` in parallel using a pool of processes.
+
+        Members of ``value`` which require a topology to be built
+        (:class:`geopandas.GeoDataFrame <geopandas:GeoDataFrame>` instances, paths to
+        existing :term:`TopoJSON` / :term:`GeoJSON` files, and serialized TopoJSON /
+        GeoJSON documents) are built using
+        :meth:`MapData.from_many() <highcharts_maps.options.series.data.map_data.MapData.from_many>`,
+        while all other members (e.g. :class:`MapData`,
+        :class:`AsyncMapData <highcharts_maps.options.series.data.map_data.AsyncMapData>`,
+        or URLs) are applied as-is. The order of ``value`` is preserved.
+
+        .. note::
+
+          Asynchronously-loaded map data should be supplied as a URL, an
+          :class:`AsyncMapData <highcharts_maps.options.series.data.map_data.AsyncMapData>`
+          instance, or a :class:`dict <python:dict>`, rather than as a JSON string.
+
+        :param value: The map geometries to apply. Accepts any value supported by
+          :meth:`.map_data <highcharts_maps.options.series.base.MapSeriesBase.map_data>`.
+
+        :param max_workers: The maximum number of worker processes to use. Defaults to
+          :obj:`None <python:None>`, which uses one per CPU.
+        :type max_workers: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param kwargs: additional keyword arguments which are passed to
+          :meth:`MapData.from_geodataframe() <highcharts_maps.options.series.data.map_data.MapData.from_geodataframe>`
+          for each :class:`geopandas.GeoDataFrame <geopandas:GeoDataFrame>` in ``value``
+        :type kwargs: :class:`dict <python:dict>`
+
+        :raises HighchartsValueError: if a string in ``value`` is neither a URL, the path
+          to an existing file, nor a serialized TopoJSON / GeoJSON document
+        """
+        if checkers.is_type(value, 'GeoDataFrame') or \
+           not checkers.is_iterable(value, forbid_literals = (str, bytes, dict)):
+            value = [value] if value is not None else []
+            is_single = True
+        else:
+            value = [x for x in value]
+            is_single = False
+
+        pending = [index for index, item in enumerate(value)
+                   if _requires_topology(item)]
+        built = MapData.from_many([value[x] for x in pending],
+                                  max_workers = max_workers,
+                                  **kwargs)
+        for index, map_data in zip(pending, built):
+            value[index] = map_data
+
+        if is_single:
+            self.map_data = value[0] if value else None
+        else:
+            self.map_data = value
+
     @property
     def is_async(self) -> bool:
         """Read-only property, where ``True`` indicates that the map data is loaded
@@ -378,10 +543,11 @@ class MapSeriesBase(SeriesBase):
             if key == 'mapData' and self.is_map_data_independent:
                 item = f'HCP: REPLACE-WITH-{item.variable_name}'
             elif key == 'mapData' and self.is_async:
-                fetch_counter = item.fetch_counter
-                item = 'HCP: REPLACE-WITH-topology'
-                if fetch_counter > 0:
-                    item = f'{item}{fetch_counter}'
+                context = RenderContext.get_current()
+                name = context.get_topology_name(item) if context else None
+                if not name:
+                    name = f'topology{item.fetch_counter or ""}'
+                item = f'HCP: REPLACE-WITH-{name}'
 
             serialized = serialize_to_js_literal(item,
                                                  encoding = encoding,
@@ -400,7 +566,8 @@ class MapSeriesBase(SeriesBase):
 
     def load_from_geopandas(self,
                             gdf,
-                            property_map):
+                            property_map,
+                            reproject = None):
         """Replace the contents of the
         :meth:`.data <highcharts_maps.options.series.base.SeriesBase.data>` property
         with data points and the
@@ -419,13 +586,23 @@ class MapSeriesBase(SeriesBase):
           :class:`GeoDataFrame <geopandas:GeoDataFrame>` column.
         :type property_map: :class:`dict <python:dict>`
 
+        :param reproject: An optional target coordinate reference system (e.g.
+          ``'EPSG:5070'``) into which the geometries are transformed server-side, or a
+          callable which transforms them. Defaults to :obj:`None <python:None>`, which
+          leaves coordinates as-is.
+
+          .. seealso::
+
+            * :meth:`MapData.from_geodataframe() <highcharts_maps.options.series.data.map_data.MapData.from_geodataframe>`
+
+        :type reproject: :class:`str <python:str>`, :class:`int <python:int>`,
+          callable, or :obj:`None <python:None>`
+
         :raises HighchartsPandasDeserializationError: if ``property_map`` references
           a column that does not exist in the data frame
         :raises HighchartsDependencyError: if `geopandas <https://geopandas.org/>`__ is
           not available in the runtime environment
         """
-        self.map_data = MapData.from_geodataframe(as_gdf = gdf)
-
         try:
             from geopandas import GeoDataFrame
         except ImportError:
@@ -438,14 +615,15 @@ class MapSeriesBase(SeriesBase):
                                               f'GeoDataFrame or Series. Was: '
                                               f'{gdf.__class__.__name__}')
 
-        self.map_data = MapData.from_geodataframe(as_gdf = gdf)
+        self.map_data = MapData.from_geodataframe(as_gdf = gdf, reproject = reproject)
         self.load_from_pandas(gdf, property_map)
 
     @classmethod
     def from_geopandas(cls,
                        gdf,
                        property_map,
-                       series_kwargs = None):
+                       series_kwargs = None,
+                       reproject = None):
         """Create a :term:`series` instance whose
         :meth:`.data <highcharts_maps.options.series.base.SeriesBase.data>` property
         is populated from a `geopandas <https://geopandas.org/>`__
@@ -474,6 +652,13 @@ class MapSeriesBase(SeriesBase):
 
         :type series_kwargs: :class:`dict <python:dict>`
 
+        :param reproject: An optional target coordinate reference system (e.g.
+          ``'EPSG:5070'``) into which the geometries are transformed server-side, or a
+          callable which transforms them. Defaults to :obj:`None <python:None>`, which
+          leaves coordinates as-is.
+        :type reproject: :class:`str <python:str>`, :class:`int <python:int>`,
+          callable, or :obj:`None <python:None>`
+
         :returns: A :term:`series` instance (descended from
           :class:`MapSeriesBase <highcharts_maps.options.series.base.MapSeriesBase>`) with
           its :meth:`.data <highcharts_maps.options.series.base.SeriesBase.data>` and
@@ -491,10 +676,484 @@ class MapSeriesBase(SeriesBase):
         series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
 
         instance = cls(**series_kwargs)
-        instance.load_from_geopandas(gdf, property_map)
+        instance.load_from_geopandas(gdf, property_map, reproject = reproject)
 
         return instance
 
+    def load_from_csv_chunked(self,
+                              as_string_or_file,
+                              property_column_map,
+                              join_by = None,
+                              has_header_row = True,
+                              delimiter = ',',
+                              null_text = 'None',
+                              dtypes = None,
+                              chunk_size = 100000,
+                              encoding = 'utf-8'):
+        """Replace the existing
+        :meth:`.data <highcharts_maps.options.series.base.SeriesBase.data>` property
+        with columnar data read from a (potentially very large) CSV string or file.
+
+        Unlike :meth:`.load_from_csv() <highcharts_core.options.series.base.SeriesBase.load_from_csv>`,
+        this method does not create a data point object per CSV record. Instead, the CSV
+        data is read ``chunk_size`` records at a time, only the requested columns are
+        retained, and each column is converted to a typed
+        :class:`numpy.ndarray <numpy:numpy.ndarray>` in one vectorized operation per
+        chunk. The resulting columns are stored directly in the series' data
+        collection, and the series'
+        :meth:`.keys <highcharts_maps.options.series.base.SeriesBase.keys>` are set to
+        describe them.
+
+          .. note::
+
+            For an example :class:`MapSeries <highcharts_maps.options.series.map.MapSeries>`,
+            the minimum code required would be:
+
+              .. code-block:: python
+
+                my_series = MapSeries()
+                my_series.load_from_csv_chunked('population.csv',
+                                                property_column_map = {
+                                                    'value': 'population'
+                                                },
+                                                join_by = ['iso-a2', 'country_code'])
+
+            This joins each record to the map geometry whose ``iso-a2`` property
+            matches the record's ``country_code`` column, with the record's
+            ``population`` column supplying the point's
+            :meth:`.value <highcharts_maps.options.series.data.geometric.GeometricData.value>`.
+
+          .. tip::
+
+            If `pyarrow <https://arrow.apache.org/docs/python/>`__ is available in the
+            runtime environment, its (multi-threaded) streaming CSV reader will be used
+            to parse the data.
+
+        :param as_string_or_file: The CSV data to use to populate data. Accepts either
+          the raw CSV data as a :class:`str <python:str>` or a path to a file in the
+          runtime environment that contains the CSV data.
+        :type as_string_or_file: :class:`str <python:str>` or Path-like
+
+        :param property_column_map: A :class:`dict <python:dict>` used to indicate which
+          data point property should be set to which CSV column. The keys in the
+          :class:`dict <python:dict>` should correspond to properties in the data point
+          class, while the value can either be a numerical index (starting with 0) or a
+          :class:`str <python:str>` indicating the label for the CSV column.
+        :type property_column_map: :class:`dict <python:dict>`
+
+        :param join_by: The CSV column that should be used to join the data to the
+          series' map geometries. Accepts either a :class:`str <python:str>`, which is
+          both the CSV column label and the property in the
+          :meth:`.map_data <highcharts_maps.options.series.base.MapSeriesBase.map_data>`
+          to join on, or a 2-member collection where the first member is the property in
+          the map data and the second is the CSV column (label or index). If supplied,
+          the series' ``join_by`` option is set accordingly. Defaults to
+          :obj:`None <python:None>`.
+        :type join_by: :class:`str <python:str>`, 2-member :class:`list <python:list>`,
+          or :obj:`None <python:None>`
+
+        :param has_header_row: If ``True``, indicates that the first row of
+          ``as_string_or_file`` contains column labels, rather than actual data. Defaults
+          to ``True``.
+        :type has_header_row: :class:`bool <python:bool>`
+
+        :param delimiter: The delimiter used between columns. Defaults to ``,``.
+        :type delimiter: :class:`str <python:str>`
+
+        :param null_text: The string used to indicate an empty value. Empty column
+          values are always interpreted as null. Defaults to ``'None'``.
+        :type null_text: :class:`str <python:str>`
+
+        :param dtypes: An optional :class:`dict <python:dict>` mapping data point
+          properties (keys in ``property_column_map``) to the NumPy dtype their column
+          should be converted to. Columns without an explicit dtype are converted to
+          :obj:`numpy.float64` where possible, falling back to strings. Defaults to
+          :obj:`None <python:None>`.
+        :type dtypes: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param chunk_size: The number of CSV records to parse at a time. Defaults to
+          ``100000``.
+        :type chunk_size: :class:`int <python:int>`
+
+        :param encoding: The character encoding of the CSV data. Defaults to
+          ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :raises HighchartsCSVDeserializationError: if ``property_column_map`` or
+          ``join_by`` reference a column that cannot be found, or if a column's values
+          cannot be converted to the requested dtype
+        :raises HighchartsValueError: if ``join_by`` is supplied for a series that does
+          not support it
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        property_column_map = validators.dict(property_column_map)
+        dtypes = validators.dict(dtypes, allow_empty = True) or {}
+        for key in dtypes:
+            if key not in property_column_map:
+                raise errors.HighchartsValueError(f'dtypes received a property ("{key}") '
+                                                  f'that is not in property_column_map')
+
+        keys = [to_camelCase(x) for x in property_column_map]
+        columns = [property_column_map[x] for x in property_column_map]
+        column_dtypes = [dtypes.get(x, None) for x in property_column_map]
+
+        series_join_by = None
+        if join_by is not None:
+            if not hasattr(self, 'join_by'):
+                raise errors.HighchartsValueError(f'{self.__class__.__name__} does not '
+                                                  f'support join_by')
+            if checkers.is_type(join_by, str):
+                map_key = join_by
+                column = join_by
+            else:
+                join_by = validators.iterable(join_by)
+                if len(join_by) != 2:
+                    raise errors.HighchartsValueError(f'join_by expects a string or a '
+                                                      f'2-member collection. Received '
+                                                      f'a {len(join_by)}-member '
+                                                      f'collection.')
+                map_key, column = join_by
+
+            data_key = column if checkers.is_type(column, str) else map_key
+            if data_key == map_key:
+                series_join_by = map_key
+            else:
+                series_join_by = [map_key, data_key]
+
+            keys.insert(0, data_key)
+            columns.insert(0, column)
+            column_dtypes.insert(0, object)
+
+        if len(set(keys)) != len(keys):
+            raise errors.HighchartsValueError('property_column_map and join_by resolve '
+                                              'to duplicate data point properties')
+
+        chunks = [[] for x in keys]
+        for chunk in iter_csv_column_chunks(as_string_or_file,
+                                            columns = columns,
+                                            dtypes = column_dtypes,
+                                            has_header_row = has_header_row,
+                                            delimiter = delimiter,
+                                            null_text = null_text,
+                                            chunk_size = chunk_size,
+                                            encoding = encoding):
+            for index, array in enumerate(chunk):
+                chunks[index].append(array)
+
+        if not chunks[0]:
+            self.data = None
+            return
+
+        collection = self._data_collection_class()()
+        collection._ndarray = {
+            key: np.concatenate(chunks[index]) for index, key in enumerate(keys)
+        }
+        self._data = collection
+        self.keys = keys
+        if series_join_by is not None:
+            self.join_by = series_join_by
+
+    @classmethod
+    def from_csv_chunked(cls,
+                         as_string_or_file,
+                         property_column_map,
+                         join_by = None,
+                         has_header_row = True,
+                         delimiter = ',',
+                         null_text = 'None',
+                         dtypes = None,
+                         chunk_size = 100000,
+                         encoding = 'utf-8',
+                         series_kwargs = None):
+        """Create a :term:`series` instance whose
+        :meth:`.data <highcharts_maps.options.series.base.SeriesBase.data>` property
+        is populated with columnar data read from a (potentially very large) CSV string
+        or file.
+
+        .. seealso::
+
+          This is a convenience wrapper around
+          :meth:`.load_from_csv_chunked() <highcharts_maps.options.series.base.MapSeriesBase.load_from_csv_chunked>`,
+          which documents the parameters shared by both methods.
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+
+          .. warning::
+
+            If ``series_kwargs`` contains a ``data`` or ``keys`` key, their values will
+            be *overwritten*.
+
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :returns: A :term:`series` instance (descended from
+          :class:`MapSeriesBase <highcharts_maps.options.series.base.MapSeriesBase>`)
+          with its :meth:`.data <highcharts_maps.options.series.base.SeriesBase.data>`
+          populated from the CSV data.
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+
+        instance = cls(**series_kwargs)
+        instance.load_from_csv_chunked(as_string_or_file,
+                                       property_column_map = property_column_map,
+                                       join_by = join_by,
+                                       has_header_row = has_header_row,
+                                       delimiter = delimiter,
+                                       null_text = null_text,
+                                       dtypes = dtypes,
+                                       chunk_size = chunk_size,
+                                       encoding = encoding)
+
+        return instance
+
+    def set_label_anchors(self,
+                          map_data = None,
+                          projection = None,
+                          precision = 0.01,
+                          overwrite = False):
+        """Populate the
+        :meth:`middle_x <highcharts_maps.options.series.data.geometric.GeometricData.middle_x>`
+        and
+        :meth:`middle_y <highcharts_maps.options.series.data.geometric.GeometricData.middle_y>`
+        of the series' data points with the label anchors calculated for the
+        :term:`map geometry` they are joined to, so that each data label is placed at the
+        visual center of its map area rather than the center of its bounding box.
+
+        The data points are matched to the map geometry using the series'
+        ``join_by`` setting (or ``'hc-key'`` if it is not set). Columnar data (e.g.
+        loaded using
+        :meth:`.load_from_csv_chunked() <highcharts_maps.options.series.base.MapSeriesBase.load_from_csv_chunked>`)
+        receives ``middleX`` and ``middleY`` columns, while data point objects are
+        updated in place.
+
+        .. seealso::
+
+          * :meth:`MapData.get_label_anchors() <highcharts_maps.options.series.data.map_data.MapData.get_label_anchors>`
+
+        :param map_data: The :term:`map geometry` whose label anchors should be applied.
+          Defaults to :obj:`None <python:None>`, which applies the series'
+          :meth:`.map_data <highcharts_maps.options.series.base.MapSeriesBase.map_data>`.
+        :type map_data: :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>`,
+          :class:`list <python:list>` of
+          :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>`, or
+          :obj:`None <python:None>`
+
+        :param projection: The :term:`projection` with which the map will be rendered.
+          Defaults to :obj:`None <python:None>`, which applies the projection recommended
+          by the map geometry (if any).
+        :type projection: :class:`ProjectionOptions <highcharts_maps.utility_classes.projections.ProjectionOptions>`
+          or :obj:`None <python:None>`
+
+        :param precision: The precision to which each anchor is found, as a fraction of
+          the larger dimension of its map area. Defaults to ``0.01``.
+        :type precision: numeric
+
+        :param overwrite: If ``True``, replaces any ``middle_x`` / ``middle_y`` values
+          already set on the data points. Defaults to ``False``.
+        :type overwrite: :class:`bool <python:bool>`
+
+        :raises HighchartsValueError: if the series' data points do not support label
+          anchors, if the map geometry is not available in Python (e.g. it is loaded
+          asynchronously), or if the series joins its data to the map geometry by
+          position
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        if not hasattr(self._data_point_class(), 'middle_x'):
+            raise errors.HighchartsValueError(f'{self.__class__.__name__} does not '
+                                              f'support label anchors')
+
+        map_data = map_data if map_data is not None else self.map_data
+        if not checkers.is_iterable(map_data, forbid_literals = (str, bytes, dict)):
+            map_data = [map_data] if map_data is not None else []
+        map_data = [x for x in map_data if isinstance(x, MapData)]
+        if not map_data:
+            raise errors.HighchartsValueError('set_label_anchors() requires map '
+                                              'geometry that is available in Python. '
+                                              'Asynchronous or external map data is '
+                                              'not supported.')
+
+        map_key, data_key = self._get_join_keys('set_label_anchors()')
+
+        anchors = {}
+        for item in map_data:
+            anchors.update(item.get_label_anchors(key = map_key,
+                                                  projection = projection,
+                                                  precision = precision))
+
+        data = self._data
+        if not data:
+            return
+
+        ndarray = getattr(data, '_ndarray', None)
+        if ndarray and data_key in ndarray:
+            middles = np.array([anchors.get(x, (np.nan, np.nan))
+                                for x in ndarray[data_key].tolist()],
+                               dtype = float).reshape(-1, 2)
+            for index, key in enumerate(['middleX', 'middleY']):
+                if not overwrite and key in ndarray:
+                    existing = np.asarray(ndarray[key], dtype = float)
+                    middles[:, index] = np.where(np.isnan(existing),
+                                                 middles[:, index],
+                                                 existing)
+                ndarray[key] = middles[:, index]
+
+            keys = list(self.keys or ndarray.keys())
+            self.keys = keys + [x for x in ['middleX', 'middleY'] if x not in keys]
+            return
+
+        data_points = data if isinstance(data, list) else (data.data_points or [])
+        attribute = to_snake_case(data_key)
+        for data_point in data_points:
+            if hasattr(data_point.__class__, attribute):
+                key = getattr(data_point, attribute)
+            else:
+                key = (data_point.properties or {}).get(data_key, None)
+            if key not in anchors:
+                continue
+            if overwrite or data_point.middle_x is None:
+                data_point.middle_x = anchors[key][0]
+            if overwrite or data_point.middle_y is None:
+                data_point.middle_y = anchors[key][1]
+
+    def set_drilldown_maps(self,
+                           map_data,
+                           parent_key,
+                           directory,
+                           base_url,
+                           object_name = None,
+                           filename_template = '{hash}.topo.json',
+                           overwrite = False) -> dict:
+        """Split the detailed :term:`map geometry` of a drilldown map into one child map
+        per data point of the series, write each child map to a content-hashed
+        :term:`TopoJSON` asset, and set the
+        :meth:`drilldown <highcharts_maps.options.series.data.geometric.GeometricData.drilldown>`
+        of each data point that has a child map.
+
+        This allows the series to render only its own (e.g. state-level) map geometry
+        up front, with the (e.g. county-level) geometry of each child map fetched only
+        when the user drills into it. Assign the child maps returned to the chart using
+        :meth:`Chart.add_drilldown_maps() <highcharts_maps.chart.Chart.add_drilldown_maps>`,
+        which calls this method.
+
+        The data points are matched to their child map using the series' ``join_by``
+        setting (or ``'hc-key'`` if it is not set): a data point's drilldown is set to
+        its key where ``parent_key`` identifies it as the parent of any features in
+        ``map_data``.
+
+        .. seealso::
+
+          * :meth:`MapData.split() <highcharts_maps.options.series.data.map_data.MapData.split>`
+          * :meth:`MapData.write_asset() <highcharts_maps.options.series.data.map_data.MapData.write_asset>`
+
+        :param map_data: The detailed :term:`map geometry` to split.
+        :type map_data: :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>`
+
+        :param parent_key: The name of the feature property holding the key of each
+          feature's parent data point, or a callable which receives a feature's
+          properties and returns that key.
+        :type parent_key: :class:`str <python:str>` or callable
+
+        :param directory: The directory to write the assets to. Created if it does not
+          exist.
+        :type directory: Path-like
+
+        :param base_url: The URL from which the files in ``directory`` are served.
+        :type base_url: :class:`str <python:str>`
+
+        :param object_name: The name(s) of the objects within ``map_data`` to split.
+          Defaults to :obj:`None <python:None>`, which splits all of them.
+        :type object_name: :class:`str <python:str>`, iterable of
+          :class:`str <python:str>`, or :obj:`None <python:None>`
+
+        :param filename_template: The name of each asset, with ``{hash}`` replaced by the
+          hash of its content. Defaults to ``'{hash}.topo.json'``.
+        :type filename_template: :class:`str <python:str>`
+
+        :param overwrite: If ``True``, replaces any ``drilldown`` already set on the data
+          points. Defaults to ``False``.
+        :type overwrite: :class:`bool <python:bool>`
+
+        :returns: The child map of each parent, keyed by the parent's key (which is also
+          its drilldown id).
+        :rtype: :class:`dict <python:dict>` of
+          :class:`AsyncMapData <highcharts_maps.options.series.data.map_data.AsyncMapData>`
+
+        :raises HighchartsValueError: if the series' data points do not support
+          drilldown, if ``map_data`` has no topology, or if the series joins its data to
+          the map geometry by position
+        """
+        if not hasattr(self._data_point_class(), 'drilldown'):
+            raise errors.HighchartsValueError(f'{self.__class__.__name__} does not '
+                                              f'support drilldown')
+        map_data = validate_types(map_data, MapData)
+        if map_data is None:
+            raise errors.HighchartsValueError('set_drilldown_maps() requires map data')
+        base_url = validators.url(base_url).rstrip('/')
+        _, data_key = self._get_join_keys('set_drilldown_maps()')
+
+        children = {}
+        for parent, child in map_data.split(parent_key,
+                                            object_name = object_name).items():
+            filename = child.write_asset(directory,
+                                         filename_template = filename_template)
+            children[str(parent)] = AsyncMapData(
+                url = f'{base_url}/{os.path.basename(filename)}'
+            )
+
+        data = self._data
+        if not data:
+            return children
+
+        ndarray = getattr(data, '_ndarray', None)
+        if ndarray and data_key in ndarray:
+            drilldowns = [str(x) if str(x) in children else None
+                          for x in ndarray[data_key].tolist()]
+            if not overwrite and 'drilldown' in ndarray:
+                drilldowns = [x if x is not None and x == x else y
+                              for x, y in zip(ndarray['drilldown'].tolist(), drilldowns)]
+            ndarray['drilldown'] = np.array(drilldowns, dtype = object)
+
+            keys = list(self.keys or ndarray.keys())
+            self.keys = keys + [x for x in ['drilldown'] if x not in keys]
+            return children
+
+        data_points = data if isinstance(data, list) else (data.data_points or [])
+        attribute = to_snake_case(data_key)
+        for data_point in data_points:
+            if hasattr(data_point.__class__, attribute):
+                key = getattr(data_point, attribute)
+            else:
+                key = (data_point.properties or {}).get(data_key, None)
+            if key is None or str(key) not in children:
+                continue
+            if overwrite or data_point.drilldown is None:
+                data_point.drilldown = str(key)
+
+        return children
+
+    def _get_join_keys(self, method_name):
+        """Return the keys of the map geometry and of the data points by which the
+        series joins its data to its map geometry, as a 2-member
+        :class:`tuple <python:tuple>`.
+
+        :raises HighchartsValueError: if the series joins its data to its map geometry
+          by position
+        """
+        join_by = getattr(self, 'join_by', None)
+        if isinstance(join_by, constants.EnforcedNullType):
+            raise errors.HighchartsValueError(f'{method_name} does not support series '
+                                              f'joined to their map geometry by '
+                                              f'position')
+        elif join_by is None:
+            return 'hc-key', 'hc-key'
+        elif isinstance(join_by, str):
+            return join_by, join_by
+
+        return join_by[0], join_by[1]
+
     def convert_to(self, series_type):
         """Creates a new series of ``series_type`` from the current series.
         
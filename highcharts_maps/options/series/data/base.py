@@ -1 +1,201 @@
+from validator_collection import validators
+
 from highcharts_core.options.series.data.base import *
+
+from highcharts_maps import constants, errors, utility_functions
+
+
+class CompactDataMixin(object):
+    """Mixin which stores a :term:`data point`'s attributes sparsely.
+
+    Data point classes initialize every one of their (many) underlying attributes to
+    :obj:`None <python:None>`, although in practice only a handful are ever populated.
+    Classes using this mixin only keep attributes with a value in the instance's
+    ``__dict__``: assigning :obj:`None <python:None>` to the attribute underlying one of
+    the class's properties removes it from the instance, leaving the class-level
+    :obj:`None <python:None>` default (declared once, when the class is created) to be
+    returned when the attribute is read. Property access and serialization are
+    unaffected, while the per-point memory footprint shrinks.
+
+    """
+
+    _compact_attributes = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        names = set()
+        for owner in cls.__mro__:
+            for name, value in owner.__dict__.items():
+                if isinstance(value, property) and not name.startswith('_'):
+                    names.add(f'_{name}')
+
+        attributes = set()
+        for name in names:
+            default = getattr(cls, name, constants.EnforcedNull)
+            if default is constants.EnforcedNull:
+                setattr(cls, name, None)
+                attributes.add(name)
+            elif default is None:
+                attributes.add(name)
+
+        cls._compact_attributes = frozenset(attributes)
+
+    def __setattr__(self, name, value):
+        if value is None and name in self.__class__._compact_attributes:
+            self.__dict__.pop(name, None)
+            return
+
+        object.__setattr__(self, name, value)
+
+
+class TrustedConstructionMixin(object):
+    """Mixin which adds a *trusted* bulk-construction path to :term:`data point`
+    classes.
+
+    Ordinarily, every property of a data point is set through its property setter, which
+    validates (and coerces) the value received. When the data being loaded has already
+    been typed (e.g. columns of a :class:`pandas.DataFrame <pandas:pandas.DataFrame>` or
+    :class:`numpy.ndarray <numpy:numpy.ndarray>` with known-good dtypes), that
+    validation is redundant and dominates construction time. The classmethods supplied
+    by this mixin assign values directly to the instance's underlying attributes
+    instead.
+
+    .. warning::
+
+      Trusted construction performs no coercion. Values are stored exactly as they are
+      received (other than :class:`numpy.ndarray <numpy:numpy.ndarray>` and
+      :class:`pandas.Series <pandas:pandas.Series>` columns, which are converted to
+      native Python values with ``NaN`` as :obj:`None <python:None>`), so only pass
+      values that are already of the type each property expects.
+
+    """
+
+    _trusted_templates = {}
+
+    @classmethod
+    def _get_trusted_template(cls) -> dict:
+        """Return the (cached) attribute values of an empty instance of the class.
+
+        :rtype: :class:`dict <python:dict>`
+        """
+        template = TrustedConstructionMixin._trusted_templates.get(cls, None)
+        if template is None:
+            template = dict(cls().__dict__)
+            TrustedConstructionMixin._trusted_templates[cls] = template
+
+        return template
+
+    @classmethod
+    def _get_trusted_attribute(cls, prop) -> str:
+        """Return the name of the attribute which stores the value of ``prop``.
+
+        :raises HighchartsValueError: if ``prop`` is not a property of the class
+        """
+        attribute = f'_{prop}'
+        template = cls._get_trusted_template()
+        if (attribute not in template and not hasattr(cls, attribute)) or \
+           not hasattr(cls, prop):
+            raise errors.HighchartsValueError(f'{cls.__name__} has no property '
+                                              f'"{prop}"')
+
+        return attribute
+
+    @classmethod
+    def construct_trusted(cls, **kwargs):
+        """Create a single data point instance from ``kwargs`` *without* validating
+        them.
+
+        :param kwargs: Keyword arguments whose keys correspond to properties of the
+          data point class.
+
+        :raises HighchartsValueError: if a keyword does not correspond to a property of
+          the data point class
+
+        :returns: A data point instance.
+        """
+        instance = cls.__new__(cls)
+        instance.__dict__.update(cls._get_trusted_template())
+        for key in kwargs:
+            instance.__dict__[cls._get_trusted_attribute(key)] = kwargs[key]
+
+        return instance
+
+    @classmethod
+    def from_trusted_columns(cls, columns, validate_sample = True):
+        """Create a collection of data point instances from columnar data *without*
+        validating each value.
+
+        .. code-block:: python
+
+          points = GeometricData.from_trusted_columns({
+              'name': df['hc-key'],
+              'value': df['population'].to_numpy()
+          })
+
+        :param columns: A :class:`dict <python:dict>` whose keys are data point
+          properties and whose values are equal-length columns of values (e.g.
+          :class:`numpy.ndarray <numpy:numpy.ndarray>`,
+          :class:`pandas.Series <pandas:pandas.Series>`, or
+          :class:`list <python:list>`).
+        :type columns: :class:`dict <python:dict>`
+
+        :param validate_sample: If ``True``, validates the first non-null value of each
+          column through the property's regular setter, which catches columns of the
+          wrong type at a cost that does not grow with the number of data points.
+          Defaults to ``True``.
+        :type validate_sample: :class:`bool <python:bool>`
+
+        :raises HighchartsValueError: if a key in ``columns`` does not correspond to a
+          property of the data point class, if the columns differ in length, or if a
+          sampled value fails validation
+
+        :returns: Collection of data point instances.
+        :rtype: :class:`list <python:list>`
+        """
+        columns = validators.dict(columns, allow_empty = True) or {}
+        if not columns:
+            return []
+
+        attributes = []
+        values = []
+        for key in columns:
+            attributes.append(cls._get_trusted_attribute(key))
+            column = columns[key]
+            if hasattr(column, 'to_numpy'):
+                column = column.to_numpy()
+            if utility_functions.is_ndarray(column):
+                column = utility_functions.from_ndarray(column)
+            else:
+                column = list(column)
+            values.append(column)
+
+        length = len(values[0])
+        if any(len(x) != length for x in values):
+            raise errors.HighchartsValueError('from_trusted_columns expects columns of '
+                                              'equal length')
+
+        if validate_sample:
+            scratch = cls()
+            for key, column in zip(columns, values):
+                sample = next((x for x in column if x is not None), None)
+                if sample is None:
+                    continue
+                try:
+                    setattr(scratch, key, sample)
+                except (ValueError, TypeError) as error:
+                    raise errors.HighchartsValueError(f'column "{key}" contains values '
+                                                      f'that are not valid for '
+                                                      f'{cls.__name__}.{key}: {error}')
+
+        template = cls._get_trusted_template()
+        new = cls.__new__
+        collection = []
+        for row in zip(*values):
+            instance = new(cls)
+            instance_dict = instance.__dict__
+            instance_dict.update(template)
+            instance_dict.update(zip(attributes, row))
+            collection.append(instance)
+
+        return collection
@@ -1 +1,47 @@
 from highcharts_core.options.series.data.cartesian import *
+from highcharts_core.options.series.data.cartesian import (
+    CartesianValueData as CoreCartesianValueData,
+    CartesianValueDataCollection as CoreCartesianValueDataCollection
+)
+
+from highcharts_maps.options.series.data.base import (CompactDataMixin,
+                                                      TrustedConstructionMixin)
+
+
+class CartesianValueData(CoreCartesianValueData,
+                         CompactDataMixin,
+                         TrustedConstructionMixin):
+    """Variant of :class:`CartesianData` which supports three values (an ``x``, ``y``, and
+    ``value``)."""
+
+    @classmethod
+    def from_ndarray(cls, value):
+        """Creates a collection of data points from a `NumPy <https://numpy.org>`__
+        :class:`ndarray <numpy:ndarray>` instance.
+
+        :returns: A collection of data point values.
+        :rtype: :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`
+        """
+        return CartesianValueDataCollection.from_ndarray(value)
+
+
+class CartesianValueDataCollection(CoreCartesianValueDataCollection):
+    """A collection of :class:`CartesianValueData` objects.
+
+    .. note::
+
+      When serializing to JS literals, if possible, the collection is serialized to a primitive
+      array to boost performance within Python *and* JavaScript. However, this may not always be
+      possible if data points have non-array-compliant properties configured (e.g. adjusting their
+      style, names, identifiers, etc.). If serializing to a primitive array is not possible, the
+      results are serialized as JS literal objects.
+
+    """
+
+    @classmethod
+    def _get_data_point_class(cls):
+        """The Python class to use as the underlying data point within the Collection.
+
+        :rtype: class object
+        """
+        return CartesianValueData
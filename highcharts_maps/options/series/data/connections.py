@@ -3,18 +3,25 @@ from typing import Optional, List, Any
 from collections import UserDict
 
 from validator_collection import validators, checkers
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 from highcharts_core.options.series.data.connections import *
 
 from highcharts_maps import constants, errors
 from highcharts_core.options.series.data.collections import DataPointCollection
+from highcharts_maps.options.series.data.base import (CompactDataMixin,
+                                                      TrustedConstructionMixin)
 from highcharts_maps.decorators import class_sensitive
 from highcharts_maps.utility_classes.gradients import Gradient
 from highcharts_maps.utility_classes.patterns import Pattern
 from highcharts_maps.utility_classes.markers import FlowmapMarker
 
 
-class FlowmapData(WeightedConnectionData):
+class FlowmapData(WeightedConnectionData, CompactDataMixin, TrustedConstructionMixin):
     """Variant of :class:`ConnectionData` that also applies a ``weight`` to the
     connection."""
     
@@ -117,7 +124,7 @@ class FlowmapData(WeightedConnectionData):
             if 'lon' in value:
                 reformed_value.append(value.get('lon', None))
             elif 'longitude' in value:
-                reformed_value = reformed_value.append(value.get('longitude', None))
+                reformed_value.append(value.get('longitude', None))
             else:
                 missing_keys.append('longitude')
             
@@ -275,7 +282,10 @@ class FlowmapData(WeightedConnectionData):
 
     @weight.setter
     def weight(self, value):
-        self._weight = validators.numeric(value, allow_empty = True)
+        if value is None or isinstance(value, constants.EnforcedNullType):
+            self._weight = None
+        else:
+            self._weight = validators.numeric(value)
 
     @classmethod
     def from_list(cls, value):
@@ -303,7 +313,7 @@ class FlowmapData(WeightedConnectionData):
                 as_obj = cls.from_dict(item)
             elif item is None or isinstance(item, constants.EnforcedNullType):
                 as_obj = cls()
-            if checkers.is_iterable(item, forbid_literals = (str, bytes, dict, UserDict)):
+            elif checkers.is_iterable(item, forbid_literals = (str, bytes, dict, UserDict)):
                 if len(item) == 3:
                     as_obj = cls(from_ = item[0],
                                  to = item[1],
@@ -448,3 +458,443 @@ class FlowmapDataCollection(DataPointCollection):
         :rtype: class object
         """
         return FlowmapData
+
+    @staticmethod
+    def _to_column(value, name, dtype = None):
+        """Convert ``value`` (a NumPy, Arrow, or pandas array, or any iterable) to a
+        one-dimensional :class:`numpy.ndarray <numpy:numpy.ndarray>`."""
+        if hasattr(value, 'to_numpy'):
+            value = value.to_numpy()
+        try:
+            column = np.asarray(value, dtype = dtype)
+        except (ValueError, TypeError):
+            raise errors.HighchartsValueError(f'{name} could not be converted to an '
+                                              f'array of {dtype or "values"}')
+        if column.ndim != 1:
+            raise errors.HighchartsValueError(f'{name} expects a one-dimensional array. '
+                                              f'Received an array with {column.ndim} '
+                                              f'dimensions.')
+
+        return column
+
+    @classmethod
+    def _validate_coordinate_columns(cls, lon, lat, ids, prefix):
+        """Return a validated column of ``[longitude, latitude]`` pairs (as an ``(N, 2)``
+        :class:`numpy.ndarray <numpy:numpy.ndarray>`) or of point IDs."""
+        has_coordinates = lon is not None or lat is not None
+        if has_coordinates and ids is not None:
+            raise errors.HighchartsValueError(f'{prefix} accepts either coordinates or '
+                                              f'IDs, not both')
+        if ids is not None:
+            column = cls._to_column(ids, f'{prefix}_id', dtype = object)
+            if any(not isinstance(x, str) for x in column):
+                raise errors.HighchartsValueError(f'{prefix}_id expects string IDs')
+            return column
+        if lon is None or lat is None:
+            raise errors.HighchartsValueError(f'{prefix} expects both {prefix}_lon and '
+                                              f'{prefix}_lat, or {prefix}_id')
+
+        lon = cls._to_column(lon, f'{prefix}_lon', dtype = np.float64)
+        lat = cls._to_column(lat, f'{prefix}_lat', dtype = np.float64)
+        if len(lon) != len(lat):
+            raise errors.HighchartsValueError(f'{prefix}_lon and {prefix}_lat must have '
+                                              f'the same length')
+
+        invalid_lon = ~np.isfinite(lon) | (lon < -180) | (lon > 180)
+        invalid_lat = ~np.isfinite(lat) | (lat < -90) | (lat > 90)
+        if invalid_lon.any():
+            index = int(np.argmax(invalid_lon))
+            raise errors.HighchartsValueError(f'{prefix}_lon expects values between '
+                                              f'-180 and 180. Received {lon[index]} at '
+                                              f'index {index}.')
+        if invalid_lat.any():
+            index = int(np.argmax(invalid_lat))
+            raise errors.HighchartsValueError(f'{prefix}_lat expects values between '
+                                              f'-90 and 90. Received {lat[index]} at '
+                                              f'index {index}.')
+
+        return np.column_stack((lon, lat))
+
+    @classmethod
+    def from_coordinates(cls,
+                         from_lon = None,
+                         from_lat = None,
+                         to_lon = None,
+                         to_lat = None,
+                         weight = None,
+                         from_id = None,
+                         to_id = None):
+        """Create a collection from columns of origin and destination coordinates (or
+        point IDs), validating them in vectorized form and storing them as columns
+        rather than as individual :class:`FlowmapData` instances.
+
+        .. code-block:: python
+
+          collection = FlowmapDataCollection.from_coordinates(
+              from_lon = df['origin_lon'],
+              from_lat = df['origin_lat'],
+              to_lon = df['destination_lon'],
+              to_lat = df['destination_lat'],
+              weight = df['passengers']
+          )
+          my_series = FlowmapSeries(data = collection)
+
+        :param from_lon: The longitudes of each link's origin.
+        :param from_lat: The latitudes of each link's origin.
+        :param to_lon: The longitudes of each link's destination.
+        :param to_lat: The latitudes of each link's destination.
+
+        :param weight: The weight of each link. Defaults to :obj:`None <python:None>`,
+          which serializes each link's weight as ``null``.
+
+        :param from_id: The IDs of the map points holding each link's origin. Supply
+          either ``from_id`` or ``from_lon`` and ``from_lat``. Defaults to
+          :obj:`None <python:None>`.
+
+        :param to_id: The IDs of the map points holding each link's destination. Supply
+          either ``to_id`` or ``to_lon`` and ``to_lat``. Defaults to
+          :obj:`None <python:None>`.
+
+        .. note::
+
+          Each column may be a :class:`numpy.ndarray <numpy:numpy.ndarray>`, a
+          `pyarrow <https://arrow.apache.org/docs/python/>`__ array, a
+          :class:`pandas.Series <pandas:pandas.Series>`, or any iterable.
+
+        :returns: A collection whose
+          :meth:`.ndarray <highcharts_core.options.series.data.collections.DataPointCollection.ndarray>`
+          holds the ``from_``, ``to``, and ``weight`` columns.
+        :rtype: :class:`FlowmapDataCollection`
+
+        :raises HighchartsValueError: if the columns are missing, differ in length, or
+          contain coordinates that are out of range
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in the runtime '
+                                                   'environment. Please install it '
+                                                   'using "pip install numpy" or '
+                                                   'equivalent.')
+
+        columns = {
+            'from_': cls._validate_coordinate_columns(from_lon, from_lat, from_id, 'from'),
+            'to': cls._validate_coordinate_columns(to_lon, to_lat, to_id, 'to'),
+        }
+        if weight is not None:
+            columns['weight'] = cls._to_column(weight, 'weight', dtype = np.float64)
+        else:
+            columns['weight'] = np.full(len(columns['from_']), np.nan)
+
+        lengths = set(len(x) for x in columns.values())
+        if len(lengths) > 1:
+            raise errors.HighchartsValueError(f'from_coordinates expects columns of '
+                                              f'equal length. Received lengths: '
+                                              f'{sorted(lengths)}')
+
+        collection = cls()
+        collection._ndarray = columns
+
+        return collection
+
+    @staticmethod
+    def _to_endpoint_column(values, name):
+        """Convert a sequence of :class:`FlowmapData` endpoints (point IDs or
+        ``[longitude, latitude]`` pairs) to an object array of IDs or an ``(N, 2)``
+        :class:`numpy.ndarray <numpy:numpy.ndarray>` of coordinates."""
+        if all(isinstance(x, str) for x in values):
+            return np.asarray(values, dtype = object).reshape(-1)
+        if any(isinstance(x, str) or x is None for x in values):
+            raise errors.HighchartsValueError(f'{name} must be either all point IDs or '
+                                              f'all coordinates to aggregate flows')
+
+        return np.asarray(values, dtype = np.float64).reshape(-1, 2)
+
+    def _get_flow_columns(self):
+        """Return the ``from_``, ``to``, and ``weight`` columns of the collection,
+        whether it holds columnar data or data points."""
+        if self.ndarray and not self.data_points and 'from_' in self.ndarray:
+            from_ = self.ndarray['from_']
+            to = self.ndarray['to']
+            weight = self.ndarray.get('weight', None)
+            if weight is None:
+                weight = np.full(len(from_), np.nan)
+            return from_, to, np.asarray(weight, dtype = np.float64)
+
+        data_points = self.to_array(force_object = True) if self else []
+        from_ = self._to_endpoint_column([x.from_ for x in data_points], 'from')
+        to = self._to_endpoint_column([x.to for x in data_points], 'to')
+        weight = np.asarray([np.nan if x.weight is None else float(x.weight)
+                             for x in data_points],
+                            dtype = np.float64)
+
+        return from_, to, weight
+
+    @staticmethod
+    def _group_endpoints(column, resolution = None):
+        """Group the endpoints in ``column``, snapping coordinates to a grid of
+        ``resolution`` degrees if supplied.
+
+        :returns: The group index of each endpoint, and the endpoint representing each
+          group (the ID, or the mean coordinates of the group's members).
+        :rtype: :class:`tuple <python:tuple>` of
+          :class:`numpy.ndarray <numpy:numpy.ndarray>`
+        """
+        if column.dtype == object:
+            groups, inverse = np.unique(column, return_inverse = True)
+            return inverse.reshape(-1), groups.astype(object)
+
+        if resolution:
+            keys = np.floor(column / resolution).astype(np.int64)
+        else:
+            keys = column
+        inverse = np.unique(keys, axis = 0, return_inverse = True)[1].reshape(-1)
+        counts = np.bincount(inverse)
+        groups = np.column_stack([np.bincount(inverse, weights = column[:, 0]) / counts,
+                                  np.bincount(inverse, weights = column[:, 1]) / counts])
+
+        return inverse, groups
+
+    @staticmethod
+    def _bundle_flows(from_, to, weight, bundle_angle, bundle_distance):
+        """Merge near-parallel flows: those whose bearings fall in the same
+        ``bundle_angle``-degree bin and whose midpoints and lengths fall in the same
+        ``bundle_distance``-degree bin. Each bundle runs between the mean origin and mean
+        destination of its members, and carries their summed weight."""
+        delta = to - from_
+        bearing = np.degrees(np.arctan2(delta[:, 1], delta[:, 0])) + 180
+        midpoint = (from_ + to) / 2
+        length = np.hypot(delta[:, 0], delta[:, 1])
+        keys = np.column_stack([np.floor(bearing / bundle_angle),
+                                np.floor(midpoint / bundle_distance),
+                                np.floor(length / bundle_distance)]).astype(np.int64)
+
+        inverse = np.unique(keys, axis = 0, return_inverse = True)[1].reshape(-1)
+        counts = np.bincount(inverse)
+
+        def mean(values):
+            return np.bincount(inverse, weights = values) / counts
+
+        bundled_from = np.column_stack([mean(from_[:, 0]), mean(from_[:, 1])])
+        bundled_to = np.column_stack([mean(to[:, 0]), mean(to[:, 1])])
+
+        return bundled_from, bundled_to, np.bincount(inverse, weights = weight)
+
+    def aggregate(self,
+                  resolution = None,
+                  regions = None,
+                  weight_quantile = None,
+                  bundle = False,
+                  bundle_angle = 10,
+                  bundle_distance = 1):
+        """Return a new collection in which the collection's flows are aggregated by
+        origin and destination, with their weights summed.
+
+        Flows are grouped by their endpoints, which are:
+
+          * point IDs, if the flows are expressed using IDs, or
+          * coordinates snapped to a grid of ``resolution`` degrees, or
+          * the region returned for each coordinate by ``regions``, or
+          * (if neither ``resolution`` nor ``regions`` is supplied) exact coordinates.
+
+        Coordinates that are snapped to a grid are replaced by the mean coordinates of
+        the (origin and destination) endpoints in their grid cell. Flows without a weight count as a weight of
+        ``1``.
+
+        .. code-block:: python
+
+          aggregated = collection.aggregate(resolution = 0.5,
+                                            weight_quantile = 0.9,
+                                            bundle = True)
+
+        :param resolution: The size (in degrees) of the grid cells to which coordinates
+          are snapped. Defaults to :obj:`None <python:None>`.
+        :type resolution: numeric or :obj:`None <python:None>`
+
+        :param regions: A function which receives arrays of longitudes and latitudes,
+          and returns an equal-length array of the IDs of the regions (map points)
+          containing them. The aggregated flows then connect those IDs. Defaults to
+          :obj:`None <python:None>`.
+        :type regions: callable or :obj:`None <python:None>`
+
+        :param weight_quantile: If supplied, aggregated flows whose weight falls below
+          this quantile (between ``0`` and ``1``) of all aggregated weights are dropped.
+          Defaults to :obj:`None <python:None>`.
+        :type weight_quantile: numeric or :obj:`None <python:None>`
+
+        :param bundle: If ``True``, merges near-parallel aggregated flows into
+          bundles. Requires coordinate endpoints. Defaults to ``False``.
+        :type bundle: :class:`bool <python:bool>`
+
+        :param bundle_angle: The width (in degrees) of the bearing bins used to
+          determine whether flows are parallel. Must be greater than ``0``. Defaults to
+          ``10``.
+        :type bundle_angle: numeric
+
+        :param bundle_distance: The size (in degrees) of the bins used to determine
+          whether parallel flows are near one another (by their midpoints and lengths).
+          Must be greater than ``0``. Defaults to ``1``.
+        :type bundle_distance: numeric
+
+        :returns: A collection whose
+          :meth:`.ndarray <highcharts_core.options.series.data.collections.DataPointCollection.ndarray>`
+          holds the aggregated ``from_``, ``to``, and ``weight`` columns, sorted by
+          descending weight.
+        :rtype: :class:`FlowmapDataCollection`
+
+        :raises HighchartsValueError: if the arguments are invalid or incompatible with
+          the collection's flows
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in the runtime '
+                                                   'environment. Please install it '
+                                                   'using "pip install numpy" or '
+                                                   'equivalent.')
+
+        resolution = validators.numeric(resolution, allow_empty = True, minimum = 0)
+        weight_quantile = validators.numeric(weight_quantile,
+                                             allow_empty = True,
+                                             minimum = 0,
+                                             maximum = 1)
+        bundle_angle = validators.numeric(bundle_angle, minimum = 0)
+        bundle_distance = validators.numeric(bundle_distance, minimum = 0)
+        if bundle_angle <= 0 or bundle_distance <= 0:
+            raise errors.HighchartsValueError(f'bundle_angle and bundle_distance '
+                                              f'expect values greater than 0. '
+                                              f'Received: {bundle_angle}, '
+                                              f'{bundle_distance}')
+        if resolution is not None and regions is not None:
+            raise errors.HighchartsValueError('aggregate accepts either resolution or '
+                                              'regions, not both')
+        if regions is not None and not callable(regions):
+            raise errors.HighchartsValueError('regions expects a callable')
+
+        from_, to, weight = self._get_flow_columns()
+        weight = np.where(np.isnan(weight), 1.0, weight)
+
+        if regions is not None:
+            region_columns = []
+            for column, name in [(from_, 'from'), (to, 'to')]:
+                if column.dtype == object:
+                    region_columns.append(column)
+                    continue
+                region_ids = self._to_column(regions(column[:, 0], column[:, 1]),
+                                             f'regions() for {name}',
+                                             dtype = object)
+                if len(region_ids) != len(column):
+                    raise errors.HighchartsValueError(f'regions() returned '
+                                                      f'{len(region_ids)} values for '
+                                                      f'{len(column)} coordinates')
+                region_columns.append(region_ids)
+            from_, to = region_columns
+
+        if (from_.dtype == object) == (to.dtype == object):
+            index, groups = self._group_endpoints(np.concatenate([from_, to]),
+                                                  resolution)
+            from_index, to_index = index[:len(from_)], index[len(from_):]
+            from_groups = to_groups = groups
+        else:
+            from_index, from_groups = self._group_endpoints(from_, resolution)
+            to_index, to_groups = self._group_endpoints(to, resolution)
+
+        pair_keys = from_index.astype(np.int64) * len(to_groups) + to_index
+        pairs, first, inverse = np.unique(pair_keys,
+                                          return_index = True,
+                                          return_inverse = True)
+        inverse = inverse.reshape(-1)
+        from_ = from_groups[from_index[first]]
+        to = to_groups[to_index[first]]
+        weight = np.bincount(inverse, weights = weight, minlength = len(pairs))
+
+        if bundle and len(weight):
+            if from_.dtype == object or to.dtype == object:
+                raise errors.HighchartsValueError('bundling flows requires coordinate '
+                                                  'endpoints, not point IDs')
+            from_, to, weight = self._bundle_flows(from_,
+                                                   to,
+                                                   weight,
+                                                   float(bundle_angle),
+                                                   float(bundle_distance))
+
+        if weight_quantile is not None and len(weight):
+            keep = weight >= np.quantile(weight, float(weight_quantile))
+            from_, to, weight = from_[keep], to[keep], weight[keep]
+
+        order = np.argsort(-weight, kind = 'stable')
+
+        collection = self.__class__()
+        collection._ndarray = {
+            'from_': from_[order],
+            'to': to[order],
+            'weight': weight[order],
+        }
+
+        return collection
+
+    @staticmethod
+    def _serialize_column(column):
+        """Serialize each member of ``column`` to a JavaScript literal string, returning
+        a :class:`list <python:list>` of strings."""
+        if column.dtype == object:
+            return [
+                "'" + x.replace('\\', '\\\\').replace("'", "\\'") + "'"
+                for x in column.tolist()
+            ]
+
+        as_str = column.astype(str)
+        if column.ndim == 2:
+            return [f'[{x},{y}]' for x, y in zip(as_str[:, 0].tolist(),
+                                                  as_str[:, 1].tolist())]
+
+        return np.where(np.isnan(column), 'null', as_str).tolist()
+
+    def to_js_literal(self,
+                      filename = None,
+                      encoding = 'utf-8',
+                      careful_validation = False) -> Optional[str]:
+        """Return the object represented as a :class:`str <python:str>` containing the
+        JavaScript object literal.
+
+        .. note::
+
+          If the collection holds only columnar data (e.g. as created by
+          :meth:`.from_coordinates() <FlowmapDataCollection.from_coordinates>`), the
+          columns are serialized directly, without assembling per-row lists.
+
+        :param filename: The name of a file to which the JavaScript object literal should
+          be persisted. Defaults to :obj:`None <python:None>`
+        :type filename: Path-like
+
+        :param encoding: The character encoding to apply to the resulting object. Defaults
+          to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :param careful_validation: if ``True``, will carefully validate JavaScript values
+          along the way using the
+          `esprima-python <https://github.com/Kronuz/esprima-python>`__ library. Defaults
+          to ``False``.
+        :type careful_validation: :class:`bool <python:bool>`
+
+        :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+        """
+        if not self.ndarray or self.data_points or self.array is not None:
+            return super().to_js_literal(filename = filename,
+                                         encoding = encoding,
+                                         careful_validation = careful_validation)
+
+        if filename:
+            filename = validators.path(filename)
+
+        props = [x for x in self._get_props_from_array() if x in self.ndarray]
+        columns = [self._serialize_column(self.ndarray[x]) for x in props]
+        as_str = '[' + ','.join(f"[{','.join(x)}]" for x in zip(*columns)) + ']'
+
+        if filename:
+            with open(filename, 'w', encoding = encoding) as file_:
+                file_.write(as_str)
+
+        return as_str
@@ -11,13 +11,15 @@ except ImportError:
 
 from highcharts_maps import constants, errors, utility_functions
 from highcharts_maps.decorators import class_sensitive, validate_types
-from highcharts_maps.options.series.data.base import DataCore
+from highcharts_maps.options.series.data.base import (DataCore,
+                                                      CompactDataMixin,
+                                                      TrustedConstructionMixin)
 from highcharts_maps.options.series.data.collections import DataPointCollection
 from highcharts_maps.utility_classes.data_labels import DataLabel
 from highcharts_maps.utility_classes.geojson import Feature
 
 
-class GeometricDataBase(DataCore):
+class GeometricDataBase(DataCore, CompactDataMixin, TrustedConstructionMixin):
     """Base class for representing geometric data on map charts."""
 
     def __init__(self, **kwargs):
@@ -930,11 +932,13 @@ class GeometricLatLonData(GeometricDataBase):
     def __init__(self, **kwargs):
         self._lat = None
         self._lon = None
+        self._value = None
         self._x = None
         self._y = None
 
         self.lat = kwargs.get('lat', None)
         self.lon = kwargs.get('lon', None)
+        self.value = kwargs.get('value', None)
         self.x = kwargs.get('x', None)
         self.y = kwargs.get('y', None)
 
@@ -988,6 +992,23 @@ class GeometricLatLonData(GeometricDataBase):
     def lon(self, value):
         self._lon = validators.numeric(value, allow_empty = True)
 
+    @property
+    def value(self) -> Optional[int | float | Decimal | constants.EnforcedNullType]:
+        """The ``value`` of the data point (e.g. the value represented by a
+        :class:`GeoHeatmapSeries <highcharts_maps.options.series.flowmap.GeoHeatmapSeries>`
+        cell). Defaults to :obj:`None <python:None>`.
+
+        :rtype: numeric or :class:`EnforcedNullType` or :obj:`None <python:None>`
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value_):
+        if value_ is None or isinstance(value_, constants.EnforcedNullType):
+            self._value = None
+        else:
+            self._value = validators.numeric(value_)
+
     @property
     def x(self) -> Optional[int | float | Decimal]:
         """The x-coordinate of the data point, expressed in projected units. Defaults to
@@ -1123,6 +1144,7 @@ class GeometricLatLonData(GeometricDataBase):
             'geometry': as_dict.get('geometry', None),
             'lat': as_dict.get('lat', None),
             'lon': as_dict.get('lon', None),
+            'value': as_dict.get('value', None),
             'x': as_dict.get('x', None),
             'y': as_dict.get('y', None),
         }
@@ -1143,6 +1165,7 @@ class GeometricLatLonData(GeometricDataBase):
         untrimmed = {
             'lat': self.lat,
             'lon': self.lon,
+            'value': self.value,
             'x': self.x,
             'y': self.y,
         }
@@ -1,5 +1,10 @@
 from typing import Optional
 from collections import UserDict
+import concurrent.futures
+import contextvars
+import copy
+import hashlib
+import itertools
 import requests
 import os
 
@@ -16,15 +21,478 @@ except ImportError:
 
 import geojson
 from validator_collection import validators, checkers
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 from highcharts_maps import errors, utility_functions
-from highcharts_maps.decorators import class_sensitive
+from highcharts_maps.decorators import class_sensitive, validate_types
 from highcharts_maps.metaclasses import HighchartsMeta
 from highcharts_maps.utility_classes.topojson import Topology
+from highcharts_maps.utility_classes.crs import CRSTransformer
 from highcharts_maps.utility_classes.javascript_functions import CallbackFunction
 from highcharts_maps.utility_classes.fetch_configuration import FetchConfiguration
 
 
+_LABEL_ANCHOR_CACHE = {}
+_LABEL_ANCHOR_CACHE_SIZE = 32
+
+
+def _iter_features(geometry):
+    """Yield the feature geometries found within a :term:`TopoJSON` object."""
+    if geometry.get('type', None) == 'GeometryCollection':
+        for item in geometry.get('geometries', []) or []:
+            yield item
+    elif geometry.get('type', None):
+        yield geometry
+
+
+def _get_feature_polygons(geometry):
+    """Return the polygons of a :term:`TopoJSON` feature geometry, each expressed as a
+    list of rings of arc indices."""
+    geometry_type = geometry.get('type', None)
+    if geometry_type == 'Polygon':
+        return [geometry.get('arcs', []) or []]
+    if geometry_type == 'MultiPolygon':
+        return list(geometry.get('arcs', []) or [])
+    if geometry_type == 'GeometryCollection':
+        return [polygon for item in geometry.get('geometries', []) or []
+                for polygon in _get_feature_polygons(item)]
+
+    return []
+
+
+def _get_ring(arc_indices, positions, offsets):
+    """Assemble the positions of a ring from the (decoded) arcs it references, skipping
+    the position each arc shares with the one before it."""
+    parts = []
+    for count, index in enumerate(arc_indices):
+        if index < 0:
+            part = positions[offsets[~index]:offsets[~index + 1]][::-1]
+        else:
+            part = positions[offsets[index]:offsets[index + 1]]
+        parts.append(part[1:] if count else part)
+
+    if not parts:
+        return np.zeros((0, 2))
+
+    ring = np.concatenate(parts)
+
+    return ring[~np.isnan(ring).any(axis = 1)]
+
+
+def _build_topology(value, kwargs):
+    """Build the :term:`topology` of a single :term:`map geometry`.
+
+    Defined at module level so that it can be dispatched to a process pool.
+
+    :rtype: :class:`Topology <highcharts_maps.utility_classes.topojson.Topology>`
+    """
+    if checkers.is_type(value, 'GeoDataFrame'):
+        return MapData.from_geodataframe(value, **kwargs).topology
+
+    return MapData(topology = value).topology
+
+
+def _map_in_processes(function, arguments, max_workers = None):
+    """Apply ``function`` to each tuple of ``arguments`` using a process pool, returning
+    the results in the order of ``arguments``.
+
+    If only one worker would be used, ``function`` is applied in the current process
+    instead, which avoids the overhead of starting (and pickling data into) a pool.
+    """
+    arguments = [x for x in arguments]
+    max_workers = validators.integer(max_workers, allow_empty = True, minimum = 1)
+    max_workers = min(max_workers or os.cpu_count() or 1, len(arguments))
+    if max_workers <= 1:
+        return [function(*x) for x in arguments]
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers = max_workers) as executor:
+        return list(executor.map(function, *zip(*arguments)))
+
+
+def _remap_arc_indices(value, mapping):
+    """Replace the (possibly nested, and possibly reversed) arc indices in ``value``
+    with their counterparts in ``mapping``."""
+    if isinstance(value, list):
+        return [_remap_arc_indices(x, mapping) for x in value]
+
+    return mapping[value] if value >= 0 else ~mapping[~value]
+
+
+def _remap_geometry_arcs(geometry, mapping):
+    """Replace the arc indices referenced by ``geometry`` (and any geometries it
+    contains) with their counterparts in ``mapping``, in place."""
+    if 'arcs' in geometry:
+        geometry['arcs'] = _remap_arc_indices(geometry['arcs'], mapping)
+    for item in geometry.get('geometries', []) or []:
+        _remap_geometry_arcs(item, mapping)
+
+
+def _expand_arc_indices(value, mapping):
+    """Replace each arc index in the (possibly nested) arc references ``value`` with the
+    sequence of arc indices in ``mapping`` that the arc was cut into, reversing the
+    sequence for a reversed arc."""
+    if value and isinstance(value[0], list):
+        return [_expand_arc_indices(x, mapping) for x in value]
+
+    result = []
+    for index in value:
+        if index >= 0:
+            result.extend(mapping[index])
+        else:
+            result.extend(~x for x in reversed(mapping[~index]))
+
+    return result
+
+
+def _expand_geometry_arcs(geometry, mapping):
+    """Replace the arc indices referenced by ``geometry`` (and any geometries it
+    contains) with the sequences of arc indices in ``mapping``, in place."""
+    if 'arcs' in geometry:
+        geometry['arcs'] = _expand_arc_indices(geometry['arcs'], mapping)
+    for item in geometry.get('geometries', []) or []:
+        _expand_geometry_arcs(item, mapping)
+
+
+def _transform_point_geometries(geometry, function):
+    """Replace the positions of the ``Point`` and ``MultiPoint`` geometries found within
+    ``geometry`` with the result of applying ``function`` to them, in place.
+
+    ``function`` receives (and should return) a list of positions.
+    """
+    geometry_type = geometry.get('type', None)
+    if geometry_type == 'Point' and geometry.get('coordinates', None):
+        geometry['coordinates'] = function([geometry['coordinates']])[0]
+    elif geometry_type == 'MultiPoint' and geometry.get('coordinates', None):
+        geometry['coordinates'] = function(geometry['coordinates'])
+    for item in geometry.get('geometries', []) or []:
+        _transform_point_geometries(item, function)
+
+
+def _collect_arc_indices(value, result):
+    """Add the (absolute) arc indices referenced within ``value`` to the set
+    ``result``."""
+    if isinstance(value, list):
+        for item in value:
+            _collect_arc_indices(item, result)
+    else:
+        result.add(value if value >= 0 else ~value)
+
+
+def _collect_geometry_arcs(geometry, result):
+    """Add the (absolute) arc indices referenced by ``geometry`` (and any geometries
+    it contains) to the set ``result``."""
+    if 'arcs' in geometry:
+        _collect_arc_indices(geometry['arcs'], result)
+    for item in geometry.get('geometries', []) or []:
+        _collect_geometry_arcs(item, result)
+
+
+def _get_feature_matcher(features, key):
+    """Return a function which indicates whether a :term:`TopoJSON` feature geometry
+    is matched by ``features``, as supplied to :meth:`MapData.select`."""
+    def get_key(geometry):
+        return (geometry.get('properties', None) or {}).get(key, geometry.get(key, None))
+
+    if callable(features):
+        return lambda geometry: bool(features(geometry.get('properties', None) or {}))
+
+    if isinstance(features, dict):
+        filters = {}
+        for name, value in features.items():
+            if checkers.is_iterable(value, forbid_literals = (str, bytes, dict)):
+                filters[name] = [x for x in value]
+            else:
+                filters[name] = [value]
+
+        def matcher(geometry):
+            properties = geometry.get('properties', None) or {}
+            return all(properties.get(name, geometry.get(name, None)) in values
+                       for name, values in filters.items())
+
+        return matcher
+
+    if checkers.is_iterable(features, forbid_literals = (str, bytes)):
+        keys = set(features)
+    else:
+        keys = set([features])
+
+    return lambda geometry: get_key(geometry) in keys
+
+
+def _to_list(value):
+    """Return ``value`` (a position or list of positions held by a :term:`topology`) as
+    a (nested) :class:`list <python:list>`."""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_to_list(x) for x in value]
+
+    return value
+
+
+def _copy_feature_geometry(geometry, coordinates = None):
+    """Return a copy of the :term:`TopoJSON` feature geometry ``geometry``, as held by a
+    :class:`Topology <highcharts_maps.utility_classes.topojson.Topology>`'s output.
+
+    Point positions which the topology holds by reference to its ``coordinates`` are
+    resolved, as they would be when serializing the topology.
+    """
+    result = {**geometry}
+    if 'properties' in result and isinstance(result['properties'], dict):
+        result['properties'] = {**result['properties']}
+    if 'geometries' in result:
+        result['geometries'] = [_copy_feature_geometry(x, coordinates)
+                                for x in result['geometries']]
+
+    geometry_type = result.get('type', None)
+    if result.pop('reset_coords', None) and coordinates and \
+       geometry_type in ['Point', 'MultiPoint']:
+        indices = result['coordinates']
+        for _ in range(1 if geometry_type == 'Point' else 2):
+            indices = list(itertools.chain(*indices))
+        positions = [_to_list(coordinates[x][0]) for x in indices]
+        result['coordinates'] = positions[0] if geometry_type == 'Point' else positions
+
+    return result
+
+
+def _subset_topology_dict(as_dict, selected):
+    """Return a copy of the :term:`TopoJSON` topology ``as_dict`` whose objects are
+    replaced by ``selected`` (a :class:`dict <python:dict>` of object name to object
+    geometry), retaining and re-numbering only the arcs that they reference.
+
+    ``as_dict`` may be the output held by a
+    :class:`Topology <highcharts_maps.utility_classes.topojson.Topology>`, which is
+    read but not modified: only the selected geometries and the arcs they reference are
+    copied.
+    """
+    used_arcs = set()
+    for geometry in selected.values():
+        _collect_geometry_arcs(geometry, used_arcs)
+
+    arcs = as_dict.get('arcs', []) or []
+    mapping = {}
+    subset = []
+    for index in sorted(used_arcs):
+        mapping[index] = len(subset)
+        subset.append(_to_list(arcs[index]))
+
+    result = {
+        name: (dict(value) if isinstance(value, dict) else value)
+        for name, value in as_dict.items()
+        if name not in ['objects', 'arcs', 'bbox', 'coordinates', 'options']
+    }
+    result['objects'] = {}
+    coordinates = as_dict.get('coordinates', None)
+    for name, geometry in selected.items():
+        geometry = _copy_feature_geometry(geometry, coordinates)
+        _remap_geometry_arcs(geometry, mapping)
+        result['objects'][name] = geometry
+    result['arcs'] = subset
+
+    return result
+
+
+def _cut_arcs_at_junctions(arcs):
+    """Cut each of ``arcs`` at its junctions: the positions at which it meets, leaves,
+    or crosses another arc.
+
+    A position is a junction if it is an end of an (open) arc, or if it is reached from
+    different neighbouring positions by different arcs. A closed ring is rotated to
+    start at its first junction, or - if it has none - at its lowest position, so that
+    identical rings in different sources are cut identically.
+
+    :param arcs: The arcs, each an ``(N, 2)`` :class:`numpy.ndarray <numpy:numpy.ndarray>`
+      of at least two positions, without consecutive duplicates.
+    :type arcs: :class:`list <python:list>`
+
+    :returns: The segments of each arc, in order.
+    :rtype: :class:`list <python:list>` of :class:`list <python:list>` of
+      :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    """
+    if not any(len(x) for x in arcs):
+        return [[x] for x in arcs]
+
+    offsets = np.concatenate([[0], np.cumsum([len(x) for x in arcs])])
+    _, ids = np.unique(np.vstack(arcs), axis = 0, return_inverse = True)
+    ids = ids.reshape(-1)
+    arc_ids = [ids[offsets[x]:offsets[x + 1]] for x in range(len(arcs))]
+    closed = [len(x) > 2 and x[0] == x[-1] for x in arc_ids]
+
+    is_junction = np.zeros(ids.max() + 1, dtype = bool)
+    neighbours = []
+    for vertices, is_closed in zip(arc_ids, closed):
+        if not len(vertices):
+            continue
+        if is_closed:
+            vertices = vertices[:-1]
+            previous, following = np.roll(vertices, 1), np.roll(vertices, -1)
+        else:
+            is_junction[vertices[[0, -1]]] = True
+            previous, following = vertices[:-2], vertices[2:]
+            vertices = vertices[1:-1]
+        neighbours.append(np.stack([vertices,
+                                    np.minimum(previous, following),
+                                    np.maximum(previous, following)], axis = 1))
+
+    neighbours = np.unique(np.vstack(neighbours), axis = 0)
+    vertices, counts = np.unique(neighbours[:, 0], return_counts = True)
+    is_junction[vertices[counts > 1]] = True
+
+    result = []
+    for arc, vertices, is_closed in zip(arcs, arc_ids, closed):
+        if len(arc) < 2:
+            result.append([arc])
+            continue
+        if is_closed:
+            starts = np.flatnonzero(is_junction[vertices[:-1]])
+            if len(starts):
+                start = starts[0]
+            else:
+                start = np.lexsort((arc[:-1, 1], arc[:-1, 0]))[0]
+            if start:
+                arc = np.vstack([arc[start:-1], arc[:start + 1]])
+                vertices = np.concatenate([vertices[start:-1], vertices[:start + 1]])
+
+        cuts = np.flatnonzero(is_junction[vertices[1:-1]]) + 1
+        bounds = [0, *cuts.tolist(), len(arc) - 1]
+        result.append([arc[first:last + 1]
+                       for first, last in zip(bounds[:-1], bounds[1:])])
+
+    return result
+
+
+def _merge_topology_dicts(as_dicts, object_names, quantization = None):
+    """Combine :term:`TopoJSON` topologies into a single topology holding one object per
+    input, named as per ``object_names``.
+
+    The arcs of every topology are decoded (if quantized) onto common coordinates and
+    cut at the junctions they share with any other topology's arcs (see
+    :func:`_cut_arcs_at_junctions`). The resulting segments are added to a single
+    collection of arcs, in which a segment that appears in more than one topology (in
+    either direction) is stored only once. The arc indices of each topology's
+    geometries are re-mapped accordingly.
+
+    :param quantization: If supplied, the arcs are quantized onto a transform common
+      to all of the topologies, covering this many positions along each axis, before
+      identical arcs are detected. If :obj:`None <python:None>`, the arcs are left
+      unquantized and only arcs with identical coordinates are combined.
+
+    :rtype: :class:`dict <python:dict>`
+    """
+    sources = []
+    extent = []
+    for as_dict in as_dicts:
+        transform = as_dict.get('transform', None)
+        positions, offsets = utility_functions.decode_arcs(as_dict.get('arcs', []),
+                                                           transform)
+        source_objects = as_dict.get('objects', {}) or {}
+        if len(source_objects) == 1:
+            geometry = list(source_objects.values())[0]
+        else:
+            geometry = {
+                'type': 'GeometryCollection',
+                'geometries': [x for x in source_objects.values()]
+            }
+
+        points = []
+        if transform:
+            scale, translate = transform['scale'], transform['translate']
+            _transform_point_geometries(
+                geometry,
+                lambda values: [[x[0] * scale[0] + translate[0],
+                                 x[1] * scale[1] + translate[1]] for x in values]
+            )
+        _transform_point_geometries(geometry,
+                                    lambda values: points.extend(values) or values)
+
+        sources.append((positions, offsets, geometry))
+        extent.append(positions)
+        extent.append(np.array([x[:2] for x in points], dtype = float).reshape(-1, 2))
+
+    extent = np.vstack(extent)
+    extent = extent[~np.isnan(extent).any(axis = 1)]
+
+    merged = {
+        'type': 'Topology',
+        'objects': {},
+        'arcs': []
+    }
+    for as_dict in as_dicts:
+        extras = {key: as_dict[key] for key in as_dict
+                  if key not in ['type', 'objects', 'arcs', 'transform', 'bbox']}
+        if extras:
+            merged.update(extras)
+            break
+    if len(extent):
+        merged['bbox'] = [*extent.min(axis = 0).tolist(), *extent.max(axis = 0).tolist()]
+
+    if quantization and len(extent):
+        quantization = int(quantization)
+        translate = extent.min(axis = 0)
+        scale = (extent.max(axis = 0) - translate) / (quantization - 1)
+        scale[scale == 0] = 1
+        merged['transform'] = {
+            'scale': scale.tolist(),
+            'translate': translate.tolist()
+        }
+
+        def encode(values):
+            values = np.asarray(values, dtype = float).reshape(-1, 2)
+            return np.round((values - translate) / scale).astype(np.int64)
+    else:
+        quantization = None
+
+    source_arcs = []
+    for positions, offsets, geometry in sources:
+        arcs = []
+        for arc_index in range(len(offsets) - 1):
+            arc = positions[offsets[arc_index]:offsets[arc_index + 1]]
+            arc = encode(arc) if quantization else arc + 0.0
+            changed = np.concatenate([[True], (np.diff(arc, axis = 0) != 0).any(axis = 1)])
+            arc = arc[changed]
+            if len(arc) < 2:
+                arc = np.vstack([arc, arc])
+            arcs.append(arc)
+        source_arcs.append(arcs)
+
+    segments = iter(_cut_arcs_at_junctions([x for arcs in source_arcs for x in arcs]))
+
+    index = {}
+    for arcs, (_, _, geometry), object_name in zip(source_arcs, sources, object_names):
+        mapping = []
+        for _ in arcs:
+            arc_mapping = []
+            for segment in next(segments):
+                key = segment.tobytes()
+                if key in index:
+                    arc_mapping.append(index[key])
+                    continue
+                reversed_key = segment[::-1].tobytes()
+                if reversed_key in index:
+                    arc_mapping.append(~index[reversed_key])
+                    continue
+
+                index[key] = len(merged['arcs'])
+                arc_mapping.append(index[key])
+                if quantization:
+                    segment = np.concatenate([segment[:1], np.diff(segment, axis = 0)])
+                merged['arcs'].append(segment.tolist())
+            mapping.append(arc_mapping)
+
+        _expand_geometry_arcs(geometry, mapping)
+        if quantization:
+            _transform_point_geometries(geometry,
+                                        lambda values: encode([x[:2] for x in values])
+                                                       .tolist())
+        merged['objects'][object_name] = geometry
+
+    return merged
+
 class MapData(HighchartsMeta):
     """The :term:`map geometry` data which defines the areas and features of the map
     itself."""
@@ -72,6 +540,29 @@ class MapData(HighchartsMeta):
 
         return f'{self.__class__.__name__}({kwargs_as_str})'
 
+    def __getstate__(self):
+        """Return the state of the map data to pickle, in which the
+        :meth:`.topology <highcharts_maps.options.series.data.map_data.MapData.topology>`
+        is serialized to :term:`TopoJSON`, which is far more compact (and faster to
+        restore) than its underlying object graph.
+
+        :rtype: :class:`dict <python:dict>`
+        """
+        return {
+            '_force_geojson': self.force_geojson,
+            '_topology': self.topology.to_json() if self.topology is not None else None
+        }
+
+    def __setstate__(self, state):
+        self._force_geojson = None
+        self._topology = None
+
+        self.force_geojson = state.get('_force_geojson', None)
+        topology = state.get('_topology', None)
+        if isinstance(topology, (str, bytes)):
+            topology = json.loads(topology)
+        self.topology = topology
+
     @property
     def force_geojson(self) -> Optional[bool]:
         """If ``True``, will serialize as :term:`GeoJSON`. If ``False``, will serialize
@@ -502,8 +993,28 @@ class MapData(HighchartsMeta):
         """
         return self.topology.to_gdf(object_name = object_name)
 
+    @staticmethod
+    def _get_reprojector(reproject, source_crs = None):
+        """Return a callable which transforms an ``(N, 2)``
+        :class:`numpy.ndarray <numpy:numpy.ndarray>` of coordinates as indicated by
+        ``reproject``.
+
+        :param reproject: A callable (returned as-is), or a target CRS from which a
+          :class:`CRSTransformer <highcharts_maps.utility_classes.crs.CRSTransformer>`
+          is created.
+
+        :param source_crs: The CRS of the coordinates being transformed, if known.
+
+        :rtype: callable
+        """
+        if callable(reproject):
+            return reproject
+
+        return CRSTransformer(target_crs = reproject,
+                              source_crs = source_crs or 'EPSG:4326')
+
     @classmethod
-    def from_geodataframe(cls, as_gdf, prequantize = False, **kwargs):
+    def from_geodataframe(cls, as_gdf, prequantize = False, reproject = None, **kwargs):
         """Create a :class:`MapData` instance from a
         :class:`geopandas.GeoDataFrame <geopandas:GeoDataFrame>`.
 
@@ -515,19 +1026,561 @@ class MapData(HighchartsMeta):
           ("quantizing the topology") before generating the :class:`Topology` instance.
           Defaults to ``False``.
         :type prequantize: :class:`bool <python:bool>`
-        
+
+        :param reproject: An optional target coordinate reference system (e.g.
+          ``'EPSG:5070'``) into which the geometries are transformed from the CRS of
+          ``as_gdf`` (or ``'EPSG:4326'``, if it has none), or a callable which receives
+          the coordinates of all geometries as a single ``(N, 2)``
+          :class:`numpy.ndarray <numpy:numpy.ndarray>` and returns the transformed
+          coordinates with the same shape. Defaults to :obj:`None <python:None>`, which
+          leaves coordinates as-is.
+
+          .. seealso::
+
+            * :class:`CRSTransformer <highcharts_maps.utility_classes.crs.CRSTransformer>`
+
+        :type reproject: :class:`str <python:str>`, :class:`int <python:int>`,
+          callable, or :obj:`None <python:None>`
+
         :param kwargs: additional keyword arguments which are passed to the
           :class:`Topology` constructor
         :type kwargs: :class:`dict <python:dict>`
 
         :rtype: :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>`
         """
+        if reproject is not None:
+            try:
+                import shapely
+            except ImportError:
+                raise errors.HighchartsDependencyError('MapData.from_geodataframe() '
+                                                       'requires shapely be installed '
+                                                       'to reproject geometries. '
+                                                       'However, it was not found in '
+                                                       'the runtime environment.')
+            reprojector = cls._get_reprojector(reproject,
+                                               source_crs = getattr(as_gdf, 'crs', None))
+            geometries = shapely.transform(np.asarray(as_gdf.geometry.values),
+                                           reprojector)
+            as_gdf = as_gdf.copy()
+            as_gdf[as_gdf.geometry.name] = geometries
+            if not callable(reproject):
+                as_gdf = as_gdf.set_crs(reproject, allow_override = True)
+
         topology = Topology(as_gdf, prequantize = prequantize, **kwargs)
 
         return cls(topology = topology)
 
     @classmethod
-    def from_shapefile(cls, shp_filename):
+    def from_many(cls, values, max_workers = None, **kwargs):
+        """Create a :class:`MapData` instance from each of ``values``, building their
+        :term:`topologies <topology>` in parallel using a pool of processes.
+
+        Constructing (and quantizing) a topology is CPU-bound, so when preparing many
+        independent maps (e.g. one per region) this is considerably faster than creating
+        each :class:`MapData` in turn. The results are returned in the same order as
+        ``values``, and are identical to those that would be produced serially.
+
+        .. code-block:: python
+
+          regions = [gdf[gdf['region'] == x] for x in gdf['region'].unique()]
+          region_maps = MapData.from_many(regions, topoquantize = 1e5)
+
+        .. note::
+
+          Each value (and each keyword argument) is pickled in order to be sent to a
+          worker process, so a callable supplied as ``reproject`` must be defined at
+          module level rather than as a ``lambda``.
+
+        :param values: The :term:`map geometries <map geometry>` to build. Accepts
+          :class:`geopandas.GeoDataFrame <geopandas:GeoDataFrame>` instances, along with
+          any other value accepted by
+          :meth:`.topology <highcharts_maps.options.series.data.map_data.MapData.topology>`
+          (e.g. :term:`TopoJSON` / :term:`GeoJSON` strings or files).
+        :type values: iterable
+
+        :param max_workers: The maximum number of worker processes to use. Defaults to
+          :obj:`None <python:None>`, which uses one per CPU. If ``1``, the topologies are
+          built in the current process.
+        :type max_workers: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param kwargs: additional keyword arguments which are passed to
+          :meth:`.from_geodataframe() <highcharts_maps.options.series.data.map_data.MapData.from_geodataframe>`
+          for each :class:`geopandas.GeoDataFrame <geopandas:GeoDataFrame>` in
+          ``values``
+        :type kwargs: :class:`dict <python:dict>`
+
+        :rtype: :class:`list <python:list>` of :class:`MapData`
+        """
+        values = validators.iterable(values,
+                                     allow_empty = True,
+                                     forbid_literals = (str, bytes, dict)) or []
+        values = [x for x in values]
+        topologies = _map_in_processes(_build_topology,
+                                       [(x, kwargs) for x in values],
+                                       max_workers = max_workers)
+
+        return [cls(topology = x) for x in topologies]
+
+    @classmethod
+    def from_geodataframes(cls,
+                           gdfs,
+                           object_names = None,
+                           max_workers = None,
+                           topoquantize = False,
+                           **kwargs):
+        """Create a single :class:`MapData` instance holding one :term:`TopoJSON` object
+        per :class:`geopandas.GeoDataFrame <geopandas:GeoDataFrame>` in ``gdfs``,
+        building the topology of each object in parallel using a pool of processes.
+
+        The per-object topologies are then merged, which means that (unlike supplying
+        the same collection to
+        :meth:`.topology <highcharts_maps.options.series.data.map_data.MapData.topology>`)
+        arcs are only shared across objects where their coordinates are identical.
+        The result does not depend on the number of workers used.
+
+        :param gdfs: The geometries of each object.
+        :type gdfs: iterable of
+          :class:`geopandas.GeoDataFrame <geopandas:GeoDataFrame>`
+
+        :param object_names: The name to give each object. Defaults to
+          :obj:`None <python:None>`, which names them ``'obj_0'``, ``'obj_1'``, etc.
+        :type object_names: iterable of :class:`str <python:str>` or
+          :obj:`None <python:None>`
+
+        :param max_workers: The maximum number of worker processes to use. Defaults to
+          :obj:`None <python:None>`, which uses one per CPU. If ``1``, the topologies are
+          built in the current process.
+        :type max_workers: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param topoquantize: If supplied, the quantization factor applied to the merged
+          topology. Defaults to ``False``, which does not quantize it.
+        :type topoquantize: :class:`int <python:int>`, :class:`float <python:float>`,
+          or :class:`bool <python:bool>`
+
+        :param kwargs: additional keyword arguments which are passed to
+          :meth:`.from_geodataframe() <highcharts_maps.options.series.data.map_data.MapData.from_geodataframe>`
+          for each :class:`geopandas.GeoDataFrame <geopandas:GeoDataFrame>`
+        :type kwargs: :class:`dict <python:dict>`
+
+        :rtype: :class:`MapData`
+
+        :raises HighchartsValueError: if ``object_names`` does not supply a unique name
+          for each member of ``gdfs``
+        """
+        gdfs = [x for x in validators.iterable(gdfs)]
+        if object_names is None:
+            object_names = [f'obj_{x}' for x in range(len(gdfs))]
+        else:
+            object_names = [validators.string(x)
+                            for x in validators.iterable(object_names)]
+        if len(object_names) != len(gdfs) or \
+           len(set(object_names)) != len(object_names):
+            raise errors.HighchartsValueError(f'object_names expects a unique name for '
+                                              f'each of the {len(gdfs)} GeoDataFrames. '
+                                              f'Received: {object_names}')
+
+        topologies = _map_in_processes(_build_topology,
+                                       [(x, kwargs) for x in gdfs],
+                                       max_workers = max_workers)
+        merged = _merge_topology_dicts([x.to_dict() for x in topologies], object_names)
+        topology = Topology(merged, object_name = object_names)
+        if topoquantize:
+            topology = topology.topoquantize(topoquantize)
+
+        return cls(topology = topology)
+
+    def merge(self, *others, object_names = None, quantization = 1e5):
+        """Combine this instance's topology with those of ``others`` into a single
+        :term:`TopoJSON` topology, returned as a new :class:`MapData` instance.
+
+        Each topology is kept as a separate named object within the result (a topology
+        holding more than one object is collected into a ``GeometryCollection``), while
+        the arcs of all topologies are stored once in a single collection. Every arc is
+        cut at the junctions it shares with the arcs of the other topologies, and
+        segments which appear in more than one topology (in either direction) - for
+        example the boundary between a country outline and the state borders within
+        it - are detected and stored only once, so that the result serializes as one
+        compact topology.
+
+        .. note::
+
+          Only segments whose coordinates are identical once quantized onto the common
+          transform are combined. Boundaries that were digitized or simplified
+          differently in each source will still be stored separately.
+
+        :param others: The map data to merge with this instance. Accepts
+          :class:`MapData` instances or any value supported by
+          :meth:`.topology <highcharts_maps.options.series.data.map_data.MapData.topology>`.
+        :type others: :class:`MapData`, :class:`Topology`, :class:`str <python:str>`,
+          or :class:`dict <python:dict>`
+
+        :param object_names: The name to give each topology's object in the result, with
+          this instance first. Defaults to :obj:`None <python:None>`, which re-uses the
+          name of a topology's object where it holds only one, and names it
+          ``'obj_<index>'`` otherwise.
+        :type object_names: iterable of :class:`str <python:str>` or
+          :obj:`None <python:None>`
+
+        :param quantization: The number of positions along each axis of the transform
+          onto which the merged topology is quantized. Defaults to ``1e5``. If
+          :obj:`None <python:None>` or ``0``, the topology is left unquantized and only
+          arcs with exactly identical coordinates are combined.
+        :type quantization: :class:`int <python:int>`, :class:`float <python:float>`,
+          or :obj:`None <python:None>`
+
+        :rtype: :class:`MapData`
+
+        :raises HighchartsValueError: if any of the map data has no topology, or if
+          ``object_names`` does not supply a unique name for each topology
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          available in the runtime environment
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in the runtime '
+                                                   'environment. Please install it '
+                                                   'using "pip install numpy" or '
+                                                   'equivalent.')
+
+        sources = [self] + [x if isinstance(x, MapData) else MapData(topology = x)
+                            for x in others]
+        for source in sources:
+            if not isinstance(source.topology, Topology):
+                raise errors.HighchartsValueError('merge() expects map data with a '
+                                                  'topology. Received map data with '
+                                                  'none.')
+
+        as_dicts = [x.topology.to_dict() for x in sources]
+        if object_names is None:
+            object_names = []
+            for index, as_dict in enumerate(as_dicts):
+                names = [x for x in (as_dict.get('objects', {}) or {})]
+                name = names[0] if len(names) == 1 else f'obj_{index}'
+                if name in object_names:
+                    name = f'{name}_{index}'
+                object_names.append(name)
+        else:
+            object_names = [validators.string(x)
+                            for x in validators.iterable(object_names)]
+        if len(object_names) != len(sources) or \
+           len(set(object_names)) != len(object_names):
+            raise errors.HighchartsValueError(f'object_names expects a unique name for '
+                                              f'each of the {len(sources)} topologies. '
+                                              f'Received: {object_names}')
+
+        quantization = validators.numeric(quantization,
+                                          allow_empty = True,
+                                          minimum = 0)
+        if quantization and quantization < 2:
+            raise errors.HighchartsValueError(f'quantization expects at least 2 '
+                                              f'positions per axis. Received: '
+                                              f'{quantization}')
+        merged = _merge_topology_dicts(as_dicts,
+                                       object_names,
+                                       quantization = quantization)
+
+        return self.__class__(topology = Topology(merged, object_name = object_names))
+
+    def select(self, features, key = 'hc-key', object_name = None):
+        """Return a new :class:`MapData` instance whose topology holds only the features
+        of this instance's topology that are matched by ``features``.
+
+        The subset is taken directly from the :term:`TopoJSON` ``objects`` and ``arcs``
+        (without rebuilding the topology): only the matched feature geometries are kept,
+        and only the arcs they reference are retained and re-numbered. The selected
+        features' geometries, properties, and any quantization transform are left
+        unchanged.
+
+        :param features: Determines which features to select. Accepts:
+
+          * a callable, which receives each feature's properties as a
+            :class:`dict <python:dict>` and returns ``True`` if it should be selected
+          * a :class:`dict <python:dict>` of property filters, selecting the features
+            whose properties match every filter. The value of each filter may either be
+            a single value to match, or an iterable of acceptable values
+          * an iterable of ``key`` values (or a single ``key`` value), selecting the
+            features whose ``key`` is among them
+
+        :type features: callable, :class:`dict <python:dict>`, iterable, or
+          :class:`str <python:str>`
+
+        :param key: The property of each feature (or, failing that, the member of its
+          geometry) which is compared to ``features`` when supplied as key values.
+          Defaults to ``'hc-key'``.
+        :type key: :class:`str <python:str>`
+
+        :param object_name: The name(s) of the topology's objects from which to select
+          features, with any other objects omitted from the result. Defaults to
+          :obj:`None <python:None>`, which selects from all objects.
+        :type object_name: :class:`str <python:str>`, iterable of
+          :class:`str <python:str>`, or :obj:`None <python:None>`
+
+        :rtype: :class:`MapData`
+
+        :raises HighchartsValueError: if this instance has no topology, or if
+          ``object_name`` does not identify one of its objects
+        """
+        if not isinstance(self.topology, Topology):
+            raise errors.HighchartsValueError('select() requires map data with a '
+                                              'topology. This instance has none.')
+        key = validators.string(key)
+        matcher = _get_feature_matcher(features, key)
+
+        # The topology's output is read in place (rather than serialized), so that
+        # only the selected geometries and their arcs are copied.
+        as_dict = self.topology.output
+        objects = as_dict.get('objects', {}) or {}
+        object_names = self._get_object_names(objects, object_name)
+
+        selected = {}
+        for name in object_names:
+            geometry = objects[name]
+            if geometry.get('type', None) == 'GeometryCollection':
+                matched = [x for x in _iter_features(geometry) if matcher(x)]
+                selected[name] = {**geometry, 'geometries': matched}
+            elif geometry.get('type', None) and matcher(geometry):
+                selected[name] = geometry
+            else:
+                selected[name] = {'type': 'GeometryCollection', 'geometries': []}
+
+        result = _subset_topology_dict(as_dict, selected)
+
+        return self.__class__(topology = Topology(result, object_name = object_names))
+
+    def split(self, parent_key, object_name = None):
+        """Split this instance's topology into one :class:`MapData` instance per parent
+        region, each holding only the features that belong to that region.
+
+        This is typically used to prepare the child maps of a drilldown map (e.g. the
+        counties of each state), with each child topology produced as per
+        :meth:`.select() <highcharts_maps.options.series.data.map_data.MapData.select>`:
+        only the features belonging to the region are kept, and only the arcs they
+        reference are retained and re-numbered.
+
+        :param parent_key: Determines the parent region of each feature. Accepts either
+          the name of the feature property (or, failing that, the member of its
+          geometry) which holds the key of its parent region, or a callable which
+          receives the feature's properties as a :class:`dict <python:dict>` and returns
+          the key of its parent region. Features whose parent is
+          :obj:`None <python:None>` are omitted.
+        :type parent_key: :class:`str <python:str>` or callable
+
+        :param object_name: The name(s) of the topology's objects from which to take
+          features, with any other objects omitted from the results. Defaults to
+          :obj:`None <python:None>`, which takes features from all objects.
+        :type object_name: :class:`str <python:str>`, iterable of
+          :class:`str <python:str>`, or :obj:`None <python:None>`
+
+        :returns: The map data of each parent region, keyed by the parent's key in the
+          order each parent is first encountered.
+        :rtype: :class:`dict <python:dict>` of :class:`MapData`
+
+        :raises HighchartsValueError: if this instance has no topology, or if
+          ``object_name`` does not identify one of its objects
+        """
+        if not isinstance(self.topology, Topology):
+            raise errors.HighchartsValueError('split() requires map data with a '
+                                              'topology. This instance has none.')
+        if callable(parent_key):
+            get_parent = lambda geometry: parent_key(geometry.get('properties', None)
+                                                     or {})
+        else:
+            parent_key = validators.string(parent_key)
+            get_parent = lambda geometry: (geometry.get('properties', None) or {}).get(
+                parent_key,
+                geometry.get(parent_key, None)
+            )
+
+        # As in select(), the topology's output is read in place, so that each child
+        # copies only its own geometries and arcs.
+        as_dict = self.topology.output
+        objects = as_dict.get('objects', {}) or {}
+        object_names = self._get_object_names(objects, object_name)
+
+        groups = {}
+        for name in object_names:
+            geometry = objects[name]
+            for feature in _iter_features(geometry):
+                parent = get_parent(feature)
+                if parent is None:
+                    continue
+                if parent not in groups:
+                    groups[parent] = {
+                        x: {**objects[x], 'type': 'GeometryCollection', 'geometries': []}
+                        for x in object_names
+                    }
+                    for x in object_names:
+                        groups[parent][x].pop('arcs', None)
+                        groups[parent][x].pop('coordinates', None)
+                groups[parent][name]['geometries'].append(feature)
+
+        return {
+            parent: self.__class__(
+                topology = Topology(_subset_topology_dict(as_dict, selected),
+                                    object_name = object_names)
+            )
+            for parent, selected in groups.items()
+        }
+
+    def write_asset(self,
+                    directory,
+                    filename_template = '{hash}.topo.json',
+                    encoding = 'utf-8') -> str:
+        """Write the instance's topology to a :term:`TopoJSON` file in ``directory``
+        whose name is derived from a hash of its content, so that it can be served with
+        long-lived caching and fetched client-side (e.g. using
+        :class:`AsyncMapData <highcharts_maps.options.series.data.map_data.AsyncMapData>`).
+
+        If a file of the same name already exists, it is assumed to hold the same content
+        and is not re-written.
+
+        :param directory: The directory to write the file to. Created if it does not
+          exist.
+        :type directory: Path-like
+
+        :param filename_template: The name of the file, with ``{hash}`` replaced by the
+          hash of its content. Defaults to ``'{hash}.topo.json'``.
+        :type filename_template: :class:`str <python:str>`
+
+        :param encoding: The character encoding of the file. Defaults to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :returns: The path of the file.
+        :rtype: :class:`str <python:str>`
+
+        :raises HighchartsValueError: if this instance has no topology
+        """
+        if not isinstance(self.topology, Topology):
+            raise errors.HighchartsValueError('write_asset() requires map data with a '
+                                              'topology. This instance has none.')
+        directory = validators.path(directory)
+        filename_template = validators.string(filename_template)
+        os.makedirs(directory, exist_ok = True)
+
+        as_json = self.topology.to_json()
+        if isinstance(as_json, str):
+            as_json = as_json.encode(encoding)
+
+        content_hash = hashlib.sha1(as_json).hexdigest()[:16]
+        filename = os.path.join(directory,
+                                filename_template.format(hash = content_hash))
+        if not os.path.exists(filename):
+            with open(filename, 'wb') as file_:
+                file_.write(as_json)
+
+        return filename
+
+    @staticmethod
+    def _get_object_names(objects, object_name):
+        """Return the names of the :term:`TopoJSON` ``objects`` identified by
+        ``object_name``, defaulting to all of them.
+
+        :raises HighchartsValueError: if ``object_name`` does not identify one of
+          ``objects``
+        """
+        if object_name is None:
+            object_names = [x for x in objects]
+        elif checkers.is_string(object_name):
+            object_names = [object_name]
+        else:
+            object_names = [validators.string(x) for x in object_name]
+        missing = [x for x in object_names if x not in objects]
+        if missing:
+            raise errors.HighchartsValueError(f'object_name {missing} not found in the '
+                                              f'topology. Available objects: '
+                                              f'{list(objects)}')
+
+        return object_names
+
+    @staticmethod
+    def _iter_shapefile_features(reader,
+                                 chunk_size = 10000,
+                                 record_filter = None,
+                                 fields = None,
+                                 reproject = None,
+                                 simplify = None):
+        """Generator which reads the shapes and records from a
+        :class:`shapefile.Reader` in chunks of ``chunk_size``, yielding a
+        :class:`list <python:list>` of :term:`GeoJSON` feature
+        :class:`dict <python:dict>` objects for each chunk.
+
+        Only one chunk of shapes and records is held in memory at any given time.
+
+        :rtype: generator of :class:`list <python:list>` of
+          :class:`dict <python:dict>`
+        """
+        if fields:
+            iterator = reader.iterShapeRecords(fields = fields)
+        else:
+            iterator = reader.iterShapeRecords()
+
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                break
+
+            shapes = []
+            properties = []
+            for shape_record in chunk:
+                shape = shape_record.shape
+                if not shape.points:
+                    continue
+                record = shape_record.record.as_dict()
+                if record_filter is not None and not record_filter(record):
+                    continue
+                shapes.append(shape)
+                properties.append(record)
+
+            if not shapes:
+                continue
+
+            if reproject is not None:
+                lengths = [len(x.points) for x in shapes]
+                points = np.asarray([point[:2]
+                                     for shape in shapes
+                                     for point in shape.points],
+                                    dtype = float)
+                points = np.asarray(reproject(points), dtype = float)
+                start = 0
+                for shape, length in zip(shapes, lengths):
+                    shape.points = points[start:start + length].tolist()
+                    start += length
+
+            geometries = [x.__geo_interface__ for x in shapes]
+
+            if simplify:
+                try:
+                    import shapely
+                    from shapely.geometry import shape as to_shape, mapping
+                except ImportError:
+                    raise errors.HighchartsDependencyError('MapData.from_shapefile() '
+                                                           'requires shapely be '
+                                                           'installed to simplify '
+                                                           'geometries. However, it '
+                                                           'was not found in the '
+                                                           'runtime environment.')
+                as_shapely = np.asarray([to_shape(x) for x in geometries])
+                simplified = shapely.simplify(as_shapely,
+                                              simplify,
+                                              preserve_topology = True)
+                geometries = [mapping(x) for x in simplified]
+
+            yield [{
+                'type': 'Feature',
+                'geometry': geometry,
+                'properties': record
+            } for geometry, record in zip(geometries, properties)]
+
+    @classmethod
+    def from_shapefile(cls,
+                       shp_filename,
+                       chunk_size = 10000,
+                       record_filter = None,
+                       fields = None,
+                       reproject = None,
+                       simplify = None,
+                       source_crs = None,
+                       **kwargs):
         """Create a :class:`MapData` instance from an :term:`ESRI Shapefile <shapefile>`.
 
         :param shp_filename: The full filename of an :term:`ESRI Shapefile <shapefile>`
@@ -558,7 +1611,74 @@ class MapData(HighchartsMeta):
         :type shp_filename: :class:`str <python:str>` or
           :class:`bytes <python:bytes>`
 
+        :param chunk_size: The number of shapes (and their records) to read from the
+          :term:`shapefile` at a time. Defaults to ``10000``.
+
+          .. note::
+
+            Only one chunk of the shapefile's shapes and records is read at a time.
+            Each chunk is filtered, reprojected, and simplified before its (now
+            smaller) features are retained. However, the retained features of *all*
+            chunks are then held together to construct the topology - so that borders
+            shared by shapes from different chunks are detected as shared arcs - and so
+            peak memory is proportional to every retained feature (plus one chunk),
+            rather than to a single chunk. Use ``record_filter``, ``fields``, and
+            ``simplify`` to reduce what is retained.
+
+        :type chunk_size: :class:`int <python:int>`
+
+        :param record_filter: An optional predicate which receives the attributes of each
+          record as a :class:`dict <python:dict>` and returns ``True`` if the shape should
+          be included in the map data. Defaults to :obj:`None <python:None>`, which
+          includes all shapes.
+        :type record_filter: callable or :obj:`None <python:None>`
+
+        :param fields: An optional whitelist of field names to read from the
+          :term:`shapefile`. Fields that are not whitelisted are neither read nor retained
+          as feature properties. Defaults to :obj:`None <python:None>`, which reads all
+          fields.
+        :type fields: iterable of :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param reproject: An optional target coordinate reference system (e.g.
+          ``'EPSG:5070'``) into which coordinates are transformed from ``source_crs``,
+          or a callable which receives the coordinates of each chunk as a single
+          ``(N, 2)`` :class:`numpy.ndarray <numpy:numpy.ndarray>` and returns the
+          transformed coordinates with the same shape. Defaults to
+          :obj:`None <python:None>`, which leaves coordinates as-is.
+
+          .. seealso::
+
+            * :class:`CRSTransformer <highcharts_maps.utility_classes.crs.CRSTransformer>`
+
+        :type reproject: :class:`str <python:str>`, :class:`int <python:int>`,
+          callable, or :obj:`None <python:None>`
+
+        :param simplify: An optional tolerance (expressed in the units of the shapefile's
+          coordinates) used to simplify each geometry before it is retained. Defaults to
+          :obj:`None <python:None>`, which applies no simplification.
+
+          .. note::
+
+            Simplification is applied per-geometry (preserving each geometry's own
+            topology) and requires `shapely <https://shapely.readthedocs.io>`__.
+
+        :type simplify: numeric or :obj:`None <python:None>`
+
+        :param source_crs: The coordinate reference system of the shapefile, used when
+          ``reproject`` is a target CRS. Defaults to :obj:`None <python:None>`, which
+          reads it from the shapefile's ``.prj`` file (if present) or otherwise assumes
+          ``'EPSG:4326'``.
+        :type source_crs: :class:`str <python:str>`, :class:`int <python:int>`, or
+          :obj:`None <python:None>`
+
+        :param kwargs: additional keyword arguments which are passed to the
+          :class:`Topology` constructor
+        :type kwargs: :class:`dict <python:dict>`
+
         :rtype: :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>`
+
+        :raises HighchartsDependencyError: if `PyShp <https://github.com/GeospatialPython/pyshp>`__
+          is not available in the runtime environment
         """
         try:
             import shapefile
@@ -569,12 +1689,271 @@ class MapData(HighchartsMeta):
                                                    'runtime environment.')
 
         shp_filename = validators.file_exists(shp_filename)
+        chunk_size = validators.integer(chunk_size, minimum = 1)
+        simplify = validators.numeric(simplify, allow_empty = True, minimum = 0)
+        if fields is not None:
+            fields = [validators.string(x) for x in validators.iterable(fields)]
+        if reproject is not None and not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('MapData.from_shapefile() requires '
+                                                   'NumPy be installed to reproject '
+                                                   'coordinates. However, it was not '
+                                                   'found in the runtime environment.')
+        if reproject is not None and not callable(reproject):
+            if source_crs is None:
+                prj_filename = os.path.splitext(shp_filename)[0] + '.prj'
+                if os.path.isfile(prj_filename):
+                    with open(prj_filename, 'r') as prj_file:
+                        source_crs = prj_file.read().strip() or None
+            reproject = cls._get_reprojector(reproject, source_crs = source_crs)
+
+        features = []
+        with shapefile.Reader(shp_filename) as reader:
+            for chunk in cls._iter_shapefile_features(reader,
+                                                      chunk_size = chunk_size,
+                                                      record_filter = record_filter,
+                                                      fields = fields,
+                                                      reproject = reproject,
+                                                      simplify = simplify):
+                features.extend(chunk)
+
+        topology = Topology({
+            'type': 'FeatureCollection',
+            'features': features
+        }, **kwargs)
 
-        data = shapefile.Reader(shp_filename)
+        return cls(topology = topology)
 
-        topology = Topology(data)
 
-        return cls(topology = topology)
+    def get_label_anchors(self, key = 'hc-key', projection = None, precision = 0.01):
+        """Calculate the position at which each feature of the :term:`map geometry`
+        should be labeled, expressed as the
+        :meth:`middle_x <highcharts_maps.options.series.data.geometric.GeometricData.middle_x>` and
+        :meth:`middle_y <highcharts_maps.options.series.data.geometric.GeometricData.middle_y>`
+        values Highcharts Maps expects.
+
+        Each anchor is the feature's *pole of inaccessibility*: the position within the
+        feature that is farthest from its outline, which (unlike the center of its
+        bounding box) always falls inside concave or irregular shapes. The poles of all
+        features are found in a single vectorized pass, and the results are cached for
+        the topology, so repeated calls (e.g. when rendering several charts of the same
+        map) are effectively free.
+
+        .. note::
+
+          For features composed of multiple polygons (e.g. a county with islands), the
+          anchor is placed within the polygon of the largest area. The ``middle_x`` and
+          ``middle_y`` values are fractions of the bounding box of the *whole* feature,
+          and ``middle_y`` is oriented the way Highcharts Maps will apply it: from the
+          top of the feature if it is rendered with a geographic
+          :term:`projection`, and from the bottom if not.
+
+        .. seealso::
+
+          * :meth:`MapSeriesBase.set_label_anchors() <highcharts_maps.options.series.base.MapSeriesBase.set_label_anchors>`
+          * :func:`get_poles_of_inaccessibility() <highcharts_maps.utility_functions.get_poles_of_inaccessibility>`
+
+        :param key: The property of each feature whose value identifies it in the
+          result. Defaults to ``'hc-key'``.
+        :type key: :class:`str <python:str>`
+
+        :param projection: The :term:`projection` with which the map will be rendered,
+          whose distortion the anchors should reflect. Defaults to
+          :obj:`None <python:None>`, which applies the projection recommended by the map
+          geometry (if any).
+        :type projection: :class:`ProjectionOptions <highcharts_maps.utility_classes.projections.ProjectionOptions>`
+          or :obj:`None <python:None>`
+
+        :param precision: The precision to which each anchor is found, as a fraction of
+          the larger dimension of its polygon. Defaults to ``0.01``.
+        :type precision: numeric
+
+        :returns: A :class:`dict <python:dict>` whose keys are the ``key`` values of the
+          map's features, and whose values are 2-member :class:`tuple <python:tuple>` of
+          the corresponding ``middle_x`` and ``middle_y``. Features without a ``key`` or
+          without any polygons are omitted.
+        :rtype: :class:`dict <python:dict>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          available in the runtime environment
+        :raises HighchartsValueError: if ``projection`` cannot be applied in Python
+        """
+        from highcharts_maps.utility_classes.projections import ProjectionOptions
+
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in the runtime '
+                                                   'environment. Please install it '
+                                                   'using "pip install numpy" or '
+                                                   'equivalent.')
+        key = validators.string(key)
+        precision = validators.float(precision, minimum = 0)
+        if not self.topology:
+            return {}
+
+        if projection is not None:
+            projection = validate_types(projection, ProjectionOptions)
+            projection._get_projection_functions()
+
+        as_json = self.topology.to_json()
+        if isinstance(as_json, str):
+            as_json = as_json.encode('utf-8')
+        cache_key = (hashlib.sha1(as_json).hexdigest(),
+                     key,
+                     projection.to_json() if projection is not None else None,
+                     precision)
+        if cache_key in _LABEL_ANCHOR_CACHE:
+            return dict(_LABEL_ANCHOR_CACHE[cache_key])
+
+        as_dict = json.loads(as_json)
+        objects = as_dict.get('objects', {}) or {}
+        if projection is None:
+            recommendations = [as_dict.get('hc-recommended-mapview', None)] + \
+                [objects[x].get('hc-recommended-mapview', None) for x in objects]
+            projection = next((x.get('projection', None) for x in recommendations
+                               if isinstance(x, dict) and x.get('projection', None)),
+                              None)
+            if projection is not None:
+                projection = validate_types(projection, ProjectionOptions)
+
+        positions, offsets = utility_functions.decode_arcs(as_dict.get('arcs', []),
+                                                           as_dict.get('transform', None))
+        if projection is not None and projection.name:
+            positions = np.column_stack(projection.forward(positions[:, 0],
+                                                           positions[:, 1],
+                                                           clip = True))
+
+        keys = []
+        bounds = []
+        polygons = []
+        for object_name in objects:
+            for geometry in _iter_features(objects[object_name]):
+                feature_key = (geometry.get('properties', None) or {}).get(
+                    key,
+                    geometry.get(key, None)
+                )
+                if feature_key is None:
+                    continue
+
+                largest = None
+                largest_area = -1
+                feature_bounds = None
+                for polygon in _get_feature_polygons(geometry):
+                    rings = [_get_ring(x, positions, offsets) for x in polygon]
+                    if not rings or len(rings[0]) < 3:
+                        continue
+                    outer = rings[0]
+                    area = abs(np.dot(outer[:, 0], np.roll(outer[:, 1], -1)) -
+                               np.dot(outer[:, 1], np.roll(outer[:, 0], -1)))
+                    if area > largest_area:
+                        largest, largest_area = rings, area
+                    polygon_bounds = np.concatenate([outer.min(axis = 0),
+                                                     outer.max(axis = 0)])
+                    if feature_bounds is None:
+                        feature_bounds = polygon_bounds
+                    else:
+                        feature_bounds = np.concatenate([
+                            np.minimum(feature_bounds[:2], polygon_bounds[:2]),
+                            np.maximum(feature_bounds[2:], polygon_bounds[2:])
+                        ])
+
+                if largest is not None:
+                    keys.append(feature_key)
+                    bounds.append(feature_bounds)
+                    polygons.append(largest)
+
+        anchors = {}
+        if polygons:
+            poles = utility_functions.get_poles_of_inaccessibility(polygons,
+                                                                   precision = precision)
+            bounds = np.asarray(bounds)
+            width = bounds[:, 2] - bounds[:, 0]
+            height = bounds[:, 3] - bounds[:, 1]
+            with np.errstate(invalid = 'ignore', divide = 'ignore'):
+                middle_x = np.where(width > 0, (poles[:, 0] - bounds[:, 0]) / width, 0.5)
+                if projection is not None and projection.name:
+                    middle_y = (bounds[:, 3] - poles[:, 1]) / height
+                else:
+                    middle_y = (poles[:, 1] - bounds[:, 1]) / height
+                middle_y = np.where(height > 0, middle_y, 0.5)
+
+            middle_x = np.clip(np.round(middle_x, 4), 0, 1).tolist()
+            middle_y = np.clip(np.round(middle_y, 4), 0, 1).tolist()
+            anchors = dict(zip(keys, zip(middle_x, middle_y)))
+
+        if len(_LABEL_ANCHOR_CACHE) >= _LABEL_ANCHOR_CACHE_SIZE:
+            _LABEL_ANCHOR_CACHE.pop(next(iter(_LABEL_ANCHOR_CACHE)))
+        _LABEL_ANCHOR_CACHE[cache_key] = anchors
+
+        return dict(anchors)
+
+
+_RENDER_CONTEXT = contextvars.ContextVar('highcharts_maps_render_context',
+                                        default = None)
+
+
+class RenderContext(object):
+    """The state of a single serialization of a chart to a JavaScript literal, which
+    assigns the (JavaScript) variable names of the :term:`topologies <topology>` that the
+    chart fetches asynchronously without modifying the chart or its
+    :class:`AsyncMapData` instances.
+
+    While a context is entered, it applies to serializations within the same thread (or
+    :mod:`asyncio` task), so that the same chart can be serialized concurrently.
+
+    .. code-block:: python
+
+      with RenderContext():
+          as_str = my_chart.options.to_js_literal()
+
+    """
+
+    def __init__(self):
+        self._topology_names = {}
+        self._token = None
+
+    @staticmethod
+    def get_current():
+        """Return the context entered in the current thread or task, if any.
+
+        :rtype: :class:`RenderContext` or :obj:`None <python:None>`
+        """
+        return _RENDER_CONTEXT.get()
+
+    def add_topology(self, map_data) -> tuple:
+        """Assign a variable name to the :term:`topology` fetched by ``map_data``, which
+        is shared by all map data fetching the same URL.
+
+        :param map_data: The map data to fetch.
+        :type map_data: :class:`AsyncMapData`
+
+        :returns: The variable name, and whether it was newly assigned (i.e. the topology
+          still needs to be fetched).
+        :rtype: :class:`tuple <python:tuple>` of :class:`str <python:str>` and
+          :class:`bool <python:bool>`
+        """
+        if map_data.url in self._topology_names:
+            return self._topology_names[map_data.url], False
+
+        name = f'topology{len(self._topology_names) + 1}'
+        self._topology_names[map_data.url] = name
+
+        return name, True
+
+    def get_topology_name(self, map_data) -> Optional[str]:
+        """Return the variable name assigned to the :term:`topology` fetched by
+        ``map_data``, if any.
+
+        :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+        """
+        return self._topology_names.get(map_data.url, None)
+
+    def __enter__(self):
+        self._token = _RENDER_CONTEXT.set(self)
+        return self
+
+    def __exit__(self, *args):
+        _RENDER_CONTEXT.reset(self._token)
+        self._token = None
 
 
 class AsyncMapData(HighchartsMeta):
@@ -677,6 +2056,12 @@ class AsyncMapData(HighchartsMeta):
         """The number to append to the ``topology`` variable name when serializing the
         map data. Defaults to ``0``.
 
+        .. note::
+
+          When serialized as part of a
+          :class:`Chart <highcharts_maps.chart.Chart>`, the variable name is instead
+          assigned by the chart's :class:`RenderContext`.
+
         :rtype: :class:`int <python:int>`
         """
         return self._fetch_counter
@@ -740,10 +2125,10 @@ class AsyncMapData(HighchartsMeta):
             filename = validators.path(filename)
 
         if self.fetch_config:
-            self.fetch_config.url = self.url
-            fetch_config = self.fetch_config
+            fetch_config = copy.copy(self.fetch_config)
+            fetch_config.url = self.url
         else:
-            fetch_config = FetchConfiguration(self.url)
+            fetch_config = FetchConfiguration(url = self.url)
             
         if self.selector:
             function = f"""const selector = {str(self.selector)};\n"""
@@ -752,7 +2137,11 @@ class AsyncMapData(HighchartsMeta):
             function = ''
             fetch = f"""const topology = await {str(fetch_config)}.then(response => response.json());"""
 
-        if self.fetch_counter and self.fetch_counter > 0:
+        context = RenderContext.get_current()
+        name = context.get_topology_name(self) if context else None
+        if name:
+            fetch = fetch.replace('const topology', f'const {name}')
+        elif self.fetch_counter and self.fetch_counter > 0:
             fetch = fetch.replace('const topology', f'const topology{self.fetch_counter}')
 
         as_str = f'{function}{fetch}'
@@ -1,11 +1,18 @@
 from typing import Optional, List
 
+from validator_collection import validators
+
 from highcharts_maps.decorators import class_sensitive
 from highcharts_maps.options.plot_options.flowmap import FlowmapOptions, GeoHeatmapOptions
 from highcharts_maps.options.series.base import SeriesBase
 from highcharts_maps.options.series.data.connections import FlowmapData, FlowmapDataCollection
-from highcharts_maps.options.series.data.geometric import GeometricLatLonData
-from highcharts_maps.utility_functions import mro__to_untrimmed_dict, is_ndarray
+from highcharts_maps.options.series.data.geometric import (GeometricLatLonData,
+                                                           GeometricLatLonDataCollection)
+from highcharts_maps.utility_functions import (mro__to_untrimmed_dict,
+                                               is_ndarray,
+                                               bin_lat_lon)
+from highcharts_maps.js_literal_functions import (serialize_to_js_literal,
+                                                  assemble_js_literal)
 
 
 class FlowmapSeries(SeriesBase, FlowmapOptions):
@@ -135,6 +142,125 @@ class FlowmapSeries(SeriesBase, FlowmapOptions):
 
         return untrimmed
 
+    def to_js_literal(self,
+                      filename = None,
+                      encoding = 'utf-8',
+                      careful_validation = False) -> Optional[str]:
+        """Return the object represented as a :class:`str <python:str>` containing the
+        JavaScript object literal.
+
+        .. note::
+
+          If the series' :meth:`.data <FlowmapSeries.data>` is a
+          :class:`FlowmapDataCollection` holding columnar data, its columns are
+          serialized directly by
+          :meth:`FlowmapDataCollection.to_js_literal() <highcharts_maps.options.series.data.connections.FlowmapDataCollection.to_js_literal>`.
+
+        :param filename: The name of a file to which the JavaScript object literal should
+          be persisted. Defaults to :obj:`None <python:None>`
+        :type filename: Path-like
+
+        :param encoding: The character encoding to apply to the resulting object. Defaults
+          to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :param careful_validation: if ``True``, will carefully validate JavaScript values
+          along the way using the
+          `esprima-python <https://github.com/Kronuz/esprima-python>`__ library. Defaults
+          to ``False``.
+        :type careful_validation: :class:`bool <python:bool>`
+
+        :rtype: :class:`str <python:str>` or :obj:`None <python:None>`
+        """
+        if filename:
+            filename = validators.path(filename)
+
+        untrimmed = self._to_untrimmed_dict()
+        as_dict = {}
+        for key in untrimmed:
+            item = untrimmed[key]
+            if key == 'data' and isinstance(item, FlowmapDataCollection):
+                serialized = item.to_js_literal(encoding = encoding,
+                                                careful_validation = careful_validation)
+            else:
+                serialized = serialize_to_js_literal(item,
+                                                     encoding = encoding,
+                                                     careful_validation = careful_validation)
+            if serialized is not None:
+                as_dict[key] = serialized
+
+        as_str = assemble_js_literal(as_dict,
+                                     careful_validation = careful_validation)
+
+        if filename:
+            with open(filename, 'w', encoding = encoding) as file_:
+                file_.write(as_str)
+
+        return as_str
+
+    def aggregate_flows(self,
+                        resolution = None,
+                        regions = None,
+                        weight_quantile = None,
+                        bundle = False,
+                        bundle_angle = 10,
+                        bundle_distance = 1):
+        """Replace the series' :meth:`.data <FlowmapSeries.data>` with far fewer,
+        aggregated flows, grouped by origin and destination with their weights summed.
+
+        .. code-block:: python
+
+          my_series = FlowmapSeries.from_pandas(df, ...)
+          my_series.aggregate_flows(resolution = 0.5,
+                                    weight_quantile = 0.9,
+                                    bundle = True)
+
+        :param resolution: The size (in degrees) of the grid cells to which coordinates
+          are snapped. Defaults to :obj:`None <python:None>`.
+        :type resolution: numeric or :obj:`None <python:None>`
+
+        :param regions: A function which receives arrays of longitudes and latitudes,
+          and returns an equal-length array of the IDs of the regions (map points)
+          containing them. Defaults to :obj:`None <python:None>`.
+        :type regions: callable or :obj:`None <python:None>`
+
+        :param weight_quantile: If supplied, aggregated flows whose weight falls below
+          this quantile (between ``0`` and ``1``) are dropped. Defaults to
+          :obj:`None <python:None>`.
+        :type weight_quantile: numeric or :obj:`None <python:None>`
+
+        :param bundle: If ``True``, merges near-parallel aggregated flows into
+          bundles. Defaults to ``False``.
+        :type bundle: :class:`bool <python:bool>`
+
+        :param bundle_angle: The width (in degrees) of the bearing bins used to
+          determine whether flows are parallel. Defaults to ``10``.
+        :type bundle_angle: numeric
+
+        :param bundle_distance: The size (in degrees) of the bins used to determine
+          whether parallel flows are near one another. Defaults to ``1``.
+        :type bundle_distance: numeric
+
+        .. seealso::
+
+          * :meth:`FlowmapDataCollection.aggregate() <highcharts_maps.options.series.data.connections.FlowmapDataCollection.aggregate>`
+
+        """
+        if not self.data:
+            return
+
+        if isinstance(self.data, FlowmapDataCollection):
+            collection = self.data
+        else:
+            collection = FlowmapDataCollection(data_points = self.data)
+
+        self._data = collection.aggregate(resolution = resolution,
+                                          regions = regions,
+                                          weight_quantile = weight_quantile,
+                                          bundle = bundle,
+                                          bundle_angle = bundle_angle,
+                                          bundle_distance = bundle_distance)
+
     @classmethod
     def _data_collection_class(cls):
         """Returns the class object used for the data collection.
@@ -279,3 +405,111 @@ class GeoHeatmapSeries(FlowmapSeries, GeoHeatmapOptions):
         untrimmed = mro__to_untrimmed_dict(self, in_cls = in_cls)
 
         return untrimmed
+
+    def load_from_lat_lon(self,
+                          lat,
+                          lon,
+                          value = None,
+                          reducer = 'sum'):
+        """Replace the series' :meth:`.data <GeoHeatmapSeries.data>` with one data
+        point per non-empty cell of the series'
+        :meth:`.colsize <GeoHeatmapSeries.colsize>` by
+        :meth:`.rowsize <GeoHeatmapSeries.rowsize>` grid, binning the points supplied
+        in Python rather than in the browser.
+
+        .. code-block:: python
+
+          my_series = GeoHeatmapSeries(colsize = 2, rowsize = 2)
+          my_series.load_from_lat_lon(df['lat'], df['lon'], df['speed'],
+                                      reducer = 'mean')
+
+        :param lat: The latitudes of the points.
+        :type lat: array-like
+
+        :param lon: The longitudes of the points.
+        :type lon: array-like
+
+        :param value: The values of the points. Defaults to
+          :obj:`None <python:None>`, which gives each point a value of ``1``.
+        :type value: array-like or :obj:`None <python:None>`
+
+        :param reducer: How to reduce the values of the points in each cell. Accepts
+          ``'sum'``, ``'mean'``, ``'count'``, ``'max'``, or ``'min'``. Defaults to
+          ``'sum'``.
+        :type reducer: :class:`str <python:str>`
+
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+
+        .. seealso::
+
+          * :func:`bin_lat_lon() <highcharts_maps.utility_functions.bin_lat_lon>`
+
+        """
+        columns = bin_lat_lon(lat,
+                              lon,
+                              value = value,
+                              colsize = self.colsize or 1,
+                              rowsize = self.rowsize or 1,
+                              reducer = reducer)
+        self.load_from_trusted_columns(columns, validate_sample = False)
+
+    @classmethod
+    def from_lat_lon(cls,
+                     lat,
+                     lon,
+                     value = None,
+                     reducer = 'sum',
+                     series_kwargs = None):
+        """Create a :class:`GeoHeatmapSeries` whose
+        :meth:`.data <GeoHeatmapSeries.data>` holds one data point per non-empty grid
+        cell, binning the points supplied in Python rather than in the browser.
+
+        :param lat: The latitudes of the points.
+        :type lat: array-like
+
+        :param lon: The longitudes of the points.
+        :type lon: array-like
+
+        :param value: The values of the points. Defaults to
+          :obj:`None <python:None>`, which gives each point a value of ``1``.
+        :type value: array-like or :obj:`None <python:None>`
+
+        :param reducer: How to reduce the values of the points in each cell. Accepts
+          ``'sum'``, ``'mean'``, ``'count'``, ``'max'``, or ``'min'``. Defaults to
+          ``'sum'``.
+        :type reducer: :class:`str <python:str>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance
+          (including its ``colsize`` and ``rowsize``). Defaults to
+          :obj:`None <python:None>`.
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :returns: A :class:`GeoHeatmapSeries` instance.
+        :rtype: :class:`GeoHeatmapSeries`
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+
+        instance = cls(**series_kwargs)
+        instance.load_from_lat_lon(lat, lon, value = value, reducer = reducer)
+
+        return instance
+
+    @classmethod
+    def _data_collection_class(cls):
+        """Returns the class object used for the data collection.
+        
+        :rtype: :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`
+          descendent
+        """
+        return GeometricLatLonDataCollection
+    
+    @classmethod
+    def _data_point_class(cls):
+        """Returns the class object used for individual data points.
+        
+        :rtype: :class:`DataBase <highcharts_core.options.series.data.base.DataBase>` 
+          descendent
+        """
+        return GeometricLatLonData
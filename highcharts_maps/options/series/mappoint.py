@@ -1,9 +1,19 @@
 from typing import Optional, List
 
+from validator_collection import validators
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from highcharts_maps import errors, utility_functions
 from highcharts_maps.options.plot_options.mappoint import MapPointOptions
 from highcharts_maps.options.series.base import MapSeriesBase
 from highcharts_maps.options.series.data.geometric import GeometricLatLonData, GeometricLatLonDataCollection
 from highcharts_maps.utility_functions import mro__to_untrimmed_dict, is_ndarray
+from highcharts_maps.utility_classes.clusters import ClusterHierarchy
+from highcharts_maps.utility_classes.crs import CRSTransformer
 
 
 class MapPointSeries(MapSeriesBase, MapPointOptions):
@@ -167,6 +177,239 @@ class MapPointSeries(MapSeriesBase, MapPointOptions):
 
         return untrimmed
 
+    def load_from_cluster_hierarchy(self,
+                                    hierarchy,
+                                    zoom = None,
+                                    cluster_options = None,
+                                    disable_client_clustering = True):
+        """Replace the series' :meth:`.data <MapPointSeries.data>` with the clusters
+        (precomputed server-side) visible at ``zoom``.
+
+        Clusters are styled using ``cluster_options`` as they would be client-side.
+        Unless ``disable_client_clustering`` is ``False``, the series'
+        :meth:`.cluster <MapPointSeries.cluster>` options are replaced by a copy with
+        clustering disabled, so that the precomputed clusters are not clustered again.
+        The original options object (which may be shared with other series) is not
+        modified.
+
+        .. code-block:: python
+
+          hierarchy = ClusterHierarchy(df['lat'], df['lon'])
+          my_series = MapPointSeries(id = 'stores', cluster = {...})
+          my_series.load_from_cluster_hierarchy(hierarchy, zoom = 3)
+
+          hierarchy.write_assets('static/stores', zooms = range(4, 18))
+          my_chart.options.chart.events = {
+              'redraw': hierarchy.get_loader_callback('/static/stores/{zoom}.json',
+                                                      'stores',
+                                                      inline_zoom = 3)
+          }
+
+        :param hierarchy: The precomputed clusters.
+        :type hierarchy: :class:`ClusterHierarchy <highcharts_maps.utility_classes.clusters.ClusterHierarchy>`
+
+        :param zoom: The zoom level whose clusters should be rendered inline. Defaults
+          to :obj:`None <python:None>`, which uses the hierarchy's lowest zoom level.
+        :type zoom: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param cluster_options: The options used to style clusters. Defaults to
+          :obj:`None <python:None>`, which applies the series'
+          :meth:`.cluster <MapPointSeries.cluster>` options.
+        :type cluster_options: :class:`ClusterOptions <highcharts_maps.utility_classes.clusters.ClusterOptions>`
+          or :obj:`None <python:None>`
+
+        :param disable_client_clustering: If ``True``, disables client-side clustering
+          of the series (on a copy of its
+          :meth:`.cluster <MapPointSeries.cluster>` options). Defaults to ``True``.
+        :type disable_client_clustering: :class:`bool <python:bool>`
+
+        :raises HighchartsValueError: if ``hierarchy`` is not a
+          :class:`ClusterHierarchy <highcharts_maps.utility_classes.clusters.ClusterHierarchy>`
+        """
+        if not isinstance(hierarchy, ClusterHierarchy):
+            raise errors.HighchartsValueError(f'hierarchy expects a ClusterHierarchy. '
+                                              f'Received: {hierarchy.__class__.__name__}')
+        if zoom is None:
+            zoom = hierarchy.min_zoom
+        if cluster_options is None:
+            cluster_options = self.cluster
+        if disable_client_clustering and self.cluster is not None:
+            cluster = utility_functions.shallow_copy(self.cluster)
+            cluster.enabled = False
+            self.cluster = cluster
+
+        data_points = hierarchy.to_data_points(zoom, cluster_options = cluster_options)
+        self._data = data_points or None
+
+    @classmethod
+    def from_cluster_hierarchy(cls,
+                               hierarchy,
+                               zoom = None,
+                               cluster_options = None,
+                               series_kwargs = None,
+                               disable_client_clustering = True):
+        """Create a :class:`MapPointSeries` whose
+        :meth:`.data <MapPointSeries.data>` holds the clusters (precomputed
+        server-side) visible at ``zoom``.
+
+        :param hierarchy: The precomputed clusters.
+        :type hierarchy: :class:`ClusterHierarchy <highcharts_maps.utility_classes.clusters.ClusterHierarchy>`
+
+        :param zoom: The zoom level whose clusters should be rendered inline. Defaults
+          to :obj:`None <python:None>`, which uses the hierarchy's lowest zoom level.
+        :type zoom: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param cluster_options: The options used to style clusters. Defaults to
+          :obj:`None <python:None>`, which applies the series'
+          :meth:`.cluster <MapPointSeries.cluster>` options.
+        :type cluster_options: :class:`ClusterOptions <highcharts_maps.utility_classes.clusters.ClusterOptions>`
+          or :obj:`None <python:None>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :param disable_client_clustering: If ``True``, disables client-side clustering
+          of the series. Defaults to ``True``.
+        :type disable_client_clustering: :class:`bool <python:bool>`
+
+        :returns: A :class:`MapPointSeries` instance.
+        :rtype: :class:`MapPointSeries`
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+
+        instance = cls(**series_kwargs)
+        instance.load_from_cluster_hierarchy(hierarchy,
+                                             zoom = zoom,
+                                             cluster_options = cluster_options,
+                                             disable_client_clustering = disable_client_clustering)
+
+        return instance
+
+    def load_from_lat_lon(self,
+                          lat,
+                          lon,
+                          columns = None,
+                          reproject = None):
+        """Replace the series' :meth:`.data <MapPointSeries.data>` with one data point
+        per latitude / longitude pair, optionally reprojecting them server-side.
+
+        When ``reproject`` is supplied, the points are transformed in a single
+        vectorized batch and positioned using their ``x`` and ``y`` (rather than
+        ``lat`` and ``lon``), which allows them to be rendered on a pre-projected map
+        without loading :meth:`proj4 <highcharts_maps.options.chart.ChartOptions.proj4>`
+        or applying
+        :meth:`map_transforms <highcharts_maps.options.chart.ChartOptions.map_transforms>`
+        client-side.
+
+        .. code-block:: python
+
+          my_series = MapPointSeries()
+          my_series.load_from_lat_lon(df['lat'], df['lon'],
+                                      columns = {'name': df['city']},
+                                      reproject = 'EPSG:5070')
+
+        :param lat: The latitudes of the points.
+        :type lat: array-like
+
+        :param lon: The longitudes of the points.
+        :type lon: array-like
+
+        :param columns: Additional columns of data point properties (e.g. ``name`` or
+          ``id``), keyed by property name. Defaults to :obj:`None <python:None>`.
+        :type columns: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param reproject: An optional target coordinate reference system (e.g.
+          ``'EPSG:5070'``), a
+          :class:`CRSTransformer <highcharts_maps.utility_classes.crs.CRSTransformer>`
+          (e.g. one built from the map's ``map_transforms``), or a callable which
+          receives an ``(N, 2)`` :class:`numpy.ndarray <numpy:numpy.ndarray>` of
+          longitudes and latitudes and returns the transformed coordinates. Defaults
+          to :obj:`None <python:None>`, which leaves the points as latitudes /
+          longitudes.
+        :type reproject: :class:`str <python:str>`, :class:`int <python:int>`,
+          callable, or :obj:`None <python:None>`
+
+        :raises HighchartsDependencyError: if NumPy is not available in the runtime
+          environment
+        :raises HighchartsValueError: if ``lat`` and ``lon`` differ in length
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in the runtime '
+                                                   'environment. Please install it '
+                                                   'using "pip install numpy" or '
+                                                   'equivalent.')
+        columns = dict(validators.dict(columns, allow_empty = True) or {})
+
+        lat = np.asarray(lat.to_numpy() if hasattr(lat, 'to_numpy') else lat,
+                         dtype = float)
+        lon = np.asarray(lon.to_numpy() if hasattr(lon, 'to_numpy') else lon,
+                         dtype = float)
+        if lat.shape != lon.shape:
+            raise errors.HighchartsValueError(f'lat and lon must have the same length. '
+                                              f'Received lengths: {len(lat)}, '
+                                              f'{len(lon)}')
+
+        if reproject is None:
+            columns['lat'] = lat
+            columns['lon'] = lon
+        else:
+            if not callable(reproject):
+                reproject = CRSTransformer(target_crs = reproject)
+            projected = np.asarray(reproject(np.stack([lon, lat], axis = -1)),
+                                   dtype = float)
+            projected[~np.isfinite(projected)] = np.nan
+            columns['x'] = projected[:, 0]
+            columns['y'] = projected[:, 1]
+
+        self.load_from_trusted_columns(columns)
+
+    @classmethod
+    def from_lat_lon(cls,
+                     lat,
+                     lon,
+                     columns = None,
+                     reproject = None,
+                     series_kwargs = None):
+        """Create a :class:`MapPointSeries` whose
+        :meth:`.data <MapPointSeries.data>` holds one data point per latitude /
+        longitude pair, optionally reprojecting them server-side.
+
+        :param lat: The latitudes of the points.
+        :type lat: array-like
+
+        :param lon: The longitudes of the points.
+        :type lon: array-like
+
+        :param columns: Additional columns of data point properties (e.g. ``name`` or
+          ``id``), keyed by property name. Defaults to :obj:`None <python:None>`.
+        :type columns: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param reproject: An optional target coordinate reference system, a
+          :class:`CRSTransformer <highcharts_maps.utility_classes.crs.CRSTransformer>`,
+          or a callable which transforms an ``(N, 2)``
+          :class:`numpy.ndarray <numpy:numpy.ndarray>` of longitudes and latitudes.
+          Defaults to :obj:`None <python:None>`.
+        :type reproject: :class:`str <python:str>`, :class:`int <python:int>`,
+          callable, or :obj:`None <python:None>`
+
+        :param series_kwargs: An optional :class:`dict <python:dict>` containing keyword
+          arguments that should be used when instantiating the series instance. Defaults
+          to :obj:`None <python:None>`.
+        :type series_kwargs: :class:`dict <python:dict>`
+
+        :returns: A :class:`MapPointSeries` instance.
+        :rtype: :class:`MapPointSeries`
+        """
+        series_kwargs = validators.dict(series_kwargs, allow_empty = True) or {}
+
+        instance = cls(**series_kwargs)
+        instance.load_from_lat_lon(lat, lon, columns = columns, reproject = reproject)
+
+        return instance
+
     @classmethod
     def _data_collection_class(cls):
         """Returns the class object used for the data collection.
@@ -0,0 +1,369 @@
+from typing import Optional
+
+from validator_collection import validators, checkers
+
+from highcharts_maps import constants, errors
+from highcharts_maps.js_literal_functions import (serialize_to_js_literal,
+                                                  get_js_literal,
+                                                  replace_map_data_placeholders)
+from highcharts_maps.metaclasses import HighchartsMeta
+from highcharts_maps.options.series.data.connections import FlowmapDataCollection
+from highcharts_maps.options.series.data.map_data import (MapData,
+                                                          AsyncMapData,
+                                                          RenderContext)
+from highcharts_maps.utility_classes.javascript_functions import VariableName
+
+_MAP_DATA_TYPES = (MapData, AsyncMapData, VariableName)
+
+
+class ChartDiff(object):
+    """The changes between two states of a chart, expressed as the calls to the
+    Highcharts JS API which bring a chart rendered from the first state up to date with
+    the second.
+
+    Re-rendering a map chart to reflect a change - e.g. new data for a dashboard that
+    refreshes every few seconds - re-sends its whole configuration (including its
+    :term:`map geometry`) to the browser, and rebuilds the chart from scratch. A
+    :class:`ChartDiff` instead compares the two states and produces only what changed:
+
+      * ``chart.update({...})`` with the option subtrees that changed,
+      * ``chart.series[i].update({...})`` with the series options that changed,
+      * ``chart.series[i].data[j].update(...)`` for each point that changed, when only a
+        few (see ``max_point_updates``) of the series' points changed,
+      * ``chart.series[i].setData([...])`` when more of the series' data changed,
+      * ``chart.series[i].remove()`` and ``chart.addSeries({...})`` for series that were
+        removed or added,
+
+    followed by a single ``chart.redraw()``. :term:`Map data` that is unchanged is never
+    re-sent.
+
+    .. code-block:: python
+
+      diff = ChartDiff(previous_chart, current_chart)
+      as_js = diff.to_js_literal()
+
+      # or, equivalently
+      as_js = previous_chart.diff(current_chart).to_js_literal()
+
+    Series are matched by their position in the chart's
+    :meth:`.series <highcharts_maps.options.HighchartsMapsOptions.series>`. Options that
+    were set in the first state but not in the second are reset to ``null``.
+
+    :param old: The state of the chart as it was rendered.
+    :type old: :class:`Chart <highcharts_maps.chart.Chart>` or
+      :class:`HighchartsMapsOptions <highcharts_maps.options.HighchartsMapsOptions>`
+
+    :param new: The state of the chart to update it to.
+    :type new: :class:`Chart <highcharts_maps.chart.Chart>` or
+      :class:`HighchartsMapsOptions <highcharts_maps.options.HighchartsMapsOptions>`
+
+    :param max_point_updates: The most points of a series to update individually. If
+      more of a series' points changed (or the number of its points changed), its data
+      is replaced using ``setData()``. Defaults to ``10``.
+    :type max_point_updates: :class:`int <python:int>`
+
+    :param careful_validation: if ``True``, will carefully validate JavaScript values
+      along the way using the
+      `esprima-python <https://github.com/Kronuz/esprima-python>`__ library. Defaults
+      to ``False``.
+    :type careful_validation: :class:`bool <python:bool>`
+
+    :raises HighchartsValueError: if ``old`` or ``new`` is not a chart or chart options
+    """
+
+    def __init__(self, old, new, max_point_updates = 10, careful_validation = False):
+        self._max_point_updates = validators.integer(max_point_updates, minimum = 0)
+        self._careful_validation = bool(careful_validation)
+        self._variable_name = getattr(new, 'variable_name', None) or \
+                              getattr(old, 'variable_name', None)
+        self._operations = []
+        self._preludes = []
+        self._map_data_keys = {}
+
+        old_options = self._get_options(old)
+        new_options = self._get_options(new)
+
+        with RenderContext() as context:
+            self._context = context
+            try:
+                self._compare(old_options, new_options)
+            finally:
+                self._context = None
+
+    @property
+    def operations(self) -> list:
+        """The calls which apply the changes, in the order in which they are made. Each
+        is a :class:`tuple <python:tuple>` of the target relative to the (JavaScript)
+        chart (e.g. ``'series[0]'``, or ``''`` for the chart itself), the name of the
+        method to call, and its arguments as JavaScript literals (excluding the
+        ``redraw`` argument).
+
+        :rtype: :class:`list <python:list>` of :class:`tuple <python:tuple>`
+        """
+        return list(self._operations)
+
+    @property
+    def has_changes(self) -> bool:
+        """Read-only property, where ``True`` indicates that the two states of the chart
+        differ.
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        return bool(self._operations)
+
+    @staticmethod
+    def _get_options(value):
+        if checkers.is_type(value, 'Chart'):
+            return value.options
+        if value is None or isinstance(value, HighchartsMeta):
+            return value
+
+        raise errors.HighchartsValueError(f'ChartDiff expects a Chart or chart options. '
+                                          f'Received: {value.__class__.__name__}')
+
+    def _to_js(self, value) -> Optional[str]:
+        """Return ``value`` serialized as a JavaScript literal, or
+        :obj:`None <python:None>` if it would be omitted from the chart."""
+        if self._is_map_data(value):
+            return self._get_map_data_js(value)
+
+        serialized = serialize_to_js_literal(value,
+                                             careful_validation = self._careful_validation)
+        if serialized is None:
+            return None
+
+        return get_js_literal(serialized, careful_validation = self._careful_validation)
+
+    @staticmethod
+    def _is_map_data(value) -> bool:
+        if isinstance(value, _MAP_DATA_TYPES):
+            return True
+
+        return isinstance(value, list) and len(value) > 0 and \
+               all(isinstance(x, _MAP_DATA_TYPES) for x in value)
+
+    def _get_map_data_key(self, value):
+        """Return a value which is equal for (and only for) map data which renders the
+        same map."""
+        if isinstance(value, list):
+            return tuple(self._get_map_data_key(x) for x in value)
+        if isinstance(value, VariableName):
+            return 'VariableName', value.variable_name
+        if isinstance(value, AsyncMapData):
+            return 'AsyncMapData', value.to_js_literal()
+        if isinstance(value, MapData):
+            if id(value) not in self._map_data_keys:
+                topology = value.topology.to_json() if value.topology else None
+                self._map_data_keys[id(value)] = (value, ('MapData',
+                                                          value.force_geojson,
+                                                          topology))
+            return self._map_data_keys[id(value)][1]
+
+        return value
+
+    def _get_map_data_js(self, value) -> str:
+        if isinstance(value, list):
+            return '[' + ', '.join(self._get_map_data_js(x) for x in value) + ']'
+        if isinstance(value, VariableName):
+            return value.variable_name
+        if isinstance(value, AsyncMapData):
+            return self._add_async_map_data(value)
+
+        return value.to_js_literal(careful_validation = self._careful_validation)
+
+    def _add_async_map_data(self, value) -> str:
+        """Register the :class:`AsyncMapData` ``value`` to be fetched before the changes
+        are applied, and return the variable which holds its topology."""
+        name, is_new = self._context.add_topology(value)
+        if is_new:
+            self._preludes.append(value.to_js_literal())
+
+        return name
+
+    def _get_patch(self, old_dict, new_dict) -> dict:
+        """Return the changes between two (untrimmed) dictionaries of options, with each
+        changed value serialized as a JavaScript literal (or nested as a
+        :class:`dict <python:dict>` of changes)."""
+        patch = {}
+        keys = list(new_dict) + [x for x in old_dict if x not in new_dict]
+        for key in keys:
+            old_value = old_dict.get(key, None)
+            new_value = new_dict.get(key, None)
+            if old_value is new_value:
+                continue
+
+            if self._is_map_data(old_value) or self._is_map_data(new_value):
+                if self._get_map_data_key(old_value) == self._get_map_data_key(new_value):
+                    continue
+                change = self._to_js(new_value)
+            elif self._is_recursable(new_value):
+                if type(old_value) is type(new_value):
+                    change = self._get_patch(old_value._to_untrimmed_dict(),
+                                             new_value._to_untrimmed_dict())
+                else:
+                    change = self._get_patch({}, new_value._to_untrimmed_dict())
+                if not change:
+                    continue
+            else:
+                change = self._to_js(new_value)
+                if change == self._to_js(old_value):
+                    continue
+
+            if change is None:
+                change = get_js_literal(constants.EnforcedNull)
+            patch[key] = change
+
+        return patch
+
+    @staticmethod
+    def _is_recursable(value) -> bool:
+        """Return whether ``value`` is serialized as (only) the sum of its properties,
+        so that changes to it can be applied property by property."""
+        return isinstance(value, HighchartsMeta) and \
+               type(value).to_js_literal is HighchartsMeta.to_js_literal
+
+    @classmethod
+    def _assemble(cls, patch) -> str:
+        as_str = ',\n'.join(
+            f'  {key}: {cls._assemble(value) if isinstance(value, dict) else value}'
+            for key, value in patch.items()
+        )
+
+        return '{\n' + as_str + '\n}'
+
+    def _get_series_js(self, series) -> str:
+        map_data = series.__dict__.get('_map_data', None)
+        for item in (map_data if isinstance(map_data, list) else [map_data]):
+            if isinstance(item, AsyncMapData):
+                self._add_async_map_data(item)
+
+        as_str = series.to_js_literal(careful_validation = self._careful_validation)
+
+        return replace_map_data_placeholders(as_str) or '{}'
+
+    def _get_data_js(self, data):
+        """Return the serialized ``data`` of a series, and its points serialized
+        individually (or :obj:`None <python:None>` if they are not serialized as a
+        list of points)."""
+        if isinstance(data, FlowmapDataCollection):
+            serialized = data.to_js_literal(careful_validation = self._careful_validation)
+        else:
+            serialized = serialize_to_js_literal(data,
+                                                 careful_validation = self._careful_validation)
+        if serialized is None:
+            return None, None
+
+        points = None
+        if isinstance(serialized, list):
+            points = [get_js_literal(x, careful_validation = self._careful_validation)
+                      for x in serialized]
+
+        return get_js_literal(serialized,
+                              careful_validation = self._careful_validation), points
+
+    def _compare_data(self, target, old_data, new_data):
+        old_js, old_points = self._get_data_js(old_data)
+        new_js, new_points = self._get_data_js(new_data)
+        if old_js == new_js:
+            return
+
+        if old_points is not None and new_points is not None and \
+           len(old_points) == len(new_points):
+            changed = [index for index, (old_point, new_point)
+                       in enumerate(zip(old_points, new_points))
+                       if old_point != new_point]
+            if len(changed) <= self._max_point_updates:
+                for index in changed:
+                    self._operations.append((f'{target}.data[{index}]',
+                                             'update',
+                                             (new_points[index], )))
+                return
+
+        self._operations.append((target, 'setData', (new_js or '[]', )))
+
+    def _compare_series(self, index, old_series, new_series):
+        target = f'series[{index}]'
+        if type(old_series) is not type(new_series):
+            self._operations.append((target,
+                                     'update',
+                                     (self._get_series_js(new_series), )))
+            return
+
+        old_dict = old_series._to_untrimmed_dict()
+        new_dict = new_series._to_untrimmed_dict()
+        old_data = old_dict.pop('data', None)
+        new_data = new_dict.pop('data', None)
+
+        patch = self._get_patch(old_dict, new_dict)
+        if patch:
+            self._operations.append((target, 'update', (self._assemble(patch), )))
+
+        self._compare_data(target, old_data, new_data)
+
+    def _compare(self, old_options, new_options):
+        old_dict = old_options._to_untrimmed_dict() if old_options else {}
+        new_dict = new_options._to_untrimmed_dict() if new_options else {}
+        old_series = old_dict.pop('series', None) or []
+        new_series = new_dict.pop('series', None) or []
+
+        patch = self._get_patch(old_dict, new_dict)
+        if patch:
+            self._operations.append(('', 'update', (self._assemble(patch), )))
+
+        for index, (old_item, new_item) in enumerate(zip(old_series, new_series)):
+            if old_item is not new_item:
+                self._compare_series(index, old_item, new_item)
+
+        for index in reversed(range(len(new_series), len(old_series))):
+            self._operations.append((f'series[{index}]', 'remove', ()))
+
+        for item in new_series[len(old_series):]:
+            self._operations.append(('', 'addSeries', (self._get_series_js(item), )))
+
+    def to_js_literal(self, variable_name = None, redraw = True) -> str:
+        """Return the JavaScript code which applies the changes to the (JavaScript)
+        chart.
+
+        If the changes include :term:`map data` which is fetched asynchronously, the
+        code is wrapped in an asynchronous function which fetches it first.
+
+        :param variable_name: The name of the (JavaScript) variable holding the chart.
+          Defaults to :obj:`None <python:None>`, which applies the
+          :meth:`.variable_name <highcharts_maps.chart.Chart.variable_name>` of the
+          (new, or else old) chart.
+        :type variable_name: :class:`str <python:str>` or :obj:`None <python:None>`
+
+        :param redraw: If ``True``, redraws the chart once all changes have been made.
+          Defaults to ``True``.
+        :type redraw: :class:`bool <python:bool>`
+
+        :returns: The JavaScript code, which is empty if the two states of the chart do
+          not differ.
+        :rtype: :class:`str <python:str>`
+
+        :raises HighchartsValueError: if ``variable_name`` is not supplied and neither
+          chart has a variable name
+        """
+        variable_name = validators.variable_name(variable_name, allow_empty = True) or \
+                        self._variable_name
+        if not variable_name:
+            raise errors.HighchartsValueError('variable_name is required, as neither '
+                                              'chart has a variable_name')
+
+        if not self._operations:
+            return ''
+
+        statements = []
+        for target, method, arguments in self._operations:
+            target = f'{variable_name}.{target}' if target else variable_name
+            arguments = ', '.join(arguments + ('false', ))
+            statements.append(f'{target}.{method}({arguments});')
+        if redraw:
+            statements.append(f'{variable_name}.redraw();')
+
+        as_str = '\n'.join(statements)
+        if self._preludes:
+            as_str = '(async () => {\n' + '\n'.join(self._preludes) + '\n' + \
+                     as_str + '\n})();'
+
+        return as_str
@@ -0,0 +1,329 @@
+import re
+import secrets
+from typing import Optional
+
+try:
+    import orjson as json
+except ImportError:
+    try:
+        import rapidjson as json
+    except ImportError:
+        try:
+            import simplejson as json
+        except ImportError:
+            import json
+
+from validator_collection import validators, checkers
+
+from highcharts_maps import constants, errors, utility_functions
+from highcharts_maps.js_literal_functions import serialize_to_js_literal, get_js_literal
+from highcharts_maps.metaclasses import HighchartsMeta
+
+_SLOT_PATH_ELEMENT = re.compile(r'([A-Za-z_$][\w$]*)((?:\[\d+\])*)')
+
+
+class ChartTemplate(object):
+    """A chart whose configuration is serialized once, so that it can be rendered
+    repeatedly with different values for a handful of designated *slots*.
+
+    A chart served to many users often differs between requests only in its data (and
+    perhaps its title or the range of its color axis), while its styling, map view,
+    legend, and :term:`map geometry` stay the same. Re-serializing the whole chart for
+    every request spends most of its time on that static configuration.
+
+    When the template is compiled, the chart is serialized once with a placeholder in
+    place of each slot, and the output is split into static chunks around them. Each
+    call to :meth:`.render() <ChartTemplate.render>` then only validates and serializes
+    the values supplied for the slots, and joins them with the static chunks. Its cost
+    is proportional to those values, rather than to the chart's configuration.
+
+    Each slot is identified by the path to a property of the chart's
+    :meth:`.options <highcharts_maps.chart.Chart.options>`, in the (camelCase) form used
+    by Highcharts JS, with list items addressed by index:
+
+    .. code-block:: python
+
+      template = ChartTemplate(my_chart,
+                               slots = {
+                                   'data': 'series[0].data',
+                                   'title': 'title.text',
+                                   'min': 'colorAxis.min',
+                                   'max': 'colorAxis.max'
+                               })
+
+      as_js_literal = template.render(data = [{'hc-key': 'fo', 'value': 12}],
+                                      title = 'Population (2024)')
+
+    Slots not supplied to :meth:`.render() <ChartTemplate.render>` keep the value they
+    had in the chart when the template was compiled.
+
+    .. note::
+
+      The template is unaffected by any changes made to the chart after it was
+      compiled.
+
+    :param chart: The chart to compile.
+    :type chart: :class:`Chart <highcharts_maps.chart.Chart>`
+
+    :param slots: The properties that vary between renders, as a
+      :class:`dict <python:dict>` mapping the name of each slot to its path, or as an
+      iterable of paths (each of which then names its own slot).
+    :type slots: :class:`dict <python:dict>` or iterable of :class:`str <python:str>`
+
+    :param format: The serialization to render: ``'js'`` for a JavaScript literal (as
+      :meth:`Chart.to_js_literal() <highcharts_maps.chart.Chart.to_js_literal>`) or
+      ``'json'`` for JSON (as :meth:`Chart.to_json() <highcharts_maps.chart.Chart.to_json>`).
+      Defaults to ``'js'``.
+    :type format: :class:`str <python:str>`
+
+    :param careful_validation: if ``True``, will carefully validate JavaScript values
+      along the way using the
+      `esprima-python <https://github.com/Kronuz/esprima-python>`__ library. Defaults
+      to ``False``. Only applies to the ``'js'`` format.
+    :type careful_validation: :class:`bool <python:bool>`
+
+    :raises HighchartsValueError: if ``format`` is not supported, if ``chart`` has no
+      options, or if a slot's path does not identify a property of the chart's options
+    """
+
+    def __init__(self, chart, slots, format = 'js', careful_validation = False):
+        format = validators.string(format).lower()
+        if format not in ['js', 'json']:
+            raise errors.HighchartsValueError(f'format expects "js" or "json". '
+                                              f'Received: "{format}"')
+        if getattr(chart, 'options', None) is None:
+            raise errors.HighchartsValueError('chart has no options to compile into a '
+                                              'template')
+
+        if checkers.is_dict(slots):
+            slots = dict(slots)
+        elif checkers.is_iterable(slots, forbid_literals = (str, bytes, dict)):
+            slots = {x: x for x in slots}
+        else:
+            raise errors.HighchartsValueError(f'slots expects a dict or an iterable of '
+                                              f'paths. Received: {slots}')
+        if not slots:
+            raise errors.HighchartsValueError('slots cannot be empty')
+
+        self._format = format
+        self._careful_validation = bool(careful_validation)
+        self._slots = {}
+        self._chunks = []
+        self._chunk_slots = []
+        self._defaults = {}
+
+        self._compile(chart, slots)
+
+    @property
+    def format(self) -> str:
+        """The serialization rendered by the template: ``'js'`` or ``'json'``.
+
+        :rtype: :class:`str <python:str>`
+        """
+        return self._format
+
+    @property
+    def slots(self) -> dict:
+        """The slots of the template, mapping the name of each to its path.
+
+        :rtype: :class:`dict <python:dict>`
+        """
+        return {key: value[0] for key, value in self._slots.items()}
+
+    @staticmethod
+    def _parse_path(path) -> list:
+        """Split the slot ``path`` into a :class:`list <python:list>` of (snake_case)
+        property names and list indices.
+
+        :raises HighchartsValueError: if ``path`` is not a valid path
+        """
+        if not isinstance(path, str) or not path:
+            raise errors.HighchartsValueError(f'slot paths must be non-empty strings. '
+                                              f'Received: {path}')
+
+        keys = []
+        for element in path.split('.'):
+            match = _SLOT_PATH_ELEMENT.fullmatch(element)
+            if not match:
+                raise errors.HighchartsValueError(f'"{path}" is not a valid slot path')
+            keys.append(utility_functions.to_snake_case(match.group(1)))
+            keys.extend(int(x) for x in re.findall(r'\d+', match.group(2)))
+
+        if not isinstance(keys[-1], str):
+            raise errors.HighchartsValueError(f'slot path "{path}" must end with a '
+                                              f'property, not a list index')
+
+        return keys
+
+    @staticmethod
+    def _is_property(owner, name) -> bool:
+        """Return whether ``name`` is a property of ``owner`` whose value is held in the
+        attribute ``_<name>``.
+
+        :rtype: :class:`bool <python:bool>`
+        """
+        # The instance's __dict__ is checked directly, as some classes (e.g. series)
+        # define a __getattr__() which would answer for attributes they do not have.
+        return isinstance(owner, HighchartsMeta) and \
+               isinstance(getattr(owner.__class__, name, None), property) and \
+               f'_{name}' in owner.__dict__
+
+    @staticmethod
+    def _resolve(options, path, keys):
+        """Return the object which holds the property at the end of ``keys``, starting
+        from ``options``.
+
+        :raises HighchartsValueError: if ``keys`` does not identify a property
+        """
+        owner = options
+        for key in keys[:-1]:
+            if isinstance(key, int):
+                if not checkers.is_iterable(owner, forbid_literals = (str, bytes, dict)) \
+                   or key >= len(owner):
+                    raise errors.HighchartsValueError(f'slot path "{path}" refers to an '
+                                                      f'item which does not exist')
+                owner = owner[key]
+            elif ChartTemplate._is_property(owner, key):
+                owner = getattr(owner, key)
+            else:
+                raise errors.HighchartsValueError(f'slot path "{path}" refers to a '
+                                                  f'property which does not exist')
+            if owner is None:
+                raise errors.HighchartsValueError(f'slot path "{path}" passes through a '
+                                                  f'property which has not been set')
+
+        if not ChartTemplate._is_property(owner, keys[-1]):
+            raise errors.HighchartsValueError(f'slot path "{path}" refers to a property '
+                                              f'which does not exist')
+
+        return owner
+
+    @classmethod
+    def _replace(cls, value, keys, replacement):
+        """Return a copy of ``value`` in which the property at the end of ``keys`` holds
+        ``replacement``, copying (shallowly) only the objects along the way."""
+        if not keys:
+            return replacement
+
+        key = keys[0]
+        if isinstance(key, int):
+            items = list(value)
+            items[key] = cls._replace(items[key], keys[1:], replacement)
+
+            return items
+
+        result = utility_functions.shallow_copy(value)
+        setattr(result,
+                f'_{key}',
+                cls._replace(getattr(value, f'_{key}'), keys[1:], replacement))
+
+        return result
+
+    def _compile(self, chart, slots):
+        options = chart.options
+        prefix = f'hcslot{secrets.token_hex(8)}x'
+        placeholders = {}
+        for index, (slot, path) in enumerate(slots.items()):
+            keys = self._parse_path(path)
+            owner = self._resolve(options, path, keys)
+            placeholder = f'{prefix}{index}'
+            options = self._replace(options, keys, placeholder)
+
+            self._slots[slot] = (path, utility_functions.shallow_copy(owner), keys[-1])
+            self._defaults[slot] = self._serialize(owner, keys[-1], getattr(owner,
+                                                                            keys[-1]))
+            placeholders[placeholder] = slot
+
+        compiled = utility_functions.shallow_copy(chart)
+        compiled._options = options
+        if self.format == 'json':
+            as_str = compiled.to_json()
+            quote = '"'
+        else:
+            as_str = compiled.to_js_literal(careful_validation = self._careful_validation)
+            quote = "'"
+
+        pattern = f'{quote}({re.escape(prefix)}\\d+){quote}'
+        if isinstance(as_str, bytes):
+            pattern = pattern.encode('utf-8')
+
+        start = 0
+        for match in re.finditer(pattern, as_str):
+            placeholder = match.group(1)
+            if isinstance(placeholder, bytes):
+                placeholder = placeholder.decode('utf-8')
+            self._chunks.append(as_str[start:match.start()])
+            self._chunk_slots.append(placeholders[placeholder])
+            start = match.end()
+        self._chunks.append(as_str[start:])
+
+        for slot in slots:
+            if self._chunk_slots.count(slot) != 1:
+                raise errors.HighchartsValueError(f'slot "{slot}" is not serialized '
+                                                  f'exactly once by the chart')
+
+    def _serialize(self, owner, name, value):
+        """Serialize ``value`` as the property ``name`` of ``owner`` would be
+        serialized."""
+        if self.format == 'json':
+            key = utility_functions.to_camelCase(name)
+            trimmed = owner.trim_dict({key: value},
+                                      to_json = True,
+                                      context = owner.__class__.__name__)
+            value = trimmed.get(key, None)
+            if value == constants.EnforcedNull:
+                value = None
+
+            return json.dumps(value)
+
+        serialized = serialize_to_js_literal(value,
+                                             careful_validation = self._careful_validation)
+
+        return get_js_literal(serialized, careful_validation = self._careful_validation)
+
+    def render(self, values = None, **kwargs) -> Optional[str | bytes]:
+        """Render the chart with the values supplied for its slots.
+
+        Each value is validated (and coerced) exactly as if it had been assigned to its
+        property, so it accepts anything the property would (e.g. a
+        :class:`numpy.ndarray <numpy:numpy.ndarray>` for series data).
+
+        .. code-block:: python
+
+          as_js_literal = template.render({'data': new_data, 'title': 'Updated'})
+
+          # or, equivalently
+          as_js_literal = template.render(data = new_data, title = 'Updated')
+
+        :param values: The values of the slots to render, keyed by slot name. Slots that
+          are not supplied keep their value from the compiled chart.
+        :type values: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+        :param kwargs: Further values of slots, keyed by slot name.
+
+        :returns: The chart serialized as per :meth:`.format <ChartTemplate.format>`.
+        :rtype: :class:`str <python:str>` or :class:`bytes <python:bytes>`
+
+        :raises HighchartsValueError: if a value is supplied for a slot that the
+          template does not have
+        """
+        values = {**(values or {}), **kwargs}
+        fragments = dict(self._defaults)
+        for slot, value in values.items():
+            if slot not in self._slots:
+                raise errors.HighchartsValueError(f'the template has no slot named '
+                                                  f'"{slot}"')
+            _, owner, name = self._slots[slot]
+            owner = utility_functions.shallow_copy(owner)
+            setattr(owner, name, value)
+            fragments[slot] = self._serialize(owner, name, getattr(owner, name))
+
+        parts = [self._chunks[0]]
+        for slot, chunk in zip(self._chunk_slots, self._chunks[1:]):
+            fragment = fragments[slot]
+            if isinstance(chunk, bytes) and isinstance(fragment, str):
+                fragment = fragment.encode('utf-8')
+            parts.append(fragment)
+            parts.append(chunk)
+
+        return parts[0][:0].join(parts)
@@ -1 +1,493 @@
 from highcharts_core.utility_classes.clusters import *
+
+import json
+import os
+
+from validator_collection import validators
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from highcharts_maps import errors
+
+
+CLUSTER_METHODS = ['grid', 'hierarchical']
+
+
+class ClusterHierarchy(object):
+    """Server-side index of point clusters across a range of zoom levels, which allows a
+    :class:`MapPointSeries <highcharts_maps.options.series.mappoint.MapPointSeries>` to
+    ship only the clusters visible at the current zoom level rather than every point.
+
+    Points are projected to `Web Mercator <https://en.wikipedia.org/wiki/Web_Mercator_projection>`__
+    and clustered from ``max_zoom`` down to ``min_zoom``, with each level built from the
+    clusters of the level below it. At each zoom level, a grid of cells ``radius``
+    pixels wide (on a world ``extent`` pixels wide at zoom ``0``) serves as the spatial
+    index:
+
+      * ``'grid'`` clustering merges the points falling within each cell.
+      * ``'hierarchical'`` clustering (modeled on
+        `supercluster <https://github.com/mapbox/supercluster>`__) seeds a cluster with
+        the heaviest point in each cell, and merges every point into the nearest seed
+        within ``radius`` pixels in its own or a neighboring cell.
+
+    Both are vectorized with `NumPy <https://numpy.org>`__, so millions of points can
+    be indexed in seconds.
+
+    .. code-block:: python
+
+      hierarchy = ClusterHierarchy(df['lat'], df['lon'], names = df['store'])
+      my_series = MapPointSeries.from_cluster_hierarchy(hierarchy, zoom = 3)
+      hierarchy.write_assets('static/stores', zooms = range(4, 18))
+
+    :param lat: The latitudes of the points.
+    :type lat: array-like
+
+    :param lon: The longitudes of the points.
+    :type lon: array-like
+
+    :param value: The values of the points, which are summed into each cluster's value.
+      Defaults to :obj:`None <python:None>`.
+    :type value: array-like or :obj:`None <python:None>`
+
+    :param names: The names of the points, applied to points which remain unclustered.
+      Defaults to :obj:`None <python:None>`.
+    :type names: array-like or :obj:`None <python:None>`
+
+    :param method: The clustering method, either ``'hierarchical'`` or ``'grid'``.
+      Defaults to ``'hierarchical'``.
+    :type method: :class:`str <python:str>`
+
+    :param radius: The cluster radius (or grid size), in pixels. Defaults to ``50``,
+      matching the default
+      :meth:`VectorLayoutAlgorithm.grid_size <highcharts_maps.utility_classes.clusters.VectorLayoutAlgorithm.grid_size>`.
+    :type radius: numeric
+
+    :param extent: The width of the world, in pixels, at zoom level ``0``. Defaults to
+      ``256``.
+    :type extent: numeric
+
+    :param min_zoom: The lowest zoom level to index. Defaults to ``0``.
+    :type min_zoom: :class:`int <python:int>`
+
+    :param max_zoom: The highest zoom level at which points are clustered. At higher
+      zoom levels, every point is returned individually. Defaults to ``16``.
+    :type max_zoom: :class:`int <python:int>`
+
+    :param minimum_cluster_size: The minimum number of points to form a cluster, as in
+      :meth:`ClusterOptions.minimum_cluster_size <highcharts_maps.utility_classes.clusters.ClusterOptions.minimum_cluster_size>`.
+      Defaults to ``2``.
+    :type minimum_cluster_size: :class:`int <python:int>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsValueError: if the arguments are invalid
+
+    """
+
+    def __init__(self,
+                 lat,
+                 lon,
+                 value = None,
+                 names = None,
+                 method = 'hierarchical',
+                 radius = 50,
+                 extent = 256,
+                 min_zoom = 0,
+                 max_zoom = 16,
+                 minimum_cluster_size = 2):
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in the runtime '
+                                                   'environment. Please install it '
+                                                   'using "pip install numpy" or '
+                                                   'equivalent.')
+
+        self.method = validators.string(method).lower()
+        if self.method not in CLUSTER_METHODS:
+            raise errors.HighchartsValueError(f'method expects one of '
+                                              f'{CLUSTER_METHODS}. Received: '
+                                              f'"{method}"')
+        self.radius = validators.float(radius, minimum = 0)
+        self.extent = validators.float(extent, minimum = 1)
+        self.min_zoom = validators.integer(min_zoom, minimum = 0)
+        self.max_zoom = validators.integer(max_zoom, minimum = self.min_zoom)
+        self.minimum_cluster_size = validators.integer(minimum_cluster_size,
+                                                       minimum = 1)
+        if not self.radius:
+            raise errors.HighchartsValueError('radius must be greater than 0')
+
+        lat = self._to_column(lat, np.float64)
+        lon = self._to_column(lon, np.float64)
+        if len(lat) != len(lon):
+            raise errors.HighchartsValueError(f'lat and lon must have the same length. '
+                                              f'Received lengths: {len(lat)}, '
+                                              f'{len(lon)}')
+        invalid = ~np.isfinite(lat) | ~np.isfinite(lon) | (np.abs(lat) > 90) | \
+            (np.abs(lon) > 180)
+        if invalid.any():
+            index = int(np.argmax(invalid))
+            raise errors.HighchartsValueError(f'point {index} has invalid coordinates: '
+                                              f'({lat[index]}, {lon[index]})')
+
+        self._lat = lat
+        self._lon = lon
+        self.names = self._to_column(names, object) if names is not None else None
+        if self.names is not None and len(self.names) != len(lat):
+            raise errors.HighchartsValueError('names must have the same length as lat')
+
+        points = {
+            'x': lon / 360 + 0.5,
+            'y': self._lat_to_y(lat),
+            'count': np.ones(len(lat)),
+            'value': None,
+            'point': np.arange(len(lat)),
+        }
+        if value is not None:
+            points['value'] = self._to_column(value, np.float64)
+            if len(points['value']) != len(lat):
+                raise errors.HighchartsValueError('value must have the same length as '
+                                                  'lat')
+
+        self._levels = {self.max_zoom + 1: points}
+        for zoom in range(self.max_zoom, self.min_zoom - 1, -1):
+            self._levels[zoom] = self._cluster(self._levels[zoom + 1], zoom)
+
+    @staticmethod
+    def _to_column(value, dtype):
+        if hasattr(value, 'to_numpy'):
+            value = value.to_numpy()
+        return np.asarray(value, dtype = dtype).reshape(-1)
+
+    @staticmethod
+    def _lat_to_y(lat):
+        sin = np.sin(np.radians(np.clip(lat, -85.0511287798, 85.0511287798)))
+        return 0.5 - 0.25 * np.log((1 + sin) / (1 - sin)) / np.pi
+
+    @staticmethod
+    def _y_to_lat(y):
+        return np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * y))))
+
+    def _assign_to_seeds(self, items, cell_x, cell_y, cells, radius):
+        """Return the index of the seed each item is merged into, using the heaviest
+        item in each grid cell as its seed."""
+        key = cell_x * cells + cell_y
+        order = np.lexsort((-items['count'], key))
+        key = key[order]
+        x = items['x'][order]
+        y = items['y'][order]
+
+        is_first = np.empty(len(order), dtype = bool)
+        is_first[:1] = True
+        np.not_equal(key[1:], key[:-1], out = is_first[1:])
+        seeds = np.flatnonzero(is_first)
+        seed_keys = key[seeds]
+
+        # Seeds always merge into themselves, so only the remaining items (those
+        # sharing a cell) need to search their own and neighboring cells.
+        assigned = np.arange(len(order))
+        candidates = np.flatnonzero(~is_first)
+        key = key[candidates]
+        x_candidates = x[candidates]
+        y_candidates = y[candidates]
+        best = np.full(len(candidates), np.inf)
+        best_seed = candidates.copy()
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                # Items are sorted by cell, so each set of neighboring cells is sorted
+                # too, keeping the lookups into the (sorted) seed cells cheap.
+                neighbor = key + (dx * cells + dy)
+                position = np.minimum(np.searchsorted(seed_keys, neighbor),
+                                      len(seed_keys) - 1)
+                seed = seeds[position]
+                distance = (x_candidates - x[seed]) ** 2 + \
+                    (y_candidates - y[seed]) ** 2
+                closer = (seed_keys[position] == neighbor) & \
+                    (distance <= radius ** 2) & (distance < best)
+                best_seed[closer] = seed[closer]
+                best[closer] = distance[closer]
+        assigned[candidates] = best_seed
+
+        result = np.empty(len(order), dtype = np.int64)
+        result[order] = order[assigned]
+
+        return result
+
+    def _cluster(self, items, zoom):
+        """Cluster ``items`` (the points or clusters of zoom level ``zoom + 1``) into the
+        clusters of zoom level ``zoom``, recording each item's parent cluster."""
+        radius = self.radius / (self.extent * 2 ** zoom)
+        cells = int(np.ceil(1 / radius)) + 2
+        cell_x = np.floor(items['x'] / radius).astype(np.int64) + 1
+        cell_y = np.floor(items['y'] / radius).astype(np.int64) + 1
+
+        if self.method == 'grid':
+            assigned = cell_x * cells + cell_y
+        else:
+            assigned = self._assign_to_seeds(items, cell_x, cell_y, cells, radius)
+
+        inverse = np.unique(assigned, return_inverse = True)[1].reshape(-1)
+        count = np.bincount(inverse, weights = items['count'])
+        if self.minimum_cluster_size > 1:
+            too_small = count[inverse] < self.minimum_cluster_size
+            if too_small.any():
+                assigned = np.where(too_small, -1 - np.arange(len(assigned)), assigned)
+                inverse = np.unique(assigned, return_inverse = True)[1].reshape(-1)
+                count = np.bincount(inverse, weights = items['count'])
+
+        order = np.argsort(inverse, kind = 'stable')
+        first = order[np.searchsorted(inverse[order], np.arange(len(count)))]
+        members = np.bincount(inverse)
+
+        items['parent'] = inverse
+        level = {
+            'x': np.bincount(inverse, weights = items['x'] * items['count']) / count,
+            'y': np.bincount(inverse, weights = items['y'] * items['count']) / count,
+            'count': count,
+            'value': None,
+            'point': np.where(members == 1, items['point'][first], -1),
+        }
+        if items['value'] is not None:
+            level['value'] = np.bincount(inverse, weights = items['value'])
+
+        return level
+
+    @property
+    def levels(self) -> dict:
+        """The clusters at each zoom level, keyed by zoom level. Each level is a
+        :class:`dict <python:dict>` of :class:`numpy.ndarray <numpy:numpy.ndarray>`
+        columns: ``'x'`` and ``'y'`` (in Web Mercator units between ``0`` and ``1``),
+        ``'count'`` (the number of points in the cluster), ``'value'``, ``'point'`` (the
+        index of the point, for clusters of a single point, otherwise ``-1``), and
+        ``'parent'`` (the index of the cluster at the next lower zoom level).
+
+        :rtype: :class:`dict <python:dict>`
+        """
+        return self._levels
+
+    def _get_zoom(self, zoom):
+        zoom = validators.integer(zoom, coerce_value = True)
+        return min(max(zoom, self.min_zoom), self.max_zoom + 1)
+
+    def get_level(self, zoom) -> dict:
+        """Return the clusters visible at ``zoom``.
+
+        :param zoom: The zoom level. Zoom levels outside the indexed range are clamped
+          to it.
+        :type zoom: :class:`int <python:int>`
+
+        :returns: A :class:`dict <python:dict>` of
+          :class:`numpy.ndarray <numpy:numpy.ndarray>` columns: ``'lat'``, ``'lon'``,
+          ``'count'``, ``'value'`` (or :obj:`None <python:None>`), and ``'point'``.
+        :rtype: :class:`dict <python:dict>`
+        """
+        level = self._levels[self._get_zoom(zoom)]
+        is_point = level['point'] >= 0
+        point = level['point'][is_point]
+        lat = self._y_to_lat(level['y'])
+        lon = (level['x'] - 0.5) * 360
+        lat[is_point] = self._lat[point]
+        lon[is_point] = self._lon[point]
+
+        return {
+            'lat': lat,
+            'lon': lon,
+            'count': level['count'].astype(np.int64),
+            'value': level['value'],
+            'point': level['point'],
+        }
+
+    def to_data_points(self, zoom, cluster_options = None) -> list:
+        """Return the clusters visible at ``zoom`` as
+        :class:`GeometricLatLonData <highcharts_maps.options.series.data.geometric.GeometricLatLonData>`
+        data points.
+
+        Clusters of more than one point are given a ``clusterPointsAmount`` property,
+        and are styled according to ``cluster_options``: its
+        :meth:`.marker <ClusterOptions.marker>` and
+        :meth:`.data_labels <ClusterOptions.data_labels>` are applied to each cluster,
+        with the marker of the :meth:`.zones <ClusterOptions.zones>` matching the
+        cluster's size taking precedence, as they would be client-side.
+
+        :param zoom: The zoom level.
+        :type zoom: :class:`int <python:int>`
+
+        :param cluster_options: The options used to style clusters. Defaults to
+          :obj:`None <python:None>`.
+        :type cluster_options: :class:`ClusterOptions` or :obj:`None <python:None>`
+
+        :rtype: :class:`list <python:list>` of
+          :class:`GeometricLatLonData <highcharts_maps.options.series.data.geometric.GeometricLatLonData>`
+        """
+        from highcharts_maps.options.series.data.geometric import GeometricLatLonData
+
+        if cluster_options is not None and not isinstance(cluster_options,
+                                                          ClusterOptions):
+            cluster_options = ClusterOptions.from_dict(validators.dict(cluster_options))
+
+        level = self.get_level(zoom)
+        is_cluster = level['count'] > 1
+        columns = {
+            'lat': level['lat'],
+            'lon': level['lon'],
+        }
+        if level['value'] is not None:
+            columns['value'] = level['value']
+        if self.names is not None:
+            columns['name'] = np.where(is_cluster,
+                                       None,
+                                       self.names[np.maximum(level['point'], 0)])
+
+        default_marker = cluster_options.marker if cluster_options else None
+        zones = (cluster_options.zones if cluster_options else None) or []
+        data_labels = cluster_options.data_labels if cluster_options else None
+        properties = [None] * len(is_cluster)
+        for index in np.flatnonzero(is_cluster).tolist():
+            count = int(level['count'][index])
+            cluster_properties = {'clusterPointsAmount': count}
+            marker = default_marker
+            for zone in zones:
+                if (zone.from_ is None or count >= zone.from_) and \
+                   (zone.to is None or count <= zone.to):
+                    marker = zone.marker or marker
+                    break
+            if marker is not None:
+                cluster_properties['marker'] = marker
+            properties[index] = cluster_properties
+        columns['properties'] = properties
+
+        data_points = GeometricLatLonData.from_trusted_columns(columns)
+        if data_labels is not None:
+            for index in np.flatnonzero(is_cluster).tolist():
+                data_points[index].data_labels = data_labels
+
+        return data_points
+
+    def to_assets(self, zooms = None, cluster_options = None) -> dict:
+        """Serialize the clusters visible at each of ``zooms`` to JSON, for delivery as
+        lazily-loaded assets.
+
+        :param zooms: The zoom levels to serialize. Defaults to
+          :obj:`None <python:None>`, which serializes every indexed zoom level.
+        :type zooms: iterable of :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param cluster_options: The options used to style clusters. Defaults to
+          :obj:`None <python:None>`.
+        :type cluster_options: :class:`ClusterOptions` or :obj:`None <python:None>`
+
+        :returns: The JSON array of data points for each zoom level, keyed by zoom level.
+        :rtype: :class:`dict <python:dict>`
+        """
+        if zooms is None:
+            zooms = range(self.min_zoom, self.max_zoom + 2)
+
+        assets = {}
+        for zoom in validators.iterable(zooms):
+            data_points = self.to_data_points(zoom, cluster_options = cluster_options)
+            assets[int(zoom)] = json.dumps([x.to_dict() for x in data_points],
+                                           separators = (',', ':'))
+
+        return assets
+
+    def write_assets(self,
+                     directory,
+                     zooms = None,
+                     cluster_options = None,
+                     filename_template = '{zoom}.json',
+                     encoding = 'utf-8') -> list:
+        """Write the clusters visible at each of ``zooms`` to a JSON file in
+        ``directory``, to be fetched client-side using the callback returned by
+        :meth:`.get_loader_callback() <ClusterHierarchy.get_loader_callback>`.
+
+        :param directory: The directory to write the files to. Created if it does not
+          exist.
+        :type directory: Path-like
+
+        :param zooms: The zoom levels to write. Defaults to
+          :obj:`None <python:None>`, which writes every indexed zoom level.
+        :type zooms: iterable of :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :param cluster_options: The options used to style clusters. Defaults to
+          :obj:`None <python:None>`.
+        :type cluster_options: :class:`ClusterOptions` or :obj:`None <python:None>`
+
+        :param filename_template: The name of each file, with ``{zoom}`` replaced by its
+          zoom level. Defaults to ``'{zoom}.json'``.
+        :type filename_template: :class:`str <python:str>`
+
+        :param encoding: The character encoding of the files. Defaults to ``'utf-8'``.
+        :type encoding: :class:`str <python:str>`
+
+        :returns: The paths of the files written.
+        :rtype: :class:`list <python:list>` of :class:`str <python:str>`
+        """
+        directory = validators.path(directory)
+        os.makedirs(directory, exist_ok = True)
+
+        filenames = []
+        assets = self.to_assets(zooms = zooms, cluster_options = cluster_options)
+        for zoom, as_str in assets.items():
+            filename = os.path.join(directory, filename_template.format(zoom = zoom))
+            with open(filename, 'w', encoding = encoding) as file_:
+                file_.write(as_str)
+            filenames.append(filename)
+
+        return filenames
+
+    def get_loader_callback(self, url_template, series_id, inline_zoom = None):
+        """Return a JavaScript callback function which, assigned to the chart's
+        ``events.redraw``, replaces the data of the series identified by ``series_id``
+        with the asset for the map's current zoom level whenever it changes.
+
+        .. note::
+
+          Zoom levels correspond to those of the map view when using the
+          ``WebMercator`` projection.
+
+        :param url_template: The URL of the assets, with ``{zoom}`` replaced by the zoom
+          level.
+        :type url_template: :class:`str <python:str>`
+
+        :param series_id: The ``id`` of the series to update.
+        :type series_id: :class:`str <python:str>`
+
+        :param inline_zoom: The zoom level of the data rendered inline with the series.
+          At or below this zoom level, the inline data is restored rather than fetched.
+          Defaults to :obj:`None <python:None>`, which fetches every zoom level.
+        :type inline_zoom: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :rtype: :class:`CallbackFunction <highcharts_maps.utility_classes.javascript_functions.CallbackFunction>`
+        """
+        from highcharts_maps.utility_classes.javascript_functions import CallbackFunction
+
+        url_template = validators.string(url_template)
+        series_id = validators.string(series_id)
+        inline_zoom = validators.integer(inline_zoom, allow_empty = True)
+        if inline_zoom is None:
+            inline_zoom = self.min_zoom - 1
+
+        function_body = f"""var chart = this,
+    series = chart.get({json.dumps(series_id)}),
+    zoom = Math.max({self.min_zoom}, Math.min({self.max_zoom + 1}, Math.floor(chart.mapView.zoom)));
+if (!series || series.clusterZoom === zoom) {{
+    return;
+}}
+if (series.clusterZoom === undefined) {{
+    series.clusterInlineData = series.options.data.slice();
+}}
+series.clusterZoom = zoom;
+if (zoom <= {inline_zoom}) {{
+    series.setData(series.clusterInlineData.slice());
+    return;
+}}
+fetch({json.dumps(url_template)}.replace('{{zoom}}', zoom))
+    .then(function (response) {{ return response.json(); }})
+    .then(function (data) {{
+        if (series.clusterZoom === zoom) {{
+            series.setData(data);
+        }}
+    }});"""
+
+        return CallbackFunction(body = function_body)
@@ -0,0 +1,484 @@
+import math
+
+from validator_collection import validators, checkers
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from highcharts_maps import errors
+
+
+GEOGRAPHIC_CRS = ['EPSG:4326', 'EPSG:4269', 'EPSG:4258', 'CRS:84', 'OGC:CRS84']
+
+CRS_DEFINITIONS = {
+    'EPSG:3857': '+proj=merc +a=6378137 +b=6378137 +lat_ts=0 +lon_0=0 +x_0=0 +y_0=0 '
+                 '+k=1 +units=m +no_defs',
+    'EPSG:900913': '+proj=merc +a=6378137 +b=6378137 +lat_ts=0 +lon_0=0 +x_0=0 '
+                   '+y_0=0 +k=1 +units=m +no_defs',
+    'EPSG:102100': '+proj=merc +a=6378137 +b=6378137 +lat_ts=0 +lon_0=0 +x_0=0 '
+                   '+y_0=0 +k=1 +units=m +no_defs',
+    'ESRI:102100': '+proj=merc +a=6378137 +b=6378137 +lat_ts=0 +lon_0=0 +x_0=0 '
+                   '+y_0=0 +k=1 +units=m +no_defs',
+    'EPSG:3395': '+proj=merc +lon_0=0 +k=1 +x_0=0 +y_0=0 +datum=WGS84 +units=m '
+                 '+no_defs',
+    'EPSG:5070': '+proj=aea +lat_0=23 +lon_0=-96 +lat_1=29.5 +lat_2=45.5 +x_0=0 '
+                 '+y_0=0 +datum=NAD83 +units=m +no_defs',
+    'ESRI:102003': '+proj=aea +lat_0=37.5 +lon_0=-96 +lat_1=29.5 +lat_2=45.5 +x_0=0 '
+                   '+y_0=0 +datum=NAD83 +units=m +no_defs',
+    'ESRI:102004': '+proj=lcc +lat_0=39 +lon_0=-96 +lat_1=33 +lat_2=45 +x_0=0 '
+                   '+y_0=0 +datum=NAD83 +units=m +no_defs',
+}
+
+ELLIPSOIDS = {
+    'WGS84': (6378137.0, 298.257223563),
+    'GRS80': (6378137.0, 298.257222101),
+    'sphere': (6370997.0, None),
+}
+
+DATUM_ELLIPSOIDS = {
+    'WGS84': 'WGS84',
+    'NAD83': 'GRS80',
+    'ETRS89': 'GRS80',
+}
+
+_DEG2RAD = math.pi / 180
+
+
+def _normalize_crs(value):
+    """Return ``value`` as a :class:`str <python:str>` CRS identifier, or unchanged
+    if it is not an integer or string (e.g. a :class:`pyproj.CRS` instance)."""
+    if checkers.is_integer(value) and not isinstance(value, bool):
+        return f'EPSG:{int(value)}'
+    if isinstance(value, str):
+        value = value.strip()
+        if ':' in value and not value.startswith('+') and '[' not in value:
+            value = value.upper()
+
+    return value
+
+
+def _is_geographic(crs):
+    """Return ``True`` if ``crs`` (a normalized identifier or definition) describes
+    geographic longitude / latitude coordinates."""
+    if not isinstance(crs, str):
+        return False
+    if crs in GEOGRAPHIC_CRS:
+        return True
+    if crs.startswith('+'):
+        return _parse_proj4(crs).get('proj', None) in ['longlat', 'latlong',
+                                                        'lonlat', 'latlon']
+
+    return crs.startswith('GEOGCS[') or crs.startswith('GEOGCRS[')
+
+
+def _parse_proj4(definition):
+    """Parse a :term:`proj4 <projection>` definition string into a
+    :class:`dict <python:dict>` of its parameters."""
+    parameters = {}
+    for item in definition.split():
+        item = item.lstrip('+')
+        if not item:
+            continue
+        key, _, value = item.partition('=')
+        parameters[key] = value if value else True
+
+    return parameters
+
+
+def _get_ellipsoid(parameters):
+    """Return the semi-major axis and eccentricity described by proj4
+    ``parameters``."""
+    if 'R' in parameters:
+        return float(parameters['R']), 0.0
+
+    name = DATUM_ELLIPSOIDS.get(parameters.get('datum', None), None) or \
+        parameters.get('ellps', None) or 'WGS84'
+    if name not in ELLIPSOIDS:
+        raise errors.HighchartsValueError(f'unable to reproject to the "{name}" '
+                                          f'ellipsoid without pyproj. Please install '
+                                          f'it using "pip install pyproj"')
+    a, rf = ELLIPSOIDS[name]
+    if 'a' in parameters:
+        a = float(parameters['a'])
+    if 'b' in parameters:
+        b = float(parameters['b'])
+        f = (a - b) / a
+    elif 'rf' in parameters:
+        f = 1 / float(parameters['rf'])
+    elif 'f' in parameters:
+        f = float(parameters['f'])
+    else:
+        f = 1 / rf if rf else 0.0
+
+    return a, math.sqrt(2 * f - f * f)
+
+
+def _get_parameter(parameters, key, default = 0.0):
+    return float(parameters.get(key, default))
+
+
+def _msfn(sin_phi, cos_phi, e):
+    return cos_phi / np.sqrt(1 - (e * sin_phi) ** 2)
+
+
+def _tsfn(phi, sin_phi, e):
+    return np.tan(np.pi / 4 - phi / 2) / \
+        np.power((1 - e * sin_phi) / (1 + e * sin_phi), e / 2)
+
+
+def _qsfn(sin_phi, e):
+    if e < 1e-7:
+        return 2 * sin_phi
+    e_sin_phi = e * sin_phi
+
+    return (1 - e * e) * (sin_phi / (1 - e_sin_phi * e_sin_phi)
+                          - np.log((1 - e_sin_phi) / (1 + e_sin_phi)) / (2 * e))
+
+
+def _get_numpy_projector(crs):
+    """Return a function which projects longitudes and latitudes (in degrees) to the
+    target ``crs`` using NumPy.
+
+    Supports geographic CRSs and ``merc``, ``lcc``, and ``aea`` proj4 definitions (as
+    well as the CRS identifiers in :data:`CRS_DEFINITIONS`). Datum shifts are not
+    applied.
+
+    :raises HighchartsValueError: if ``crs`` is not supported
+    """
+    if _is_geographic(crs):
+        return lambda lon, lat: (lon, lat)
+
+    definition = CRS_DEFINITIONS.get(crs, crs) if isinstance(crs, str) else None
+    if not definition or not definition.startswith('+'):
+        raise errors.HighchartsValueError(f'unable to reproject to "{crs}" without '
+                                          f'pyproj. Please install it using "pip '
+                                          f'install pyproj", or supply a proj4 '
+                                          f'definition of a supported projection '
+                                          f'(merc, lcc, aea)')
+
+    parameters = _parse_proj4(definition)
+    projection = parameters.get('proj', None)
+    a, e = _get_ellipsoid(parameters)
+    lon_0 = _get_parameter(parameters, 'lon_0') * _DEG2RAD
+    lat_0 = _get_parameter(parameters, 'lat_0') * _DEG2RAD
+    x_0 = _get_parameter(parameters, 'x_0')
+    y_0 = _get_parameter(parameters, 'y_0')
+    k_0 = _get_parameter(parameters, 'k_0', parameters.get('k', 1.0))
+    to_meter = _get_parameter(parameters, 'to_meter', 1.0)
+
+    if projection == 'merc':
+        lat_ts = _get_parameter(parameters, 'lat_ts') * _DEG2RAD
+        if lat_ts:
+            k_0 = float(_msfn(math.sin(lat_ts), math.cos(lat_ts), e))
+
+        def projector(lon, lat):
+            lam = lon * _DEG2RAD - lon_0
+            phi = np.clip(lat * _DEG2RAD, -np.pi / 2 + 1e-10, np.pi / 2 - 1e-10)
+            x = a * k_0 * lam
+            y = -a * k_0 * np.log(_tsfn(phi, np.sin(phi), e))
+
+            return (x + x_0) / to_meter, (y + y_0) / to_meter
+
+        return projector
+
+    if projection not in ['lcc', 'aea']:
+        raise errors.HighchartsValueError(f'unable to reproject to the "{projection}" '
+                                          f'projection without pyproj. Please install '
+                                          f'it using "pip install pyproj"')
+
+    lat_1 = _get_parameter(parameters, 'lat_1', parameters.get('lat_0', 0)) * _DEG2RAD
+    lat_2 = _get_parameter(parameters, 'lat_2', math.degrees(lat_1)) * _DEG2RAD
+    sin_1, cos_1 = math.sin(lat_1), math.cos(lat_1)
+    sin_2, cos_2 = math.sin(lat_2), math.cos(lat_2)
+    m_1 = float(_msfn(sin_1, cos_1, e))
+    m_2 = float(_msfn(sin_2, cos_2, e))
+
+    if projection == 'lcc':
+        t_1 = float(_tsfn(lat_1, sin_1, e))
+        t_2 = float(_tsfn(lat_2, sin_2, e))
+        if abs(lat_1 - lat_2) < 1e-10:
+            n = sin_1
+        else:
+            n = (math.log(m_1) - math.log(m_2)) / (math.log(t_1) - math.log(t_2))
+        c = m_1 / (n * math.pow(t_1, n))
+        rho_0 = a * k_0 * c * math.pow(float(_tsfn(lat_0, math.sin(lat_0), e)), n) \
+            if abs(abs(lat_0) - math.pi / 2) > 1e-10 else 0.0
+
+        def projector(lon, lat):
+            phi = np.clip(lat * _DEG2RAD, -np.pi / 2 + 1e-10, np.pi / 2 - 1e-10)
+            rho = a * k_0 * c * np.power(_tsfn(phi, np.sin(phi), e), n)
+            theta = n * (lon * _DEG2RAD - lon_0)
+            x = rho * np.sin(theta)
+            y = rho_0 - rho * np.cos(theta)
+
+            return (x + x_0) / to_meter, (y + y_0) / to_meter
+
+        return projector
+
+    q_1 = float(_qsfn(sin_1, e))
+    q_2 = float(_qsfn(sin_2, e))
+    if abs(lat_1 - lat_2) < 1e-10:
+        n = sin_1
+    else:
+        n = (m_1 * m_1 - m_2 * m_2) / (q_2 - q_1)
+    c = m_1 * m_1 + n * q_1
+    rho_0 = a * math.sqrt(max(c - n * float(_qsfn(math.sin(lat_0), e)), 0)) / n
+
+    def projector(lon, lat):
+        q = _qsfn(np.sin(lat * _DEG2RAD), e)
+        rho = a * np.sqrt(np.maximum(c - n * q, 0)) / n
+        theta = n * (lon * _DEG2RAD - lon_0)
+        x = rho * np.sin(theta)
+        y = rho_0 - rho * np.cos(theta)
+
+        return (x + x_0) / to_meter, (y + y_0) / to_meter
+
+    return projector
+
+
+def _points_in_ring(x, y, ring):
+    """Return a boolean mask of the points (``x``, ``y``) which fall within the
+    polygon ``ring``, using ray casting."""
+    inside = np.zeros(x.shape, dtype = bool)
+    ring = np.asarray(ring, dtype = float)[:, :2]
+    x_1, y_1 = ring[:-1, 0], ring[:-1, 1]
+    x_2, y_2 = ring[1:, 0], ring[1:, 1]
+    for index in range(len(x_1)):
+        crosses = (y_1[index] > y) != (y_2[index] > y)
+        with np.errstate(invalid = 'ignore', divide = 'ignore'):
+            intersection = (x_2[index] - x_1[index]) * (y - y_1[index]) / \
+                (y_2[index] - y_1[index]) + x_1[index]
+        inside ^= crosses & (x < intersection)
+
+    return inside
+
+
+def _apply_map_transform(x, y, transform):
+    """Apply the affine portion of a Highcharts ``hc-transform`` definition to
+    projected coordinates, as ``Chart.transformFromLatLon()`` does client-side."""
+    rotation = transform.get('rotation', None)
+    if rotation:
+        cos_angle = transform.get('cosAngle', None) or math.cos(rotation)
+        sin_angle = transform.get('sinAngle', None) or math.sin(rotation)
+        x, y = x * cos_angle + y * sin_angle, -x * sin_angle + y * cos_angle
+
+    scale = transform.get('scale', None) or 1
+    jsonres = transform.get('jsonres', None) or 1
+    x = ((x - (transform.get('xoffset', None) or 0)) * scale
+         + (transform.get('xpan', None) or 0)) * jsonres + \
+        (transform.get('jsonmarginX', None) or 0)
+    y = -((((transform.get('yoffset', None) or 0) - y) * scale
+           + (transform.get('ypan', None) or 0)) * jsonres
+          - (transform.get('jsonmarginY', None) or 0))
+
+    return x, y
+
+
+class CRSTransformer(object):
+    """Server-side, vectorized transformation of coordinates from one coordinate
+    reference system (CRS) to another, which allows pre-projected maps to be built (and
+    points to be positioned on them) without relying on
+    :meth:`ChartOptions.proj4 <highcharts_maps.options.chart.ChartOptions.proj4>` or
+    :meth:`ChartOptions.map_transforms <highcharts_maps.options.chart.ChartOptions.map_transforms>`
+    client-side.
+
+    Coordinates are transformed using `pyproj <https://pyproj4.github.io/pyproj/>`__
+    when it is available. Otherwise, a `NumPy <https://numpy.org>`__ implementation
+    supports geographic CRSs, Mercator (``merc``), Lambert Conformal Conic (``lcc``),
+    and Albers Equal Area (``aea``) proj4 definitions, as well as the identifiers in
+    :data:`CRS_DEFINITIONS` (e.g. ``'EPSG:3857'`` or ``'EPSG:5070'``), from geographic
+    source coordinates.
+
+    .. code-block:: python
+
+      transformer = CRSTransformer('EPSG:5070')
+      my_map_data = MapData.from_shapefile('states.shp', reproject = transformer)
+
+      # Position points on a map that carries Highcharts map transforms
+      transformer = CRSTransformer(map_transforms = my_chart.options.chart.map_transforms)
+      x, y = transformer.transform(df['lon'], df['lat'])
+
+    Instances are callable, receiving and returning an ``(N, 2)`` array of coordinates,
+    and so may be supplied as the ``reproject`` argument of
+    :meth:`MapData.from_shapefile() <highcharts_maps.options.series.data.map_data.MapData.from_shapefile>`
+    or :meth:`MapData.from_geodataframe() <highcharts_maps.options.series.data.map_data.MapData.from_geodataframe>`.
+
+    :param target_crs: The CRS to transform coordinates into, as an EPSG code, an
+      authority string (e.g. ``'EPSG:3857'``), a proj4 definition, or (when using
+      pyproj) anything accepted by :class:`pyproj.CRS`. Defaults to
+      :obj:`None <python:None>`, which requires ``map_transforms``.
+    :type target_crs: :class:`str <python:str>`, :class:`int <python:int>`, or
+      :obj:`None <python:None>`
+
+    :param source_crs: The CRS of the coordinates being transformed. Defaults to
+      ``'EPSG:4326'`` (longitude / latitude).
+    :type source_crs: :class:`str <python:str>` or :class:`int <python:int>`
+
+    :param map_transforms: Highcharts map transform definitions (as found in
+      :meth:`ChartOptions.map_transforms <highcharts_maps.options.chart.ChartOptions.map_transforms>`
+      or the ``hc-transform`` of a :term:`map geometry`), either keyed by name or as a
+      single definition. If supplied, coordinates are projected into each
+      definition's ``crs`` and its affine transform applied, with each point assigned
+      to the first definition whose ``hitZone`` contains it (or to the ``'default'``
+      definition), exactly as Highcharts Maps would do client-side. Defaults to
+      :obj:`None <python:None>`.
+    :type map_transforms: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+    :param use_pyproj: Whether to use pyproj. Defaults to :obj:`None <python:None>`,
+      which uses pyproj if it is available.
+    :type use_pyproj: :class:`bool <python:bool>` or :obj:`None <python:None>`
+
+    :raises HighchartsDependencyError: if NumPy (or, when ``use_pyproj`` is ``True``,
+      pyproj) is not available in the runtime environment
+    :raises HighchartsValueError: if the arguments are invalid, or if the CRSs are not
+      supported without pyproj
+
+    """
+
+    def __init__(self,
+                 target_crs = None,
+                 source_crs = 'EPSG:4326',
+                 map_transforms = None,
+                 use_pyproj = None):
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in the runtime '
+                                                   'environment. Please install it '
+                                                   'using "pip install numpy" or '
+                                                   'equivalent.')
+
+        try:
+            import pyproj
+            has_pyproj = True
+        except ImportError:
+            has_pyproj = False
+        if use_pyproj and not has_pyproj:
+            raise errors.HighchartsDependencyError('pyproj is not available in the '
+                                                   'runtime environment. Please install '
+                                                   'using "pip install pyproj"')
+        self.use_pyproj = has_pyproj if use_pyproj is None else bool(use_pyproj)
+
+        self.target_crs = _normalize_crs(target_crs)
+        self.source_crs = _normalize_crs(source_crs or 'EPSG:4326')
+
+        map_transforms = validators.dict(map_transforms, allow_empty = True) or {}
+        if map_transforms and 'crs' in map_transforms:
+            map_transforms = {'default': map_transforms}
+        self.map_transforms = map_transforms or None
+
+        if not self.map_transforms and self.target_crs is None:
+            raise errors.HighchartsValueError('CRSTransformer requires a target_crs or '
+                                              'map_transforms')
+
+        self._zones = []
+        self._default = None
+        for name in map_transforms:
+            transform = validators.dict(map_transforms[name])
+            crs = _normalize_crs(transform.get('crs', None) or self.target_crs)
+            if crs is None:
+                raise errors.HighchartsValueError(f'map transform "{name}" has no crs')
+            step = (self._get_projector(crs), transform)
+            if transform.get('hitZone', None):
+                self._zones.append(step)
+            if name == 'default' or (self._default is None
+                                     and not transform.get('hitZone', None)):
+                self._default = step
+        if not map_transforms:
+            self._default = (self._get_projector(self.target_crs), None)
+
+    def _get_projector(self, crs):
+        if self.use_pyproj:
+            from pyproj import Transformer
+
+            transformer = Transformer.from_crs(self.source_crs, crs, always_xy = True)
+
+            return transformer.transform
+
+        if not _is_geographic(self.source_crs):
+            raise errors.HighchartsValueError(f'unable to reproject from '
+                                              f'"{self.source_crs}" without pyproj. '
+                                              f'Please install it using "pip install '
+                                              f'pyproj"')
+
+        return _get_numpy_projector(crs)
+
+    @staticmethod
+    def _project(x, y, projector, transform):
+        with np.errstate(invalid = 'ignore', divide = 'ignore', over = 'ignore'):
+            x, y = projector(x, y)
+            x = np.asarray(x, dtype = float)
+            y = np.asarray(y, dtype = float)
+            if transform is not None:
+                x, y = _apply_map_transform(x, y, transform)
+
+        return x, y
+
+    @property
+    def backend(self) -> str:
+        """The library used to transform coordinates, either ``'pyproj'`` or
+        ``'numpy'``.
+
+        :rtype: :class:`str <python:str>`
+        """
+        return 'pyproj' if self.use_pyproj else 'numpy'
+
+    def transform(self, x, y):
+        """Transform coordinates from the source CRS.
+
+        :param x: The x coordinates (longitudes, for geographic CRSs).
+        :type x: array-like
+
+        :param y: The y coordinates (latitudes, for geographic CRSs).
+        :type y: array-like
+
+        :returns: The transformed x and y coordinates. Coordinates which cannot be
+          transformed are returned as ``NaN``.
+        :rtype: 2-member :class:`tuple <python:tuple>` of
+          :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+        :raises HighchartsValueError: if ``x`` and ``y`` differ in shape
+        """
+        x = np.asarray(x, dtype = float)
+        y = np.asarray(y, dtype = float)
+        if x.shape != y.shape:
+            raise errors.HighchartsValueError('x and y must have the same shape')
+
+        result_x = np.full(x.shape, np.nan)
+        result_y = np.full(y.shape, np.nan)
+        remaining = np.ones(x.shape, dtype = bool)
+        for projector, transform in self._zones:
+            projected_x, projected_y = self._project(x[remaining],
+                                                     y[remaining],
+                                                     projector,
+                                                     transform)
+            coordinates = transform['hitZone'].get('coordinates', None) or [[]]
+            within = _points_in_ring(projected_x, projected_y, coordinates[0])
+            indices = np.flatnonzero(remaining)[within]
+            result_x[indices] = projected_x[within]
+            result_y[indices] = projected_y[within]
+            remaining[indices] = False
+
+        if self._default is not None and remaining.any():
+            projected_x, projected_y = self._project(x[remaining],
+                                                     y[remaining],
+                                                     *self._default)
+            result_x[remaining] = projected_x
+            result_y[remaining] = projected_y
+
+        invalid = ~np.isfinite(result_x) | ~np.isfinite(result_y)
+        result_x[invalid] = np.nan
+        result_y[invalid] = np.nan
+
+        return result_x, result_y
+
+    def __call__(self, coordinates):
+        """Transform an ``(N, 2)`` array of coordinates from the source CRS.
+
+        :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+        """
+        coordinates = np.asarray(coordinates, dtype = float)
+        x, y = self.transform(coordinates[..., 0], coordinates[..., 1])
+
+        return np.stack([x, y], axis = -1)
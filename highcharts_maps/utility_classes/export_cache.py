@@ -0,0 +1,374 @@
+import abc
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from validator_collection import validators
+
+from highcharts_maps import errors
+
+
+class ExportCacheBase(abc.ABC):
+    """Base class for caches of the chart images produced by the
+    :term:`Export Server`, which allow repeated exports of an identical chart to skip
+    the :term:`Export Server` entirely.
+
+    Images are keyed by a hash of the canonical form of the request that produced them
+    (see :meth:`.get_key() <ExportCacheBase.get_key>`), which covers the chart's
+    options as well as its format, scale, dimensions, constructor, global options, and
+    any callback or custom code.
+
+    Sub-classes provide the storage backend by implementing the abstract ``_get()``,
+    ``_set()``, ``_delete()``, ``_clear()``, and ``_get_usage()`` methods.
+    """
+
+    def __init__(self, ttl = None):
+        self._ttl = None
+        self.ttl = ttl
+
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def ttl(self) -> Optional[int | float]:
+        """The number of seconds for which a cached image remains valid. Defaults to
+        :obj:`None <python:None>`, which keeps images until they are evicted.
+
+        :rtype: numeric or :obj:`None <python:None>`
+        """
+        return self._ttl
+
+    @ttl.setter
+    def ttl(self, value):
+        self._ttl = validators.numeric(value, allow_empty = True, minimum = 0)
+
+    @property
+    def stats(self) -> dict:
+        """Statistics describing the use of the cache since it was created (or since
+        :meth:`.reset_stats() <ExportCacheBase.reset_stats>` was last called), as a
+        :class:`dict <python:dict>` with the following keys:
+
+          * ``'hits'``: the number of images retrieved from the cache
+          * ``'misses'``: the number of images requested that were not in the cache
+          * ``'evictions'``: the number of images removed to keep the cache within its
+            size limit
+          * ``'expirations'``: the number of images removed because their
+            :meth:`.ttl <ExportCacheBase.ttl>` had elapsed
+          * ``'entries'``: the number of images currently in the cache
+          * ``'size'``: the total size (in bytes) of the images currently in the cache
+
+        :rtype: :class:`dict <python:dict>`
+        """
+        with self._lock:
+            entries, size = self._get_usage()
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+                'entries': entries,
+                'size': size
+            }
+
+    def reset_stats(self):
+        """Reset the hit, miss, eviction, and expiration counts of
+        :meth:`.stats <ExportCacheBase.stats>` to zero."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
+
+    @staticmethod
+    def get_key(request_body) -> str:
+        """Return the cache key of an :term:`Export Server` request.
+
+        The key is a hash of the request's canonical form, in which the members of each
+        JSON object are sorted, so that requests which differ only in the order of their
+        options share a key.
+
+        :param request_body: The JSON body of the request.
+        :type request_body: :class:`str <python:str>` or :class:`bytes <python:bytes>`
+
+        :rtype: :class:`str <python:str>`
+        """
+        canonical = json.dumps(json.loads(request_body),
+                               sort_keys = True,
+                               separators = (',', ':'),
+                               ensure_ascii = False)
+
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key) -> Optional[bytes]:
+        """Return the image cached under ``key``, or :obj:`None <python:None>` if it is
+        not in the cache (or has expired).
+
+        :param key: The cache key, as returned by
+          :meth:`.get_key() <ExportCacheBase.get_key>`.
+        :type key: :class:`str <python:str>`
+
+        :rtype: :class:`bytes <python:bytes>` or :obj:`None <python:None>`
+        """
+        with self._lock:
+            value = self._get(key, time.time())
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+
+            return value
+
+    def set(self, key, value):
+        """Cache the image ``value`` under ``key``.
+
+        :param key: The cache key, as returned by
+          :meth:`.get_key() <ExportCacheBase.get_key>`.
+        :type key: :class:`str <python:str>`
+
+        :param value: The exported image.
+        :type value: :class:`bytes <python:bytes>` or :class:`str <python:str>`
+        """
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        elif not isinstance(value, bytes):
+            raise errors.HighchartsValueError(f'value expects bytes or str. Received: '
+                                              f'{value.__class__.__name__}')
+
+        now = time.time()
+        with self._lock:
+            self._set(key, value, now + self.ttl if self.ttl is not None else None, now)
+
+    def delete(self, key):
+        """Remove the image cached under ``key``, if any.
+
+        :param key: The cache key.
+        :type key: :class:`str <python:str>`
+        """
+        with self._lock:
+            self._delete(key)
+
+    def clear(self):
+        """Remove every image from the cache."""
+        with self._lock:
+            self._clear()
+
+    @abc.abstractmethod
+    def _get(self, key, now):
+        """Return the image stored under ``key``, or :obj:`None <python:None>` if it is
+        missing or expired as of ``now``."""
+
+    @abc.abstractmethod
+    def _set(self, key, value, expires_at, now):
+        """Store the image ``value`` under ``key`` until ``expires_at``."""
+
+    @abc.abstractmethod
+    def _delete(self, key):
+        """Remove the image stored under ``key`` (if any)."""
+
+    @abc.abstractmethod
+    def _clear(self):
+        """Remove every image from the storage backend."""
+
+    @abc.abstractmethod
+    def _get_usage(self):
+        """Return the number of images in the cache and their total size in bytes."""
+
+
+class MemoryExportCache(ExportCacheBase):
+    """Cache of exported chart images held in memory, which evicts the least-recently
+    used images once their total size exceeds
+    :meth:`.max_size <MemoryExportCache.max_size>`.
+
+    .. code-block:: python
+
+      cache = MemoryExportCache(max_size = 256 * 1024 * 1024, ttl = 3600)
+      my_chart.download_chart(cache = cache)
+
+    """
+
+    def __init__(self, max_size = 64 * 1024 * 1024, ttl = None):
+        super().__init__(ttl = ttl)
+        self._max_size = None
+        self.max_size = max_size
+
+        self._entries = OrderedDict()
+        self._size = 0
+
+    @property
+    def max_size(self) -> int:
+        """The maximum total size (in bytes) of the images held in the cache. Defaults
+        to 64 MiB.
+
+        :rtype: :class:`int <python:int>`
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        self._max_size = validators.integer(value, minimum = 0)
+
+    def _get(self, key, now):
+        entry = self._entries.get(key, None)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= now:
+            self._delete(key)
+            self._expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+
+        return value
+
+    def _set(self, key, value, expires_at, now):
+        self._delete(key)
+        if len(value) > self.max_size:
+            return
+
+        self._entries[key] = (value, expires_at)
+        self._size += len(value)
+        while self._size > self.max_size:
+            oldest = next(iter(self._entries))
+            self._delete(oldest)
+            self._evictions += 1
+
+    def _delete(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0])
+
+    def _clear(self):
+        self._entries.clear()
+        self._size = 0
+
+    def _get_usage(self):
+        return len(self._entries), self._size
+
+
+class DirectoryExportCache(ExportCacheBase):
+    """Cache of exported chart images held as files in a directory, which can be shared
+    across processes and persists between them.
+
+    Each image is written atomically to a file named after its cache key. If
+    :meth:`.max_size <DirectoryExportCache.max_size>` is set, the least-recently used
+    images are evicted once their total size exceeds it.
+
+    .. code-block:: python
+
+      cache = DirectoryExportCache('/var/cache/maps', ttl = 24 * 3600)
+      my_chart.download_chart(cache = cache)
+
+    """
+
+    def __init__(self, directory, max_size = None, ttl = None):
+        super().__init__(ttl = ttl)
+        self._directory = None
+        self._max_size = None
+
+        self.directory = directory
+        self.max_size = max_size
+
+    @property
+    def directory(self) -> str:
+        """The directory in which the images are held. Created if it does not exist.
+
+        :rtype: Path-like
+        """
+        return self._directory
+
+    @directory.setter
+    def directory(self, value):
+        value = validators.path(value)
+        os.makedirs(value, exist_ok = True)
+        self._directory = value
+
+    @property
+    def max_size(self) -> Optional[int]:
+        """The maximum total size (in bytes) of the images held in the cache. Defaults
+        to :obj:`None <python:None>`, which does not limit the size of the cache.
+
+        :rtype: :class:`int <python:int>` or :obj:`None <python:None>`
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value):
+        self._max_size = validators.integer(value, allow_empty = True, minimum = 0)
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, f'{key}.export')
+
+    def _iter_entries(self):
+        """Yield the path, size, and last-used time of each image in the cache."""
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith('.export'):
+                stat = entry.stat()
+                yield entry.path, stat.st_size, stat.st_atime
+
+    def _get(self, key, now):
+        path = self._get_path(key)
+        try:
+            if self.ttl is not None and os.path.getmtime(path) + self.ttl <= now:
+                self._delete(key)
+                self._expirations += 1
+                return None
+            with open(path, 'rb') as file_:
+                value = file_.read()
+            os.utime(path, (now, os.path.getmtime(path)))
+        except FileNotFoundError:
+            return None
+
+        return value
+
+    def _set(self, key, value, expires_at, now):
+        if self.max_size is not None and len(value) > self.max_size:
+            return
+
+        descriptor, temporary_path = tempfile.mkstemp(dir = self.directory,
+                                                      suffix = '.tmp')
+        with os.fdopen(descriptor, 'wb') as file_:
+            file_.write(value)
+        os.utime(temporary_path, (now, now))
+        os.replace(temporary_path, self._get_path(key))
+
+        if self.max_size is None:
+            return
+
+        entries = sorted(self._iter_entries(), key = lambda x: x[2])
+        size = sum(x[1] for x in entries)
+        for path, entry_size, _ in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+            self._evictions += 1
+
+    def _delete(self, key):
+        try:
+            os.remove(self._get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _clear(self):
+        for path, _, _ in list(self._iter_entries()):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _get_usage(self):
+        entries = list(self._iter_entries())
+
+        return len(entries), sum(x[1] for x in entries)
@@ -1,13 +1,20 @@
 from typing import Optional, List
 from decimal import Decimal
+import copy
 
 from validator_collection import validators, checkers
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
-from highcharts_maps import errors
+from highcharts_maps import errors, utility_functions
 from highcharts_maps.decorators import class_sensitive, validate_types
 from highcharts_maps.metaclasses import HighchartsMeta
 from highcharts_maps.utility_classes.javascript_functions import (JavaScriptClass,
                                                                   CallbackFunction)
+from highcharts_maps.utility_classes.topojson import Topology
 from highcharts_maps.js_literal_functions import (serialize_to_js_literal,
                                                   assemble_js_literal)
 
@@ -157,6 +164,278 @@ class CustomProjection(JavaScriptClass):
             self._methods = value
 
 
+PROJECTION_NAMES = ['EqualEarth',
+                    'LambertConformalConic',
+                    'Miller',
+                    'Orthographic',
+                    'WebMercator']
+
+_DEG2RAD = 0.017453292519943295
+
+_EQUAL_EARTH_A1 = 1.340264
+_EQUAL_EARTH_A2 = -0.081106
+_EQUAL_EARTH_A3 = 0.000893
+_EQUAL_EARTH_A4 = 0.003796
+_EQUAL_EARTH_M = 0.8660254037844386
+_EQUAL_EARTH_SCALE = 74.03120656864502
+
+_LAMBERT_EPSILON = 1e-6
+_LAMBERT_SCALE = 63.78137
+
+_MILLER_SCALE = 63.78137
+
+_ORTHOGRAPHIC_SCALE = 63.78460826781007
+
+_WEB_MERCATOR_MAX_LATITUDE = 85.0511287798
+_WEB_MERCATOR_SCALE = 63.78137
+
+
+def _rotate(lon, lat, rotation, inverse = False):
+    """Apply the three-axis spherical ``rotation`` to arrays of longitudes and latitudes
+    (in degrees), mirroring the rotator applied client-side by Highcharts Maps.
+
+    :returns: The rotated longitudes and latitudes, in degrees.
+    :rtype: 2-member :class:`tuple <python:tuple>` of
+      :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    """
+    rotation = list(rotation) + [None, None]
+    delta_lambda = float(rotation[0] or 0) * _DEG2RAD
+    delta_phi = float(rotation[1] or 0) * _DEG2RAD
+    delta_gamma = float(rotation[2] or 0) * _DEG2RAD
+    if not delta_lambda and not delta_phi and not delta_gamma:
+        return lon, lat
+
+    cos_delta_phi = np.cos(delta_phi)
+    sin_delta_phi = np.sin(delta_phi)
+    cos_delta_gamma = np.cos(delta_gamma)
+    sin_delta_gamma = np.sin(delta_gamma)
+
+    lon = lon * _DEG2RAD
+    if not inverse:
+        lon = lon + delta_lambda
+    lat = lat * _DEG2RAD
+    cos_lat = np.cos(lat)
+    sin_lat = np.sin(lat)
+    x = np.cos(lon) * cos_lat
+    y = np.sin(lon) * cos_lat
+
+    if not inverse:
+        k = sin_lat * cos_delta_phi + x * sin_delta_phi
+        rotated_lon = np.arctan2(y * cos_delta_gamma - k * sin_delta_gamma,
+                                 x * cos_delta_phi - sin_lat * sin_delta_phi)
+        rotated_lat = np.arcsin(np.clip(k * cos_delta_gamma + y * sin_delta_gamma,
+                                        -1, 1))
+    else:
+        k = sin_lat * cos_delta_gamma - y * sin_delta_gamma
+        rotated_lon = np.arctan2(y * cos_delta_gamma + sin_lat * sin_delta_gamma,
+                                 x * cos_delta_phi + k * sin_delta_phi) - delta_lambda
+        rotated_lat = np.arcsin(np.clip(k * cos_delta_phi - x * sin_delta_phi, -1, 1))
+        rotated_lon = (rotated_lon + np.pi) % (2 * np.pi) - np.pi
+
+    return rotated_lon / _DEG2RAD, rotated_lat / _DEG2RAD
+
+
+def _equal_earth_forward(lon, lat, parallels = None, clip = False):
+    sin_theta = _EQUAL_EARTH_M * np.sin(lat * _DEG2RAD)
+    theta = np.arcsin(sin_theta)
+    theta2 = theta * theta
+    theta6 = theta2 * theta2 * theta2
+    x = lon * _DEG2RAD * np.cos(theta) * _EQUAL_EARTH_SCALE / (
+        _EQUAL_EARTH_M * (_EQUAL_EARTH_A1
+                          + 3 * _EQUAL_EARTH_A2 * theta2
+                          + theta6 * (7 * _EQUAL_EARTH_A3
+                                      + 9 * _EQUAL_EARTH_A4 * theta2)))
+    y = theta * _EQUAL_EARTH_SCALE * (_EQUAL_EARTH_A1
+                                      + _EQUAL_EARTH_A2 * theta2
+                                      + theta6 * (_EQUAL_EARTH_A3
+                                                  + _EQUAL_EARTH_A4 * theta2))
+
+    return x, y
+
+
+def _equal_earth_inverse(x, y, parallels = None):
+    x = x / _EQUAL_EARTH_SCALE
+    y = y / _EQUAL_EARTH_SCALE
+    theta = y.copy()
+    for _ in range(12):
+        theta2 = theta * theta
+        theta6 = theta2 * theta2 * theta2
+        fy = theta * (_EQUAL_EARTH_A1
+                      + _EQUAL_EARTH_A2 * theta2
+                      + theta6 * (_EQUAL_EARTH_A3 + _EQUAL_EARTH_A4 * theta2)) - y
+        fpy = _EQUAL_EARTH_A1 + 3 * _EQUAL_EARTH_A2 * theta2 + theta6 * (
+            7 * _EQUAL_EARTH_A3 + 9 * _EQUAL_EARTH_A4 * theta2)
+        delta = fy / fpy
+        theta = theta - delta
+        if not np.any(np.abs(delta) >= 1e-9):
+            break
+
+    theta2 = theta * theta
+    theta6 = theta2 * theta2 * theta2
+    lon = _EQUAL_EARTH_M * x * (_EQUAL_EARTH_A1
+                                + 3 * _EQUAL_EARTH_A2 * theta2
+                                + theta6 * (7 * _EQUAL_EARTH_A3
+                                            + 9 * _EQUAL_EARTH_A4 * theta2)) / \
+        np.cos(theta) / _DEG2RAD
+    lat = np.arcsin(np.sin(theta) / _EQUAL_EARTH_M) / _DEG2RAD
+    outside = np.abs(lon) > 180
+
+    return np.where(outside, np.nan, lon), np.where(outside, np.nan, lat)
+
+
+def _get_lambert_constants(parallels):
+    """Return the cone constants (``n``, ``c``) for the standard ``parallels``.
+
+    :raises HighchartsValueError: if ``parallels`` is empty
+    """
+    if not parallels:
+        raise errors.HighchartsValueError('the LambertConformalConic projection '
+                                          'requires parallels to be projected '
+                                          'server-side')
+
+    lat1 = float(parallels[0]) * _DEG2RAD
+    lat2 = float(parallels[1]) * _DEG2RAD if len(parallels) > 1 else lat1
+    cos_lat1 = np.cos(lat1)
+
+    def tany(value):
+        return np.tan((np.pi / 2 + value) / 2)
+
+    if lat1 == lat2:
+        n = np.sin(lat1)
+    else:
+        n = np.log(cos_lat1 / np.cos(lat2)) / np.log(tany(lat2) / tany(lat1))
+    if abs(n) < 1e-10:
+        n = (np.sign(n) or 1) * 1e-10
+    c = cos_lat1 * np.power(tany(lat1), n) / n
+
+    return n, c
+
+
+def _lambert_forward(lon, lat, parallels = None, clip = False):
+    n, c = _get_lambert_constants(parallels)
+    lon = lon * _DEG2RAD
+    lat = lat * _DEG2RAD
+    if c > 0:
+        lat = np.maximum(lat, -np.pi / 2 + _LAMBERT_EPSILON)
+    else:
+        lat = np.minimum(lat, np.pi / 2 - _LAMBERT_EPSILON)
+
+    r = c / np.power(np.tan((np.pi / 2 + lat) / 2), n)
+    x = r * np.sin(n * lon) * _LAMBERT_SCALE
+    y = (c - r * np.cos(n * lon)) * _LAMBERT_SCALE
+
+    return x, y
+
+
+def _lambert_inverse(x, y, parallels = None):
+    n, c = _get_lambert_constants(parallels)
+    x = x / _LAMBERT_SCALE
+    y = y / _LAMBERT_SCALE
+    cy = c - y
+    rho = np.sign(n) * np.sqrt(x * x + cy * cy)
+    lon = np.arctan2(x, np.abs(cy)) * np.sign(cy)
+    lon = np.where(cy * n < 0, lon - np.pi * np.sign(x) * np.sign(cy), lon)
+    lat = 2 * np.arctan(np.power(c / rho, 1 / n)) - np.pi / 2
+
+    return (lon / n) / _DEG2RAD, lat / _DEG2RAD
+
+
+def _miller_forward(lon, lat, parallels = None, clip = False):
+    x = lon * _DEG2RAD * _MILLER_SCALE
+    y = 1.25 * _MILLER_SCALE * np.log(np.tan(np.pi / 4 + 0.4 * lat * _DEG2RAD))
+
+    return x, y
+
+
+def _miller_inverse(x, y, parallels = None):
+    lon = x / (_MILLER_SCALE * _DEG2RAD)
+    lat = 2.5 * (np.arctan(np.exp(0.8 * y / _MILLER_SCALE)) - np.pi / 4) / _DEG2RAD
+
+    return lon, lat
+
+
+def _orthographic_forward(lon, lat, parallels = None, clip = False):
+    outside = (lon < -90) | (lon > 90)
+    if clip:
+        lon = np.clip(lon, -90, 90)
+    lat = lat * _DEG2RAD
+    x = np.cos(lat) * np.sin(lon * _DEG2RAD) * _ORTHOGRAPHIC_SCALE
+    y = np.sin(lat) * _ORTHOGRAPHIC_SCALE
+    if not clip:
+        x = np.where(outside, np.nan, x)
+        y = np.where(outside, np.nan, y)
+
+    return x, y
+
+
+def _orthographic_inverse(x, y, parallels = None):
+    x = x / _ORTHOGRAPHIC_SCALE
+    y = y / _ORTHOGRAPHIC_SCALE
+    z = np.sqrt(x * x + y * y)
+    c = np.arcsin(z)
+    sin_c = np.sin(c)
+    lon = np.arctan2(x * sin_c, z * np.cos(c))
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        lat = np.arcsin(np.where(z == 0, 0, y * sin_c / z))
+
+    return lon / _DEG2RAD, lat / _DEG2RAD
+
+
+def _web_mercator_forward(lon, lat, parallels = None, clip = False):
+    outside = np.abs(lat) > _WEB_MERCATOR_MAX_LATITUDE
+    if clip:
+        lat = np.clip(lat, -_WEB_MERCATOR_MAX_LATITUDE, _WEB_MERCATOR_MAX_LATITUDE)
+    sin_lat = np.sin(lat * _DEG2RAD)
+    x = _WEB_MERCATOR_SCALE * lon * _DEG2RAD
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        y = _WEB_MERCATOR_SCALE * np.log((1 + sin_lat) / (1 - sin_lat)) / 2
+    if not clip:
+        x = np.where(outside, np.nan, x)
+        y = np.where(outside, np.nan, y)
+
+    return x, y
+
+
+def _web_mercator_inverse(x, y, parallels = None):
+    lon = x / (_WEB_MERCATOR_SCALE * _DEG2RAD)
+    lat = (2 * np.arctan(np.exp(y / _WEB_MERCATOR_SCALE)) - np.pi / 2) / _DEG2RAD
+
+    return lon, lat
+
+
+_PROJECTION_FUNCTIONS = {
+    'EqualEarth': (_equal_earth_forward, _equal_earth_inverse),
+    'LambertConformalConic': (_lambert_forward, _lambert_inverse),
+    'Miller': (_miller_forward, _miller_inverse),
+    'Orthographic': (_orthographic_forward, _orthographic_inverse),
+    'WebMercator': (_web_mercator_forward, _web_mercator_inverse),
+}
+
+
+def _decode_position(position, transform):
+    if not transform:
+        return [float(position[0]), float(position[1])]
+
+    return [position[0] * transform['scale'][0] + transform['translate'][0],
+            position[1] * transform['scale'][1] + transform['translate'][1]]
+
+
+def _collect_positions(geometry, transform, positions, targets):
+    """Gather the (decoded) positions of the ``Point`` and ``MultiPoint`` geometries
+    found within ``geometry``, along with the geometries they belong to."""
+    geometry_type = geometry.get('type', None)
+    if geometry_type == 'GeometryCollection':
+        for item in geometry.get('geometries', []) or []:
+            _collect_positions(item, transform, positions, targets)
+    elif geometry_type == 'Point' and geometry.get('coordinates', None):
+        positions.append(_decode_position(geometry['coordinates'], transform))
+        targets.append((geometry, None))
+    elif geometry_type == 'MultiPoint':
+        for index, position in enumerate(geometry.get('coordinates', []) or []):
+            positions.append(_decode_position(position, transform))
+            targets.append((geometry, index))
+
+
 class ProjectionOptions(HighchartsMeta):
     """The projection options allow applying client-side :term:`projection` to a map given
     in geographic coordinates, typically from :term:`TopoJSON` or :term:`GeoJSON`."""
@@ -261,6 +540,8 @@ class ProjectionOptions(HighchartsMeta):
                                                   f'member values. Received: '
                                                   f'{len(processed)}.')
 
+            self._rotation = processed
+
     @property
     def custom(self) -> Optional[CustomProjection]:
         """The definition of a custom projection that should be used.
@@ -350,3 +631,280 @@ class ProjectionOptions(HighchartsMeta):
                 file_.write(as_str)
 
         return as_str
+
+    def _get_projection_functions(self):
+        """Return the forward and inverse functions which implement the
+        :term:`projection` server-side, or :obj:`None <python:None>` if no projection
+        is named.
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          available in the runtime environment
+        :raises HighchartsValueError: if the projection cannot be applied server-side
+        """
+        if not HAS_NUMPY:
+            raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                                   'It was not found in the runtime '
+                                                   'environment. Please install it '
+                                                   'using "pip install numpy" or '
+                                                   'equivalent.')
+        if self.custom is not None:
+            raise errors.HighchartsValueError(f'custom projections are calculated '
+                                              f'client-side and cannot be applied in '
+                                              f'Python. Received: "{self.name}"')
+        if not self.name:
+            return None
+
+        functions = _PROJECTION_FUNCTIONS.get(self.name, None)
+        if not functions:
+            raise errors.HighchartsValueError(f'unable to apply the "{self.name}" '
+                                              f'projection in Python. Supports: '
+                                              f'{", ".join(PROJECTION_NAMES)}')
+
+        return functions
+
+    def forward(self, lon, lat, clip = False):
+        """Project longitudes and latitudes (in degrees) to the projected units used by
+        Highcharts Maps, applying the
+        :meth:`.rotation <highcharts_maps.utility_classes.projections.ProjectionOptions.rotation>`
+        and :meth:`.parallels <highcharts_maps.utility_classes.projections.ProjectionOptions.parallels>`
+        configured. The results match those calculated client-side for the same
+        :meth:`.name <highcharts_maps.utility_classes.projections.ProjectionOptions.name>`.
+
+        .. note::
+
+          If no :meth:`.name <highcharts_maps.utility_classes.projections.ProjectionOptions.name>`
+          is set, the coordinates are only rotated.
+
+        :param lon: The longitudes to project.
+        :type lon: numeric, iterable of numeric values, or
+          :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+        :param lat: The latitudes to project.
+        :type lat: numeric, iterable of numeric values, or
+          :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+        :param clip: If ``True``, coordinates which fall outside of the projection's
+          domain (e.g. the far side of the globe in an ``'Orthographic'`` projection, or
+          beyond the maximum latitude of a ``'WebMercator'`` projection) are moved to
+          its edge. If ``False``, they are returned as ``NaN``. Defaults to ``False``.
+        :type clip: :class:`bool <python:bool>`
+
+        :returns: The projected x and y values.
+        :rtype: 2-member :class:`tuple <python:tuple>` of
+          :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          available in the runtime environment
+        :raises HighchartsValueError: if the projection cannot be applied in Python, or
+          if ``lon`` and ``lat`` differ in shape
+        """
+        functions = self._get_projection_functions()
+        lon = np.asarray(lon, dtype = float)
+        lat = np.asarray(lat, dtype = float)
+        if lon.shape != lat.shape:
+            raise errors.HighchartsValueError('lon and lat must have the same shape')
+
+        with np.errstate(invalid = 'ignore', divide = 'ignore'):
+            if self.rotation:
+                lon, lat = _rotate(lon, lat, self.rotation)
+            if not functions:
+                return lon.copy(), lat.copy()
+
+            return functions[0](lon, lat, parallels = self.parallels, clip = clip)
+
+    def inverse(self, x, y):
+        """Convert projected units back to longitudes and latitudes (in degrees),
+        reversing :meth:`.forward() <highcharts_maps.utility_classes.projections.ProjectionOptions.forward>`.
+
+        :param x: The projected x values.
+        :type x: numeric, iterable of numeric values, or
+          :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+        :param y: The projected y values.
+        :type y: numeric, iterable of numeric values, or
+          :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+        :returns: The longitudes and latitudes. Values which do not correspond to a
+          location on the globe are returned as ``NaN``.
+        :rtype: 2-member :class:`tuple <python:tuple>` of
+          :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          available in the runtime environment
+        :raises HighchartsValueError: if the projection cannot be applied in Python, or
+          if ``x`` and ``y`` differ in shape
+        """
+        functions = self._get_projection_functions()
+        x = np.asarray(x, dtype = float)
+        y = np.asarray(y, dtype = float)
+        if x.shape != y.shape:
+            raise errors.HighchartsValueError('x and y must have the same shape')
+
+        with np.errstate(invalid = 'ignore', divide = 'ignore'):
+            if functions:
+                lon, lat = functions[1](x, y, parallels = self.parallels)
+            else:
+                lon, lat = x.copy(), y.copy()
+            if self.rotation:
+                lon, lat = _rotate(lon, lat, self.rotation, inverse = True)
+
+        return lon, lat
+
+    def project_topology(self, topology, precision = None):
+        """Return a copy of ``topology`` whose arcs and points have been projected in
+        Python.
+
+        All of the arcs are decoded and projected in a single vectorized pass. The
+        result is not quantized, and any Highcharts view or transform recommendations
+        embedded in the source are removed, so that Highcharts Maps renders the result
+        as-is when the chart applies no projection of its own.
+
+        .. warning::
+
+          Unlike client-side projection, geometries that cross the antimeridian of the
+          (rotated) globe are not cut, and geometries outside of the projection's domain
+          are moved to its edge rather than clipped precisely.
+
+        :param topology: The :term:`topology` to project.
+        :type topology: :class:`Topology <highcharts_maps.utility_classes.topojson.Topology>`
+
+        :param precision: If supplied, the number of decimal places to which the
+          projected coordinates are rounded. Defaults to :obj:`None <python:None>`,
+          which does not round.
+        :type precision: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :rtype: :class:`Topology <highcharts_maps.utility_classes.topojson.Topology>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          available in the runtime environment
+        :raises HighchartsValueError: if ``topology`` is not a
+          :class:`Topology <highcharts_maps.utility_classes.topojson.Topology>`, or if
+          the projection cannot be applied in Python
+        """
+        self._get_projection_functions()
+        if not isinstance(topology, Topology):
+            raise errors.HighchartsValueError(f'topology expects a Topology instance. '
+                                              f'Received: {topology.__class__.__name__}')
+        precision = validators.integer(precision, allow_empty = True, minimum = 0)
+
+        as_dict = topology.to_dict()
+        transform = as_dict.pop('transform', None)
+        for key in ['hc-recommended-mapview', 'hc-recommended-transform', 'hc-transform']:
+            as_dict.pop(key, None)
+
+        positions = []
+        targets = []
+        objects = as_dict.get('objects', {}) or {}
+        for object_name in objects:
+            for key in ['hc-recommended-mapview',
+                        'hc-recommended-transform',
+                        'hc-transform']:
+                objects[object_name].pop(key, None)
+            _collect_positions(objects[object_name], transform, positions, targets)
+
+        arcs = as_dict.get('arcs', []) or []
+        vertices, offsets = utility_functions.decode_arcs(arcs, transform)
+
+        vertices = np.vstack([vertices, np.array(positions, dtype = float).reshape(-1, 2)])
+        x, y = self.forward(vertices[:, 0], vertices[:, 1], clip = True)
+        projected = np.column_stack([x, y])
+        if precision is not None:
+            projected = np.round(projected, precision)
+
+        arc_count = int(offsets[-1])
+        as_dict['arcs'] = [x.tolist()
+                           for x in np.split(projected[:arc_count],
+                                             offsets[1:-1])] if arcs else []
+        for (geometry, index), position in zip(targets,
+                                               projected[arc_count:].tolist()):
+            if index is None:
+                geometry['coordinates'] = position
+            else:
+                geometry['coordinates'][index] = position
+
+        valid = projected[~np.isnan(projected).any(axis = 1)]
+        if len(valid):
+            as_dict['bbox'] = [*valid.min(axis = 0).tolist(),
+                               *valid.max(axis = 0).tolist()]
+        else:
+            as_dict.pop('bbox', None)
+
+        return Topology(as_dict, object_name = topology.options.object_name)
+
+    def project_map_data(self, map_data, precision = None):
+        """Return a copy of ``map_data`` whose :term:`topology` has been projected in
+        Python.
+
+        .. seealso::
+
+          * :meth:`ProjectionOptions.project_topology() <highcharts_maps.utility_classes.projections.ProjectionOptions.project_topology>`
+          * :meth:`Chart.pre_project() <highcharts_maps.chart.Chart.pre_project>`
+
+        :param map_data: The :term:`map geometries <map geometry>` to project.
+        :type map_data: :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>`
+
+        :param precision: If supplied, the number of decimal places to which the
+          projected coordinates are rounded. Defaults to :obj:`None <python:None>`,
+          which does not round.
+        :type precision: :class:`int <python:int>` or :obj:`None <python:None>`
+
+        :rtype: :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>`
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          available in the runtime environment
+        :raises HighchartsValueError: if ``map_data`` is not a
+          :class:`MapData <highcharts_maps.options.series.data.map_data.MapData>`
+          with a :term:`topology`, or if the projection cannot be applied in Python
+        """
+        from highcharts_maps.options.series.data.map_data import MapData
+
+        if not isinstance(map_data, MapData) or not map_data.topology:
+            raise errors.HighchartsValueError('map_data expects a MapData instance '
+                                              'with a topology')
+
+        projected = MapData(topology = self.project_topology(map_data.topology,
+                                                             precision = precision))
+        projected.force_geojson = map_data.force_geojson
+
+        return projected
+
+    def project_data_points(self, data_points):
+        """Return copies of ``data_points`` whose ``lat`` and ``lon`` have been replaced
+        by their projected y and x values, respectively.
+
+        Data points which fall outside of the projection's domain have their ``lat``
+        and ``lon`` removed, so that they are not rendered. Data points without a
+        ``lat`` or ``lon`` are copied unchanged.
+
+        :param data_points: The data points to project, e.g. the
+          :meth:`.data <highcharts_maps.options.series.mappoint.MapPointSeries.data>` of
+          a :class:`MapPointSeries <highcharts_maps.options.series.mappoint.MapPointSeries>`.
+        :type data_points: iterable of data points which support ``lat`` and ``lon``
+
+        :rtype: :class:`list <python:list>` of data points
+
+        :raises HighchartsDependencyError: if `NumPy <https://numpy.org>`__ is not
+          available in the runtime environment
+        :raises HighchartsValueError: if the projection cannot be applied in Python
+        """
+        self._get_projection_functions()
+        points = [copy.copy(x) for x in data_points or []]
+        lon = np.array([getattr(x, 'lon', None) for x in points], dtype = float)
+        lat = np.array([getattr(x, 'lat', None) for x in points], dtype = float)
+        x, y = self.forward(lon, lat)
+
+        for point, lon_, lat_, x_, y_ in zip(points,
+                                             lon.tolist(),
+                                             lat.tolist(),
+                                             x.tolist(),
+                                             y.tolist()):
+            if lon_ != lon_ or lat_ != lat_:
+                continue
+            if x_ != x_ or y_ != y_:
+                point.lon = None
+                point.lat = None
+            else:
+                point.lon = x_
+                point.lat = y_
+
+        return points
@@ -1,9 +1,19 @@
-from validator_collection import validators
+import csv
+import io
+import itertools
+
+from validator_collection import validators, checkers
 
 from highcharts_core.utility_functions import *
 
 from highcharts_maps import errors
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 def validate_bounding_array(value,
                             allow_singleton = True,
@@ -114,3 +124,758 @@ def validate_bounding_array(value,
                                                       f'unacceptable value: {value}')
 
             return value
+
+
+def _resolve_csv_columns(columns, header):
+    """Resolve ``columns`` (labels or indices) against the CSV ``header``.
+
+    :returns: A :class:`list <python:list>` of column indices, in the same order as
+      ``columns``.
+    :rtype: :class:`list <python:list>` of :class:`int <python:int>`
+
+    :raises HighchartsCSVDeserializationError: if a column cannot be found
+    """
+    indices = []
+    for column in columns:
+        if checkers.is_integer(column):
+            if header is not None and column >= len(header):
+                raise errors.HighchartsCSVDeserializationError(
+                    f'column index {column} is out of range for CSV data with '
+                    f'{len(header)} columns'
+                )
+            indices.append(int(column))
+        elif header is None:
+            raise errors.HighchartsCSVDeserializationError(
+                f'column "{column}" is referenced by label, but the CSV data has no '
+                f'header row'
+            )
+        elif column not in header:
+            raise errors.HighchartsCSVDeserializationError(
+                f'column "{column}" was not found in the CSV header row'
+            )
+        else:
+            indices.append(header.index(column))
+
+    return indices
+
+
+def _convert_csv_column(values, dtype, null_text):
+    """Convert a chunk of raw CSV ``values`` to a typed
+    :class:`numpy.ndarray <numpy:numpy.ndarray>` in a single vectorized operation.
+
+    If ``dtype`` is :obj:`None <python:None>`, will try :obj:`numpy.float64` and fall
+    back to an ``object`` array of strings.
+
+    :returns: The converted array.
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+    """
+    nulls = ('', null_text)
+    if dtype is None:
+        try:
+            return _convert_csv_column(values, np.float64, null_text)
+        except errors.HighchartsCSVDeserializationError:
+            dtype = object
+
+    dtype = np.dtype(dtype)
+    if dtype.kind in ['O', 'U', 'S']:
+        return np.asarray([None if x in nulls else x for x in values], dtype = object)
+
+    try:
+        if dtype.kind == 'f':
+            return np.asarray(['nan' if x in nulls else x for x in values],
+                              dtype = dtype)
+
+        return np.asarray(values, dtype = dtype)
+    except (ValueError, TypeError, OverflowError):
+        raise errors.HighchartsCSVDeserializationError(
+            f'unable to convert CSV values to {dtype}'
+        )
+
+
+def _iter_csv_chunks_pyarrow(as_string_or_file,
+                             columns,
+                             dtypes,
+                             has_header_row,
+                             delimiter,
+                             null_text,
+                             chunk_size,
+                             encoding):
+    """Implementation of :func:`iter_csv_column_chunks` using the streaming CSV reader
+    from `pyarrow <https://arrow.apache.org/docs/python/>`__."""
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    if checkers.is_on_filesystem(as_string_or_file):
+        with open(as_string_or_file, 'r', newline = '', encoding = encoding) as file_:
+            first_row = next(csv.reader(file_, delimiter = delimiter), [])
+        source = as_string_or_file
+    else:
+        first_row = next(csv.reader(io.StringIO(as_string_or_file),
+                                    delimiter = delimiter), [])
+        source = io.BytesIO(as_string_or_file.encode(encoding))
+
+    if has_header_row:
+        column_names = first_row
+    else:
+        column_names = [f'f{index}' for index in range(len(first_row))]
+
+    indices = _resolve_csv_columns(columns, first_row if has_header_row else None)
+    include_columns = [column_names[x] for x in indices]
+    column_types = {}
+    for name, dtype in zip(include_columns, dtypes):
+        if dtype is None:
+            continue
+        if np.dtype(dtype).kind in ['O', 'U', 'S']:
+            column_types[name] = pa.string()
+        else:
+            column_types[name] = pa.from_numpy_dtype(np.dtype(dtype))
+
+    read_options = pa_csv.ReadOptions(
+        encoding = encoding,
+        column_names = None if has_header_row else column_names,
+        block_size = max(chunk_size * 64, 1 << 16)
+    )
+    parse_options = pa_csv.ParseOptions(delimiter = delimiter)
+    convert_options = pa_csv.ConvertOptions(
+        include_columns = include_columns,
+        column_types = column_types,
+        null_values = ['', null_text],
+        strings_can_be_null = True
+    )
+
+    try:
+        reader = pa_csv.open_csv(source,
+                                 read_options = read_options,
+                                 parse_options = parse_options,
+                                 convert_options = convert_options)
+        for batch in reader:
+            chunk = []
+            for name, dtype in zip(include_columns, dtypes):
+                array = batch.column(name).to_numpy(zero_copy_only = False)
+                if dtype is not None and array.dtype != np.dtype(dtype):
+                    array = array.astype(dtype)
+                chunk.append(array)
+            yield chunk
+    except pa.ArrowException as error:
+        raise errors.HighchartsCSVDeserializationError(str(error))
+
+
+def _iter_csv_chunks_python(as_string_or_file,
+                            columns,
+                            dtypes,
+                            has_header_row,
+                            delimiter,
+                            null_text,
+                            chunk_size,
+                            encoding):
+    """Implementation of :func:`iter_csv_column_chunks` using the standard library
+    :mod:`csv <python:csv>` module and vectorized NumPy conversion per chunk."""
+    if checkers.is_on_filesystem(as_string_or_file):
+        file_ = open(as_string_or_file, 'r', newline = '', encoding = encoding)
+    else:
+        file_ = io.StringIO(as_string_or_file)
+
+    dtypes = list(dtypes)
+    with file_:
+        reader = csv.reader(file_, delimiter = delimiter)
+        header = next(reader, None) if has_header_row else None
+        indices = _resolve_csv_columns(columns, header)
+
+        while True:
+            rows = list(itertools.islice(reader, chunk_size))
+            if not rows:
+                break
+            try:
+                raw_columns = [[row[x] for row in rows] for x in indices]
+            except IndexError:
+                raise errors.HighchartsCSVDeserializationError(
+                    'CSV data contains a row with fewer columns than expected'
+                )
+
+            chunk = []
+            for position, values in enumerate(raw_columns):
+                array = _convert_csv_column(values, dtypes[position], null_text)
+                # Lock in the dtype inferred from the first chunk so that every chunk
+                # concatenates to the same type.
+                dtypes[position] = array.dtype
+                chunk.append(array)
+
+            yield chunk
+
+
+def iter_csv_column_chunks(as_string_or_file,
+                           columns,
+                           dtypes = None,
+                           has_header_row = True,
+                           delimiter = ',',
+                           null_text = 'None',
+                           chunk_size = 100000,
+                           encoding = 'utf-8'):
+    """Iterate over CSV data in chunks, yielding each chunk as a list of typed
+    :class:`numpy.ndarray <numpy:numpy.ndarray>` columns.
+
+    Only the columns requested in ``columns`` are retained, and each is converted in a
+    single vectorized operation per chunk rather than value-by-value. If
+    `pyarrow <https://arrow.apache.org/docs/python/>`__ is available in the runtime
+    environment, its streaming CSV reader is used (in which case chunks are sized by
+    pyarrow's block reader). Otherwise, the standard library :mod:`csv <python:csv>`
+    module is used to read ``chunk_size`` records at a time.
+
+    :param as_string_or_file: The CSV data, either as a :class:`str <python:str>` or as
+      a path to a file in the runtime environment.
+    :type as_string_or_file: :class:`str <python:str>` or Path-like
+
+    :param columns: The columns to read, either as numerical indices (starting with 0)
+      or as :class:`str <python:str>` header labels.
+    :type columns: iterable of :class:`int <python:int>` or :class:`str <python:str>`
+
+    :param dtypes: An optional collection of NumPy dtypes, one per member of
+      ``columns``. A :obj:`None <python:None>` member will be inferred as
+      :obj:`numpy.float64` where possible, falling back to strings. Defaults to
+      :obj:`None <python:None>`.
+    :type dtypes: iterable or :obj:`None <python:None>`
+
+    :param has_header_row: If ``True``, indicates that the first row of the CSV data
+      contains column labels. Defaults to ``True``.
+    :type has_header_row: :class:`bool <python:bool>`
+
+    :param delimiter: The delimiter used between columns. Defaults to ``,``.
+    :type delimiter: :class:`str <python:str>`
+
+    :param null_text: The string used to indicate an empty value. Empty strings are
+      always treated as null. Defaults to ``'None'``.
+    :type null_text: :class:`str <python:str>`
+
+    :param chunk_size: The number of records to read per chunk. Defaults to
+      ``100000``.
+    :type chunk_size: :class:`int <python:int>`
+
+    :param encoding: The character encoding of the CSV data. Defaults to ``'utf-8'``.
+    :type encoding: :class:`str <python:str>`
+
+    :returns: A generator yielding a :class:`list <python:list>` of
+      :class:`numpy.ndarray <numpy:numpy.ndarray>` per chunk, in the order of
+      ``columns``.
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsCSVDeserializationError: if a column cannot be found or its
+      values cannot be converted to the requested dtype
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in the runtime '
+                                               'environment. Please install it using '
+                                               '"pip install numpy" or equivalent.')
+
+    columns = [x for x in validators.iterable(columns)]
+    dtypes = [x for x in dtypes] if dtypes is not None else [None for x in columns]
+    if len(dtypes) != len(columns):
+        raise errors.HighchartsValueError(f'dtypes expects one member per column. '
+                                          f'Received {len(dtypes)} dtypes for '
+                                          f'{len(columns)} columns.')
+    chunk_size = validators.integer(chunk_size, minimum = 1)
+
+    try:
+        import pyarrow.csv
+        implementation = _iter_csv_chunks_pyarrow
+    except ImportError:
+        implementation = _iter_csv_chunks_python
+
+    return implementation(as_string_or_file,
+                          columns = columns,
+                          dtypes = dtypes,
+                          has_header_row = has_header_row,
+                          delimiter = delimiter,
+                          null_text = null_text,
+                          chunk_size = chunk_size,
+                          encoding = encoding)
+
+
+GRID_REDUCERS = ['sum', 'mean', 'count', 'max', 'min']
+
+
+def bin_lat_lon(lat,
+                lon,
+                value = None,
+                colsize = 1,
+                rowsize = 1,
+                reducer = 'sum'):
+    """Bin latitude / longitude points into a grid of ``colsize`` by ``rowsize``
+    degree cells (aligned to ``-180, -90``), reducing the values of the points that fall
+    within each cell.
+
+    Points are assigned to cells and reduced using vectorized histogramming
+    (:func:`numpy.bincount <numpy:numpy.bincount>`), so millions of points reduce to one
+    value per non-empty cell without any per-point Python work. Points with missing or
+    out-of-range coordinates (or, unless ``reducer`` is ``'count'``, a missing value)
+    are ignored.
+
+    :param lat: The latitudes of the points.
+    :type lat: array-like
+
+    :param lon: The longitudes of the points.
+    :type lon: array-like
+
+    :param value: The values of the points. Defaults to :obj:`None <python:None>`,
+      which gives each point a value of ``1``.
+    :type value: array-like or :obj:`None <python:None>`
+
+    :param colsize: The width of each cell, in degrees of longitude. Defaults to ``1``.
+    :type colsize: numeric
+
+    :param rowsize: The height of each cell, in degrees of latitude. Defaults to ``1``.
+    :type rowsize: numeric
+
+    :param reducer: How to reduce the values of the points in each cell. Accepts
+      ``'sum'``, ``'mean'``, ``'count'``, ``'max'``, or ``'min'``. Defaults to
+      ``'sum'``.
+    :type reducer: :class:`str <python:str>`
+
+    :returns: A :class:`dict <python:dict>` with ``'lat'``, ``'lon'``, and ``'value'``
+      columns holding the center and reduced value of each non-empty cell.
+    :rtype: :class:`dict <python:dict>` of :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    :raises HighchartsValueError: if the arguments are invalid
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in the runtime '
+                                               'environment. Please install it using '
+                                               '"pip install numpy" or equivalent.')
+
+    colsize = validators.float(colsize, minimum = 0)
+    rowsize = validators.float(rowsize, minimum = 0)
+    if not colsize or not rowsize:
+        raise errors.HighchartsValueError('colsize and rowsize must be greater than 0')
+    reducer = validators.string(reducer).lower()
+    if reducer not in GRID_REDUCERS:
+        raise errors.HighchartsValueError(f'reducer expects one of {GRID_REDUCERS}. '
+                                          f'Received: "{reducer}"')
+
+    def to_column(column):
+        if hasattr(column, 'to_numpy'):
+            column = column.to_numpy()
+        return np.asarray(column, dtype = np.float64).reshape(-1)
+
+    lat = to_column(lat)
+    lon = to_column(lon)
+    if value is None:
+        value = np.ones(len(lat))
+    else:
+        value = to_column(value)
+    if len(lat) != len(lon) or len(lat) != len(value):
+        raise errors.HighchartsValueError(f'lat, lon, and value must have the same '
+                                          f'length. Received lengths: {len(lat)}, '
+                                          f'{len(lon)}, {len(value)}')
+
+    mask = (lat >= -90) & (lat <= 90) & (lon >= -180) & (lon <= 180)
+    if reducer != 'count':
+        mask &= ~np.isnan(value)
+    if not mask.all():
+        lat, lon, value = lat[mask], lon[mask], value[mask]
+
+    columns = int(np.ceil(360 / colsize))
+    rows = int(np.ceil(180 / rowsize))
+    column_index = np.minimum((lon + 180) // colsize, columns - 1).astype(np.int64)
+    row_index = np.minimum((lat + 90) // rowsize, rows - 1).astype(np.int64)
+    cell_index = row_index * columns + column_index
+
+    dense = rows * columns <= max(len(cell_index), 1 << 22)
+    if dense:
+        size = rows * columns
+        counts = np.bincount(cell_index, minlength = size)
+        cells = np.flatnonzero(counts)
+    else:
+        cells, cell_index = np.unique(cell_index, return_inverse = True)
+        cell_index = cell_index.reshape(-1)
+        size = len(cells)
+        counts = np.bincount(cell_index, minlength = size)
+
+    if reducer == 'count':
+        reduced = counts.astype(np.float64)
+    elif reducer in ['sum', 'mean']:
+        reduced = np.bincount(cell_index, weights = value, minlength = size)
+        if reducer == 'mean':
+            reduced = np.divide(reduced,
+                                counts,
+                                out = np.zeros(size),
+                                where = counts > 0)
+    else:
+        ufunc = np.maximum if reducer == 'max' else np.minimum
+        reduced = np.full(size, -np.inf if reducer == 'max' else np.inf)
+        ufunc.at(reduced, cell_index, value)
+
+    if dense:
+        reduced = reduced[cells]
+
+    return {
+        'lat': -90 + ((cells // columns) + 0.5) * rowsize,
+        'lon': -180 + ((cells % columns) + 0.5) * colsize,
+        'value': reduced,
+    }
+
+
+def decode_arcs(arcs, transform = None):
+    """Decode the (optionally quantized and delta-encoded) arcs of a :term:`TopoJSON`
+    topology into a single array of absolute positions.
+
+    :param arcs: The topology's ``arcs``.
+    :type arcs: :class:`list <python:list>` of :class:`list <python:list>` of positions
+
+    :param transform: The topology's ``transform``, if quantized. Defaults to
+      :obj:`None <python:None>`.
+    :type transform: :class:`dict <python:dict>` or :obj:`None <python:None>`
+
+    :returns: An ``(N, 2)`` array of the positions of every arc, and an array of
+      ``len(arcs) + 1`` offsets such that arc ``i`` spans
+      ``positions[offsets[i]:offsets[i + 1]]``.
+    :rtype: 2-member :class:`tuple <python:tuple>` of
+      :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in the runtime '
+                                               'environment. Please install it using '
+                                               '"pip install numpy" or equivalent.')
+
+    arcs = arcs or []
+    lengths = np.fromiter((len(x) for x in arcs), dtype = np.int64, count = len(arcs))
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    positions = np.array([x[:2] for x in itertools.chain.from_iterable(arcs)],
+                         dtype = np.float64).reshape(-1, 2)
+    if transform and len(positions):
+        totals = np.vstack([np.zeros((1, 2)), np.cumsum(positions, axis = 0)])
+        positions = totals[1:] - np.repeat(totals[offsets[:-1]], lengths, axis = 0)
+        positions = positions * transform['scale'] + transform['translate']
+
+    return positions, offsets
+
+
+def _get_signed_distances(x,
+                          y,
+                          cell_polygons,
+                          segments,
+                          segment_offsets,
+                          max_pairs = 1 << 16):
+    """Return the signed distance from each point (``x``, ``y``) to the outline of the
+    polygon it is tested against (positive inside, negative outside), evaluating every
+    point / segment pair in vectorized batches small enough to remain in cache.
+
+    ``segments`` holds the per-segment columns ``(ax, ay, by, dx, dy, slope,
+    inverse_length)`` prepared by :func:`get_poles_of_inaccessibility`.
+    """
+    ax, ay, by, dx, dy, slope, inverse_length = segments
+    x = x.astype(np.float32)
+    y = y.astype(np.float32)
+    distances = np.empty(len(x))
+    counts = segment_offsets[cell_polygons + 1] - segment_offsets[cell_polygons]
+    totals = np.cumsum(counts)
+    start = 0
+    while start < len(x):
+        consumed = totals[start - 1] if start else 0
+        stop = int(np.searchsorted(totals, consumed + max_pairs, side = 'right'))
+        stop = max(stop, start + 1)
+        batch_counts = counts[start:stop]
+        batch_offsets = np.cumsum(batch_counts) - batch_counts
+        pairs = np.repeat(np.arange(start, stop), batch_counts)
+        indices = np.arange(len(pairs)) + np.repeat(
+            segment_offsets[cell_polygons[start:stop]] - batch_offsets,
+            batch_counts
+        )
+
+        py = y[pairs]
+        segment_ay = ay[indices]
+        relative_x = x[pairs] - ax[indices]
+        relative_y = py - segment_ay
+        crosses = (segment_ay > py) != (by[indices] > py)
+        crosses &= relative_x < slope[indices] * relative_y
+
+        segment_dx = dx[indices]
+        segment_dy = dy[indices]
+        t = relative_x * segment_dx
+        t += relative_y * segment_dy
+        t *= inverse_length[indices]
+        np.clip(t, 0, 1, out = t)
+        relative_x -= t * segment_dx
+        relative_y -= t * segment_dy
+        relative_x *= relative_x
+        relative_y *= relative_y
+        relative_x += relative_y
+
+        inside = np.add.reduceat(crosses, batch_offsets, dtype = np.int64) % 2 == 1
+        nearest = np.sqrt(np.minimum.reduceat(relative_x, batch_offsets))
+        distances[start:stop] = np.where(inside, nearest, -nearest)
+        start = stop
+
+    return distances
+
+
+def get_poles_of_inaccessibility(polygons, precision = 0.01):
+    """Find the pole of inaccessibility (the interior point farthest from the outline)
+    of each polygon, which is the best position for a label within concave or
+    irregular shapes.
+
+    Implements the `polylabel <https://github.com/mapbox/polylabel>`__ algorithm,
+    refining a grid of candidate cells over every polygon at once: in each round, the
+    cells of all polygons are scored in a single vectorized pass, cells which cannot
+    contain a better position are discarded, and the rest are subdivided.
+
+    :param polygons: The polygons, each expressed as a collection of rings (the outer
+      ring followed by any holes), with each ring an iterable of ``[x, y]`` positions.
+    :type polygons: iterable of iterables of array-like
+
+    :param precision: The precision to which each position is found, as a fraction of
+      the larger dimension of the polygon's bounding box. Defaults to ``0.01``.
+    :type precision: numeric
+
+    :returns: An ``(N, 2)`` array holding the position found for each polygon (or
+      ``NaN`` for polygons without any positions).
+    :rtype: :class:`numpy.ndarray <numpy:numpy.ndarray>`
+
+    :raises HighchartsDependencyError: if NumPy is not available in the runtime
+      environment
+    """
+    if not HAS_NUMPY:
+        raise errors.HighchartsDependencyError('NumPy is required for this feature. '
+                                               'It was not found in the runtime '
+                                               'environment. Please install it using '
+                                               '"pip install numpy" or equivalent.')
+    precision = validators.float(precision, minimum = 0)
+
+    segments = []
+    segment_counts = []
+    bounds = []
+    origins = []
+    centroids = []
+    for polygon in polygons:
+        rings = [np.asarray(x, dtype = np.float64).reshape(-1, 2)[:, :2]
+                 for x in polygon or []]
+        rings = [x for x in rings if len(x)]
+        if not rings:
+            segment_counts.append(0)
+            bounds.append([np.nan] * 4)
+            origins.append([np.nan, np.nan])
+            centroids.append([np.nan, np.nan])
+            continue
+
+        # Work relative to the polygon's bounding box, so that distances can be
+        # evaluated in single precision without regard to the magnitude of the
+        # coordinates.
+        origin = rings[0].min(axis = 0)
+        count = 0
+        for index, ring in enumerate(rings):
+            ring = ring - origin
+            if (ring[0] != ring[-1]).any():
+                ring = np.vstack([ring, ring[:1]])
+            segments.append(np.hstack([ring[:-1], ring[1:]]))
+            count += len(ring) - 1
+            if index == 0:
+                outer = segments[-1]
+
+        segment_counts.append(count)
+        origins.append(origin)
+        bounds.append([0, 0, *(rings[0].max(axis = 0) - origin)])
+        cross = outer[:, 0] * outer[:, 3] - outer[:, 2] * outer[:, 1]
+        area = cross.sum() * 3
+        if area:
+            centroids.append([((outer[:, 0] + outer[:, 2]) * cross).sum() / area,
+                              ((outer[:, 1] + outer[:, 3]) * cross).sum() / area])
+        else:
+            centroids.append(outer[0, :2])
+
+    results = np.full((len(segment_counts), 2), np.nan)
+    segment_counts = np.asarray(segment_counts, dtype = np.int64)
+    valid = np.flatnonzero(segment_counts > 0)
+    if not len(valid):
+        return results
+
+    segments = np.vstack(segments)
+    delta_x = segments[:, 2] - segments[:, 0]
+    delta_y = segments[:, 3] - segments[:, 1]
+    length = delta_x * delta_x + delta_y * delta_y
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        slope = np.where(delta_y != 0, delta_x / delta_y, 0)
+        inverse_length = np.where(length > 0, 1 / length, 0)
+    segments = tuple(x.astype(np.float32) for x in (segments[:, 0],
+                                                     segments[:, 1],
+                                                     segments[:, 3],
+                                                     delta_x,
+                                                     delta_y,
+                                                     slope,
+                                                     inverse_length))
+    segment_offsets = np.concatenate([[0], np.cumsum(segment_counts)])
+    bounds = np.asarray(bounds, dtype = np.float64)
+    origins = np.asarray(origins, dtype = np.float64)
+    centroids = np.asarray(centroids, dtype = np.float64)
+
+    width = bounds[:, 2]
+    height = bounds[:, 3]
+    tolerance = np.maximum(width, height) * precision
+    cell_size = np.minimum(width, height)
+    best = np.full(len(segment_counts), -np.inf)
+
+    def update_best(cells_x, cells_y, cell_polygons, distances):
+        order = np.lexsort((distances, cell_polygons))
+        last = np.append(cell_polygons[order][1:] != cell_polygons[order][:-1], True)
+        order = order[last]
+        polygons = cell_polygons[order]
+        improved = distances[order] > best[polygons]
+        order, polygons = order[improved], polygons[improved]
+        best[polygons] = distances[order]
+        results[polygons, 0] = cells_x[order]
+        results[polygons, 1] = cells_y[order]
+
+    # Seed each polygon's best position with the better of its centroid and the
+    # center of its bounding box.
+    candidates_x = np.concatenate([centroids[valid, 0], width[valid] / 2])
+    candidates_y = np.concatenate([centroids[valid, 1], height[valid] / 2])
+    candidate_polygons = np.concatenate([valid, valid])
+    update_best(candidates_x,
+                candidates_y,
+                candidate_polygons,
+                _get_signed_distances(candidates_x,
+                                      candidates_y,
+                                      candidate_polygons,
+                                      segments,
+                                      segment_offsets))
+
+    grid_polygons = valid[cell_size[valid] > 0]
+
+    # Cover each polygon's bounding box with square cells of its shorter dimension.
+    columns = np.ceil(width[grid_polygons] / cell_size[grid_polygons]).astype(np.int64)
+    rows = np.ceil(height[grid_polygons] / cell_size[grid_polygons]).astype(np.int64)
+    counts = columns * rows
+    cell_polygons = np.repeat(grid_polygons, counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    columns = np.repeat(columns, counts)
+    half = cell_size[cell_polygons] / 2
+    cells_x = (local % columns) * half * 2 + half
+    cells_y = (local // columns) * half * 2 + half
+
+    offsets_x = np.array([-1, 1, -1, 1])
+    offsets_y = np.array([-1, -1, 1, 1])
+    while len(cells_x):
+        distances = _get_signed_distances(cells_x,
+                                          cells_y,
+                                          cell_polygons,
+                                          segments,
+                                          segment_offsets)
+        update_best(cells_x, cells_y, cell_polygons, distances)
+
+        # Discard cells which cannot hold a position (meaningfully) better than the
+        # best found so far, and split the rest into quarters.
+        keep = distances + half * np.sqrt(2) - best[cell_polygons] > \
+            tolerance[cell_polygons]
+        half = half[keep] / 2
+        cells_x = (cells_x[keep, None] + offsets_x * half[:, None]).reshape(-1)
+        cells_y = (cells_y[keep, None] + offsets_y * half[:, None]).reshape(-1)
+        cell_polygons = np.repeat(cell_polygons[keep], 4)
+        half = np.repeat(half, 4)
+
+    return results + origins
+
+    segments = np.vstack(segments)
+    delta_x = segments[:, 2] - segments[:, 0]
+    delta_y = segments[:, 3] - segments[:, 1]
+    length = delta_x * delta_x + delta_y * delta_y
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        slope = np.where(delta_y != 0, delta_x / delta_y, 0)
+        inverse_length = np.where(length > 0, 1 / length, 0)
+    segments = (segments[:, 0], segments[:, 1], segments[:, 3], delta_x, delta_y,
+                slope, inverse_length)
+    segment_offsets = np.concatenate([[0], np.cumsum(segment_counts)])
+    bounds = np.asarray(bounds, dtype = np.float64)
+    centroids = np.asarray(centroids, dtype = np.float64)
+
+    width = bounds[:, 2] - bounds[:, 0]
+    height = bounds[:, 3] - bounds[:, 1]
+    tolerance = np.maximum(width, height) * precision
+    cell_size = np.minimum(width, height)
+
+    # Seed each polygon's best position with the better of its centroid and the
+    # center of its bounding box.
+    candidates_x = np.concatenate([centroids[valid, 0],
+                                   (bounds[valid, 0] + bounds[valid, 2]) / 2])
+    candidates_y = np.concatenate([centroids[valid, 1],
+                                   (bounds[valid, 1] + bounds[valid, 3]) / 2])
+    candidate_polygons = np.concatenate([valid, valid])
+    distances = _get_signed_distances(candidates_x,
+                                      candidates_y,
+                                      candidate_polygons,
+                                      segments,
+                                      segment_offsets)
+    best = np.full(len(segment_counts), -np.inf)
+    for index in np.argsort(distances):
+        polygon = candidate_polygons[index]
+        best[polygon] = distances[index]
+        results[polygon] = [candidates_x[index], candidates_y[index]]
+
+    degenerate = valid[cell_size[valid] <= 0]
+    results[degenerate] = bounds[degenerate, :2]
+    grid_polygons = valid[cell_size[valid] > 0]
+
+    # Cover each polygon's bounding box with square cells of its shorter dimension.
+    columns = np.maximum(np.ceil(width[grid_polygons] / cell_size[grid_polygons]), 1)
+    rows = np.maximum(np.ceil(height[grid_polygons] / cell_size[grid_polygons]), 1)
+    counts = (columns * rows).astype(np.int64)
+    cell_polygons = np.repeat(grid_polygons, counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    repeated_columns = np.repeat(columns, counts).astype(np.int64)
+    half = cell_size[cell_polygons] / 2
+    cells_x = bounds[cell_polygons, 0] + (local % repeated_columns) * half * 2 + half
+    cells_y = bounds[cell_polygons, 1] + (local // repeated_columns) * half * 2 + half
+
+    while len(cells_x):
+        distances = _get_signed_distances(cells_x,
+                                          cells_y,
+                                          cell_polygons,
+                                          segments,
+                                          segment_offsets)
+
+        order = np.argsort(distances)
+        improved = distances[order] > best[cell_polygons[order]]
+        for index in order[improved]:
+            polygon = cell_polygons[index]
+            if distances[index] > best[polygon]:
+                best[polygon] = distances[index]
+                results[polygon] = [cells_x[index], cells_y[index]]
+
+        potential = distances + half * np.sqrt(2)
+        keep = potential - best[cell_polygons] > tolerance[cell_polygons]
+        cells_x, cells_y = cells_x[keep], cells_y[keep]
+        cell_polygons, half = cell_polygons[keep], half[keep] / 2
+
+        offsets_x = np.array([-1, 1, -1, 1])
+        offsets_y = np.array([-1, -1, 1, 1])
+        cells_x = (cells_x[:, None] + offsets_x * half[:, None]).reshape(-1)
+        cells_y = (cells_y[:, None] + offsets_y * half[:, None]).reshape(-1)
+        cell_polygons = np.repeat(cell_polygons, 4)
+        half = np.repeat(half, 4)
+
+    return results
+
+
+def shallow_copy(value):
+    """Return a shallow copy of the **Highcharts for Python** object ``value``, whose
+    properties can then be replaced without modifying ``value``.
+
+    .. note::
+
+      Unlike :func:`copy.copy() <python:copy.copy>`, this does not consult the
+      object's ``__getattr__()`` (which some series classes define) before the copy
+      has any attributes.
+
+    :param value: The object to copy.
+
+    :returns: A new instance of the same class, sharing ``value``'s property values.
+    """
+    result = value.__class__.__new__(value.__class__)
+    result.__dict__.update(value.__dict__)
+
+    return result
@@ -86,6 +86,18 @@ def create_output_directory(request):
         return True
 
 
+@pytest.fixture
+def local_export_server():
+    """Return a running
+    :class:`FakeExportServer <benchmarks.fake_export_server.FakeExportServer>`,
+    stopped after the test."""
+    from benchmarks.fake_export_server import FakeExportServer
+
+    server = FakeExportServer()
+    yield server
+    server.close()
+
+
 def check_input_file(input_directory, input_value, create_directory = False):
     inputs = os.path.abspath(input_directory)
     try:
@@ -1109,3 +1109,133 @@ def test_OutgoingWeightedConnectionData_to_dict(kwargs, error):
 ])
 def test_OutgoingWeightedConnectionData_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls4, input_files, filename, as_file, error)
+
+
+## NEXT CLASS
+
+from highcharts_maps.options.series.data.connections import FlowmapData as cls5
+from highcharts_maps.options.series.data.connections import FlowmapDataCollection as cls6
+
+
+@pytest.mark.parametrize('value, expected, error', [
+    ('some-id', 'some-id', None),
+    ([1, 2], [1, 2], None),
+    ({'lon': 1, 'lat': 2}, [1, 2], None),
+    ({'longitude': 1, 'latitude': 2}, [1, 2], None),
+
+    ([1, 2, 3], None, errors.HighchartsValueError),
+    ({'longitude': 1}, None, errors.HighchartsValueError),
+])
+def test_FlowmapData_validate_coordinates(value, expected, error):
+    if not error:
+        result = cls5(from_ = value)
+        assert result.from_ == expected
+    else:
+        with pytest.raises(error):
+            result = cls5(from_ = value)
+
+
+@pytest.mark.parametrize('kwargs, expected, error', [
+    ({
+        'from_lon': [1.5, -0.1],
+        'from_lat': [2, 51.5],
+        'to_lon': [3, 4],
+        'to_lat': [5, 6],
+        'weight': [1, None]
+     },
+     "[[[1.5,2.0],[3.0,5.0],1.0],[[-0.1,51.5],[4.0,6.0],null]]",
+     None),
+    ({
+        'from_id': ["o'hare", 'heathrow'],
+        'to_lon': [1, 2],
+        'to_lat': [3, 4]
+     },
+     "[['o\\'hare',[1.0,3.0],null],['heathrow',[2.0,4.0],null]]",
+     None),
+    ({
+        'from_id': ['a'],
+        'to_id': ['b'],
+        'weight': [2]
+     },
+     "[['a','b',2.0]]",
+     None),
+
+    ({'from_lon': [200], 'from_lat': [0], 'to_id': ['b']}, None, errors.HighchartsValueError),
+    ({'from_lon': [0], 'from_lat': [-91], 'to_id': ['b']}, None, errors.HighchartsValueError),
+    ({'from_lon': [0, 1], 'from_lat': [0], 'to_id': ['b', 'c']}, None, errors.HighchartsValueError),
+    ({'from_id': ['a', 'b'], 'to_id': ['b']}, None, errors.HighchartsValueError),
+    ({'from_id': ['a'], 'from_lon': [0], 'from_lat': [0], 'to_id': ['b']}, None, errors.HighchartsValueError),
+    ({'from_lon': [0], 'to_id': ['b']}, None, errors.HighchartsValueError),
+    ({'from_id': [1], 'to_id': ['b']}, None, errors.HighchartsValueError),
+])
+def test_FlowmapDataCollection_from_coordinates(kwargs, expected, error):
+    pytest.importorskip('numpy')
+    from highcharts_maps.options.series.flowmap import FlowmapSeries
+
+    if not error:
+        result = cls6.from_coordinates(**kwargs)
+        assert isinstance(result, cls6)
+        assert result.to_js_literal() == expected
+        assert len(result) == len(kwargs.get('from_lon', None) or kwargs.get('from_id'))
+
+        series = FlowmapSeries(data = result)
+        as_js_literal = series.to_js_literal()
+        assert expected in as_js_literal
+
+        round_trip = FlowmapSeries.from_js_literal(as_js_literal)
+        assert len(round_trip.data) == len(result)
+        assert round_trip.data[0].from_ == result.to_array()[0][0]
+    else:
+        with pytest.raises(error):
+            result = cls6.from_coordinates(**kwargs)
+
+
+@pytest.mark.parametrize('data, kwargs, expected, error', [
+    ([['a', 'b', 2], ['a', 'b', 3], ['b', 'a', None], ['c', 'a', 1]],
+     {},
+     "[['a','b',5.0],['b','a',1.0],['c','a',1.0]]",
+     None),
+    ([['a', 'b', 2], ['a', 'b', 3], ['b', 'a', 1], ['c', 'a', 1]],
+     {'weight_quantile': 0.9},
+     "[['a','b',5.0]]",
+     None),
+    ([[[0.25, 0.25], [5.25, 5.25], 2], [[0.75, 0.75], [5.75, 5.75], 3]],
+     {'resolution': 1},
+     "[[[0.5,0.5],[5.5,5.5],5.0]]",
+     None),
+    ([[[0, 0], [10, 0], 2], [[0, 0.2], [10, 0.2], 3], [[0, 0], [0, 10], 1]],
+     {'bundle': True},
+     "[[[0.0,0.1],[10.0,0.1],5.0],[[0.0,0.0],[0.0,10.0],1.0]]",
+     None),
+    ([[[0, 0], [10, 0], 2], [[1, 1], [9, 1], 3]],
+     {'regions': lambda lon, lat: ['west' if x < 5 else 'east' for x in lon]},
+     "[['west','east',5.0]]",
+     None),
+
+    ([['a', 'b', 2]], {'bundle': True}, None, errors.HighchartsValueError),
+    ([[[0, 0], [10, 0], 2]],
+     {'bundle': True, 'bundle_angle': 0},
+     None,
+     errors.HighchartsValueError),
+    ([[[0, 0], [10, 0], 2]],
+     {'bundle': True, 'bundle_distance': 0},
+     None,
+     errors.HighchartsValueError),
+    ([['a', 'b', 2]], {'weight_quantile': 2}, None, ValueError),
+    ([[[0, 0], [10, 0], 2]],
+     {'resolution': 1, 'regions': lambda lon, lat: lon},
+     None,
+     errors.HighchartsValueError),
+    ([['a', 'b', 2], [[0, 0], 'b', 1]], {}, None, errors.HighchartsValueError),
+])
+def test_FlowmapDataCollection_aggregate(data, kwargs, expected, error):
+    pytest.importorskip('numpy')
+
+    collection = cls6(data_points = data)
+    if not error:
+        result = collection.aggregate(**kwargs)
+        assert isinstance(result, cls6)
+        assert result.to_js_literal() == expected
+    else:
+        with pytest.raises(error):
+            result = collection.aggregate(**kwargs)
@@ -141,3 +141,75 @@ def test_GeometricLatLonData_to_dict(kwargs, error):
 ])
 def test_GeometricLatLonData_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls3, input_files, filename, as_file, error)
+
+
+@pytest.mark.parametrize('data_point_cls, columns, validate_sample, expected, error', [
+    (cls, {'name': ['us', 'fr'], 'value': [1.5, None]}, True,
+     [{'name': 'us', 'value': 1.5}, {'name': 'fr'}], None),
+    (cls2, {'name': ['us'], 'z': [3]}, True, [{'name': 'us', 'z': 3}], None),
+    (cls3, {'lat': [51.5], 'lon': [-0.1]}, True, [{'lat': 51.5, 'lon': -0.1}], None),
+    (cls, {}, True, [], None),
+    (cls, {'value': ['not-a-number']}, False, [{'value': 'not-a-number'}], None),
+
+    (cls, {'value': ['not-a-number']}, True, None, errors.HighchartsValueError),
+    (cls, {'not_a_property': [1]}, True, None, errors.HighchartsValueError),
+    (cls, {'name': ['us', 'fr'], 'value': [1]}, True, None, errors.HighchartsValueError),
+])
+def test_GeometricDataBase_from_trusted_columns(data_point_cls,
+                                                columns,
+                                                validate_sample,
+                                                expected,
+                                                error):
+    if not error:
+        result = data_point_cls.from_trusted_columns(columns,
+                                                     validate_sample = validate_sample)
+        assert len(result) == len(expected)
+        for data_point, expected_dict in zip(result, expected):
+            assert isinstance(data_point, data_point_cls)
+            assert data_point.to_dict() == expected_dict
+    else:
+        with pytest.raises(error):
+            result = data_point_cls.from_trusted_columns(columns,
+                                                         validate_sample = validate_sample)
+
+
+def test_GeometricDataBase_from_trusted_columns_ndarray():
+    np = pytest.importorskip('numpy')
+
+    columns = {
+        'name': np.array(['us', 'fr', 'de'], dtype = object),
+        'value': np.array([1.5, np.nan, 3.0])
+    }
+    result = cls.from_trusted_columns(columns)
+    expected = [cls(name = 'us', value = 1.5),
+                cls(name = 'fr'),
+                cls(name = 'de', value = 3.0)]
+
+    assert [x.to_dict() for x in result] == [x.to_dict() for x in expected]
+    assert all(isinstance(x.value, (float, type(None))) for x in result)
+
+
+@pytest.mark.parametrize('data_point_cls, kwargs', [
+    (cls, {'name': 'us', 'value': 1.5}),
+    (cls2, {'name': 'us', 'z': 3}),
+    (cls3, {'name': 'London', 'lat': 51.5, 'lon': -0.1}),
+])
+def test_GeometricDataBase_compact_storage(data_point_cls, kwargs):
+    result = data_point_cls(**kwargs)
+
+    assert sorted(result.__dict__) == sorted([f'_{x}' for x in kwargs])
+    assert result.data_labels is None
+    assert result.geometry is None
+    assert result.to_dict() == {to_camelCase(x): kwargs[x] for x in kwargs}
+
+    result.name = None
+    assert '_name' not in result.__dict__
+    assert result.name is None
+
+    with pytest.raises(AttributeError):
+        result.not_an_attribute
+
+    result._not_an_attribute = None
+    assert result.__dict__['_not_an_attribute'] is None
+    assert '_not_an_attribute' not in data_point_cls.__dict__
+    assert hasattr(data_point_cls(), '_not_an_attribute') is False
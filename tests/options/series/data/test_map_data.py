@@ -3,6 +3,9 @@
 import pytest
 
 import datetime
+import json
+import os
+import pickle
 from json.decoder import JSONDecodeError
 
 import geopandas
@@ -156,6 +159,34 @@ def test_MapData_from_geodataframe(input_files, as_str_or_file, object_name, err
             result = cls.from_geodataframe(as_str_or_file)
 
 
+@pytest.mark.parametrize('reproject, expected_max_x, error', [
+    ('EPSG:3857', 20015109.35, None),
+    ('+proj=merc +a=6378137 +b=6378137 +lat_ts=0 +lon_0=0 +x_0=0 +y_0=0 +units=m',
+     20015109.35,
+     None),
+    (lambda x: x * 2, 359.62, None),
+
+    ('EPSG:99999999', None, Exception),
+])
+def test_MapData_from_geodataframe_reproject(input_files,
+                                             reproject,
+                                             expected_max_x,
+                                             error):
+    input_file = check_input_file(input_files,
+                                  'series/data/map_data/map_data/world.topo.json')
+    topology = Topology.from_topojson(input_file, object_name = 'default')
+    gdf = topology.to_gdf(object_name = 'default')
+    if not error:
+        result = cls.from_geodataframe(gdf, reproject = reproject)
+        assert isinstance(result, cls) is True
+        gdf = result.to_geodataframe(object_name = 'data')
+        assert gdf.total_bounds[2] == pytest.approx(expected_max_x,
+                                                    rel = 1e-3)
+    else:
+        with pytest.raises(error):
+            result = cls.from_geodataframe(gdf, reproject = reproject)
+
+
 @pytest.mark.parametrize('as_str_or_file, object_name, error', [
     ('series/data/map_data/map_data/world.topo.json', 'default', None),
 ])
@@ -173,6 +204,441 @@ def test_MapData__to_geodataframe(input_files, as_str_or_file, object_name, erro
             result = as_obj.to_geodataframe()
 
 
+def _write_shapefile(tmp_path):
+    shapefile = pytest.importorskip('shapefile')
+    target = str(tmp_path / 'regions')
+    writer = shapefile.Writer(target, shapeType = shapefile.POLYGON)
+    writer.field('NAME', 'C')
+    writer.field('REGION', 'C')
+    writer.field('POP', 'N')
+    for index, (name, region) in enumerate([('a', 'midwest'),
+                                            ('b', 'midwest'),
+                                            ('c', 'south')]):
+        writer.poly([[[index, 0], [index, 1], [index + 1, 1], [index + 1, 0],
+                      [index, 0]]])
+        writer.record(name, region, (index + 1) * 10)
+    writer.close()
+
+    return target + '.shp'
+
+
+@pytest.mark.parametrize('kwargs, expected_count, expected_keys, error', [
+    ({}, 3, ['NAME', 'REGION', 'POP'], None),
+    ({'chunk_size': 1}, 3, ['NAME', 'REGION', 'POP'], None),
+    ({'chunk_size': 2,
+      'record_filter': lambda x: x['REGION'] == 'midwest'},
+     2,
+     ['NAME', 'REGION', 'POP'],
+     None),
+    ({'fields': ['NAME']}, 3, ['NAME'], None),
+    ({'reproject': lambda x: x * 2}, 3, ['NAME', 'REGION', 'POP'], None),
+    ({'reproject': 'EPSG:3857'}, 3, ['NAME', 'REGION', 'POP'], None),
+    ({'reproject': 3857, 'source_crs': 4326}, 3, ['NAME', 'REGION', 'POP'], None),
+    ({'simplify': 0.01}, 3, ['NAME', 'REGION', 'POP'], None),
+
+    ({'chunk_size': 0}, None, None, ValueError),
+])
+def test_MapData_from_shapefile(tmp_path, kwargs, expected_count, expected_keys, error):
+    shp_filename = _write_shapefile(tmp_path)
+    if not error:
+        result = cls.from_shapefile(shp_filename, **kwargs)
+        assert isinstance(result, cls) is True
+        as_dict = result.topology.to_dict()
+        geometries = as_dict['objects']['data']['geometries']
+        assert len(geometries) == expected_count
+        for geometry in geometries:
+            assert list(geometry['properties'].keys()) == expected_keys
+        if 'reproject' in kwargs and callable(kwargs['reproject']):
+            assert as_dict['bbox'][2] == 6
+        elif 'reproject' in kwargs:
+            assert as_dict['bbox'][2] == pytest.approx(333958.4723798207)
+    else:
+        with pytest.raises(error):
+            result = cls.from_shapefile(shp_filename, **kwargs)
+
+
+LABEL_ANCHOR_GEOJSON = {
+    'type': 'FeatureCollection',
+    'features': [
+        {'type': 'Feature',
+         'properties': {'hc-key': 'u', 'name': 'U'},
+         'geometry': {'type': 'Polygon',
+                      'coordinates': [[[0, 0], [3, 0], [3, 3], [2, 3], [2, 1], [1, 1],
+                                       [1, 3], [0, 3], [0, 0]]]}},
+        {'type': 'Feature',
+         'properties': {'hc-key': 'islands', 'name': 'Islands'},
+         'geometry': {'type': 'MultiPolygon',
+                      'coordinates': [[[[10, 0], [14, 0], [14, 4], [10, 4], [10, 0]]],
+                                      [[[20, 0], [21, 0], [21, 1], [20, 1],
+                                        [20, 0]]]]}},
+    ]
+}
+
+
+@pytest.mark.parametrize('kwargs, expected, error', [
+    ({}, {'u': (None, 0.195), 'islands': (0.182, 0.5)}, None),
+    ({'key': 'name'}, {'U': (None, 0.195), 'Islands': (0.182, 0.5)}, None),
+    ({'projection': {'name': 'Miller'}},
+     {'u': (None, 0.805), 'islands': (0.182, 0.5)},
+     None),
+    ({'key': 'missing'}, {}, None),
+
+    ({'projection': {'name': 'NotAProjection'}}, None, errors.HighchartsValueError),
+    ({'precision': -1}, None, ValueError),
+])
+def test_MapData_get_label_anchors(kwargs, expected, error):
+    map_data = cls(topology = Topology(LABEL_ANCHOR_GEOJSON))
+    if not error:
+        result = map_data.get_label_anchors(**kwargs)
+        assert sorted(result.keys()) == sorted(expected.keys())
+        for key in expected:
+            middle_x, middle_y = result[key]
+            if expected[key][0] is None:
+                assert min(middle_x, 1 - middle_x) == pytest.approx(0.195, abs = 0.01)
+            else:
+                assert middle_x == pytest.approx(expected[key][0], abs = 0.01)
+            assert middle_y == pytest.approx(expected[key][1], abs = 0.01)
+        assert map_data.get_label_anchors(**kwargs) == result
+    else:
+        with pytest.raises(error):
+            result = map_data.get_label_anchors(**kwargs)
+
+
+def _get_continents(input_files):
+    input_file = check_input_file(input_files,
+                                  'series/data/map_data/map_data/world.topo.json')
+    topology = Topology.from_topojson(input_file, object_name = 'default')
+    gdf = topology.to_gdf(object_name = 'default')
+
+    return [gdf[gdf['continent'] == x]
+            for x in sorted(gdf['continent'].dropna().unique())[:3]]
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    ({'max_workers': 1}, None),
+    ({'max_workers': 2}, None),
+    ({'max_workers': 2, 'topoquantize': 1e4}, None),
+
+    ({'max_workers': 0}, ValueError),
+])
+def test_MapData_from_many(input_files, kwargs, error):
+    continents = _get_continents(input_files)
+    if not error:
+        result = cls.from_many(continents, **kwargs)
+        assert len(result) == len(continents)
+        for map_data, gdf in zip(result, continents):
+            assert isinstance(map_data, cls) is True
+            as_gdf = map_data.to_geodataframe(object_name = 'data')
+            assert len(as_gdf) == len(gdf)
+            assert as_gdf['hc-key'].tolist() == gdf['hc-key'].tolist()
+
+        serial = cls.from_many(continents,
+                               **{**kwargs, 'max_workers': 1})
+        assert [x.to_topojson() for x in result] == [x.to_topojson() for x in serial]
+    else:
+        with pytest.raises(error):
+            result = cls.from_many(continents, **kwargs)
+
+
+@pytest.mark.parametrize('kwargs, expected_names, error', [
+    ({'max_workers': 1}, ['obj_0', 'obj_1', 'obj_2'], None),
+    ({'max_workers': 2, 'object_names': ['a', 'b', 'c']}, ['a', 'b', 'c'], None),
+    ({'max_workers': 1, 'topoquantize': 1e5}, ['obj_0', 'obj_1', 'obj_2'], None),
+
+    ({'object_names': ['a', 'b']}, None, errors.HighchartsValueError),
+    ({'object_names': ['a', 'a', 'b']}, None, errors.HighchartsValueError),
+])
+def test_MapData_from_geodataframes(input_files, kwargs, expected_names, error):
+    continents = _get_continents(input_files)
+    if not error:
+        result = cls.from_geodataframes(continents, **kwargs)
+        assert isinstance(result, cls) is True
+        as_dict = result.topology.to_dict()
+        assert list(as_dict['objects'].keys()) == expected_names
+        assert ('transform' in as_dict) is ('topoquantize' in kwargs)
+        for name, gdf in zip(expected_names, continents):
+            as_gdf = result.to_geodataframe(object_name = name)
+            assert as_gdf['hc-key'].tolist() == gdf['hc-key'].tolist()
+            assert as_gdf.total_bounds == pytest.approx(gdf.total_bounds, abs = 0.01)
+
+        serial = cls.from_geodataframes(continents, **{**kwargs, 'max_workers': 1})
+        assert serial.to_topojson() == result.to_topojson()
+    else:
+        with pytest.raises(error):
+            result = cls.from_geodataframes(continents, **kwargs)
+
+
+MERGE_LEFT = {
+    'type': 'Topology',
+    'objects': {
+        'left': {
+            'type': 'GeometryCollection',
+            'geometries': [{'type': 'Polygon',
+                            'arcs': [[0, 1]],
+                            'properties': {'hc-key': 'l'}}]
+        }
+    },
+    'arcs': [[[1, 0], [1, 1]], [[1, 1], [0, 1], [0, 0], [1, 0]]]
+}
+
+MERGE_RIGHT = {
+    'type': 'Topology',
+    'objects': {
+        'right': {
+            'type': 'GeometryCollection',
+            'geometries': [{'type': 'Polygon',
+                            'arcs': [[0, 1]],
+                            'properties': {'hc-key': 'r'}}]
+        }
+    },
+    'arcs': [[[1, 1], [1, 0]], [[1, 0], [2, 0], [2, 1], [1, 1]]]
+}
+
+
+@pytest.mark.parametrize('others, kwargs, expected_names, expected_arcs, error', [
+    ([MERGE_RIGHT], {}, ['left', 'right'], 3, None),
+    ([MERGE_RIGHT], {'quantization': None}, ['left', 'right'], 3, None),
+    ([MERGE_RIGHT], {'object_names': ['a', 'b']}, ['a', 'b'], 3, None),
+    ([MERGE_LEFT], {}, ['left', 'left_1'], 2, None),
+
+    ([MERGE_RIGHT], {'object_names': ['a', 'a']}, None, None, errors.HighchartsValueError),
+    ([MERGE_RIGHT], {'object_names': ['a']}, None, None, errors.HighchartsValueError),
+    ([MERGE_RIGHT], {'quantization': 1}, None, None, errors.HighchartsValueError),
+    ([cls()], {}, None, None, errors.HighchartsValueError),
+])
+def test_MapData_merge(others, kwargs, expected_names, expected_arcs, error):
+    instance = cls(topology = Topology(MERGE_LEFT, object_name = 'left'))
+    others = [x if isinstance(x, cls) else
+              cls(topology = Topology(x, object_name = list(x['objects'])))
+              for x in others]
+    if not error:
+        result = instance.merge(*others, **kwargs)
+        assert isinstance(result, cls) is True
+        assert result is not instance
+        as_dict = result.topology.to_dict()
+        assert list(as_dict['objects'].keys()) == expected_names
+        assert len(as_dict['arcs']) == expected_arcs
+        assert ('transform' in as_dict) is (kwargs.get('quantization', 1e5) is not None)
+        for name, other in zip(expected_names, [instance] + others):
+            as_gdf = result.to_geodataframe(object_name = name)
+            original_name = list(other.topology.to_dict()['objects'])[0]
+            original = other.to_geodataframe(object_name = original_name)
+            assert as_gdf['hc-key'].tolist() == original['hc-key'].tolist()
+            assert as_gdf.total_bounds == pytest.approx(original.total_bounds, abs = 1e-4)
+            assert as_gdf.area.tolist() == pytest.approx(original.area.tolist(), abs = 1e-4)
+    else:
+        with pytest.raises(error):
+            result = instance.merge(*others, **kwargs)
+
+
+MERGE_STATES = {
+    'type': 'Topology',
+    'objects': {
+        'states': {
+            'type': 'GeometryCollection',
+            'geometries': [{'type': 'Polygon',
+                            'arcs': [[0, 1]],
+                            'properties': {'hc-key': 'l'}},
+                           {'type': 'Polygon',
+                            'arcs': [[-1, 2]],
+                            'properties': {'hc-key': 'r'}}]
+        }
+    },
+    'arcs': [[[1, 0], [1, 1]],
+             [[1, 1], [0, 1], [0, 0], [1, 0]],
+             [[1, 0], [2, 0], [2, 1], [1, 1]]]
+}
+
+MERGE_OUTLINE = {
+    'type': 'Topology',
+    'objects': {
+        'country': {
+            'type': 'GeometryCollection',
+            'geometries': [{'type': 'Polygon',
+                            'arcs': [[0]],
+                            'properties': {'hc-key': 'c'}}]
+        }
+    },
+    'arcs': [[[0, 0], [1, 0], [2, 0], [2, 1], [1, 1], [0, 1], [0, 0]]]
+}
+
+
+@pytest.mark.parametrize('quantization', [1e5, None])
+def test_MapData_merge_outline(quantization):
+    states = cls(topology = Topology(MERGE_STATES, object_name = 'states'))
+    outline = cls(topology = Topology(MERGE_OUTLINE, object_name = 'country'))
+
+    result = states.merge(outline, quantization = quantization)
+    as_dict = result.topology.to_dict()
+    assert len(as_dict['arcs']) == 3
+
+    outline_arcs = as_dict['objects']['country']['geometries'][0]['arcs']
+    assert sorted(x if x >= 0 else ~x for x in outline_arcs[0]) == [1, 2]
+
+    as_gdf = result.to_geodataframe(object_name = 'country')
+    assert as_gdf.area.tolist() == pytest.approx([2.0], abs = 1e-4)
+    as_gdf = result.to_geodataframe(object_name = 'states')
+    assert as_gdf.area.tolist() == pytest.approx([1.0, 1.0], abs = 1e-4)
+
+
+@pytest.mark.parametrize('features, kwargs, expected_keys, error', [
+    (['fr', 'de'], {}, ['fr', 'de'], None),
+    ('fr', {}, ['fr'], None),
+    ({'continent': 'Oceania'}, {}, None, None),
+    ({'continent': ['Asia', 'Europe'], 'region-wb': 'Europe & Central Asia'}, {}, None, None),
+    (lambda x: x.get('continent') == 'Oceania', {}, None, None),
+    (['FRA'], {'key': 'iso-a3'}, ['fr'], None),
+    (['zz'], {}, [], None),
+    (['fr'], {'object_name': 'default'}, ['fr'], None),
+
+    (['fr'], {'object_name': 'missing'}, None, errors.HighchartsValueError),
+])
+def test_MapData_select(input_files, features, kwargs, expected_keys, error):
+    input_file = check_input_file(input_files,
+                                  'series/data/map_data/map_data/world.topo.json')
+    topology = Topology.from_topojson(input_file, object_name = 'default')
+    instance = cls(topology = topology)
+    if not error:
+        result = instance.select(features, **kwargs)
+        assert isinstance(result, cls) is True
+        as_dict = result.topology.to_dict()
+        original = topology.to_dict()
+        assert list(as_dict['objects'].keys()) == ['default']
+        assert as_dict['transform'] == original['transform']
+
+        gdf = instance.to_geodataframe(object_name = 'default')
+        if expected_keys is None:
+            if callable(features):
+                expected = gdf[gdf['continent'] == 'Oceania']
+            else:
+                expected = gdf
+                for name, value in features.items():
+                    values = value if isinstance(value, list) else [value]
+                    expected = expected[expected[name].isin(values)]
+            expected_keys = expected['hc-key'].tolist()
+        else:
+            expected = gdf[gdf['hc-key'].isin(expected_keys)]
+
+        geometries = as_dict['objects']['default']['geometries']
+        assert sorted(x['properties']['hc-key'] for x in geometries) == \
+            sorted(expected_keys)
+        used = set()
+        for geometry in geometries:
+            for ring in geometry['arcs']:
+                for item in ring:
+                    for index in (item if isinstance(item, list) else [item]):
+                        used.add(index if index >= 0 else ~index)
+        assert used == set(range(len(as_dict['arcs'])))
+        assert len(as_dict['arcs']) <= len(original['arcs'])
+
+        if expected_keys:
+            as_gdf = result.to_geodataframe(object_name = 'default')
+            assert as_gdf['hc-key'].tolist() == expected['hc-key'].tolist()
+            assert as_gdf.area.tolist() == pytest.approx(expected.area.tolist())
+    else:
+        with pytest.raises(error):
+            result = instance.select(features, **kwargs)
+
+
+def test_MapData_select_and_split_read_topology_in_place(input_files, monkeypatch):
+    input_file = check_input_file(input_files,
+                                  'series/data/map_data/map_data/world.topo.json')
+    instance = cls(topology = Topology.from_topojson(input_file,
+                                                     object_name = 'default'))
+    original = instance.topology.to_dict()
+
+    def to_json(*args, **kwargs):
+        raise AssertionError('the topology should not be serialized')
+
+    with monkeypatch.context() as patched:
+        patched.setattr(Topology, 'to_json', to_json)
+        result = instance.select(['fo', 'dk'])
+        children = instance.split('continent')
+
+    geometries = result.topology.to_dict()['objects']['default']['geometries']
+    assert sorted(x['properties']['hc-key'] for x in geometries) == ['dk', 'fo']
+    assert 'Europe' in children
+    assert instance.topology.to_dict() == original
+
+
+@pytest.mark.parametrize('parent_key, kwargs, error', [
+    ('continent', {}, None),
+    (lambda x: x.get('continent'), {'object_name': 'default'}, None),
+
+    ('continent', {'object_name': 'missing'}, errors.HighchartsValueError),
+])
+def test_MapData_split(input_files, parent_key, kwargs, error):
+    input_file = check_input_file(input_files,
+                                  'series/data/map_data/map_data/world.topo.json')
+    topology = Topology.from_topojson(input_file, object_name = 'default')
+    instance = cls(topology = topology)
+    if not error:
+        result = instance.split(parent_key, **kwargs)
+        gdf = instance.to_geodataframe(object_name = 'default')
+        continents = gdf['continent'].dropna().unique().tolist()
+        assert list(result.keys()) == continents
+        for continent, child in result.items():
+            assert isinstance(child, cls) is True
+            as_gdf = child.to_geodataframe(object_name = 'default')
+            expected = gdf[gdf['continent'] == continent]
+            assert as_gdf['hc-key'].tolist() == expected['hc-key'].tolist()
+            assert child.to_topojson() == instance.select({'continent': continent})\
+                .to_topojson()
+    else:
+        with pytest.raises(error):
+            result = instance.split(parent_key, **kwargs)
+
+
+def test_MapData_write_asset(tmp_path):
+    instance = cls(topology = Topology(MERGE_LEFT, object_name = 'left'))
+    filename = instance.write_asset(tmp_path / 'assets')
+    assert os.path.dirname(filename) == str(tmp_path / 'assets')
+    assert filename.endswith('.topo.json')
+    with open(filename, 'rb') as file_:
+        content = file_.read()
+    as_topojson = instance.to_topojson()
+    if isinstance(as_topojson, str):
+        as_topojson = as_topojson.encode('utf-8')
+    assert content == as_topojson
+
+    assert instance.write_asset(tmp_path / 'assets') == filename
+    other = cls(topology = Topology(MERGE_RIGHT, object_name = 'right'))
+    other_filename = other.write_asset(tmp_path / 'assets',
+                                       filename_template = 'right-{hash}.json')
+    assert os.path.basename(other_filename).startswith('right-')
+    assert other_filename != filename
+
+    with pytest.raises(errors.HighchartsValueError):
+        cls().write_asset(tmp_path)
+
+
+
+@pytest.mark.parametrize('filename, force_geojson', [
+    ('series/data/map_data/map_data/world.topo.json', None),
+    ('series/data/map_data/map_data/world.geo.json', True),
+])
+def test_MapData_pickle(input_files, filename, force_geojson):
+    input_file = check_input_file(input_files, filename)
+    if filename.endswith('.topo.json'):
+        instance = cls.from_topojson(input_file)
+    else:
+        instance = cls.from_geojson(input_file)
+    instance.force_geojson = force_geojson
+
+    state = instance.__getstate__()
+    assert state['_topology'] == instance.topology.to_json()
+
+    result = pickle.loads(pickle.dumps(instance))
+    assert isinstance(result, cls) is True
+    assert isinstance(result.topology, Topology) is True
+    assert result.force_geojson == force_geojson
+    assert json.loads(result.to_topojson()) == json.loads(instance.to_topojson())
+    assert pickle.loads(pickle.dumps(result)).to_js_literal() == result.to_js_literal()
+
+    empty = pickle.loads(pickle.dumps(cls()))
+    assert empty.topology is None
+
+
 ###### Next Class
 
 @pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
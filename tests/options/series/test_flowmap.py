@@ -90,6 +90,20 @@ def test_FlowmapSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
 
 
+def test_FlowmapSeries_aggregate_flows():
+    pytest.importorskip('numpy')
+
+    series = cls(data = [['a', 'b', 2], ['a', 'b', 3], ['b', 'a', None]])
+    series.aggregate_flows()
+    assert len(series.data) == 2
+
+    as_js_literal = series.to_js_literal()
+    assert "[['a','b',5.0],['b','a',1.0]]" in as_js_literal
+
+    round_trip = cls.from_js_literal(as_js_literal)
+    assert round_trip.data[0].weight == 5
+
+
 ##### NEXT CLASS
 
 STANDARD_PARAMS_2 = [
@@ -157,3 +171,20 @@ def test_GeoHeatmapSeries_to_dict(kwargs, error):
 ])
 def test_GeoHeatmapSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls2, input_files, filename, as_file, error)
+
+
+def test_GeoHeatmapSeries_from_lat_lon():
+    pytest.importorskip('numpy')
+
+    series = cls2.from_lat_lon([0.5, 0.6, 10.2],
+                               [0.5, 0.7, -20],
+                               [1, 3, 5],
+                               reducer = 'max',
+                               series_kwargs = {'colsize': 2})
+    assert len(series.data) == 2
+    assert series.data[0].lon == 1
+    assert series.data[0].value == 3
+
+    round_trip = cls2.from_js_literal(series.to_js_literal())
+    assert round_trip.data[1].lat == 10.5
+    assert round_trip.data[1].value == 5
@@ -59,3 +59,177 @@ def test_MapSeries_to_dict(kwargs, error):
 ])
 def test_MapSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+CSV_DATA = """code,population,name
+us,331.9,United States
+fr,,France
+de,83.2,Germany
+"""
+
+
+@pytest.mark.parametrize('property_column_map, join_by, kwargs, expected_keys, expected_join_by, error', [
+    ({'value': 'population'}, 'code', {}, ['code', 'value'], 'code', None),
+    ({'value': 'population'}, ['hc-key', 'code'], {}, ['code', 'value'], ['hc-key', 'code'], None),
+    ({'value': 1}, ['hc-key', 0], {}, ['hc-key', 'value'], 'hc-key', None),
+    ({'value': 'population', 'name': 'name'}, 'code', {'chunk_size': 1}, ['code', 'value', 'name'], 'code', None),
+    ({'value': 'population'}, None, {}, ['value'], None, None),
+    ({'value': 'population'}, 'code', {'dtypes': {'value': 'float32'}}, ['code', 'value'], 'code', None),
+
+    ({'value': 'missing'}, 'code', {}, None, None, errors.HighchartsCSVDeserializationError),
+    ({'value': 'name'}, 'code', {'dtypes': {'value': 'float64'}}, None, None, errors.HighchartsCSVDeserializationError),
+    ({'value': 'population'}, ['hc-key', 'code', 'extra'], {}, None, None, errors.HighchartsValueError),
+    ({'value': 'population'}, 'code', {'dtypes': {'z': 'float64'}}, None, None, errors.HighchartsValueError),
+])
+def test_MapSeries_from_csv_chunked(property_column_map,
+                                    join_by,
+                                    kwargs,
+                                    expected_keys,
+                                    expected_join_by,
+                                    error):
+    np = pytest.importorskip('numpy')
+
+    if not error:
+        result = cls.from_csv_chunked(CSV_DATA,
+                                      property_column_map = property_column_map,
+                                      join_by = join_by,
+                                      **kwargs)
+        assert isinstance(result, cls)
+        assert result.keys == expected_keys
+        assert result.join_by == expected_join_by
+        assert len(result.data) == 3
+
+        values = result.data.ndarray['value']
+        assert values.dtype.kind == 'f'
+        assert np.isnan(values[1])
+        if 'dtypes' in kwargs:
+            assert values.dtype == np.dtype(kwargs['dtypes']['value'])
+
+        as_array = result.data.to_array()
+        assert as_array[0][0] in ['us', 331.9]
+        assert as_array[1][len(expected_keys) - len(property_column_map)] is None
+        assert result.to_js_literal() is not None
+    else:
+        with pytest.raises(error):
+            result = cls.from_csv_chunked(CSV_DATA,
+                                          property_column_map = property_column_map,
+                                          join_by = join_by,
+                                          **kwargs)
+
+
+def test_MapSeries_set_label_anchors(input_files):
+    np = pytest.importorskip('numpy')
+    from highcharts_maps.options.series.data.map_data import MapData
+    from highcharts_maps.utility_classes.topojson import Topology
+    from tests.options.series.data.test_map_data import LABEL_ANCHOR_GEOJSON
+
+    map_data = MapData(topology = Topology(LABEL_ANCHOR_GEOJSON))
+    series = cls(map_data = map_data,
+                 data = [{'hc-key': 'u', 'value': 1},
+                         {'hc-key': 'islands', 'value': 2, 'middle_x': 0.9},
+                         {'hc-key': 'unknown', 'value': 3}])
+    series.set_label_anchors()
+    assert series.data[0].middle_y == pytest.approx(0.195, abs = 0.01)
+    assert series.data[1].middle_x == 0.9
+    assert series.data[1].middle_y == pytest.approx(0.5, abs = 0.01)
+    assert series.data[2].middle_x is None
+
+    series.set_label_anchors(overwrite = True)
+    assert series.data[1].middle_x == pytest.approx(0.182, abs = 0.01)
+
+    series = cls.from_csv_chunked('key,value\nu,1\nislands,2\nunknown,3\n',
+                                  property_column_map = {'value': 'value'},
+                                  join_by = ['hc-key', 'key'],
+                                  series_kwargs = {'map_data': map_data})
+    series.set_label_anchors()
+    assert series.keys == ['key', 'value', 'middleX', 'middleY']
+    middle_y = series.data.ndarray['middleY']
+    assert middle_y[0] == pytest.approx(0.195, abs = 0.01)
+    assert np.isnan(middle_y[2])
+    assert series.to_js_literal() is not None
+
+    series = cls(data = [{'hc-key': 'u', 'value': 1}])
+    with pytest.raises(errors.HighchartsValueError):
+        series.set_label_anchors()
+
+
+def test_MapSeries_set_drilldown_maps(input_files, tmp_path):
+    from highcharts_maps.options.series.data.map_data import MapData, AsyncMapData
+
+    input_file = check_input_file(input_files,
+                                  'series/data/map_data/map_data/world.topo.json')
+    map_data = MapData.from_topojson(input_file)
+    series = cls(data = [{'hc-key': 'Europe', 'value': 1},
+                         {'hc-key': 'Asia', 'value': 2, 'drilldown': 'custom'},
+                         {'hc-key': 'Atlantis', 'value': 3}])
+    result = series.set_drilldown_maps(map_data,
+                                       'continent',
+                                       tmp_path,
+                                       'https://www.example.com/maps/')
+    assert 'Europe' in result
+    assert all(isinstance(x, AsyncMapData) for x in result.values())
+    assert len(set(x.url for x in result.values())) == len(result)
+    assert len(list(tmp_path.iterdir())) == len(result)
+    for child in result.values():
+        assert child.url.startswith('https://www.example.com/maps/')
+        assert (tmp_path / child.url.split('/')[-1]).exists()
+    assert [x.drilldown for x in series.data] == ['Europe', 'custom', None]
+
+    series.set_drilldown_maps(map_data,
+                              'continent',
+                              tmp_path,
+                              'https://www.example.com/maps',
+                              overwrite = True)
+    assert series.data[1].drilldown == 'Asia'
+    assert len(list(tmp_path.iterdir())) == len(result)
+
+    series = cls.from_csv_chunked('key,value\nEurope,1\nAtlantis,2\n',
+                                  property_column_map = {'value': 'value'},
+                                  join_by = ['hc-key', 'key'])
+    series.set_drilldown_maps(map_data,
+                              'continent',
+                              tmp_path,
+                              'https://www.example.com/maps/')
+    assert series.keys == ['key', 'value', 'drilldown']
+    assert series.data.ndarray['drilldown'].tolist() == ['Europe', None]
+    assert "'Europe'" in series.to_js_literal()
+
+    series = cls(data = [{'hc-key': 'Europe', 'value': 1}], join_by = None)
+    with pytest.raises(errors.HighchartsValueError):
+        series.set_drilldown_maps(MapData(), 'continent', tmp_path,
+                                  'https://www.example.com/maps/')
+
+
+def test_MapSeries_set_map_data(input_files, tmp_path):
+    import json
+    from highcharts_maps.options.series.data.map_data import MapData, AsyncMapData
+    from highcharts_maps.utility_classes.topojson import Topology
+    from tests.options.series.data.test_map_data import LABEL_ANCHOR_GEOJSON
+
+    gdf = Topology(LABEL_ANCHOR_GEOJSON).to_gdf(object_name = 'data')
+    existing = MapData(topology = Topology(LABEL_ANCHOR_GEOJSON))
+
+    series = cls()
+    series.set_map_data([gdf, 'https://www.somewhere.com/map.topo.json', existing, gdf],
+                        max_workers = 2)
+    assert isinstance(series.map_data, list)
+    assert isinstance(series.map_data[0], MapData)
+    assert isinstance(series.map_data[1], AsyncMapData)
+    assert series.map_data[2] is existing
+    assert series.map_data[0].to_topojson() == series.map_data[3].to_topojson()
+
+    series.set_map_data(gdf, max_workers = 1)
+    assert isinstance(series.map_data, MapData)
+
+    series.set_map_data(None)
+    assert series.map_data is None
+
+    as_file = tmp_path / 'url:map.geo.json'
+    as_file.write_text(json.dumps(LABEL_ANCHOR_GEOJSON))
+    series.set_map_data([str(as_file), json.dumps(LABEL_ANCHOR_GEOJSON)],
+                        max_workers = 1)
+    assert all(isinstance(x, MapData) for x in series.map_data)
+    assert series.map_data[0].to_topojson() == series.map_data[1].to_topojson()
+
+    with pytest.raises(errors.HighchartsValueError):
+        series.set_map_data(['not a path, URL, or JSON document'], max_workers = 1)
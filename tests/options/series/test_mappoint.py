@@ -59,3 +59,65 @@ def test_MapPointSeries_to_dict(kwargs, error):
 ])
 def test_MapPointSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+def test_MapPointSeries_from_cluster_hierarchy():
+    pytest.importorskip('numpy')
+    from highcharts_maps.utility_classes.clusters import ClusterHierarchy, ClusterOptions
+
+    hierarchy = ClusterHierarchy([51.5, 51.5001, 40.7], [-0.1, -0.1001, -74],
+                                 max_zoom = 5)
+    result = cls.from_cluster_hierarchy(hierarchy,
+                                        zoom = 3,
+                                        series_kwargs = {
+                                            'cluster': {'marker': {'radius': 20}}
+                                        })
+    assert len(result.data) == 2
+    assert result.cluster.enabled is False
+
+    as_js_literal = result.to_js_literal()
+    assert 'clusterPointsAmount: 2' in as_js_literal
+
+    with pytest.raises(errors.HighchartsValueError):
+        result.load_from_cluster_hierarchy('not a hierarchy')
+
+    shared = ClusterOptions(enabled = True, marker = {'radius': 20})
+    result = cls(cluster = shared)
+    result.load_from_cluster_hierarchy(hierarchy, zoom = 3)
+    assert result.cluster.enabled is False
+    assert shared.enabled is True
+    assert 'clusterPointsAmount: 2' in result.to_js_literal()
+
+    result = cls(cluster = shared)
+    result.load_from_cluster_hierarchy(hierarchy,
+                                       zoom = 3,
+                                       disable_client_clustering = False)
+    assert result.cluster is shared
+
+
+@pytest.mark.parametrize('kwargs, expected_keys, error', [
+    ({}, ['lat', 'lon', 'name'], None),
+    ({'reproject': 'EPSG:3857'}, ['x', 'y', 'name'], None),
+    ({'reproject': lambda x: x * 2}, ['x', 'y', 'name'], None),
+
+    ({'lat': [1, 2, 3]}, None, errors.HighchartsValueError),
+])
+def test_MapPointSeries_from_lat_lon(kwargs, expected_keys, error):
+    np = pytest.importorskip('numpy')
+    kwargs = {
+        'lat': [0, 45],
+        'lon': [0, 90],
+        'columns': {'name': np.array(['a', 'b'], dtype = object)},
+        **kwargs
+    }
+
+    if not error:
+        result = cls.from_lat_lon(**kwargs)
+        assert len(result.data) == 2
+        as_dict = result.data[1].to_dict()
+        assert sorted(as_dict.keys()) == sorted(expected_keys)
+        if 'x' in as_dict:
+            assert as_dict['x'] > 90
+    else:
+        with pytest.raises(error):
+            result = cls.from_lat_lon(**kwargs)
@@ -13,7 +13,8 @@ from highcharts_maps.chart import Chart as cls
 from highcharts_maps import errors
 from tests.fixtures import input_files, check_input_file, to_camelCase, to_js_dict, \
     Class__init__, Class__to_untrimmed_dict, Class_from_dict, Class_to_dict, \
-    Class_from_js_literal, Class_from_js_literal_with_expected, run_pandas_tests
+    Class_from_js_literal, Class_from_js_literal_with_expected, run_pandas_tests, \
+    local_export_server
 
 STANDARD_PARAMS = [
     ({}, None),
@@ -477,3 +478,197 @@ def test_from_array(value, expected_shape, has_ndarray, has_data_points, error):
     else:
         with pytest.raises(error):
             result = cls.from_array(value)
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    ({'projection': {'name': 'Miller'}}, None),
+    ({}, None),
+
+    ({'projection': {'name': 'NotAProjection'}}, errors.HighchartsValueError),
+])
+def test_pre_project(input_files, kwargs, error):
+    pytest.importorskip('numpy')
+    from highcharts_maps.options.series.data.map_data import MapData
+
+    input_file = check_input_file(input_files,
+                                  'series/data/map_data/map_data/world.topo.json')
+    result = cls.from_map_data(MapData.from_topojson(input_file),
+                               options_kwargs = {
+                                   'map_view': {
+                                       'center': [90, 0],
+                                       'projection': {'name': 'EqualEarth'}
+                                   },
+                                   'series': [{
+                                       'type': 'mappoint',
+                                       'data': [{'name': 'point', 'lat': 0, 'lon': 90}]
+                                   }]
+                               })
+
+    if not error:
+        result.pre_project(**kwargs)
+        assert result.options.map_view.projection is None
+        assert 'transform' not in result.options.chart.map.topology.to_dict()
+        point = result.options.series[0].data[0]
+        assert result.options.map_view.center == pytest.approx([point.lon, point.lat])
+        assert point.lon > 90
+        assert 'projection' not in result.to_js_literal()
+    else:
+        with pytest.raises(error):
+            result.pre_project(**kwargs)
+
+
+def test_add_drilldown_maps(input_files, tmp_path):
+    from highcharts_maps.options.series.data.map_data import MapData
+
+    input_file = check_input_file(input_files,
+                                  'series/data/map_data/map_data/world.topo.json')
+    map_data = MapData.from_topojson(input_file)
+    result = cls.from_map_data(map_data,
+                               options_kwargs = {
+                                   'series': [{
+                                       'type': 'map',
+                                       'id': 'continents',
+                                       'data': [{'hc-key': 'Europe', 'value': 1},
+                                                {'hc-key': 'Asia', 'value': 2}]
+                                   }]
+                               })
+    children = result.add_drilldown_maps(map_data,
+                                         'continent',
+                                         tmp_path,
+                                         'https://www.example.com/maps/',
+                                         series = 'continents',
+                                         drilldown_series = {
+                                             'dataLabels': {'enabled': True}
+                                         })
+    assert [x.drilldown for x in result.options.series[0].data] == ['Europe', 'Asia']
+    assert 'modules/drilldown' in result.get_required_modules()
+
+    as_js = result.to_js_literal()
+    assert children['Europe'].url in as_js
+    assert 'addSeriesAsDrilldown' in as_js
+    assert '"Europe": function ()' in as_js
+    assert 'enabled: true' in as_js
+
+    with pytest.raises(errors.HighchartsValueError):
+        result.add_drilldown_maps(map_data,
+                                  'continent',
+                                  tmp_path,
+                                  'https://www.example.com/maps/',
+                                  series = 'missing')
+
+
+def test_adownload_chart(local_export_server, tmp_path):
+    import asyncio
+    from highcharts_maps.headless_export import ExportServer, AsyncExportClient
+
+    server_instance = ExportServer(**local_export_server.get_export_server_kwargs())
+    charts = [cls.from_options({'title': {'text': f'chart {x}'}}) for x in range(3)]
+
+    async def run():
+        async with AsyncExportClient(server_instance = server_instance) as client:
+            results = await asyncio.gather(*[x.adownload_chart(client = client)
+                                             for x in charts])
+            written = await charts[0].adownload_chart(client = client,
+                                                      filename = tmp_path / 'a.svg',
+                                                      format = 'svg')
+        return results, written
+
+    results, written = asyncio.run(run())
+    assert results == [f'EXPORT:png:chart:chart {x}'.encode('utf-8') for x in range(3)]
+    assert written == b'EXPORT:image/svg+xml:chart:chart 0'
+    assert (tmp_path / 'a.svg').read_text() == 'EXPORT:image/svg+xml:chart:chart 0'
+    assert local_export_server.requests[0]['scale'] == 1
+
+    with pytest.raises(errors.HighchartsValueError):
+        asyncio.run(charts[0].adownload_chart(client = 'not a client'))
+
+
+def test_to_js_literal_concurrent():
+    import concurrent.futures
+    from highcharts_maps.options import HighchartsMapsOptions
+    from highcharts_maps.options.series.map import MapSeries
+    from highcharts_maps.options.series.data.map_data import AsyncMapData
+
+    world = AsyncMapData(url = 'https://code.highcharts.com/mapdata/custom/world.topo.json')
+    europe = AsyncMapData(url = 'https://code.highcharts.com/mapdata/custom/europe.topo.json')
+    chart = cls(container = 'target',
+                options = HighchartsMapsOptions(
+                    chart = {'map': world},
+                    series = [MapSeries(name = 'a', map_data = europe),
+                              MapSeries(name = 'b', map_data = world)]
+                ))
+
+    expected = chart.to_js_literal()
+    assert expected.count('const topology1 = ') == 1
+    assert expected.count('const topology2 = ') == 1
+    assert 'map: topology1' in expected
+    assert 'mapData: topology2' in expected
+    assert 'mapData: topology1' in expected
+    assert 'HCP: REPLACE-WITH' not in expected
+
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(lambda x: chart.to_js_literal(), range(64)))
+    assert all(x == expected for x in results)
+    assert world.fetch_counter is None
+    assert europe.fetch_counter is None
+
+    as_js = chart._jupyter_javascript(random_slug = 'slug')
+    assert "'target_slug'" in as_js
+    assert chart.container == 'target'
+
+
+@pytest.mark.parametrize('format, max_workers, with_map_data', [
+    ('js', 1, True),
+    ('js', 2, True),
+    ('json', 2, False),
+])
+def test_render_many(format, max_workers, with_map_data):
+    from highcharts_maps.options import HighchartsMapsOptions
+    from highcharts_maps.options.series.map import MapSeries
+    from highcharts_maps.options.series.data.map_data import MapData
+
+    map_data = MapData(topology = {
+        'type': 'Topology',
+        'arcs': [[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]],
+                 [[1, 0], [2, 0], [2, 1], [1, 1]]],
+        'objects': {
+            'default': {
+                'type': 'GeometryCollection',
+                'geometries': [
+                    {'type': 'Polygon', 'arcs': [[0]],
+                     'properties': {'hc-key': 'a'}},
+                    {'type': 'Polygon', 'arcs': [[1, -1]],
+                     'properties': {'hc-key': 'b'}}
+                ]
+            }
+        }
+    }) if with_map_data else None
+    charts = [cls(container = f'chart_{x}',
+                  variable_name = f'chart{x}',
+                  options = HighchartsMapsOptions(
+                      chart = {'map': map_data},
+                      title = {'text': f'chart {x}'},
+                      series = [MapSeries(name = 'values',
+                                          map_data = map_data,
+                                          data = [{'hc-key': 'a', 'value': x},
+                                                  {'hc-key': 'b', 'value': 2 * x}])]
+                  ))
+              for x in range(6)]
+    charts.append(cls.from_options({'title': {'text': 'no map'}}))
+
+    if format == 'json':
+        expected = [x.to_json() for x in charts]
+    else:
+        expected = [x.to_js_literal() for x in charts]
+
+    result = cls.render_many(charts, format = format, max_workers = max_workers)
+    assert not isinstance(result, list)
+    assert list(result) == expected
+    if with_map_data:
+        assert charts[0].options.chart.map is map_data
+        assert charts[0].options.series[0].map_data is map_data
+
+    with pytest.raises(errors.HighchartsValueError):
+        cls.render_many(charts, format = 'svg')
+    with pytest.raises(errors.HighchartsValueError):
+        cls.render_many([{'title': {'text': 'not a chart'}}])
@@ -1,5 +1,6 @@
 """Tests for ``highcharts.no_data``."""
 from copy import deepcopy
+import os
 import pytest
 
 from json.decoder import JSONDecodeError
@@ -10,7 +11,8 @@ from highcharts_maps.options import HighchartsOptions
 from highcharts_maps import errors
 from tests.fixtures import input_files, check_input_file, to_camelCase, to_js_dict, \
     Class__init__, Class__to_untrimmed_dict, Class_from_dict, Class_to_dict, \
-    Class_from_js_literal, run_download_tests, create_output_directory
+    Class_from_js_literal, run_download_tests, create_output_directory, \
+    local_export_server
 
 STANDARD_PARAMS = [
     ({}, None),
@@ -193,3 +195,205 @@ def test_get_chart(input_files,
             assert result is not None
             if target_filename:
                 assert checkers.is_on_filesystem(target_file) is True
+
+
+@pytest.mark.parametrize('max_workers, as_files', [
+    (1, False),
+    (3, False),
+    (3, True),
+])
+def test_export_many(local_export_server, tmp_path, max_workers, as_files):
+    from highcharts_maps.chart import Chart
+
+    charts = [Chart.from_options({'title': {'text': f'chart {x}'}}) for x in range(8)]
+    charts[2] = {'title': {'text': 'fail'}}
+    charts[5] = {'title': {'text': 'options'}}
+    filenames = [tmp_path / f'{x}.png' for x in range(8)] if as_files else None
+
+    instance = cls(**local_export_server.get_export_server_kwargs())
+    result = instance.export_many(charts,
+                                  filenames = filenames,
+                                  max_workers = max_workers,
+                                  scale = 2)
+
+    assert len(result) == 8
+    assert instance.scale == 1
+    assert len(local_export_server.requests) == 8
+    assert len(local_export_server.connections) <= max_workers
+    assert all(x['scale'] == 2 for x in local_export_server.requests)
+    for index, item in enumerate(result):
+        if index == 2:
+            assert isinstance(item, Exception)
+            continue
+        title = 'options' if index == 5 else f'chart {index}'
+        expected = f'EXPORT:png:chart:{title}'.encode('utf-8')
+        if as_files:
+            assert str(item) == str(filenames[index])
+            assert (tmp_path / f'{index}.png').read_bytes() == expected
+        else:
+            assert item == expected
+
+
+def test_export_many_errors(local_export_server):
+    instance = cls(**local_export_server.get_export_server_kwargs())
+    assert instance.export_many([]) == []
+    with pytest.raises(errors.HighchartsValueError):
+        instance.export_many([{'title': {'text': 'a'}}], filenames = [])
+
+    result = instance.export_many([{'title': {'text': 'a'}}], format_ = 'svg')
+    assert result == [b'EXPORT:image/svg+xml:chart:a']
+
+
+def test_AsyncExportClient(local_export_server, tmp_path):
+    import asyncio
+    from highcharts_maps.headless_export import AsyncExportClient
+
+    server_instance = cls(**local_export_server.get_export_server_kwargs())
+
+    async def run():
+        async with AsyncExportClient(server_instance = server_instance,
+                                     max_concurrency = 2) as client:
+            single = await client.request_chart({'title': {'text': 'single'}})
+            written = await client.request_chart({'title': {'text': 'file'}},
+                                                 filename = tmp_path / 'file.png')
+            batch = await client.export_many([{'title': {'text': f'chart {x}'}}
+                                              for x in range(5)] +
+                                             [{'title': {'text': 'fail'}}],
+                                             format_ = 'svg')
+        return single, written, batch
+
+    single, written, batch = asyncio.run(run())
+    assert single == b'EXPORT:png:chart:single'
+    assert str(written) == str(tmp_path / 'file.png')
+    assert (tmp_path / 'file.png').read_bytes() == b'EXPORT:png:chart:file'
+    assert batch[:5] == [f'EXPORT:image/svg+xml:chart:chart {x}'.encode('utf-8')
+                         for x in range(5)]
+    assert isinstance(batch[5], Exception)
+    assert len(local_export_server.connections) <= 2
+    assert server_instance.format_ == 'png'
+
+    with pytest.raises(errors.HighchartsValueError):
+        AsyncExportClient(server_instance = 'not a server')
+    with pytest.raises(ValueError):
+        AsyncExportClient(max_concurrency = 0)
+
+
+def test_cache(local_export_server, tmp_path):
+    from highcharts_maps.chart import Chart
+    from highcharts_maps.utility_classes.export_cache import MemoryExportCache
+
+    cache = MemoryExportCache()
+    kwargs = local_export_server.get_export_server_kwargs()
+    chart = Chart.from_options({'title': {'text': 'cached'}})
+
+    first = chart.download_chart(cache = cache, **kwargs)
+    second = chart.download_chart(cache = cache,
+                                  filename = tmp_path / 'cached.png',
+                                  **kwargs)
+    assert first == second == b'EXPORT:png:chart:cached'
+    assert (tmp_path / 'cached.png').read_bytes() == first
+    assert len(local_export_server.requests) == 1
+
+    chart.download_chart(cache = cache, scale = 2, **kwargs)
+    assert len(local_export_server.requests) == 2
+
+    instance = cls(cache = cache, **kwargs)
+    result = instance.export_many([chart, {'title': {'text': 'other'}}],
+                                  constructor = 'Chart')
+    assert result[0] == first
+    assert len(local_export_server.requests) == 3
+    assert cache.stats['hits'] == 2
+    assert cache.stats['misses'] == 3
+
+    with pytest.raises(errors.HighchartsValueError):
+        cls(cache = 'not a cache')
+
+
+def test_request_chart(local_export_server, tmp_path):
+    from highcharts_maps.options.data import Data
+
+    instance = cls(**local_export_server.get_export_server_kwargs())
+    result = instance.request_chart(options = {'title': {'text': 'single'}},
+                                    data_options = Data(csv = 'a,b\n1,2'),
+                                    filename = tmp_path / 'single.png')
+    assert result == b'EXPORT:png:chart:single'
+    assert (tmp_path / 'single.png').read_bytes() == result
+
+    payload = local_export_server.requests[-1]
+    assert payload['infile']['title']['text'] == 'single'
+    assert payload['dataOptions']['csv'] == 'a,b\n1,2'
+
+
+@pytest.mark.parametrize('use_directory', [False, True])
+def test_share_map_data(local_export_server, input_files, tmp_path, use_directory):
+    from highcharts_maps.chart import Chart
+    from highcharts_maps.options.series.map import MapSeries
+    from highcharts_maps.options.series.data.map_data import MapData
+
+    input_file = check_input_file(input_files,
+                                  'series/data/map_data/map_data/world.topo.json')
+    map_data = MapData.from_topojson(input_file)
+    from highcharts_maps.options import HighchartsMapsOptions
+
+    charts = [Chart.from_options(HighchartsMapsOptions(
+                  title = {'text': f'chart {x}'},
+                  chart = {'map': map_data},
+                  series = [MapSeries(map_data = map_data)]))
+              for x in range(3)]
+
+    directory = tmp_path / 'maps' if use_directory else None
+    instance = cls(share_map_data = True,
+                   map_data_directory = directory,
+                   **local_export_server.get_export_server_kwargs())
+    result = instance.export_many(charts)
+    assert result[1] == b'EXPORT:png:mapChart:chart 1'
+
+    payload = local_export_server.requests[0]
+    key = payload['infile']['chart']['map']
+    assert key.startswith('hcmap-')
+    assert payload['infile']['series'][0]['mapData'] == key
+    if use_directory:
+        assert payload['resources']['files'] == [str(directory / f'{key}.js')]
+        assert os.listdir(directory) == [f'{key}.js']
+    else:
+        script = payload['resources']['js']
+        assert script.startswith(f'Highcharts.maps["{key}"] = ')
+        assert script.count('Highcharts.maps[') == 1
+
+    assert charts[0].options.chart.map is map_data
+    assert charts[0].options.series[0].map_data is map_data
+
+    instance.request_chart(options = charts[0].options, constructor = 'mapChart')
+    assert local_export_server.requests[-1]['infile']['chart']['map'] == key
+
+
+def test_LocalExportServer():
+    import sys
+    from highcharts_maps.chart import Chart
+    from highcharts_maps.headless_export import LocalExportServer
+
+    command = [sys.executable,
+               os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                            'benchmarks',
+                            'fake_export_server.py')]
+    chart = Chart.from_options({'title': {'text': 'local'}})
+
+    with LocalExportServer(command = command,
+                           arguments = ['--port', '{port}']) as server:
+        assert server.is_running is True
+        assert chart.download_chart(server_instance = server) == \
+            b'EXPORT:png:chart:local'
+        assert server.export_many([chart]) == [b'EXPORT:png:chart:local']
+    assert server.is_running is False
+
+    server = LocalExportServer(command = command, arguments = ['--port', '{port}'])
+    assert server.arguments == ['--port', '{port}']
+    assert server.request_chart(options = chart.options) == b'EXPORT:png:chart:local'
+    assert server.is_running is True
+    server.close()
+
+    assert LocalExportServer().arguments[:2] == ['--enableServer', '1']
+    with pytest.raises(errors.HighchartsDependencyError):
+        LocalExportServer(command = 'highcharts-export-server-not-installed').start()
+    with pytest.raises(errors.HighchartsExportServerError):
+        LocalExportServer(command = [sys.executable, '-c', 'pass']).start()
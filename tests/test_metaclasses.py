@@ -2,7 +2,11 @@
 
 import pytest
 
-from highcharts_maps.metaclasses import HighchartsMeta
+import copy
+import copyreg
+import pickle
+
+from highcharts_maps.metaclasses import HighchartsMeta, register_pickling
 from highcharts_maps import constants
 
 from json.decoder import JSONDecodeError
@@ -333,3 +337,62 @@ def test_from_js_literal(cls, as_str, error):
     else:
         with pytest.raises(error):
             result = cls.from_js_literal(as_str)
+
+
+@pytest.mark.parametrize('instance, expected_state, error', [
+    (test_class_instance, {'item1': 123, 'item2': 456}, None),
+    (test_class_trimmed_instance, {'item1': 123}, None),
+    (TestClass(), {}, None),
+])
+def test_pickle(instance, expected_state, error):
+    register_pickling([TestClass])
+    if not error:
+        assert copyreg.dispatch_table[TestClass](instance)[1][1] == expected_state
+        result = pickle.loads(pickle.dumps(instance))
+        assert isinstance(result, TestClass) is True
+        assert result.__dict__ == instance.__dict__
+        assert result.to_js_literal() == instance.to_js_literal()
+        assert copy.copy(instance).__dict__ == instance.__dict__
+    else:
+        with pytest.raises(error):
+            result = pickle.loads(pickle.dumps(instance))
+
+
+def test_register_pickling():
+    from highcharts_core.metaclasses import HighchartsMeta as CoreHighchartsMeta
+    from highcharts_core.options.title import Title
+    from highcharts_maps.chart import Chart
+    from highcharts_maps.headless_export import ExportServer, LocalExportServer
+    from highcharts_maps.options import HighchartsMapsOptions
+    from highcharts_maps.options.series.data.map_data import MapData
+
+    assert '__getstate__' not in vars(CoreHighchartsMeta)
+    assert '__reduce__' not in vars(CoreHighchartsMeta)
+    assert Title in copyreg.dispatch_table
+    assert HighchartsMapsOptions in copyreg.dispatch_table
+    for cls in [Chart, ExportServer, LocalExportServer, MapData]:
+        assert cls not in copyreg.dispatch_table
+
+    server = LocalExportServer()
+    copy.copy(server)
+    assert server.is_running is False
+
+
+def test_pickle_options():
+    from highcharts_maps.options import HighchartsMapsOptions
+
+    instance = HighchartsMapsOptions.from_dict({
+        'title': {'text': 'Population'},
+        'colorAxis': {'min': 0},
+        'series': [{'type': 'map',
+                    'name': 'Population',
+                    'data': [{'hc-key': 'fo', 'value': 1},
+                             {'hc-key': 'dk', 'value': 2}]}]
+    })
+    state = copyreg.dispatch_table[HighchartsMapsOptions](instance)[1][1]
+    assert set(state) == {'_title', '_color_axis', '_series'}
+
+    result = pickle.loads(pickle.dumps(instance))
+    assert result.__dict__.keys() == instance.__dict__.keys()
+    assert result.to_js_literal() == instance.to_js_literal()
+    assert result.series[0].data[0].value == 1
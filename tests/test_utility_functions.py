@@ -140,4 +140,95 @@ if HAS_NUMPY:
             assert result is expected
         else:
             with pytest.raises(error):
-                result = utility_functions.is_arraylike(value)
\ No newline at end of file
+                result = utility_functions.is_arraylike(value)
+
+    @pytest.mark.parametrize('kwargs, expected, error', [
+        ({'lat': [0.5, 0.6, 10.2], 'lon': [0.5, 0.7, -20], 'value': [1, 3, 5]},
+         {'lat': [0.5, 10.5], 'lon': [0.5, -19.5], 'value': [4, 5]},
+         None),
+        ({'lat': [0.5, 0.6, 10.2], 'lon': [0.5, 0.7, -20], 'value': [1, 3, 5],
+          'reducer': 'mean'},
+         {'lat': [0.5, 10.5], 'lon': [0.5, -19.5], 'value': [2, 5]},
+         None),
+        ({'lat': [0.5, 0.6, 10.2], 'lon': [0.5, 0.7, -20], 'value': [1, None, 5],
+          'reducer': 'count'},
+         {'lat': [0.5, 10.5], 'lon': [0.5, -19.5], 'value': [2, 1]},
+         None),
+        ({'lat': [0.5, 0.6, 10.2], 'lon': [0.5, 0.7, -20], 'value': [1, 3, 5],
+          'reducer': 'max', 'colsize': 30, 'rowsize': 30},
+         {'lat': [15, 15], 'lon': [-15, 15], 'value': [5, 3]},
+         None),
+        ({'lat': [0.5, 0.6, 95, None], 'lon': [0.5, 0.7, 0, 0], 'reducer': 'min'},
+         {'lat': [0.5], 'lon': [0.5], 'value': [1]},
+         None),
+        ({'lat': [90], 'lon': [180]},
+         {'lat': [89.5], 'lon': [179.5], 'value': [1]},
+         None),
+
+        ({'lat': [0], 'lon': [0], 'reducer': 'median'}, None, ValueError),
+        ({'lat': [0], 'lon': [0], 'colsize': 0}, None, ValueError),
+        ({'lat': [0, 1], 'lon': [0]}, None, ValueError),
+    ])
+    def test_bin_lat_lon(kwargs, expected, error):
+        if not error:
+            result = utility_functions.bin_lat_lon(**kwargs)
+            for key in expected:
+                assert np.allclose(result[key], expected[key])
+        else:
+            with pytest.raises(error):
+                result = utility_functions.bin_lat_lon(**kwargs)
+
+    @pytest.mark.parametrize('arcs, transform, expected_positions, expected_offsets', [
+        ([[[0, 0], [1, 1]], [[1, 1], [2, 0]]],
+         None,
+         [[0, 0], [1, 1], [1, 1], [2, 0]],
+         [0, 2, 4]),
+        ([[[0, 0], [1, 1]], [[2, 2], [1, -1]]],
+         {'scale': [2, 10], 'translate': [1, 0]},
+         [[1, 0], [3, 10], [5, 20], [7, 10]],
+         [0, 2, 4]),
+        ([], None, [], [0]),
+    ])
+    def test_decode_arcs(arcs, transform, expected_positions, expected_offsets):
+        positions, offsets = utility_functions.decode_arcs(arcs, transform)
+        assert positions.reshape(-1).tolist() == \
+            np.asarray(expected_positions, dtype = float).reshape(-1).tolist()
+        assert offsets.tolist() == expected_offsets
+
+    @pytest.mark.parametrize('polygons, kwargs, expected, error', [
+        ([[[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]]]], {}, [[5, 5]], None),
+        ([[[[0, 0], [10, 0], [10, 10], [0, 10]]]], {}, [[5, 5]], None),
+        ([[[[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]],
+           [[4, 4], [6, 4], [6, 6], [4, 6], [4, 4]]]],
+         {'precision': 0.001},
+         [[7.66, 7.66]],
+         None),
+        ([[[[1e6, 2e6], [1e6 + 4000, 2e6], [1e6 + 4000, 2e6 + 2000],
+            [1e6, 2e6 + 2000], [1e6, 2e6]]]],
+         {},
+         [[1e6 + 2000, 2e6 + 1000]],
+         None),
+        ([[], [[[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]]]],
+         {},
+         [[np.nan, np.nan], [2, 2]],
+         None),
+
+        ([[[[0, 0], [1, 0], [1, 1]]]], {'precision': -1}, None, ValueError),
+    ])
+    def test_get_poles_of_inaccessibility(polygons, kwargs, expected, error):
+        if not error:
+            result = utility_functions.get_poles_of_inaccessibility(polygons, **kwargs)
+            assert np.allclose(result, expected, atol = 0.1, equal_nan = True)
+        else:
+            with pytest.raises(error):
+                result = utility_functions.get_poles_of_inaccessibility(polygons,
+                                                                        **kwargs)
+
+    def test_get_poles_of_inaccessibility_concave():
+        u_shape = [[0, 0], [3, 0], [3, 3], [2, 3], [2, 1], [1, 1], [1, 3], [0, 3],
+                   [0, 0]]
+        result = utility_functions.get_poles_of_inaccessibility([[u_shape]],
+                                                                precision = 0.001)
+        x, y = result[0]
+        assert y == pytest.approx(0.586, abs = 0.01)
+        assert min(x, 3 - x) == pytest.approx(0.586, abs = 0.01)
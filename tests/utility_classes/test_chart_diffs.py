@@ -0,0 +1,182 @@
+"""Tests for ``highcharts_maps.utility_classes.chart_diffs``."""
+
+import pytest
+
+from highcharts_maps.chart import Chart
+from highcharts_maps.options import HighchartsMapsOptions
+from highcharts_maps.options.series.data.map_data import MapData
+from highcharts_maps.utility_classes.chart_diffs import ChartDiff
+from highcharts_maps.utility_classes.javascript_functions import VariableName
+from highcharts_maps.utility_classes.topojson import Topology
+from highcharts_maps import errors
+
+
+TOPOLOGY = {
+    'type': 'Topology',
+    'objects': {
+        'default': {
+            'type': 'GeometryCollection',
+            'geometries': [{'type': 'Polygon',
+                            'arcs': [[0, 1]],
+                            'properties': {'hc-key': 'l'}}]
+        }
+    },
+    'arcs': [[[1, 0], [1, 1]], [[1, 1], [0, 1], [0, 0], [1, 0]]]
+}
+
+OTHER_TOPOLOGY = {
+    'type': 'Topology',
+    'objects': {
+        'default': {
+            'type': 'GeometryCollection',
+            'geometries': [{'type': 'Polygon',
+                            'arcs': [[0, 1]],
+                            'properties': {'hc-key': 'r'}}]
+        }
+    },
+    'arcs': [[[1, 1], [1, 0]], [[1, 0], [2, 0], [2, 1], [1, 1]]]
+}
+
+DATA = [{'hc-key': f'key-{x}', 'value': x} for x in range(20)]
+
+
+def get_chart(data = DATA,
+              title = 'Population',
+              map_data = None,
+              legend = True,
+              extra_series = 0):
+    as_dict = {
+        'title': {'text': title},
+        'legend': {'enabled': legend},
+        'series': [{'type': 'map',
+                    'name': 'Population',
+                    'joinBy': 'hc-key',
+                    'data': data}]
+    }
+    if map_data is not None:
+        as_dict['chart'] = {'map': map_data}
+    for index in range(extra_series):
+        as_dict['series'].append({'type': 'mapline', 'name': f'Lines {index}'})
+
+    return Chart(container = 'container',
+                 variable_name = 'myChart',
+                 options = HighchartsMapsOptions.from_dict(as_dict))
+
+
+def get_map_data(topology):
+    return MapData(topology = Topology(topology, object_name = 'default'))
+
+
+def with_values(changes):
+    return [{**x, 'value': changes.get(index, x['value'])} for index, x in enumerate(DATA)]
+
+
+def get_targets(diff):
+    return [(target, method) for target, method, _ in diff.operations]
+
+
+def test_unchanged():
+    map_data = get_map_data(TOPOLOGY)
+    diff = ChartDiff(get_chart(map_data = map_data),
+                     get_chart(map_data = get_map_data(TOPOLOGY)))
+    assert diff.has_changes is False
+    assert diff.operations == []
+    assert diff.to_js_literal() == ''
+
+
+def test_options():
+    diff = ChartDiff(get_chart(), get_chart(title = 'Other', legend = None))
+    assert get_targets(diff) == [('', 'update')]
+    as_str = diff.to_js_literal()
+    assert as_str.startswith('myChart.update({')
+    assert "text: 'Other'" in as_str
+    assert 'enabled: null' in as_str
+    assert 'Population' not in as_str
+    assert as_str.endswith('}, false);\nmyChart.redraw();')
+
+
+@pytest.mark.parametrize('data, max_point_updates, expected', [
+    (with_values({3: 30}), 10, [('series[0].data[3]', 'update')]),
+    (with_values({3: 30, 5: 50}), 10, [('series[0].data[3]', 'update'),
+                                       ('series[0].data[5]', 'update')]),
+    (with_values({3: 30, 5: 50}), 1, [('series[0]', 'setData')]),
+    (with_values({x: x * 10 for x in range(1, 20)}), 10, [('series[0]', 'setData')]),
+    (DATA[:5], 10, [('series[0]', 'setData')]),
+    ([], 10, [('series[0]', 'setData')]),
+])
+def test_data(data, max_point_updates, expected):
+    old = get_chart()
+    new = get_chart(data = data)
+    diff = ChartDiff(old, new, max_point_updates = max_point_updates)
+    assert get_targets(diff) == expected
+
+    if expected[0][1] == 'setData':
+        series = new.options.series[0]
+        series_as_str = series.to_js_literal()
+        assert diff.operations[0][2][0] in series_as_str or data == []
+    else:
+        assert 'value: 30' in diff.operations[0][2][0]
+
+
+def test_series():
+    diff = ChartDiff(get_chart(extra_series = 2), get_chart(extra_series = 1))
+    assert get_targets(diff) == [('series[2]', 'remove')]
+    assert diff.to_js_literal() == 'myChart.series[2].remove(false);\nmyChart.redraw();'
+
+    diff = ChartDiff(get_chart(extra_series = 3), get_chart(extra_series = 1))
+    assert get_targets(diff) == [('series[3]', 'remove'), ('series[2]', 'remove')]
+
+    diff = ChartDiff(get_chart(), get_chart(extra_series = 1))
+    assert get_targets(diff) == [('', 'addSeries')]
+    assert "name: 'Lines 0'" in diff.operations[0][2][0]
+
+
+def test_map_data():
+    map_data = get_map_data(TOPOLOGY)
+    diff = ChartDiff(get_chart(map_data = map_data),
+                     get_chart(map_data = get_map_data(OTHER_TOPOLOGY), title = 'Other'))
+    assert get_targets(diff) == [('', 'update')]
+    assert 'map:' in diff.operations[0][2][0]
+
+    diff = ChartDiff(get_chart(map_data = map_data), get_chart(title = 'Other',
+                                                               map_data = map_data))
+    assert 'map' not in diff.to_js_literal()
+
+    diff = ChartDiff(get_chart(map_data = map_data),
+                     get_chart(map_data = VariableName(variable_name = 'worldMap')))
+    assert 'map: worldMap' in diff.to_js_literal()
+
+
+def test_async_map_data():
+    url = 'https://code.highcharts.com/mapdata/custom/world.topo.json'
+    diff = ChartDiff(get_chart(), get_chart(map_data = url))
+    as_str = diff.to_js_literal()
+    assert as_str.startswith('(async () => {\nconst topology1 = await fetch(')
+    assert 'map: topology1' in as_str
+    assert as_str.endswith('myChart.redraw();\n})();')
+
+    assert ChartDiff(get_chart(map_data = url),
+                     get_chart(map_data = url)).has_changes is False
+
+
+def test_to_js_literal():
+    old = get_chart()
+    new = get_chart(title = 'Other')
+    as_str = old.diff(new).to_js_literal()
+    assert as_str == ChartDiff(old, new).to_js_literal()
+    assert old.diff(new).to_js_literal(variable_name = 'other', redraw = False) == \
+        as_str.replace('myChart.', 'other.').replace('\nother.redraw();', '')
+
+    diff = ChartDiff(old.options, new.options)
+    assert diff.operations == old.diff(new).operations
+    with pytest.raises(errors.HighchartsValueError):
+        diff.to_js_literal()
+
+
+@pytest.mark.parametrize('old, new, kwargs', [
+    ('not a chart', None, {}),
+    (None, None, {'max_point_updates': -1}),
+])
+def test_ChartDiff_errors(old, new, kwargs):
+    with pytest.raises((errors.HighchartsValueError, ValueError)):
+        ChartDiff(old, new or get_chart(), **kwargs)
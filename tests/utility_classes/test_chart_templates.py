@@ -0,0 +1,88 @@
+"""Tests for ``highcharts_maps.utility_classes.chart_templates``."""
+
+import pytest
+
+import numpy as np
+
+from highcharts_maps.chart import Chart
+from highcharts_maps.options import HighchartsMapsOptions
+from highcharts_maps.utility_classes.chart_templates import ChartTemplate
+from highcharts_maps import errors
+
+
+def get_chart(data, title = "Population's growth", minimum = 0):
+    return Chart(container = 'container',
+                 variable_name = 'myChart',
+                 options = HighchartsMapsOptions.from_dict({
+                     'title': {'text': title},
+                     'colorAxis': {'min': minimum, 'max': 100, 'type': 'logarithmic'},
+                     'legend': {'enabled': True},
+                     'series': [{'type': 'map',
+                                 'name': 'Population',
+                                 'joinBy': 'hc-key',
+                                 'data': data}]
+                 }))
+
+
+DATA = [{'hc-key': 'fo', 'value': 1}]
+NEW_DATA = [{'hc-key': 'dk', 'value': 2}, {'hc-key': 'no', 'value': 3}]
+
+
+@pytest.mark.parametrize('format', ['js', 'json'])
+@pytest.mark.parametrize('slots, values, expected_kwargs', [
+    (['series[0].data'], {'series[0].data': NEW_DATA}, {'data': NEW_DATA}),
+    ({'data': 'series[0].data', 'title': 'title.text', 'min': 'colorAxis.min'},
+     {'data': NEW_DATA, 'title': "Other's title", 'min': 5},
+     {'data': NEW_DATA, 'title': "Other's title", 'minimum': 5}),
+    ({'data': 'series[0].data', 'title': 'title.text'},
+     {'title': 'Only the title'},
+     {'data': DATA, 'title': 'Only the title'}),
+    ({'data': 'series[0].data'},
+     {'data': np.array([['dk', 2], ['no', 3]], dtype = object)},
+     {'data': np.array([['dk', 2], ['no', 3]], dtype = object)}),
+])
+def test_render(format, slots, values, expected_kwargs):
+    chart = get_chart(DATA)
+    template = ChartTemplate(chart, slots, format = format)
+
+    if format == 'json':
+        assert template.render() == chart.to_json()
+        expected = get_chart(**expected_kwargs).to_json()
+    else:
+        assert template.render() == chart.to_js_literal()
+        expected = get_chart(**expected_kwargs).to_js_literal()
+
+    assert template.render(values) == expected
+    assert template.render(**values) == expected
+
+    chart.options.title.text = 'Changed after compiling'
+    assert template.render(values) == expected
+
+
+def test_to_template():
+    chart = get_chart(DATA)
+    template = chart.to_template({'data': 'series[0].data'})
+    assert isinstance(template, ChartTemplate) is True
+    assert template.slots == {'data': 'series[0].data'}
+    assert template.format == 'js'
+    assert template.render(data = NEW_DATA) == get_chart(NEW_DATA).to_js_literal()
+
+
+@pytest.mark.parametrize('slots, kwargs, error', [
+    (['series[0].data'], {'format': 'svg'}, errors.HighchartsValueError),
+    ([], {}, errors.HighchartsValueError),
+    (['series[1].data'], {}, errors.HighchartsValueError),
+    (['series[0]'], {}, errors.HighchartsValueError),
+    (['series[0].notAProperty'], {}, errors.HighchartsValueError),
+    (['subtitle.text'], {}, errors.HighchartsValueError),
+    (['title..text'], {}, errors.HighchartsValueError),
+])
+def test_ChartTemplate_errors(slots, kwargs, error):
+    with pytest.raises(error):
+        ChartTemplate(get_chart(DATA), slots, **kwargs)
+
+
+def test_render_errors():
+    template = ChartTemplate(get_chart(DATA), {'data': 'series[0].data'})
+    with pytest.raises(errors.HighchartsValueError):
+        template.render(title = 'Not a slot')
@@ -217,3 +217,75 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+##### NEXT CLASS
+
+from highcharts_maps.utility_classes.clusters import ClusterHierarchy as cls2
+
+CLUSTER_POINTS = {
+    'lat': [51.5, 51.5001, 40.7, -33.9],
+    'lon': [-0.1, -0.1001, -74, 151.2],
+    'value': [1, 2, 3, 4],
+    'names': ['London A', 'London B', 'New York', 'Sydney'],
+}
+
+
+@pytest.mark.parametrize('kwargs, zoom, expected_counts, error', [
+    ({'max_zoom': 5}, 0, [1, 1, 2], None),
+    ({'max_zoom': 5}, 5, [1, 1, 2], None),
+    ({'max_zoom': 5}, 6, [1, 1, 1, 1], None),
+    ({'max_zoom': 5}, 99, [1, 1, 1, 1], None),
+    ({'max_zoom': 5, 'method': 'grid'}, 5, [1, 1, 2], None),
+    ({'max_zoom': 5, 'minimum_cluster_size': 3}, 0, [1, 1, 1, 1], None),
+    ({'max_zoom': 2, 'radius': 100000}, 0, [4], None),
+
+    ({'method': 'kmeans'}, 0, None, errors.HighchartsValueError),
+    ({'radius': 0}, 0, None, errors.HighchartsValueError),
+    ({'lat': [95], 'lon': [0], 'value': None, 'names': None},
+     0,
+     None,
+     errors.HighchartsValueError),
+])
+def test_ClusterHierarchy(kwargs, zoom, expected_counts, error):
+    pytest.importorskip('numpy')
+    kwargs = {**CLUSTER_POINTS, **kwargs}
+
+    if not error:
+        result = cls2(**kwargs)
+        level = result.get_level(zoom)
+        assert sorted(level['count'].tolist()) == expected_counts
+        assert level['value'].sum() == 10
+        for index, point in enumerate(level['point'].tolist()):
+            if point >= 0:
+                assert level['lat'][index] == kwargs['lat'][point]
+                assert level['lon'][index] == kwargs['lon'][point]
+    else:
+        with pytest.raises(error):
+            result = cls2(**kwargs)
+
+
+def test_ClusterHierarchy_to_data_points(tmp_path):
+    pytest.importorskip('numpy')
+    hierarchy = cls2(max_zoom = 5, **CLUSTER_POINTS)
+    cluster_options = cls(marker = {'radius': 20},
+                          zones = [{'from': 2, 'to': 5, 'marker': {'radius': 10}}],
+                          data_labels = {'enabled': True})
+
+    data_points = hierarchy.to_data_points(3, cluster_options = cluster_options)
+    assert len(data_points) == 3
+    clusters = [x for x in data_points if x.name is None]
+    assert len(clusters) == 1
+    as_dict = clusters[0].to_dict()
+    assert as_dict['clusterPointsAmount'] == 2
+    assert as_dict['marker'] == {'radius': 10}
+    assert as_dict['dataLabels'] == {'enabled': True}
+
+    filenames = hierarchy.write_assets(tmp_path, zooms = [4, 6])
+    assert len(filenames) == 2
+    assert (tmp_path / '6.json').read_text().count('"name"') == 4
+
+    callback = hierarchy.get_loader_callback('/stores/{zoom}.json',
+                                             'stores',
+                                             inline_zoom = 3)
+    assert '"/stores/{zoom}.json"' in str(callback)
@@ -0,0 +1,86 @@
+"""Tests for ``highcharts.utility_classes.crs``."""
+
+import pytest
+
+from highcharts_maps.utility_classes.crs import CRSTransformer as cls
+from highcharts_maps import errors
+
+US_LAMBERT = '+proj=lcc +lat_1=33 +lat_2=45 +lat_0=39 +lon_0=-96 +x_0=0 +y_0=0 ' \
+             '+datum=NAD83 +units=m +no_defs'
+
+
+@pytest.mark.parametrize('target_crs', [
+    4326,
+    'EPSG:3857',
+    'epsg:3395',
+    'EPSG:5070',
+    'ESRI:102003',
+    'ESRI:102004',
+    US_LAMBERT,
+    '+proj=lcc +lat_1=49 +lat_0=49 +lon_0=-95 +k_0=0.9 +x_0=100 +y_0=200 +ellps=GRS80',
+    '+proj=aea +lat_1=20 +lat_2=60 +lat_0=40 +lon_0=-96 +R=6371000 +units=m',
+    '+proj=merc +lat_ts=30 +lon_0=10 +ellps=WGS84 +units=m',
+])
+def test_CRSTransformer_numpy_matches_pyproj(target_crs):
+    np = pytest.importorskip('numpy')
+    pytest.importorskip('pyproj')
+    lon = np.linspace(-125, -66, 50)
+    lat = np.linspace(24, 50, 50)
+
+    numpy_result = cls(target_crs, use_pyproj = False).transform(lon, lat)
+    pyproj_result = cls(target_crs, use_pyproj = True).transform(lon, lat)
+
+    assert numpy_result[0] == pytest.approx(pyproj_result[0], abs = 1e-3)
+    assert numpy_result[1] == pytest.approx(pyproj_result[1], abs = 1e-3)
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    ({}, errors.HighchartsValueError),
+    ({'target_crs': 'EPSG:2056'}, errors.HighchartsValueError),
+    ({'target_crs': '+proj=tmerc +lon_0=9'}, errors.HighchartsValueError),
+    ({'target_crs': 'EPSG:3857', 'source_crs': 'EPSG:5070'},
+     errors.HighchartsValueError),
+    ({'map_transforms': {'default': {'scale': 1}}}, errors.HighchartsValueError),
+])
+def test_CRSTransformer_numpy_errors(kwargs, error):
+    pytest.importorskip('numpy')
+    with pytest.raises(error):
+        result = cls(use_pyproj = False, **kwargs)
+
+
+@pytest.mark.parametrize('use_pyproj', [False, True])
+def test_CRSTransformer_map_transforms(use_pyproj):
+    np = pytest.importorskip('numpy')
+    if use_pyproj:
+        pytest.importorskip('pyproj')
+    map_transforms = {
+        'default': {
+            'crs': US_LAMBERT,
+            'scale': 0.000151481324748,
+            'jsonres': 15.5,
+            'jsonmarginX': -999,
+            'jsonmarginY': 9851,
+            'xoffset': -2361356.09818,
+            'yoffset': 1398996.77886
+        },
+        'hawaii': {
+            'crs': 'EPSG:4326',
+            'xoffset': -170,
+            'yoffset': 30,
+            'hitZone': {
+                'type': 'Polygon',
+                'coordinates': [[[0, 0], [20, 0], [20, -20], [0, -20], [0, 0]]]
+            }
+        }
+    }
+    instance = cls(map_transforms = map_transforms, use_pyproj = use_pyproj)
+
+    x, y = instance.transform([-96, -157], [39, 20])
+    assert x[0] == pytest.approx((2361356.09818 * 0.000151481324748) * 15.5 - 999)
+    assert y[0] == pytest.approx(-((1398996.77886 * 0.000151481324748) * 15.5 - 9851),
+                                 abs = 1e-6)
+    assert [x[1], y[1]] == pytest.approx([13, -10])
+
+    coordinates = instance(np.array([[-96, 39]]))
+    assert coordinates.shape == (1, 2)
+    assert coordinates[0, 0] == pytest.approx(x[0])
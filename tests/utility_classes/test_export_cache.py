@@ -0,0 +1,111 @@
+"""Tests for ``highcharts_maps.utility_classes.export_cache``."""
+
+import os
+import time
+
+import pytest
+
+from highcharts_maps.utility_classes.export_cache import ExportCacheBase, \
+    MemoryExportCache, DirectoryExportCache
+from highcharts_maps import errors
+
+
+def test_get_key():
+    first = ExportCacheBase.get_key('{"type": "png", "infile": {"a": 1, "b": [1, 2]}}')
+    second = ExportCacheBase.get_key('{"infile":{"b":[1,2],"a":1},"type":"png"}')
+    third = ExportCacheBase.get_key('{"infile":{"b":[2,1],"a":1},"type":"png"}')
+
+    assert first == second
+    assert first != third
+
+
+def test_MemoryExportCache():
+    cache = MemoryExportCache(max_size = 10)
+    cache.set('a', b'1234')
+    cache.set('b', b'5678')
+    assert cache.get('a') == b'1234'
+
+    cache.set('c', b'90')
+    cache.set('d', b'ab')
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1234'
+    assert cache.get('d') == b'ab'
+
+    cache.set('e', b'this is too large to cache')
+    assert cache.get('e') is None
+
+    assert cache.stats == {
+        'hits': 3,
+        'misses': 2,
+        'evictions': 1,
+        'expirations': 0,
+        'entries': 3,
+        'size': 8
+    }
+
+    cache.delete('a')
+    assert cache.stats['size'] == 4
+    cache.clear()
+    cache.reset_stats()
+    assert cache.stats == {
+        'hits': 0,
+        'misses': 0,
+        'evictions': 0,
+        'expirations': 0,
+        'entries': 0,
+        'size': 0
+    }
+
+    with pytest.raises(errors.HighchartsValueError):
+        cache.set('a', 123)
+
+
+def test_MemoryExportCache_ttl():
+    cache = MemoryExportCache(ttl = 0.05)
+    cache.set('a', 'value')
+    assert cache.get('a') == b'value'
+    time.sleep(0.1)
+    assert cache.get('a') is None
+    assert cache.stats['expirations'] == 1
+    assert cache.stats['entries'] == 0
+
+
+def test_DirectoryExportCache(tmp_path):
+    cache = DirectoryExportCache(tmp_path / 'cache', max_size = 10)
+    cache.set('a', b'1234')
+    cache.set('b', b'5678')
+    os.utime(tmp_path / 'cache' / 'b.export', (1, 1))
+    assert cache.get('a') == b'1234'
+
+    cache.set('c', b'90ab')
+    assert cache.get('b') is None
+    assert cache.get('c') == b'90ab'
+    assert cache.stats['evictions'] == 1
+    assert cache.stats['entries'] == 2
+    assert cache.stats['size'] == 8
+
+    shared = DirectoryExportCache(tmp_path / 'cache')
+    assert shared.get('a') == b'1234'
+
+    cache.clear()
+    assert os.listdir(tmp_path / 'cache') == []
+
+
+def test_DirectoryExportCache_ttl(tmp_path):
+    cache = DirectoryExportCache(tmp_path, ttl = 60)
+    cache.set('a', b'value')
+    assert cache.get('a') == b'value'
+    os.utime(tmp_path / 'a.export', (1, 1))
+    assert cache.get('a') is None
+    assert cache.stats['expirations'] == 1
+
+
+def test_ExportCacheBase_is_abstract():
+    class IncompleteExportCache(ExportCacheBase):
+        def _get(self, key, now):
+            return None
+
+    with pytest.raises(TypeError):
+        ExportCacheBase()
+    with pytest.raises(TypeError):
+        IncompleteExportCache()
@@ -0,0 +1,141 @@
+"""Tests for ``highcharts.utility_classes.projections``."""
+
+import pytest
+
+from json.decoder import JSONDecodeError
+
+from highcharts_maps.utility_classes.projections import ProjectionOptions as cls
+from highcharts_maps.options.series.data.map_data import MapData
+from highcharts_maps.options.series.data.geometric import GeometricLatLonData
+from highcharts_maps import errors
+from tests.fixtures import input_files, check_input_file, to_camelCase, to_js_dict, \
+    Class__init__, Class__to_untrimmed_dict, Class_from_dict, Class_to_dict, \
+    Class_from_js_literal
+
+STANDARD_PARAMS = [
+    ({}, None),
+    ({
+      'name': 'Orthographic',
+      'rotation': [10, -20, 5]
+    }, None),
+    ({
+      'name': 'LambertConformalConic',
+      'parallels': [30, 60],
+      'rotation': [-10]
+    }, None),
+
+    ({
+      'rotation': [10, 20, 30, 40]
+    }, errors.HighchartsValueError),
+]
+
+
+@pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
+def test__init__(kwargs, error):
+    Class__init__(cls, kwargs, error)
+
+
+@pytest.mark.parametrize('kwargs, error', STANDARD_PARAMS)
+def test__to_untrimmed_dict(kwargs, error):
+    Class__to_untrimmed_dict(cls, kwargs, error)
+
+
+@pytest.mark.parametrize('kwargs, error',  STANDARD_PARAMS)
+def test_from_dict(kwargs, error):
+    Class_from_dict(cls, kwargs, error)
+
+
+@pytest.mark.parametrize('kwargs, error',  STANDARD_PARAMS)
+def test_to_dict(kwargs, error):
+    Class_to_dict(cls, kwargs, error)
+
+
+@pytest.mark.parametrize('kwargs, lon, lat, expected, error', [
+    ({}, [10], [20], [(10, 20)], None),
+    ({'name': 'EqualEarth'}, [0], [0], [(0, 0)], None),
+    ({'name': 'Miller'}, [90], [0], [(100.18754171394622, 0)], None),
+    ({'name': 'WebMercator'}, [0, 0], [0, 89], [(0, 0), None], None),
+    ({'name': 'Orthographic'}, [0, 120], [90, 0], [(0, 63.78460826781007), None], None),
+    ({'name': 'Orthographic', 'rotation': [-120]}, [120], [0], [(0, 0)], None),
+    ({'name': 'LambertConformalConic', 'parallels': [30, 60]},
+     [0, 15, -40],
+     [45, 50, 20],
+     None,
+     None),
+    ({'name': 'EqualEarth', 'rotation': [30, 20, 10]},
+     [-150, 0, 170],
+     [-80, 0, 60],
+     None,
+     None),
+
+    ({'name': 'LambertConformalConic'}, [0], [0], None, errors.HighchartsValueError),
+    ({'name': 'NotAProjection'}, [0], [0], None, errors.HighchartsValueError),
+    ({'name': 'EqualEarth'}, [0, 1], [0], None, errors.HighchartsValueError),
+])
+def test_ProjectionOptions_forward(kwargs, lon, lat, expected, error):
+    np = pytest.importorskip('numpy')
+    instance = cls(**kwargs)
+
+    if not error:
+        x, y = instance.forward(lon, lat)
+        if expected:
+            for index, item in enumerate(expected):
+                if item is None:
+                    assert np.isnan(x[index]) and np.isnan(y[index])
+                else:
+                    assert x[index] == pytest.approx(item[0])
+                    assert y[index] == pytest.approx(item[1])
+        else:
+            result_lon, result_lat = instance.inverse(x, y)
+            assert result_lon.tolist() == pytest.approx(lon)
+            assert result_lat.tolist() == pytest.approx(lat)
+    else:
+        with pytest.raises(error):
+            result = instance.forward(lon, lat)
+
+
+@pytest.mark.parametrize('filename, kwargs, error', [
+    ('series/data/map_data/map_data/world.topo.json', {'name': 'EqualEarth'}, None),
+    ('series/data/map_data/map_data/world.topo.json',
+     {'name': 'Orthographic', 'rotation': [-10, -50]},
+     None),
+
+    ('series/data/map_data/map_data/world.topo.json',
+     {'name': 'NotAProjection'},
+     errors.HighchartsValueError),
+])
+def test_ProjectionOptions_project_map_data(input_files, filename, kwargs, error):
+    np = pytest.importorskip('numpy')
+    input_file = check_input_file(input_files, filename)
+    map_data = MapData.from_topojson(input_file)
+    instance = cls(**kwargs)
+
+    if not error:
+        result = instance.project_map_data(map_data, precision = 3)
+        assert isinstance(result, MapData) is True
+        as_dict = result.topology.to_dict()
+        assert 'transform' not in as_dict
+        assert len(as_dict['arcs']) == len(map_data.topology.to_dict()['arcs'])
+        for item in as_dict['objects'].values():
+            assert 'hc-recommended-transform' not in item
+        vertices = np.array([x for arc in as_dict['arcs'] for x in arc])
+        assert np.isnan(vertices).any() is np.False_
+        assert np.abs(vertices).max() < 250
+    else:
+        with pytest.raises(error):
+            result = instance.project_map_data(map_data)
+
+
+def test_ProjectionOptions_project_data_points():
+    pytest.importorskip('numpy')
+    instance = cls(name = 'Orthographic')
+    data_points = [GeometricLatLonData(name = 'front', lat = 0, lon = 0),
+                   GeometricLatLonData(name = 'back', lat = 0, lon = 180),
+                   GeometricLatLonData(name = 'none')]
+
+    result = instance.project_data_points(data_points)
+    assert len(result) == 3
+    assert result[0].lat == 0 and result[0].lon == 0
+    assert result[1].lat is None and result[1].lon is None
+    assert result[2].name == 'none'
+    assert data_points[1].lon == 180